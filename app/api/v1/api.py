@@ -21,6 +21,9 @@ from app.api.v1.endpoints.data_management import routes as data_management_route
 from app.api.v1.endpoints.notices import routes as notices_routes
 from app.api.v1.endpoints.notice_templates import routes as notice_templates_routes
 from app.api.v1.endpoints.files import routes as files_routes
+from app.api.v1.endpoints.batch import routes as batch_routes
+from app.api.v1.endpoints.sync import routes as sync_routes
+from app.api.v1.endpoints.jobs import routes as jobs_routes
 from app.core.permissions import permission_required
 
 # API v1 메인 라우터
@@ -168,6 +171,13 @@ api_router.include_router(
     tags=["files"],
     dependencies=[Depends(permission_required("notices"))]
 )
+# 파일 다운로드/미리보기 (서명 URL은 토큰 없이 접근 — 권한 체크는 라우트에서 수행)
+# /files/{file_id} 경로가 위 라우터의 고정 경로(/storage-usage 등)를 가리지 않도록 뒤에 등록
+api_router.include_router(
+    files_routes.download_router,
+    prefix="/files",
+    tags=["files"]
+)
 
 # 사용자 관리
 api_router.include_router(
@@ -176,3 +186,24 @@ api_router.include_router(
     tags=["users"],
     dependencies=[Depends(permission_required("users"))]
 )
+
+# 배치 요청 (하위 요청별 권한 체크는 각 라우터에서 수행)
+api_router.include_router(
+    batch_routes.router,
+    prefix="/batch",
+    tags=["batch"]
+)
+
+# 증분 동기화 (엔티티별 권한 체크는 라우트에서 수행)
+api_router.include_router(
+    sync_routes.router,
+    prefix="/sync",
+    tags=["sync"]
+)
+
+# 백그라운드 작업 조회 (요청자/관리자 확인은 라우트에서 수행)
+api_router.include_router(
+    jobs_routes.router,
+    prefix="/jobs",
+    tags=["jobs"]
+)
@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+"""
+배치(다중) 요청 API 패키지
+"""
+
+from .routes import router
+
+__all__ = ["router"]
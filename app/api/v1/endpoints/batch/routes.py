@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+배치(다중) 요청 API
+- VBA 클라이언트가 여러 조회/저장 요청을 한 번의 HTTP 호출로 보내기 위한 엔드포인트
+- 하위 요청은 기존 라우터를 그대로 통과(권한 체크 포함)하며, 인증/권한 평가 결과는 배치 단위로 공유
+"""
+import asyncio
+import contextvars
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+import anyio
+from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
+from app.core.logger import app_logger
+from app.core.security import (
+    auth_cache_key,
+    enable_auth_cache,
+    get_current_user,
+    oauth2_scheme,
+    reset_auth_cache,
+)
+
+router = APIRouter()
+
+MAX_BATCH_REQUESTS = 20
+MAX_BATCH_CONCURRENCY = 4  # DB 커넥션 풀(pool_size=5) 고려
+ALLOWED_METHODS = {"GET", "POST", "PUT", "PATCH", "DELETE"}
+FORWARD_HEADERS = {"authorization", "x-company-cd", "accept", "accept-language", "user-agent"}
+
+
+class BatchSubRequest(BaseModel):
+    id: Optional[str] = Field(None, description="응답 매칭용 식별자 (미지정 시 순번)")
+    method: str = Field("GET", description="HTTP 메서드")
+    path: str = Field(..., description="API 경로 (예: /projects/list)")
+    query: Optional[Dict[str, Any]] = Field(None, description="쿼리 파라미터")
+    body: Optional[Any] = Field(None, description="JSON 요청 본문")
+
+
+class BatchRequest(BaseModel):
+    requests: List[BatchSubRequest] = Field(..., min_length=1, max_length=MAX_BATCH_REQUESTS)
+
+
+def _normalize_path(path: str) -> str:
+    path = (path or "").strip()
+    if not path.startswith("/"):
+        path = "/" + path
+    prefix = settings.API_V1_PREFIX.rstrip("/")
+    if prefix and (path == prefix or path.startswith(prefix + "/")):
+        path = path[len(prefix):] or "/"
+    return path.split("?", 1)[0]
+
+
+def _encode_query(query: Optional[Dict[str, Any]]) -> str:
+    if not query:
+        return ""
+    pairs = []
+    for key, value in query.items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        for item in values:
+            if item is None:
+                continue
+            if isinstance(item, bool):
+                item = "true" if item else "false"
+            pairs.append((key, item))
+    return urlencode(pairs)
+
+
+def _build_scope(request: Request, method: str, path: str, query_string: str, body: bytes) -> Dict[str, Any]:
+    full_path = f"{settings.API_V1_PREFIX.rstrip('/')}{path}"
+    headers = [
+        (name, value)
+        for name, value in request.scope.get("headers", [])
+        if name.decode("latin-1").lower() in FORWARD_HEADERS
+    ]
+    if body:
+        headers.append((b"content-type", b"application/json"))
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+    return {
+        "type": "http",
+        "asgi": request.scope.get("asgi", {"version": "3.0"}),
+        "http_version": request.scope.get("http_version", "1.1"),
+        "method": method,
+        "scheme": request.scope.get("scheme", "http"),
+        "server": request.scope.get("server"),
+        "client": request.scope.get("client"),
+        "root_path": request.scope.get("root_path", ""),
+        "path": full_path,
+        "raw_path": full_path.encode("utf-8"),
+        "query_string": query_string.encode("latin-1"),
+        "headers": headers,
+        "state": dict(request.scope.get("state") or {}),
+    }
+
+
+async def _dispatch(app, scope: Dict[str, Any], body: bytes) -> Tuple[int, Dict[str, str], bytes]:
+    """ASGI 앱에 하위 요청을 직접 전달하고 응답을 수집"""
+    request_sent = False
+    response: Dict[str, Any] = {"status": 500, "headers": {}, "body": bytearray()}
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = {
+                k.decode("latin-1").lower(): v.decode("latin-1")
+                for k, v in message.get("headers", [])
+            }
+        elif message["type"] == "http.response.body":
+            response["body"].extend(message.get("body", b""))
+
+    try:
+        await app(scope, receive, send)
+    except Exception as e:
+        # 전역 예외 핸들러가 응답을 보낸 뒤 재발생시키는 경우가 있으므로 응답이 없을 때만 대체
+        if not response["body"]:
+            response["status"] = 500
+            response["headers"] = {"content-type": "application/json"}
+            response["body"] = bytearray(json.dumps({"detail": str(e)}).encode("utf-8"))
+    return response["status"], response["headers"], bytes(response["body"])
+
+
+def _run_sub_request(app, scope: Dict[str, Any], body: bytes) -> Tuple[int, Dict[str, str], bytes]:
+    # 대부분의 라우트가 async def 안에서 동기 DB 호출을 하므로,
+    # 하위 요청마다 별도 스레드/이벤트 루프에서 실행해야 실제로 병렬 처리된다.
+    return asyncio.run(_dispatch(app, scope, body))
+
+
+def _decode_body(headers: Dict[str, str], raw: bytes) -> Any:
+    if not raw:
+        return None
+    content_type = headers.get("content-type", "")
+    if "json" in content_type:
+        try:
+            return json.loads(raw)
+        except ValueError:
+            pass
+    return raw.decode("utf-8", errors="replace")
+
+
+@router.post("")
+async def execute_batch(
+    payload: BatchRequest,
+    request: Request,
+    token: str = Depends(oauth2_scheme),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    여러 API 요청을 한 번에 실행
+
+    - 각 하위 요청은 기존 라우터/권한 체크를 그대로 통과
+    - 인증 사용자 조회 및 권한 평가는 배치 내에서 1회만 수행 후 공유
+    - 결과는 요청 순서대로 status/elapsed_ms/body 포함
+    """
+    batch_path = request.url.path.rstrip("/")
+
+    prepared = []
+    for idx, sub in enumerate(payload.requests):
+        method = (sub.method or "GET").upper()
+        if method not in ALLOWED_METHODS:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 메서드입니다: {sub.method}")
+        path = _normalize_path(sub.path)
+        if f"{settings.API_V1_PREFIX.rstrip('/')}{path}".rstrip("/") == batch_path:
+            raise HTTPException(status_code=400, detail="배치 요청은 중첩할 수 없습니다.")
+        body = b""
+        if sub.body is not None and method != "GET":
+            body = json.dumps(sub.body, ensure_ascii=False, default=str).encode("utf-8")
+        scope = _build_scope(request, method, path, _encode_query(sub.query), body)
+        prepared.append((sub.id if sub.id is not None else str(idx), method, path, scope, body))
+
+    limiter = anyio.CapacityLimiter(MAX_BATCH_CONCURRENCY)
+    cache_token = enable_auth_cache({auth_cache_key(token): current_user})
+    started = time.perf_counter()
+
+    async def _run(item):
+        sub_id, method, path, scope, body = item
+        sub_started = time.perf_counter()
+        # 하위 요청마다 컨텍스트 복사 (인증 캐시 dict는 참조로 공유)
+        ctx = contextvars.copy_context()
+        status_code, headers, raw = await anyio.to_thread.run_sync(
+            ctx.run, _run_sub_request, request.app, scope, body,
+            limiter=limiter
+        )
+        return {
+            "id": sub_id,
+            "method": method,
+            "path": path,
+            "status": status_code,
+            "elapsed_ms": round((time.perf_counter() - sub_started) * 1000, 1),
+            "body": _decode_body(headers, raw)
+        }
+
+    try:
+        results = await asyncio.gather(*[_run(item) for item in prepared])
+    finally:
+        reset_auth_cache(cache_token)
+
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+    failed = sum(1 for r in results if r["status"] >= 400)
+    app_logger.info(
+        f"📦 배치 요청 처리: {len(results)}건 (실패 {failed}건) | "
+        f"{elapsed_ms}ms | user={current_user.get('login_id')}"
+    )
+    return {
+        "count": len(results),
+        "failed": failed,
+        "elapsed_ms": elapsed_ms,
+        "results": results
+    }
@@ -16,6 +16,7 @@ from pydantic import BaseModel
 from app.core.database import get_db
 from app.core.tenant import get_company_cd
 from app.core.logger import app_logger
+from app.services.sync_service import record_deletions
 
 router = APIRouter()
 
@@ -617,11 +618,21 @@ async def bulk_save_codes(
                         if check_code_in_use(db, code, d['code']):
                             raise HTTPException(status_code=400, detail=f"{code} 그룹 코드가 사용 중입니다.")
 
+                    record_deletions(
+                        db, "comm_code",
+                        "t.company_cd = :company_cd AND (t.group_code = :code OR (t.group_code = 'GROUP_CODE' AND t.code = :code))",
+                        {"code": code, "company_cd": company_cd}
+                    )
                     db.execute(text("DELETE FROM comm_code WHERE company_cd = :company_cd AND group_code = :group_code"), {"group_code": code, "company_cd": company_cd})
                     db.execute(text("DELETE FROM comm_code WHERE company_cd = :company_cd AND group_code = 'GROUP_CODE' AND code = :code"), {"code": code, "company_cd": company_cd})
                 else:
                     if check_code_in_use(db, group_code, code):
                         raise HTTPException(status_code=400, detail="다른 테이블에서 사용 중인 코드입니다.")
+                    record_deletions(
+                        db, "comm_code",
+                        "t.company_cd = :company_cd AND t.group_code = :group_code AND t.code = :code",
+                        {"group_code": group_code, "code": code, "company_cd": company_cd}
+                    )
                     db.execute(text("""
                         DELETE FROM comm_code 
                         WHERE company_cd = :company_cd
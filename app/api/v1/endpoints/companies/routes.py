@@ -13,6 +13,9 @@ from app.core.database import get_db
 from app.core.tenant import get_company_cd
 from app.core.security import get_current_user
 from app.core.logger import app_logger
+from app.services.data_copy_service import clone_with_id_remap, needs_id_remap
+from app.services.job_service import JobContext, register_job, submit_job
+from app.services.schema_cache import get_schema
 
 router = APIRouter()
 
@@ -39,109 +42,11 @@ class CompanyStatusRequest(BaseModel):
     is_use: str
 
 
-def _build_in_clause(values: List[str], prefix: str) -> Tuple[str, Dict[str, str]]:
-    placeholders = []
-    params: Dict[str, str] = {}
-    for idx, value in enumerate(values):
-        key = f"{prefix}{idx}"
-        placeholders.append(f":{key}")
-        params[key] = value
-    return ", ".join(placeholders), params
-
-
 def _resolve_common_tables(db: Session) -> Tuple[List[str], Dict[str, str]]:
-    if not COMMON_COPY_TABLES:
-        return [], {}
-    in_clause, params = _build_in_clause(COMMON_COPY_TABLES, "t")
-    rows = db.execute(text(f"""
-        SELECT t.table_name, t.table_comment
-        FROM information_schema.tables t
-        JOIN information_schema.columns c
-          ON c.table_schema = t.table_schema
-         AND c.table_name = t.table_name
-        WHERE t.table_schema = DATABASE()
-          AND t.table_type = 'BASE TABLE'
-          AND t.table_name IN ({in_clause})
-          AND c.column_name = 'company_cd'
-        ORDER BY t.table_name
-    """), params).fetchall()
-    tables = [row[0] for row in rows]
-    comments = {row[0]: (row[1] or "") for row in rows}
-    return tables, comments
-
-
-def _get_fk_edges(db: Session, tables: List[str]) -> List[Tuple[str, str]]:
-    if not tables:
-        return []
-    in_clause, params = _build_in_clause(tables, "t")
-    rows = db.execute(text(f"""
-        SELECT kcu.table_name AS child_table,
-               kcu.referenced_table_name AS parent_table
-        FROM information_schema.key_column_usage kcu
-        WHERE kcu.table_schema = DATABASE()
-          AND kcu.referenced_table_name IS NOT NULL
-          AND kcu.table_name IN ({in_clause})
-          AND kcu.referenced_table_name IN ({in_clause})
-    """), params).fetchall()
-    return [(row[1], row[0]) for row in rows]  # parent -> child
-
-
-def _topological_sort(tables: List[str], edges: List[Tuple[str, str]]) -> List[str]:
-    table_set = set(tables)
-    adj: Dict[str, Set[str]] = {t: set() for t in tables}
-    in_deg: Dict[str, int] = {t: 0 for t in tables}
-
-    for parent, child in edges:
-        if parent == child:
-            continue
-        if parent not in table_set or child not in table_set:
-            continue
-        if child not in adj[parent]:
-            adj[parent].add(child)
-            in_deg[child] += 1
-
-    queue = [t for t in tables if in_deg[t] == 0]
-    result: List[str] = []
-    while queue:
-        node = queue.pop(0)
-        result.append(node)
-        for nxt in adj[node]:
-            in_deg[nxt] -= 1
-            if in_deg[nxt] == 0:
-                queue.append(nxt)
-
-    if len(result) < len(tables):
-        for t in tables:
-            if t not in result:
-                result.append(t)
-    return result
-
-
-def _expand_with_parents(selected: Set[str], edges: List[Tuple[str, str]]) -> Set[str]:
-    parents_map: Dict[str, Set[str]] = {}
-    for parent, child in edges:
-        parents_map.setdefault(child, set()).add(parent)
-
-    expanded = set(selected)
-    queue = list(selected)
-    while queue:
-        child = queue.pop(0)
-        for parent in parents_map.get(child, set()):
-            if parent not in expanded:
-                expanded.add(parent)
-                queue.append(parent)
-    return expanded
-
-
-def _get_columns(db: Session, table: str) -> List[str]:
-    rows = db.execute(text("""
-        SELECT column_name
-        FROM information_schema.columns
-        WHERE table_schema = DATABASE()
-          AND table_name = :table
-        ORDER BY ordinal_position
-    """), {"table": table}).fetchall()
-    return [row[0] for row in rows]
+    schema = get_schema(db)
+    common = set(COMMON_COPY_TABLES)
+    tables = [t for t in schema.company_tables if t in common]
+    return tables, {t: schema.comments.get(t, "") for t in tables}
 
 
 def _copy_common_tables(
@@ -149,7 +54,8 @@ def _copy_common_tables(
     source_company: str,
     target_company: str,
     selected_tables: Set[str],
-    actor_id: Optional[str] = None
+    actor_id: Optional[str] = None,
+    ctx: Optional[JobContext] = None
 ) -> Dict[str, List[str]]:
     tables, _ = _resolve_common_tables(db)
     if not tables:
@@ -160,17 +66,19 @@ def _copy_common_tables(
     if not selected:
         return {"copied_tables": [], "auto_included_tables": []}
 
-    edges = _get_fk_edges(db, tables)
-    expanded = _expand_with_parents(selected, edges)
-    copy_tables_list = [t for t in tables if t in expanded]
-    insert_order = _topological_sort(copy_tables_list, edges)
+    schema = get_schema(db)
+    expanded = schema.expand_with_parents(selected, tables)
+    insert_order = schema.sort(expanded)
 
     db.execute(text("SET FOREIGN_KEY_CHECKS=0"))
-    for table in insert_order:
-        if table == "org_units":
-            _copy_org_units(db, source_company, target_company, actor_id)
+    for idx, table in enumerate(insert_order):
+        if ctx:
+            ctx.advance(idx, len(insert_order), f"공통 테이블 복사: {table}")
+        if needs_id_remap(schema, table):
+            # org_units 등 자기 참조 AUTO_INCREMENT 테이블은 새 키로 변환해 한 번에 복제
+            clone_with_id_remap(db, schema, table, source_company, target_company, actor_id)
             continue
-        cols = _get_columns(db, table)
+        cols = schema.columns_of(table)
         col_list = ", ".join([f"`{c}`" for c in cols])
         select_parts = []
         for c in cols:
@@ -198,65 +106,6 @@ def _copy_common_tables(
     }
 
 
-def _copy_org_units(
-    db: Session,
-    source_company: str,
-    target_company: str,
-    actor_id: Optional[str] = None
-) -> None:
-    rows = db.execute(text("""
-        SELECT org_id, org_name, parent_id, org_type, sort_order, is_use, created_at, updated_at, created_by, updated_by
-        FROM org_units
-        WHERE company_cd = :source_company
-        ORDER BY org_id ASC
-    """), {"source_company": source_company}).mappings().all()
-
-    if not rows:
-        return
-
-    id_map: Dict[int, int] = {}
-    for row in rows:
-        params = {
-            "company_cd": target_company,
-            "org_name": row["org_name"],
-            "parent_id": None,
-            "org_type": row["org_type"],
-            "sort_order": row["sort_order"],
-            "is_use": row["is_use"],
-            "created_at": row["created_at"],
-            "updated_at": row["updated_at"],
-            "created_by": actor_id or row["created_by"],
-            "updated_by": actor_id or row["updated_by"],
-        }
-        result = db.execute(text("""
-            INSERT INTO org_units (
-                company_cd, org_name, parent_id, org_type, sort_order, is_use,
-                created_at, updated_at, created_by, updated_by
-            ) VALUES (
-                :company_cd, :org_name, :parent_id, :org_type, :sort_order, :is_use,
-                :created_at, :updated_at, :created_by, :updated_by
-            )
-        """), params)
-        if result.lastrowid is None:
-            raise HTTPException(status_code=500, detail="Failed to copy org_units (missing org_id)")
-        id_map[row["org_id"]] = int(result.lastrowid)
-
-    for row in rows:
-        parent_id = row["parent_id"]
-        if not parent_id:
-            continue
-        new_parent = id_map.get(parent_id)
-        new_id = id_map.get(row["org_id"])
-        if not new_parent or not new_id:
-            continue
-        db.execute(text("""
-            UPDATE org_units
-            SET parent_id = :new_parent
-            WHERE company_cd = :company_cd
-              AND org_id = :org_id
-        """), {"new_parent": new_parent, "company_cd": target_company, "org_id": new_id})
-
-
 @router.get("/list")
 async def list_companies(
     is_use: Optional[str] = Query("", description="사용여부 (Y/N, 빈값=전체)"),
@@ -317,12 +166,30 @@ async def list_common_tables(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _insert_company(db: Session, params: dict) -> None:
+    db.execute(
+        text("""
+            INSERT INTO companies (
+                company_cd, company_name, company_alias, is_use, created_by, updated_by
+            ) VALUES (
+                :company_cd, :company_name, :company_alias, :is_use, :created_by, :updated_by
+            )
+        """),
+        params
+    )
+
+
 @router.post("")
 async def create_company(
     request: CompanyCreateRequest,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
+    """
+    회사 등록
+    - 공통 테이블 복사가 없으면 즉시 등록
+    - 복사 옵션이 있으면 등록+복사를 백그라운드 작업으로 실행하고 job_id 반환 (/jobs/{job_id})
+    """
     try:
         company_cd = (request.company_cd or "").strip()
         company_name = (request.company_name or "").strip()
@@ -336,23 +203,14 @@ async def create_company(
         if exists:
             raise HTTPException(status_code=409, detail="이미 존재하는 회사 코드입니다.")
 
-        db.execute(
-            text("""
-                INSERT INTO companies (
-                    company_cd, company_name, company_alias, is_use, created_by, updated_by
-                ) VALUES (
-                    :company_cd, :company_name, :company_alias, :is_use, :created_by, :updated_by
-                )
-            """),
-            {
-                "company_cd": company_cd,
-                "company_name": company_name,
-                "company_alias": (request.company_alias or "").strip() or None,
-                "is_use": (request.is_use or "Y").upper(),
-                "created_by": current_user.get("login_id"),
-                "updated_by": current_user.get("login_id"),
-            }
-        )
+        company_params = {
+            "company_cd": company_cd,
+            "company_name": company_name,
+            "company_alias": (request.company_alias or "").strip() or None,
+            "is_use": (request.is_use or "Y").upper(),
+            "created_by": current_user.get("login_id"),
+            "updated_by": current_user.get("login_id"),
+        }
 
         # 공통 테이블 복사 (옵션)
         selected_tables = set([t.strip() for t in (request.copy_common_tables or []) if t and t.strip()])
@@ -360,10 +218,13 @@ async def create_company(
         if copy_enabled and not selected_tables:
             selected_tables = {"comm_code"}
 
+        source_company = None
         if copy_enabled and selected_tables:
             source_company = (request.copy_from_company_cd or "").strip() or \
                              (current_user.get("company_cd") or get_company_cd())
-            if source_company and source_company != company_cd:
+            if source_company == company_cd:
+                source_company = None
+            if source_company:
                 source_exists = db.execute(
                     text("SELECT 1 FROM companies WHERE company_cd = :company_cd"),
                     {"company_cd": source_company}
@@ -371,25 +232,23 @@ async def create_company(
                 if not source_exists:
                     raise HTTPException(status_code=400, detail="복사 원본 회사가 존재하지 않습니다.")
 
-                copy_result = _copy_common_tables(
-                    db,
-                    source_company,
-                    company_cd,
-                    selected_tables,
-                    actor_id=current_user.get("login_id")
-                )
-                app_logger.info(
-                    "✅ 회사 공통 테이블 복사 완료",
-                    extra={
-                        "source_company": source_company,
-                        "target_company": company_cd,
-                        "copied_tables": copy_result.get("copied_tables", []),
-                        "auto_included_tables": copy_result.get("auto_included_tables", [])
-                    }
-                )
+        if not source_company:
+            _insert_company(db, company_params)
+            db.commit()
+            return {"message": "회사 등록 완료", "company_cd": company_cd}
 
-        db.commit()
-        return {"message": "회사 등록 완료", "company_cd": company_cd}
+        db.close()
+        job = submit_job(
+            current_user.get("company_cd") or get_company_cd(),
+            "company_create",
+            {
+                "company": company_params,
+                "source_company_cd": source_company,
+                "tables": sorted(selected_tables),
+            },
+            current_user.get("login_id")
+        )
+        return {"message": "회사 등록 작업 시작", "company_cd": company_cd, **job}
     except HTTPException:
         db.rollback()
         raise
@@ -399,6 +258,57 @@ async def create_company(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@register_job("company_create")
+def _run_company_create_job(ctx: JobContext) -> dict:
+    """회사 등록 + 공통 테이블 복사 (한 트랜잭션)"""
+    company = ctx.params["company"]
+    company_cd = company["company_cd"]
+    source_company = ctx.params["source_company_cd"]
+    db = ctx.session()
+    try:
+        with ctx.step("회사 등록", 5):
+            exists = db.execute(
+                text("SELECT 1 FROM companies WHERE company_cd = :company_cd"),
+                {"company_cd": company_cd}
+            ).fetchone()
+            if exists:
+                raise HTTPException(status_code=409, detail="이미 존재하는 회사 코드입니다.")
+            _insert_company(db, company)
+
+        with ctx.step("공통 테이블 복사", 95):
+            copy_result = _copy_common_tables(
+                db,
+                source_company,
+                company_cd,
+                set(ctx.params["tables"]),
+                actor_id=ctx.login_id,
+                ctx=ctx
+            )
+
+        ctx.check_cancelled()
+        db.commit()
+        app_logger.info(
+            "✅ 회사 공통 테이블 복사 완료",
+            extra={
+                "source_company": source_company,
+                "target_company": company_cd,
+                "copied_tables": copy_result.get("copied_tables", []),
+                "auto_included_tables": copy_result.get("auto_included_tables", [])
+            }
+        )
+        return {"message": "회사 등록 완료", "company_cd": company_cd, **copy_result}
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        try:
+            db.execute(text("SET FOREIGN_KEY_CHECKS=1"))
+            db.commit()
+        except Exception:
+            pass
+        db.close()
+
+
 @router.put("/{company_cd}/status")
 async def update_company_status(
     company_cd: str,
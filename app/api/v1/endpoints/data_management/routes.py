@@ -2,6 +2,8 @@
 """
 데이터 관리(회사 간 데이터 복제) API
 """
+import time
+from datetime import datetime
 from typing import List, Dict, Optional, Set, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -9,8 +11,13 @@ from pydantic import BaseModel, Field
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import engine, get_db
+from app.core.tenant import get_company_cd
+from app.core.security import get_current_user
 from app.core.logger import app_logger
+from app.services.data_copy_service import run_copy, run_sync, table_throughput
+from app.services.job_service import JobCancelled, JobContext, get_job, register_job, submit_job
+from app.services.schema_cache import get_schema, invalidate_schema_cache
 
 router = APIRouter()
 
@@ -19,24 +26,27 @@ EXCLUDED_TABLES = {
     "companies",
     "tmp_invalid_project_manager_id",
     "board_notices",
+    # 운영 테이블 (회사별 경로/상태를 담고 있어 다른 회사로 옮기면 안 됨)
+    "background_jobs",
+    "uploaded_file_blobs",
+    "upload_sessions",
+    "upload_storage_usage",
+    "sync_deletion_log",
 }
 
+# 같은 copy_id 체크포인트를 두 작업이 동시에 쓰지 않도록 잡는 MySQL 네임드 락 접두어
+DATA_COPY_LOCK_PREFIX = "psms_data_copy:"
+
 
 class DataCopyRequest(BaseModel):
     source_company_cd: str = Field(..., description="원본 회사 코드")
     target_company_cd: str = Field(..., description="대상 회사 코드")
     tables: List[str] = Field(default_factory=list, description="복제 대상 테이블 목록")
     exclude_tables: Optional[List[str]] = Field(default_factory=list, description="복제 제외 테이블 목록")
-
-
-def _build_in_clause(values: List[str], prefix: str) -> Tuple[str, Dict[str, str]]:
-    placeholders = []
-    params: Dict[str, str] = {}
-    for idx, value in enumerate(values):
-        key = f"{prefix}{idx}"
-        placeholders.append(f":{key}")
-        params[key] = value
-    return ", ".join(placeholders), params
+    batch_size: Optional[int] = Field(None, ge=1, description="청크 크기(행), 기본 DATA_COPY_BATCH_SIZE")
+    parallel: Optional[int] = Field(None, ge=1, description="같은 FK 단계 테이블 동시 처리 수, 기본 DATA_COPY_PARALLEL")
+    mode: str = Field("copy", description="copy: 대상 삭제 후 전체 복사, sync: 체크섬 비교 후 변경분만 반영")
+    dry_run: bool = Field(False, description="sync 모드에서 반영 없이 차이 리포트만 생성")
 
 
 def _normalize_tables(values: Optional[List[str]]) -> Set[str]:
@@ -45,100 +55,12 @@ def _normalize_tables(values: Optional[List[str]]) -> Set[str]:
     return {v.strip() for v in values if v and v.strip()}
 
 
-def _get_company_tables(db: Session, exclude: Optional[Set[str]] = None) -> Tuple[List[str], Dict[str, str]]:
-    rows = db.execute(text("""
-        SELECT t.table_name, t.table_comment
-        FROM information_schema.tables t
-        JOIN information_schema.columns c
-          ON c.table_schema = t.table_schema
-         AND c.table_name = t.table_name
-        WHERE t.table_schema = DATABASE()
-          AND t.table_type = 'BASE TABLE'
-          AND c.column_name = 'company_cd'
-        ORDER BY t.table_name
-    """)).fetchall()
-    tables = [row[0] for row in rows]
-    comments = {row[0]: (row[1] or "") for row in rows}
+def _get_company_tables(db: Session, exclude: Optional[Set[str]] = None, refresh: bool = False) -> Tuple[List[str], Dict[str, str]]:
+    schema = get_schema(db, refresh=refresh)
     excluded = set(EXCLUDED_TABLES)
     if exclude:
         excluded.update(exclude)
-    return [t for t in tables if t not in excluded], comments
-
-
-def _get_fk_edges(db: Session, tables: List[str]) -> List[Tuple[str, str]]:
-    if not tables:
-        return []
-    in_clause, params = _build_in_clause(tables, "t")
-    rows = db.execute(text(f"""
-        SELECT kcu.table_name AS child_table,
-               kcu.referenced_table_name AS parent_table
-        FROM information_schema.key_column_usage kcu
-        WHERE kcu.table_schema = DATABASE()
-          AND kcu.referenced_table_name IS NOT NULL
-          AND kcu.table_name IN ({in_clause})
-          AND kcu.referenced_table_name IN ({in_clause})
-    """), params).fetchall()
-    return [(row[1], row[0]) for row in rows]  # parent -> child
-
-
-def _topological_sort(tables: List[str], edges: List[Tuple[str, str]]) -> List[str]:
-    table_set = set(tables)
-    adj: Dict[str, Set[str]] = {t: set() for t in tables}
-    in_deg: Dict[str, int] = {t: 0 for t in tables}
-
-    for parent, child in edges:
-        if parent == child:
-            continue
-        if parent not in table_set or child not in table_set:
-            continue
-        if child not in adj[parent]:
-            adj[parent].add(child)
-            in_deg[child] += 1
-
-    queue = [t for t in tables if in_deg[t] == 0]
-    result: List[str] = []
-    while queue:
-        node = queue.pop(0)
-        result.append(node)
-        for nxt in adj[node]:
-            in_deg[nxt] -= 1
-            if in_deg[nxt] == 0:
-                queue.append(nxt)
-
-    if len(result) < len(tables):
-        # 사이클 등으로 인해 누락된 테이블은 원래 순서로 추가
-        for t in tables:
-            if t not in result:
-                result.append(t)
-    return result
-
-
-def _expand_with_parents(selected: Set[str], edges: List[Tuple[str, str]]) -> Set[str]:
-    # edges: parent -> child
-    parents_map: Dict[str, Set[str]] = {}
-    for parent, child in edges:
-        parents_map.setdefault(child, set()).add(parent)
-
-    expanded = set(selected)
-    queue = list(selected)
-    while queue:
-        child = queue.pop(0)
-        for parent in parents_map.get(child, set()):
-            if parent not in expanded:
-                expanded.add(parent)
-                queue.append(parent)
-    return expanded
-
-
-def _get_columns(db: Session, table: str) -> List[str]:
-    rows = db.execute(text("""
-        SELECT column_name
-        FROM information_schema.columns
-        WHERE table_schema = DATABASE()
-          AND table_name = :table
-        ORDER BY ordinal_position
-    """), {"table": table}).fetchall()
-    return [row[0] for row in rows]
+    return [t for t in schema.company_tables if t not in excluded], schema.comments
 
 
 @router.get("/tables")
@@ -151,6 +73,7 @@ async def list_tables(
     try:
         exclude = _normalize_tables(exclude_tables.split(",")) if exclude_tables else set()
         tables, comments = _get_company_tables(db, exclude)
+        schema = get_schema(db)
         items = []
         for table in tables:
             src_cnt = db.execute(
@@ -165,7 +88,9 @@ async def list_tables(
                 "table_name": table,
                 "table_comment": comments.get(table, ""),
                 "source_count": int(src_cnt),
-                "target_count": int(tgt_cnt)
+                "target_count": int(tgt_cnt),
+                # 비어 있지 않으면 copy 모드로 복제 불가 (sync 모드는 건너뜀)
+                "global_unique_keys": schema.global_unique_keys(table)
             })
         return {
             "items": items,
@@ -176,13 +101,37 @@ async def list_tables(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/copy")
-async def copy_tables(
-    request: DataCopyRequest,
-    db: Session = Depends(get_db)
-):
-    source = (request.source_company_cd or "").strip()
-    target = (request.target_company_cd or "").strip()
+@router.post("/schema/refresh")
+async def refresh_schema(db: Session = Depends(get_db)):
+    """스키마 메타데이터 캐시 갱신 (DDL 반영 후 사용, 공유 버전을 올려 다른 워커도 다음 조회 시 갱신)"""
+    try:
+        invalidate_schema_cache(db)
+        db.commit()
+        schema = get_schema(db)
+        return {
+            "table_count": len(schema.comments),
+            "company_table_count": len(schema.company_tables),
+            "fk_count": len(schema.fk_edges),
+        }
+    except Exception as e:
+        app_logger.error(f"❌ 스키마 캐시 갱신 실패: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _plan_copy(
+    db: Session,
+    source: str,
+    target: str,
+    tables: List[str],
+    exclude_tables: Optional[List[str]],
+    refresh: bool = False,
+    mode: str = "copy"
+) -> dict:
+    """
+    복제 대상 검증/확장 (요청 시 캐시 기준 검증, 작업 시작 시 스키마를 다시 읽어 계산)
+    - copy 모드: 회사 구분 없는 유일 키가 있는 테이블은 원본 키 그대로 넣으면 항상 중복 키 오류
+      → 대상 삭제 전에 400으로 거부 (sync 모드는 해당 테이블을 건너뜀)
+    """
     if not source or not target:
         raise HTTPException(status_code=400, detail="source/target company_cd is required")
     if source == target:
@@ -197,138 +146,289 @@ async def copy_tables(
         if not exists:
             raise HTTPException(status_code=400, detail=f"회사 코드가 존재하지 않습니다: {cd}")
 
-    exclude = _normalize_tables(request.exclude_tables)
-    tables, _ = _get_company_tables(db, exclude)
-    table_set = set(tables)
-    selected = {t for t in request.tables if t in table_set}
+    exclude = _normalize_tables(exclude_tables)
+    all_tables, _ = _get_company_tables(db, exclude, refresh=refresh)
+    table_set = set(all_tables)
+    selected = {t for t in tables if t in table_set}
     if not selected:
         raise HTTPException(status_code=400, detail="복제할 테이블을 선택하세요.")
 
     # FK 기반 부모 테이블 자동 포함
-    edges = _get_fk_edges(db, tables)
-    expanded = _expand_with_parents(selected, edges)
-    expanded = {t for t in expanded if t not in EXCLUDED_TABLES and t not in exclude}
-    copy_tables_list = [t for t in tables if t in expanded]
+    schema = get_schema(db)
+    expanded = schema.expand_with_parents(selected, all_tables)
+    copy_tables_list = [t for t in all_tables if t in expanded]
+    if mode == "copy":
+        conflicts = [
+            f"{t}({', '.join(schema.global_unique_keys(t))})"
+            for t in copy_tables_list if schema.global_unique_keys(t)
+        ]
+        if conflicts:
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    "회사 구분 없는 유일 키가 있어 복제할 수 없는 테이블이 포함되어 있습니다: "
+                    f"{', '.join(conflicts)} — 제외 테이블로 지정하세요."
+                )
+            )
+    return {
+        "exclude": exclude,
+        "selected": selected,
+        "expanded": expanded,
+        "copy_tables_list": copy_tables_list,
+        "levels": schema.levels(copy_tables_list),
+        "schema": schema,
+    }
 
-    insert_order = _topological_sort(copy_tables_list, edges)
-    delete_order = list(reversed(insert_order))
 
-    results = []
-    report = {
+@router.post("/copy", status_code=202)
+async def copy_tables(
+    request: DataCopyRequest,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    회사 간 테이블 복제 (백그라운드 작업)
+    요청 검증 후 job_id 반환 → /jobs/{job_id} 에서 진행률과 결과(results/report) 조회
+    실패/취소 시 job_id를 copy_id로 /copy/{copy_id}/resume 호출하면 마지막 체크포인트부터 이어서 실행
+    mode=sync: 변경분만 반영 (dry_run=true면 차이 리포트만), 중단돼도 다시 실행하면 남은 차이만 반영
+    """
+    source = (request.source_company_cd or "").strip()
+    target = (request.target_company_cd or "").strip()
+    mode = (request.mode or "copy").strip().lower()
+    if mode not in ("copy", "sync"):
+        raise HTTPException(status_code=400, detail="mode는 copy 또는 sync 입니다.")
+    if request.dry_run and mode != "sync":
+        raise HTTPException(status_code=400, detail="dry_run은 sync 모드에서만 사용할 수 있습니다.")
+    _plan_copy(db, source, target, request.tables, request.exclude_tables, mode=mode)
+    db.close()
+    company_cd = current_user.get("company_cd") or get_company_cd()
+    return submit_job(company_cd, "data_copy", {
         "source_company_cd": source,
         "target_company_cd": target,
-        "selected_tables": sorted(list(selected)),
-        "auto_included_tables": sorted([t for t in expanded if t not in selected]),
-        "excluded_tables": sorted(list(EXCLUDED_TABLES | exclude)),
-        "totals": {}
-    }
+        "tables": list(request.tables),
+        "exclude_tables": list(request.exclude_tables or []),
+        "batch_size": request.batch_size,
+        "parallel": request.parallel,
+        "mode": mode,
+        "dry_run": bool(request.dry_run),
+    }, current_user.get("login_id"))
+
+
+@router.post("/copy/{copy_id}/resume", status_code=202)
+async def resume_copy(
+    copy_id: str,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """실패/취소된 복제를 같은 요청 조건으로 이어서 실행 (새 job_id 반환)"""
+    company_cd = current_user.get("company_cd") or get_company_cd()
+    job = get_job(db, company_cd, copy_id)
+    if not job or job["job_type"] != "data_copy":
+        raise HTTPException(status_code=404, detail="복제 작업을 찾을 수 없습니다.")
+    if job["status"] not in ("FAILED", "CANCELLED"):
+        raise HTTPException(status_code=409, detail="실패/취소된 복제만 이어서 실행할 수 있습니다.")
+    params = dict(job["params"] or {})
+    # 이어하기의 이어하기도 최초 copy_id의 체크포인트 사용
+    params["copy_id"] = params.get("copy_id") or copy_id
+    if _active_copy_job(db, company_cd, params["copy_id"]):
+        raise HTTPException(status_code=409, detail="같은 복제를 이어서 실행 중인 작업이 있습니다.")
+    _plan_copy(
+        db, params["source_company_cd"], params["target_company_cd"], params["tables"], params.get("exclude_tables"),
+        mode=params.get("mode") or "copy"
+    )
+    db.close()
+    return submit_job(company_cd, "data_copy", params, current_user.get("login_id"))
+
+
+def _active_copy_job(db: Session, company_cd: str, copy_id: str) -> Optional[str]:
+    """같은 copy_id 체크포인트를 사용하는 대기/실행 중 복제 작업 ID"""
+    return db.execute(text("""
+        SELECT job_id
+        FROM background_jobs
+        WHERE company_cd = :company_cd
+          AND job_type = 'data_copy'
+          AND status IN ('QUEUED', 'RUNNING')
+          AND (
+              job_id = :copy_id
+              OR JSON_UNQUOTE(JSON_EXTRACT(params, '$.copy_id')) = :copy_id
+          )
+        LIMIT 1
+    """), {"company_cd": company_cd, "copy_id": copy_id}).scalar()
+
+
+@register_job("data_copy")
+def _run_copy_job(ctx: JobContext) -> dict:
+    source = ctx.params["source_company_cd"]
+    target = ctx.params["target_company_cd"]
+    copy_id = ctx.params.get("copy_id") or ctx.job_id
+    plan = None
     try:
-        start_time = db.execute(text("SELECT NOW()")).scalar()
-
-        # 사전 건수 집계
-        source_counts: Dict[str, int] = {}
-        target_counts_before: Dict[str, int] = {}
-        for table in copy_tables_list:
-            source_counts[table] = int(db.execute(
-                text(f"SELECT COUNT(*) FROM `{table}` WHERE company_cd = :company_cd"),
-                {"company_cd": source}
-            ).scalar() or 0)
-            target_counts_before[table] = int(db.execute(
-                text(f"SELECT COUNT(*) FROM `{table}` WHERE company_cd = :company_cd"),
-                {"company_cd": target}
-            ).scalar() or 0)
-
-        db.execute(text("SET FOREIGN_KEY_CHECKS=0"))
-
-        # delete target data (child -> parent)
-        delete_counts: Dict[str, int] = {}
-        for table in delete_order:
-            res = db.execute(
-                text(f"DELETE FROM `{table}` WHERE company_cd = :company_cd"),
-                {"company_cd": target}
+        db = ctx.session()
+        try:
+            with ctx.step("복제 대상 확인", 2):
+                plan = _plan_copy(
+                    db, source, target, ctx.params["tables"], ctx.params.get("exclude_tables"),
+                    refresh=True, mode=ctx.params.get("mode") or "copy"
+                )
+                start_time = db.execute(text("SELECT NOW()")).scalar()
+        finally:
+            db.close()
+
+        started = time.perf_counter()
+        if ctx.params.get("mode") == "sync":
+            stats = run_sync(
+                ctx, plan["schema"], source, target, plan["levels"],
+                dry_run=bool(ctx.params.get("dry_run")),
+                batch_size=ctx.params.get("batch_size"),
+                parallel=ctx.params.get("parallel")
             )
-            delete_counts[table] = int(res.rowcount or 0)
-
-        # insert from source to target (parent -> child)
-        insert_counts: Dict[str, int] = {}
-        for table in insert_order:
-            cols = _get_columns(db, table)
-            col_list = ", ".join([f"`{c}`" for c in cols])
-            select_list = ", ".join([
-                (":target_company AS `company_cd`" if c == "company_cd" else f"`{c}`")
-                for c in cols
-            ])
-            sql = f"""
-                INSERT INTO `{table}` ({col_list})
-                SELECT {select_list}
-                FROM `{table}`
-                WHERE company_cd = :source_company
-            """
-            res = db.execute(text(sql), {
-                "source_company": source,
-                "target_company": target
+            result = _sync_result(plan, source, target, stats, bool(ctx.params.get("dry_run")), str(start_time))
+            result["report"]["totals"]["elapsed_ms"] = int((time.perf_counter() - started) * 1000)
+            _write_copy_log({
+                "status": "OK",
+                "job_id": ctx.job_id,
+                "mode": "sync",
+                "report": result["report"],
+                "results": result["results"]
             })
-            insert_counts[table] = int(res.rowcount or 0)
-
-        # 사후 건수 집계
-        target_counts_after: Dict[str, int] = {}
-        for table in copy_tables_list:
-            target_counts_after[table] = int(db.execute(
-                text(f"SELECT COUNT(*) FROM `{table}` WHERE company_cd = :company_cd"),
-                {"company_cd": target}
-            ).scalar() or 0)
-
-        db.commit()
-
-        for table in copy_tables_list:
-            results.append({
-                "table_name": table,
-                "source_count": source_counts.get(table, 0),
-                "target_before": target_counts_before.get(table, 0),
-                "target_after": target_counts_after.get(table, 0),
-                "deleted": delete_counts.get(table, 0),
-                "inserted": insert_counts.get(table, 0),
-                "status": "OK" if table in expanded else "SKIP",
-                "auto_included": table not in selected
-            })
-
-        end_time = db.execute(text("SELECT NOW()")).scalar()
-        report["totals"] = {
-            "table_count": len(copy_tables_list),
-            "deleted_total": sum(delete_counts.values()),
-            "inserted_total": sum(insert_counts.values()),
-            "source_total": sum(source_counts.values()),
-            "target_before_total": sum(target_counts_before.values()),
-            "target_after_total": sum(target_counts_after.values()),
-            "started_at": str(start_time),
-            "ended_at": str(end_time)
-        }
-
+            return result
+
+        # 이어하기 요청이 동시에 들어와도 체크포인트는 한 작업만 사용 (워커 간 네임드 락)
+        with engine.connect() as lock_conn:
+            lock_name = f"{DATA_COPY_LOCK_PREFIX}{copy_id}"
+            if not lock_conn.execute(text("SELECT GET_LOCK(:name, 0)"), {"name": lock_name}).scalar():
+                raise RuntimeError("같은 복제를 실행 중인 작업이 있습니다.")
+            try:
+                checkpoints = run_copy(
+                    ctx, plan["schema"], copy_id, source, target, plan["levels"],
+                    batch_size=ctx.params.get("batch_size"),
+                    parallel=ctx.params.get("parallel")
+                )
+            finally:
+                lock_conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": lock_name})
+        result = _copy_result(plan, source, target, copy_id, checkpoints, str(start_time))
+        result["report"]["totals"]["elapsed_ms"] = int((time.perf_counter() - started) * 1000)
         _write_copy_log({
             "status": "OK",
-            "report": report,
-            "results": results
+            "job_id": ctx.job_id,
+            "copy_id": copy_id,
+            "report": result["report"],
+            "results": result["results"]
         })
-
-        return {"results": results, "expanded_tables": list(expanded), "report": report}
+        return result
     except Exception as e:
-        db.rollback()
         _write_copy_log({
-            "status": "ERROR",
-            "error": str(e),
+            "status": "CANCELLED" if isinstance(e, JobCancelled) else "ERROR",
+            "job_id": ctx.job_id,
+            "mode": ctx.params.get("mode") or "copy",
+            "copy_id": copy_id,
+            "error": str(getattr(e, "detail", e)),
             "source_company_cd": source,
             "target_company_cd": target,
-            "selected_tables": list(selected),
-            "excluded_tables": list(EXCLUDED_TABLES | exclude)
+            "selected_tables": sorted(plan["selected"]) if plan else ctx.params["tables"],
+            "excluded_tables": sorted(EXCLUDED_TABLES | (plan["exclude"] if plan else set()))
         })
-        app_logger.error(f"❌ 데이터 복제 실패: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        try:
-            db.execute(text("SET FOREIGN_KEY_CHECKS=1"))
-            db.commit()
-        except Exception:
-            pass
+        raise
+
+
+def _copy_result(plan: dict, source: str, target: str, copy_id: str, checkpoints: Dict[str, dict], started_at: str) -> dict:
+    """
+    체크포인트 → 테이블별 결과/리포트
+    대상은 전부 삭제 후 복사하므로 target_before = 삭제 건수, target_after = source_count = 복사 건수
+    (이어하기의 경우 이전 실행분 포함 누적)
+    """
+    selected = plan["selected"]
+    expanded = plan["expanded"]
+    results = []
+    for table in plan["copy_tables_list"]:
+        stats = table_throughput(checkpoints.get(table, {}))
+        results.append({
+            "table_name": table,
+            "source_count": stats["inserted"],
+            "target_before": stats["deleted"],
+            "target_after": stats["inserted"],
+            **stats,
+            "status": "OK" if table in expanded else "SKIP",
+            "auto_included": table not in selected
+        })
+
+    copy_ms = sum(r["copy_ms"] for r in results)
+    inserted_total = sum(r["inserted"] for r in results)
+    report = {
+        "copy_id": copy_id,
+        "source_company_cd": source,
+        "target_company_cd": target,
+        "selected_tables": sorted(list(selected)),
+        "auto_included_tables": sorted([t for t in expanded if t not in selected]),
+        "excluded_tables": sorted(list(EXCLUDED_TABLES | plan["exclude"])),
+        "levels": plan["levels"],
+        "totals": {
+            "table_count": len(results),
+            "deleted_total": sum(r["deleted"] for r in results),
+            "inserted_total": inserted_total,
+            "source_total": inserted_total,
+            "target_before_total": sum(r["target_before"] for r in results),
+            "target_after_total": inserted_total,
+            "chunks": sum(r["chunks"] for r in results),
+            "rows_per_sec": round(inserted_total * 1000 / copy_ms, 1) if copy_ms else None,
+            "started_at": started_at,
+            "ended_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+    }
+    return {"results": results, "expanded_tables": list(expanded), "report": report}
+
+
+def _sync_result(plan: dict, source: str, target: str, stats: Dict[str, dict], dry_run: bool, started_at: str) -> dict:
+    """동기화 통계 → 테이블별 결과/리포트 (dry_run이면 반영 예정 건수와 PK 예시)"""
+    selected = plan["selected"]
+    expanded = plan["expanded"]
+    results = []
+    for table in plan["copy_tables_list"]:
+        item = stats.get(table, {})
+        elapsed_ms = int(item.get("elapsed_ms") or 0)
+        results.append({
+            "table_name": table,
+            "chunks": item.get("chunks", 0),
+            "diff_chunks": item.get("diff_chunks", 0),
+            "scanned": item.get("scanned", 0),
+            "inserted": item.get("inserted", 0),
+            "updated": item.get("updated", 0),
+            "deleted": item.get("deleted", 0),
+            "full_replace": item.get("full_replace", False),
+            "samples": item.get("samples", {}),
+            "elapsed_ms": elapsed_ms,
+            "rows_per_sec": round(item.get("scanned", 0) * 1000 / elapsed_ms, 1) if elapsed_ms else None,
+            "status": "SKIP" if item.get("skipped") else (
+                ("DIFF" if dry_run else "SYNCED") if item.get("diff_chunks") else "SAME"
+            ),
+            "skip_reason": item.get("skipped"),
+            "auto_included": table not in selected
+        })
+
+    report = {
+        "mode": "sync",
+        "dry_run": dry_run,
+        "source_company_cd": source,
+        "target_company_cd": target,
+        "selected_tables": sorted(list(selected)),
+        "auto_included_tables": sorted([t for t in expanded if t not in selected]),
+        "excluded_tables": sorted(list(EXCLUDED_TABLES | plan["exclude"])),
+        "levels": plan["levels"],
+        "totals": {
+            "table_count": len(results),
+            "changed_tables": sum(1 for r in results if r["diff_chunks"]),
+            "skipped_tables": sorted(r["table_name"] for r in results if r["status"] == "SKIP"),
+            "chunks": sum(r["chunks"] for r in results),
+            "diff_chunks": sum(r["diff_chunks"] for r in results),
+            "scanned_total": sum(r["scanned"] for r in results),
+            "inserted_total": sum(r["inserted"] for r in results),
+            "updated_total": sum(r["updated"] for r in results),
+            "deleted_total": sum(r["deleted"] for r in results),
+            "started_at": started_at,
+            "ended_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+    }
+    return {"results": results, "expanded_tables": list(expanded), "report": report}
 
 
 def _write_copy_log(payload: dict) -> None:
@@ -1,35 +1,135 @@
 # -*- coding: utf-8 -*-
 """
-파일 업로드 API
+파일 업로드/다운로드 API
 """
-import uuid
+import asyncio
+import mimetypes
+import re
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
+from typing import Optional, Tuple
+from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, Header, HTTPException, Query, Request, UploadFile
+from fastapi.responses import FileResponse, Response
+from pydantic import BaseModel
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
-from app.core.config import BASE_DIR
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.tenant import get_company_cd
-from app.core.security import get_current_user
+from app.core.security import get_current_user, oauth2_scheme
 from app.core.logger import app_logger
+from app.core.permissions import permission_required
+from app.services.file_storage_service import (
+    ALLOWED_EXTS,
+    DOWNLOAD_SIGNATURE_PURPOSE,
+    UPLOAD_ROOT,
+    UploadTooLargeError,
+    acquire_blob,
+    find_blob,
+    preview_signature_purpose,
+    receive_upload,
+    register_uploaded_file,
+    sign_file_url,
+    verify_file_signature,
+)
+from app.services.file_preview_service import (
+    PREVIEW_VARIANTS,
+    file_preview_worker,
+    is_previewable,
+    variant_path,
+)
+from app.services.upload_gc_service import get_storage_usage, run_gc
+from app.services.upload_session_service import (
+    UploadSessionError,
+    abort_session,
+    create_session,
+    get_session,
+    mark_done,
+    session_view,
+    verify_complete,
+    write_chunk,
+)
 
 router = APIRouter()
+# 헤더 없이 접근하는 <a>/<img>/<video> 서명 URL 다운로드용 (Bearer 인증/권한 체크는 라우트에서 수행)
+download_router = APIRouter()
 
-UPLOAD_ROOT = Path(BASE_DIR) / "static" / "uploads"
-MAX_UPLOAD_BYTES = 20 * 1024 * 1024  # 20MB
-ALLOWED_EXTS = {
-    ".pdf", ".xlsx", ".xls", ".doc", ".docx", ".ppt", ".pptx",
-    ".txt", ".csv", ".zip", ".hwp",
-    ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp", ".svg",
-    ".mp4", ".mov", ".avi", ".mkv", ".mp3", ".wav"
-}
+_SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+class FileDedupRequest(BaseModel):
+    sha256: str
+    file_name: str
+    size: int
+    mime_type: Optional[str] = None
+
+
+class UploadSessionCreateRequest(BaseModel):
+    file_name: str
+    size: int
+    mime_type: Optional[str] = None
+    sha256: Optional[str] = None
+
+
+class UploadSessionCompleteRequest(BaseModel):
+    sha256: Optional[str] = None
+
+
+def _validate_name(file_name: str) -> Tuple[str, str]:
+    original_name = Path(file_name).name
+    ext = Path(original_name).suffix.lower()
+    if ext not in ALLOWED_EXTS:
+        raise HTTPException(status_code=400, detail="지원하지 않는 파일 확장자입니다.")
+    return original_name, ext
+
+
+@router.post("/dedup")
+async def dedup_file(
+    request: FileDedupRequest,
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    업로드 전 내용 해시 확인 — 같은 회사에 같은 내용이 있으면 전송 없이 등록
+    반환: found=false 이면 클라이언트가 /upload 로 전송
+    """
+    try:
+        company_cd = current_user.get("company_cd") or get_company_cd()
+        sha256 = (request.sha256 or "").strip().lower()
+        if not _SHA256_RE.match(sha256):
+            raise HTTPException(status_code=400, detail="sha256 형식이 올바르지 않습니다.")
+        original_name, _ = _validate_name(request.file_name or "")
+        blob = find_blob(db, company_cd, sha256)
+        # 크기가 다르거나 디스크에 없는 blob은 재사용하지 않음
+        if not blob or int(blob["file_size"] or 0) != request.size or not Path(blob["file_path"]).exists():
+            return {"found": False}
+        blob = acquire_blob(db, company_cd, sha256, "", blob["file_size"], blob["mime_type"])
+        if not blob:
+            # 확인 직후 정리 작업이 파일을 삭제함 → 전송 요청
+            db.rollback()
+            return {"found": False}
+        uploaded = register_uploaded_file(
+            db, company_cd, original_name, blob,
+            request.mime_type, current_user.get("login_id")
+        )
+        db.commit()
+        return {"found": True, **uploaded}
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        db.rollback()
+        app_logger.error(f"❌ 파일 중복 확인 실패: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/upload")
 async def upload_file(
     file: UploadFile = File(...),
+    content_sha256: Optional[str] = Header(None, alias="X-Content-SHA256"),
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -38,88 +138,32 @@ async def upload_file(
         if not file or not file.filename:
             raise HTTPException(status_code=400, detail="file is required")
 
-        original_name = Path(file.filename).name
-        ext = Path(original_name).suffix.lower()
-        if ext not in ALLOWED_EXTS:
-            raise HTTPException(status_code=400, detail="지원하지 않는 파일 확장자입니다.")
-        stored_name = f"{uuid.uuid4().hex}{ext}"
-
-        company_dir = UPLOAD_ROOT / company_cd
-        company_dir.mkdir(parents=True, exist_ok=True)
-
-        file_path = company_dir / stored_name
-        total_bytes = 0
+        original_name, ext = _validate_name(file.filename)
         try:
-            with file_path.open("wb") as buffer:
-                while True:
-                    chunk = await file.read(1024 * 1024)
-                    if not chunk:
-                        break
-                    total_bytes += len(chunk)
-                    if total_bytes > MAX_UPLOAD_BYTES:
-                        raise HTTPException(status_code=413, detail="파일 용량 제한을 초과했습니다.")
-                    buffer.write(chunk)
-        except HTTPException:
-            if file_path.exists():
-                file_path.unlink(missing_ok=True)
-            raise
-
-        file_size = file_path.stat().st_size if file_path.exists() else total_bytes
+            temp_path, sha256, file_size = await receive_upload(company_cd, file)
+        except UploadTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        if content_sha256 and content_sha256.strip().lower() != sha256:
+            temp_path.unlink(missing_ok=True)
+            raise HTTPException(status_code=400, detail="파일 해시가 일치하지 않습니다.")
+
         mime_type = file.content_type or ""
-        file_url = f"/static/uploads/{company_cd}/{stored_name}"
-
-        result = db.execute(text("""
-            INSERT INTO uploaded_files (
-                company_cd, original_name, stored_name, file_path, file_url,
-                mime_type, file_size, created_by, updated_by
-            ) VALUES (
-                :company_cd, :original_name, :stored_name, :file_path, :file_url,
-                :mime_type, :file_size, :created_by, :updated_by
-            )
-        """), {
-            "company_cd": company_cd,
-            "original_name": original_name,
-            "stored_name": stored_name,
-            "file_path": str(file_path),
-            "file_url": file_url,
-            "mime_type": mime_type,
-            "file_size": file_size,
-            "created_by": current_user.get("login_id"),
-            "updated_by": current_user.get("login_id")
-        })
-        file_id = None
-        try:
-            file_id = result.lastrowid
-        except Exception:
-            file_id = None
+        # 같은 내용이 이미 있으면 임시 파일은 버리고 기존 blob 참조
+        blob = acquire_blob(db, company_cd, sha256, ext, file_size, mime_type, temp_path)
+        uploaded = register_uploaded_file(
+            db, company_cd, original_name, blob, mime_type, current_user.get("login_id")
+        )
         db.commit()
-        if not file_id:
-            file_id = db.execute(text("SELECT LAST_INSERT_ID()")).scalar()
-        if not file_id:
-            file_id = db.execute(text("""
-                SELECT file_id
-                FROM uploaded_files
-                WHERE company_cd = :company_cd
-                  AND stored_name = :stored_name
-                ORDER BY file_id DESC
-                LIMIT 1
-            """), {"company_cd": company_cd, "stored_name": stored_name}).scalar()
-
-        return {
-            "file_id": file_id,
-            "url": file_url,
-            "file_name": original_name,
-            "mime_type": mime_type,
-            "size": file_size
-        }
+        file_preview_worker.enqueue(blob["file_path"], original_name)
+        return uploaded
     except HTTPException:
         db.rollback()
         raise
     except Exception as e:
         db.rollback()
         try:
-            if "file_path" in locals() and file_path and file_path.exists():
-                file_path.unlink(missing_ok=True)
+            if "temp_path" in locals() and temp_path and temp_path.exists():
+                temp_path.unlink(missing_ok=True)
         except Exception:
             pass
         app_logger.error(f"❌ 파일 업로드 실패: {e}", exc_info=True)
@@ -129,3 +173,382 @@ async def upload_file(
             await file.close()
         except Exception:
             pass
+
+
+def _upload_session_error(e: UploadSessionError) -> HTTPException:
+    headers = None
+    if e.received_bytes is not None:
+        headers = {"Upload-Offset": str(e.received_bytes)}
+    return HTTPException(status_code=e.status_code, detail=str(e), headers=headers)
+
+
+@router.post("/uploads")
+async def create_upload_session(
+    request: UploadSessionCreateRequest,
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    분할 업로드 세션 생성
+    - sha256을 함께 보내고 같은 내용이 이미 있으면 전송 없이 바로 등록 (found=true)
+    - 이후 PUT /uploads/{upload_id}?offset=N 으로 청크 전송, POST /uploads/{upload_id}/complete 로 완료
+    """
+    try:
+        company_cd = current_user.get("company_cd") or get_company_cd()
+        login_id = current_user.get("login_id")
+        original_name, _ = _validate_name(request.file_name or "")
+        if request.size <= 0:
+            raise HTTPException(status_code=400, detail="파일 크기가 올바르지 않습니다.")
+        if request.size > settings.RESUMABLE_UPLOAD_MAX_BYTES:
+            raise HTTPException(status_code=413, detail="파일 용량 제한을 초과했습니다.")
+        sha256 = (request.sha256 or "").strip().lower() or None
+        if sha256 and not _SHA256_RE.match(sha256):
+            raise HTTPException(status_code=400, detail="sha256 형식이 올바르지 않습니다.")
+
+        if sha256:
+            blob = find_blob(db, company_cd, sha256)
+            if blob and int(blob["file_size"] or 0) == request.size and Path(blob["file_path"]).exists():
+                blob = acquire_blob(db, company_cd, sha256, "", blob["file_size"], blob["mime_type"])
+                if blob:
+                    uploaded = register_uploaded_file(
+                        db, company_cd, original_name, blob, request.mime_type, login_id
+                    )
+                    db.commit()
+                    return {"found": True, **uploaded}
+                db.rollback()
+
+        session = create_session(
+            db, company_cd, original_name, request.size, request.mime_type, sha256, login_id
+        )
+        db.commit()
+        return {"found": False, **session}
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        db.rollback()
+        app_logger.error(f"❌ 업로드 세션 생성 실패: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/uploads/{upload_id}")
+async def get_upload_session(
+    upload_id: str,
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """업로드 세션 상태 (재개 시 received_bytes부터 이어서 전송)"""
+    company_cd = current_user.get("company_cd") or get_company_cd()
+    session = get_session(db, company_cd, upload_id)
+    if not session or session["created_by"] != current_user.get("login_id"):
+        raise HTTPException(status_code=404, detail="업로드 세션을 찾을 수 없습니다.")
+    return session_view(session)
+
+
+@router.put("/uploads/{upload_id}")
+async def put_upload_chunk(
+    upload_id: str,
+    request: Request,
+    offset: int = Query(..., ge=0),
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """청크 전송 (요청 본문 = 원본 바이트, 본문은 메모리에 모으지 않고 임시 파일에 바로 기록)"""
+    company_cd = current_user.get("company_cd") or get_company_cd()
+    try:
+        return await write_chunk(
+            db, company_cd, upload_id, offset, request.stream(), current_user.get("login_id")
+        )
+    except UploadSessionError as e:
+        db.rollback()
+        raise _upload_session_error(e)
+    except Exception as e:
+        db.rollback()
+        app_logger.error(f"❌ 업로드 청크 기록 실패: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/uploads/{upload_id}/complete")
+async def complete_upload_session(
+    upload_id: str,
+    request: UploadSessionCompleteRequest,
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """업로드 완료 — 크기/해시 검증 후 blob 저장소로 이동하고 uploaded_files 등록"""
+    company_cd = current_user.get("company_cd") or get_company_cd()
+    login_id = current_user.get("login_id")
+    try:
+        session = await verify_complete(db, company_cd, upload_id, request.sha256, login_id)
+        _, ext = _validate_name(session["original_name"])
+        blob = acquire_blob(
+            db, company_cd, session["sha256"], ext, int(session["total_size"]),
+            session["mime_type"], Path(session["part_path"])
+        )
+        uploaded = register_uploaded_file(
+            db, company_cd, session["original_name"], blob, session["mime_type"], login_id
+        )
+        mark_done(db, company_cd, upload_id, uploaded["file_id"])
+        db.commit()
+        file_preview_worker.enqueue(blob["file_path"], session["original_name"])
+        return uploaded
+    except UploadSessionError as e:
+        db.rollback()
+        raise _upload_session_error(e)
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        db.rollback()
+        app_logger.error(f"❌ 업로드 완료 처리 실패: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.delete("/uploads/{upload_id}")
+async def abort_upload_session(
+    upload_id: str,
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """업로드 취소 (임시 파일 삭제)"""
+    company_cd = current_user.get("company_cd") or get_company_cd()
+    try:
+        abort_session(db, company_cd, upload_id, current_user.get("login_id"))
+        return {"message": "업로드가 취소되었습니다."}
+    except UploadSessionError as e:
+        db.rollback()
+        raise _upload_session_error(e)
+    except Exception as e:
+        db.rollback()
+        app_logger.error(f"❌ 업로드 취소 실패: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _is_admin(user: dict) -> bool:
+    return (user.get("role") or "").upper() == "ADMIN"
+
+
+@router.get("/storage-usage")
+async def get_upload_storage_usage(
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """회사 업로드 저장소 사용량 (마지막 정리 작업 기준)"""
+    if not _is_admin(current_user):
+        raise HTTPException(status_code=403, detail="관리자만 조회할 수 있습니다.")
+    company_cd = current_user.get("company_cd") or get_company_cd()
+    usage = get_storage_usage(db, company_cd)
+    return usage or {"company_cd": company_cd, "measured_at": None}
+
+
+@router.post("/gc")
+async def collect_orphan_uploads(
+    dry_run: bool = Query(True, description="true면 삭제 없이 대상 건수만 집계"),
+    current_user: dict = Depends(get_current_user)
+):
+    """미참조 업로드 파일 정리 즉시 실행 (현재 회사)"""
+    if not _is_admin(current_user):
+        raise HTTPException(status_code=403, detail="관리자만 실행할 수 있습니다.")
+    company_cd = current_user.get("company_cd") or get_company_cd()
+    try:
+        reports = await asyncio.to_thread(run_gc, company_cd, dry_run, True)
+    except Exception as e:
+        app_logger.error(f"❌ 업로드 정리 실행 실패: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+    if reports is None:
+        raise HTTPException(status_code=409, detail="다른 정리 작업이 실행 중입니다.")
+    return reports[0] if reports else {"company_cd": company_cd}
+
+
+# 인라인 표시 시에도 스크립트 실행 가능성이 있는 형식은 첨부로만 전송
+_ATTACHMENT_ONLY_TYPES = {"image/svg+xml", "text/html", "application/xhtml+xml", "text/xml", "application/xml"}
+
+
+async def _download_company_cd(
+    request: Request,
+    purpose: str,
+    file_id: int,
+    cd: Optional[str],
+    exp: Optional[int],
+    sig: Optional[str],
+    db: Session
+) -> str:
+    """
+    서명 URL 또는 Bearer 토큰으로 다운로드 회사 확인
+    - 서명 URL: 발급(/link) 시점에 권한을 확인했으므로 서명/만료만 검증
+      (purpose가 다른 서명 — 예: 썸네일 서명으로 원본 다운로드 — 은 거부)
+    - Bearer 토큰: 공지사항 화면 조회 권한 확인 (라우터 단위 권한 체크 대신)
+    """
+    if sig:
+        if not cd or not exp or not verify_file_signature(purpose, cd, file_id, exp, sig):
+            raise HTTPException(status_code=403, detail="다운로드 링크가 유효하지 않거나 만료되었습니다.")
+        return cd
+    token = await oauth2_scheme(request)
+    current_user = await get_current_user(token=token, db=db)
+    await permission_required("notices", "view")(request, current_user, db)
+    return current_user.get("company_cd") or get_company_cd()
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match는 약한 비교 (W/ 접두어 무시)
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def _not_modified(request: Request, etag: Optional[str], mtime: float) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag:
+        return _etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and not if_none_match:
+        try:
+            return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+@router.get("/{file_id}/link")
+async def get_file_link(
+    file_id: int,
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """<a>/<video> 등 헤더 없이 접근하는 링크용 단기 서명 URL (API 루트 기준 경로)"""
+    company_cd = current_user.get("company_cd") or get_company_cd()
+    exists = db.execute(text("""
+        SELECT 1
+        FROM uploaded_files
+        WHERE company_cd = :company_cd
+          AND file_id = :file_id
+    """), {"company_cd": company_cd, "file_id": file_id}).fetchone()
+    if not exists:
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+    path, expires = sign_file_url(company_cd, file_id)
+    return {"url": path, "expires_at": expires}
+
+
+@download_router.api_route("/{file_id}/preview", methods=["GET", "HEAD"])
+async def get_file_preview(
+    file_id: int,
+    request: Request,
+    variant: str = Query("thumb", pattern="^(thumb|preview)$"),
+    cd: Optional[str] = Query(None, description="서명 URL: 회사 코드"),
+    exp: Optional[int] = Query(None, description="서명 URL: 만료 epoch 초"),
+    sig: Optional[str] = Query(None, description="서명 URL: 서명"),
+    db: Session = Depends(get_db)
+):
+    """
+    이미지 첨부 썸네일(thumb)/미리보기(preview) 전송
+    - 파생 파일은 원본 내용에서만 만들어지므로 file_id 기준으로 불변 → 장기 캐시
+    - 아직 생성 전이면 생성 큐에 넣고 404 (클라이언트는 원본 사용)
+    """
+    company_cd = await _download_company_cd(
+        request, preview_signature_purpose(variant), file_id, cd, exp, sig, db
+    )
+    row = db.execute(text("""
+        SELECT original_name, file_path, sha256
+        FROM uploaded_files
+        WHERE company_cd = :company_cd
+          AND file_id = :file_id
+    """), {"company_cd": company_cd, "file_id": file_id}).fetchone()
+    db.close()
+    if not row or not is_previewable(row.original_name):
+        raise HTTPException(status_code=404, detail="미리보기를 찾을 수 없습니다.")
+
+    root = UPLOAD_ROOT.resolve()
+    preview_path = variant_path(row.file_path, variant).resolve()
+    if root not in preview_path.parents or not preview_path.is_file():
+        file_preview_worker.enqueue(row.file_path, row.original_name)
+        raise HTTPException(status_code=404, detail="미리보기를 준비 중입니다.")
+
+    stat_result = preview_path.stat()
+    etag = f'"{row.sha256}-{variant}{PREVIEW_VARIANTS[variant]}"' if row.sha256 else None
+    headers = {
+        "cache-control": "private, max-age=31536000, immutable",
+        "x-content-type-options": "nosniff",
+    }
+    if etag:
+        headers["etag"] = etag
+    if _not_modified(request, etag, stat_result.st_mtime):
+        headers["last-modified"] = formatdate(stat_result.st_mtime, usegmt=True)
+        return Response(status_code=304, headers=headers)
+    return FileResponse(
+        preview_path,
+        headers=headers,
+        media_type="image/jpeg",
+        stat_result=stat_result,
+    )
+
+
+@download_router.api_route("/{file_id}", methods=["GET", "HEAD"])
+async def download_file(
+    file_id: int,
+    request: Request,
+    disposition: str = Query("attachment", pattern="^(attachment|inline)$"),
+    cd: Optional[str] = Query(None, description="서명 URL: 회사 코드"),
+    exp: Optional[int] = Query(None, description="서명 URL: 만료 epoch 초"),
+    sig: Optional[str] = Query(None, description="서명 URL: 서명"),
+    db: Session = Depends(get_db)
+):
+    """
+    회사 확인 후 파일 전송
+    - Range/If-Range 부분 전송 (동영상 탐색), 내용 해시 기반 강한 ETag, 304 조건부 응답
+    - FILE_ACCEL_REDIRECT_PREFIX 설정 시 nginx X-Accel-Redirect로 넘겨 sendfile 전송
+    - 그 외에는 FileResponse 청크 스트리밍 (서버가 지원하면 ASGI pathsend)
+    """
+    company_cd = await _download_company_cd(
+        request, DOWNLOAD_SIGNATURE_PURPOSE, file_id, cd, exp, sig, db
+    )
+    row = db.execute(text("""
+        SELECT original_name, file_path, mime_type, sha256
+        FROM uploaded_files
+        WHERE company_cd = :company_cd
+          AND file_id = :file_id
+    """), {"company_cd": company_cd, "file_id": file_id}).fetchone()
+    if not row:
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+    # 세션은 파일 전송 동안 잡고 있지 않음
+    db.close()
+
+    root = UPLOAD_ROOT.resolve()
+    file_path = Path(row.file_path).resolve()
+    if root not in file_path.parents or not file_path.is_file():
+        app_logger.warning(f"⚠️ 다운로드 파일 없음: company={company_cd}, file_id={file_id}")
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+
+    stat_result = file_path.stat()
+    media_type = row.mime_type or mimetypes.guess_type(row.original_name)[0] or "application/octet-stream"
+    if media_type in _ATTACHMENT_ONLY_TYPES:
+        disposition = "attachment"
+    # sha256이 없는 기존 파일은 FileResponse 기본 ETag(mtime-size) 사용
+    etag = f'"{row.sha256}"' if row.sha256 else None
+    headers = {
+        "cache-control": "private, max-age=86400",
+        "x-content-type-options": "nosniff",
+        "content-security-policy": "sandbox",
+    }
+    if etag:
+        headers["etag"] = etag
+
+    if _not_modified(request, etag, stat_result.st_mtime):
+        headers["last-modified"] = formatdate(stat_result.st_mtime, usegmt=True)
+        return Response(status_code=304, headers=headers)
+
+    if settings.FILE_ACCEL_REDIRECT_PREFIX:
+        relative = file_path.relative_to(root).as_posix()
+        filename = quote(row.original_name)
+        headers.update({
+            "x-accel-redirect": f"{settings.FILE_ACCEL_REDIRECT_PREFIX.rstrip('/')}/{quote(relative)}",
+            "content-disposition": f"{disposition}; filename*=utf-8''{filename}",
+        })
+        return Response(status_code=200, headers=headers, media_type=media_type)
+
+    return FileResponse(
+        file_path,
+        headers=headers,
+        media_type=media_type,
+        filename=row.original_name,
+        stat_result=stat_result,
+        content_disposition_type=disposition,
+    )
@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+"""
+백그라운드 작업 조회 API 패키지
+"""
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+백그라운드 작업 조회/취소 API
+- 요청자 본인 또는 관리자만 조회/취소 가능 (회사 범위)
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.tenant import get_company_cd
+from app.core.security import get_current_user
+from app.core.logger import app_logger
+from app.services.job_service import get_job, list_jobs, request_cancel
+
+router = APIRouter()
+
+
+def _is_admin(user: dict) -> bool:
+    return (user.get("role") or "").upper() == "ADMIN"
+
+
+def _visible_job(db: Session, job_id: str, current_user: dict) -> dict:
+    company_cd = current_user.get("company_cd") or get_company_cd()
+    job = get_job(db, company_cd, job_id)
+    if not job or not (_is_admin(current_user) or job["created_by"] == current_user.get("login_id")):
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job
+
+
+@router.get("")
+async def list_background_jobs(
+    limit: int = Query(50, ge=1, le=200),
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """최근 작업 목록 (관리자는 회사 전체, 그 외는 본인 요청분)"""
+    company_cd = current_user.get("company_cd") or get_company_cd()
+    created_by = None if _is_admin(current_user) else current_user.get("login_id")
+    return {"items": list_jobs(db, company_cd, created_by, limit)}
+
+
+@router.get("/{job_id}")
+async def get_background_job(
+    job_id: str,
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """작업 상태/진행률/단계별 소요 시간/결과 (폴링용)"""
+    return _visible_job(db, job_id, current_user)
+
+
+@router.post("/{job_id}/cancel")
+async def cancel_background_job(
+    job_id: str,
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """작업 취소 요청 (실행 중이면 다음 진행 기록 시점에 롤백 후 중단)"""
+    job = _visible_job(db, job_id, current_user)
+    if job["finished"]:
+        raise HTTPException(status_code=409, detail="이미 종료된 작업입니다.")
+    try:
+        request_cancel(db, job["company_cd"], job_id)
+    except Exception as e:
+        db.rollback()
+        app_logger.error(f"❌ 작업 취소 요청 실패: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+    return _visible_job(db, job_id, current_user)
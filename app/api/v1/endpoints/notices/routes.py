@@ -2,21 +2,56 @@
 """
 게시판(공지) API
 """
-from typing import Optional, List
+from datetime import datetime, timedelta
+from typing import Dict, Optional, List
+import base64
+import json
 import re
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from sqlalchemy import text, bindparam
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.core.tenant import get_company_cd
 from app.core.security import get_current_user
 from app.core.logger import app_logger
+from app.services.file_preview_service import thumbnail_url_for
+from app.services.notice_content_service import (
+    InlineImageError,
+    get_notice_content,
+    invalidate_content_cache,
+    process_notice_content,
+    sync_content_files,
+)
+from app.services.notice_counter_service import (
+    REACTION_COUNTERS,
+    add_notice_counter,
+    reconcile_notice_counters,
+    refresh_notice_counters,
+)
+from app.services.notice_read_service import (
+    get_read_summary,
+    invalidate_read_receipts,
+    list_readers,
+    list_unread_users,
+)
+from app.services.notice_search_service import (
+    build_boolean_query,
+    fulltext_condition,
+    make_snippet,
+    split_terms,
+)
+from app.services.notice_tag_cache import get_tag_facets, get_tagged_notice_ids, invalidate_tag_cache
+from app.services.notice_unread_service import get_unread_counts, invalidate_unread_cache, mark_all_read
+from app.services.notice_view_buffer import notice_view_buffer
 
 router = APIRouter()
 
+MAX_READER_PAGE_SIZE = 200
+
 
 class NoticeCreateRequest(BaseModel):
     title: str
@@ -53,6 +88,10 @@ class NoticeReactionRequest(BaseModel):
     reaction: str
 
 
+class NoticeReadAllRequest(BaseModel):
+    category: Optional[str] = None
+
+
 def _normalize_flag(value: Optional[str]) -> str:
     if value is None:
         return "N"
@@ -104,27 +143,100 @@ def _normalize_hashtags(value: Optional[str]) -> str:
     return " ".join([f"#{tag}" for tag in tags])
 
 
-def _sync_notice_tags(db: Session, company_cd: str, notice_id: int, hashtags: Optional[str]) -> None:
+def _sync_notice_tags(db: Session, company_cd: str, notice_id: int, hashtags: Optional[str]) -> bool:
+    """
+    해시태그 동기화 (추가된 태그만 INSERT, 제거된 태그만 DELETE)
+    변경 여부 반환 — 호출자는 commit 후 태그 캐시를 무효화한다.
+    """
     tags = _parse_hashtags(hashtags)
-    db.execute(text("""
-        DELETE FROM board_notice_tags
+    existing = set(db.execute(text("""
+        SELECT tag
+        FROM board_notice_tags
         WHERE company_cd = :company_cd
           AND notice_id = :notice_id
-    """), {"company_cd": company_cd, "notice_id": notice_id})
-    if not tags:
-        return
-    rows = [
-        {
+    """), {"company_cd": company_cd, "notice_id": notice_id}).scalars().all())
+
+    removed = sorted(existing - set(tags))
+    added = [tag for tag in tags if tag not in existing]
+    if removed:
+        db.execute(text("""
+            DELETE FROM board_notice_tags
+            WHERE company_cd = :company_cd
+              AND notice_id = :notice_id
+              AND tag IN :tags
+        """).bindparams(bindparam("tags", expanding=True)), {
             "company_cd": company_cd,
             "notice_id": notice_id,
-            "tag": tag
+            "tags": removed
+        })
+    if added:
+        db.execute(text("""
+            INSERT INTO board_notice_tags (company_cd, notice_id, tag)
+            VALUES (:company_cd, :notice_id, :tag)
+        """), [
+            {"company_cd": company_cd, "notice_id": notice_id, "tag": tag}
+            for tag in added
+        ])
+    return bool(removed or added)
+
+
+MAX_REACTION_SUMMARY_IDS = 200
+
+
+def _reaction_summaries(db: Session, company_cd: str, notice_ids: List[int], user_id: str) -> Dict[int, dict]:
+    """게시글별 반응 수(집계 컬럼) + 사용자 본인 반응을 한 번에 조회"""
+    if not notice_ids:
+        return {}
+    stmt = text("""
+        SELECT
+            n.notice_id,
+            n.like_count,
+            n.check_count,
+            GROUP_CONCAT(r.reaction ORDER BY r.reaction) AS user_reactions
+        FROM board_notices n
+        LEFT JOIN board_notice_reactions r
+          ON r.company_cd = n.company_cd
+         AND r.notice_id = n.notice_id
+         AND r.user_id = :user_id
+        WHERE n.company_cd = :company_cd
+          AND n.notice_id IN :notice_ids
+        GROUP BY n.notice_id, n.like_count, n.check_count
+    """).bindparams(bindparam("notice_ids", expanding=True))
+    rows = db.execute(stmt, {
+        "company_cd": company_cd,
+        "notice_ids": notice_ids,
+        "user_id": user_id
+    }).fetchall()
+    return {
+        int(row.notice_id): {
+            "counts": {"LIKE": int(row.like_count or 0), "CHECK": int(row.check_count or 0)},
+            "user_reactions": row.user_reactions.split(",") if row.user_reactions else []
         }
-        for tag in tags
-    ]
-    db.execute(text("""
-        INSERT INTO board_notice_tags (company_cd, notice_id, tag)
-        VALUES (:company_cd, :notice_id, :tag)
-    """), rows)
+        for row in rows
+    }
+
+
+def _parse_date(value: str, field: str) -> datetime:
+    try:
+        return datetime.strptime(value.strip()[:10], "%Y-%m-%d")
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"{field} 형식이 올바르지 않습니다. (YYYY-MM-DD)")
+
+
+def _encode_cursor(values: list) -> str:
+    """keyset 커서 인코딩 (datetime은 ISO 문자열)"""
+    values = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    return base64.urlsafe_b64encode(json.dumps(values).encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str, size: int) -> list:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8"))
+        if not isinstance(values, list) or len(values) != size:
+            raise ValueError(cursor)
+        return values
+    except Exception:
+        raise HTTPException(status_code=400, detail="cursor 값이 올바르지 않습니다.")
 
 
 @router.get("/list")
@@ -143,6 +255,7 @@ async def list_notices(
     status: Optional[str] = Query(None),
     sort_field: Optional[str] = Query(None),
     sort_dir: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None, description="keyset 페이지 커서 (이전 응답의 next_cursor, 기본 정렬에서만 사용)"),
     db: Session = Depends(get_db)
 ):
     try:
@@ -154,89 +267,127 @@ async def list_notices(
             where.append("n.category = :category")
             params["category"] = category
 
+        needs_user_join = False
+        search_terms: List[str] = []
+        relevance_sql = None
         if search_text:
-            field_map = {
-                "title": "n.title",
-                "content": "n.content",
-                "author_id": "n.author_id",
-                "author_name": "u.user_name"
-            }
-            target = field_map.get(search_field or "title", "n.title")
-            where.append(f"{target} LIKE :search")
-            params["search"] = f"%{search_text}%"
+            search_key = search_field or "title"
+            search_terms = split_terms(search_text)
+            # 제목/본문/전체 검색은 FULLTEXT(ngram) 인덱스 사용, 짧은 검색어(1글자)는 LIKE
+            ft_where, relevance_sql = fulltext_condition(search_key, search_terms)
+            if ft_where:
+                where.append(ft_where)
+                params["ft_query"] = build_boolean_query(search_terms)
+            elif search_key == "all":
+                where.append("(n.title LIKE :search OR n.content_text LIKE :search OR n.hashtags LIKE :search)")
+                params["search"] = f"%{search_text}%"
+            else:
+                field_map = {
+                    "title": "n.title",
+                    "content": "n.content_text",
+                    "author_id": "n.author_id",
+                    "author_name": "u.user_name"
+                }
+                target = field_map.get(search_key, "n.title")
+                needs_user_join = target.startswith("u.")
+                where.append(f"{target} LIKE :search")
+                params["search"] = f"%{search_text}%"
 
         if active_only:
             where.append("(n.start_date IS NULL OR n.start_date <= CURDATE())")
             where.append("(n.end_date IS NULL OR n.end_date >= CURDATE())")
 
         if author:
+            needs_user_join = True
             where.append("(u.user_name LIKE :author OR n.author_id LIKE :author)")
             params["author"] = f"%{author}%"
 
+        # 날짜 조건은 컬럼 가공 없이 반개구간 [from, to+1일) 으로 비교 (인덱스 사용)
         if created_from:
-            where.append("DATE(n.created_at) >= :created_from")
-            params["created_from"] = created_from
+            where.append("n.created_at >= :created_from")
+            params["created_from"] = _parse_date(created_from, "created_from")
         if created_to:
-            where.append("DATE(n.created_at) <= :created_to")
-            params["created_to"] = created_to
+            where.append("n.created_at < :created_to")
+            params["created_to"] = _parse_date(created_to, "created_to") + timedelta(days=1)
 
         if has_files:
             has_files_upper = str(has_files).upper()
             if has_files_upper == "Y":
-                where.append("""
-                    EXISTS (
-                        SELECT 1
-                        FROM board_notice_files bf
-                        WHERE bf.company_cd = n.company_cd
-                          AND bf.notice_id = n.notice_id
-                    )
-                """)
+                where.append("n.attach_count > 0")
             elif has_files_upper == "N":
-                where.append("""
-                    NOT EXISTS (
-                        SELECT 1
-                        FROM board_notice_files bf
-                        WHERE bf.company_cd = n.company_cd
-                          AND bf.notice_id = n.notice_id
-                    )
-                """)
+                where.append("n.attach_count = 0")
 
         if status:
             where.append("n.status = :status")
             params["status"] = _normalize_status(status)
 
+        expanding = []
         tag_list = _parse_hashtags(tags) if tags else []
         if tag_list:
-            where.append("""
-                EXISTS (
-                    SELECT 1
-                    FROM board_notice_tags t
-                    WHERE t.company_cd = n.company_cd
-                      AND t.notice_id = n.notice_id
-                      AND t.tag IN :tags
-                )
-            """)
-            params["tags"] = tag_list
+            # 태그 패싯 캐시로 게시글 ID를 먼저 구하고, 결과가 크면 DB 조건으로 대체
+            tagged_ids = get_tagged_notice_ids(db, company_cd, tag_list)
+            if tagged_ids is not None:
+                if tagged_ids:
+                    where.append("n.notice_id IN :tag_notice_ids")
+                    params["tag_notice_ids"] = sorted(tagged_ids)
+                    expanding.append("tag_notice_ids")
+                else:
+                    where.append("1 = 0")
+            else:
+                where.append("""
+                    EXISTS (
+                        SELECT 1
+                        FROM board_notice_tags t
+                        WHERE t.company_cd = n.company_cd
+                          AND t.tag IN :tags
+                          AND t.notice_id = n.notice_id
+                    )
+                """)
+                params["tags"] = tag_list
+                expanding.append("tags")
 
         where_sql = " AND ".join(where) if where else "1=1"
+        # 작성자명 조건이 없으면 건수 조회에서 users 조인 생략
+        count_join = ""
+        if needs_user_join:
+            count_join = """
+            LEFT JOIN users u
+              ON u.login_id = n.author_id
+             AND u.company_cd = n.company_cd
+            """
 
         count_stmt = text(f"""
             SELECT COUNT(*)
             FROM board_notices n
-            LEFT JOIN users u
-              ON u.login_id = n.author_id
-             AND u.company_cd = n.company_cd
+            {count_join}
             WHERE {where_sql}
         """)
-        if tag_list:
-            count_stmt = count_stmt.bindparams(bindparam("tags", expanding=True))
+        if expanding:
+            count_stmt = count_stmt.bindparams(*[bindparam(name, expanding=True) for name in expanding])
         count_row = db.execute(count_stmt, params).fetchone()
         total_records = int(count_row[0]) if count_row else 0
         total_pages = (total_records + page_size - 1) // page_size or 1
         offset = (page - 1) * page_size
         params.update({"limit": page_size, "offset": offset})
 
+        # keyset 페이지: 기본 정렬(is_fixed, created_at, notice_id DESC)에서만 지원
+        keyset = not sort_field and not relevance_sql
+        page_where_sql = where_sql
+        if cursor and keyset:
+            c_fixed, c_created, c_id = _decode_cursor(cursor, 3)
+            page_where_sql += """
+              AND (
+                n.is_fixed < :c_fixed
+                OR (n.is_fixed = :c_fixed AND n.created_at < :c_created)
+                OR (n.is_fixed = :c_fixed AND n.created_at = :c_created AND n.notice_id < :c_id)
+              )
+            """
+            params.update({"c_fixed": c_fixed, "c_created": c_created, "c_id": c_id, "offset": 0})
+
         order_by = "n.is_fixed DESC, n.created_at DESC, n.notice_id DESC"
+        if relevance_sql:
+            # 검색 시 기본 정렬은 관련도 순
+            order_by = "relevance DESC, n.created_at DESC, n.notice_id DESC"
         if sort_field:
             field_map = {
                 "notice_id": "n.notice_id",
@@ -247,6 +398,7 @@ async def list_notices(
                 "start_date": "n.start_date",
                 "end_date": "n.end_date",
                 "view_count": "n.view_count",
+                "reply_count": "n.reply_count",
                 "created_at": "n.created_at",
             }
             target = field_map.get(sort_field)
@@ -254,6 +406,12 @@ async def list_notices(
                 direction = "DESC" if (sort_dir or "").lower() == "desc" else "ASC"
                 order_by = f"{target} {direction}"
 
+        search_columns = ""
+        if search_terms:
+            search_columns = ", n.content_text AS search_content"
+            if relevance_sql:
+                search_columns += f", {relevance_sql} AS relevance"
+
         list_stmt = text(f"""
             SELECT
                 n.notice_id,
@@ -267,47 +425,163 @@ async def list_notices(
                 n.end_date,
                 n.view_count,
                 n.created_at,
-                COALESCE(r.reply_count, 0) AS reply_count,
-                CASE WHEN af.attach_count > 0 THEN 'Y' ELSE 'N' END AS has_attachments
+                n.excerpt,
+                n.reply_count,
+                CASE WHEN n.attach_count > 0 THEN 'Y' ELSE 'N' END AS has_attachments,
+                n.like_count,
+                n.check_count,
+                n.read_count{search_columns}
             FROM board_notices n
             LEFT JOIN users u
               ON u.login_id = n.author_id
              AND u.company_cd = n.company_cd
-            LEFT JOIN (
-                SELECT company_cd, notice_id, COUNT(*) AS reply_count
-                FROM board_notice_replies
-                GROUP BY company_cd, notice_id
-            ) r
-              ON r.company_cd = n.company_cd
-             AND r.notice_id = n.notice_id
-            LEFT JOIN (
-                SELECT company_cd, notice_id, COUNT(*) AS attach_count
-                FROM board_notice_files
-                GROUP BY company_cd, notice_id
-            ) af
-              ON af.company_cd = n.company_cd
-             AND af.notice_id = n.notice_id
-            WHERE {where_sql}
+            WHERE {page_where_sql}
             ORDER BY {order_by}
             LIMIT :limit OFFSET :offset
         """)
-        if tag_list:
-            list_stmt = list_stmt.bindparams(bindparam("tags", expanding=True))
+        if expanding:
+            list_stmt = list_stmt.bindparams(*[bindparam(name, expanding=True) for name in expanding])
         rows = db.execute(list_stmt, params).fetchall()
 
         items = [dict(r._mapping) for r in rows]
+        next_cursor = None
+        if keyset and len(items) == page_size:
+            last = items[-1]
+            next_cursor = _encode_cursor([last["is_fixed"], last["created_at"], last["notice_id"]])
+        if search_terms:
+            for item in items:
+                content_text = item.pop("search_content", None)
+                item["snippet"] = make_snippet(content_text, search_terms)
+                item["title_highlight"] = make_snippet(item.get("title"), search_terms, width=len(item.get("title") or ""))
         return {
             "items": items,
             "total_records": total_records,
             "total_pages": total_pages,
             "current_page": page,
-            "page_size": page_size
+            "page_size": page_size,
+            "next_cursor": next_cursor
         }
+    except HTTPException:
+        raise
     except Exception as e:
         app_logger.error(f"❌ 게시판 목록 조회 실패: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/counters/reconcile")
+async def reconcile_counters(
+    all_companies: bool = Query(False),
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """게시글 집계 컬럼(답글/첨부/반응/읽음 수) 재집계 (관리자)"""
+    if not _is_admin(current_user):
+        raise HTTPException(status_code=403, detail="관리자만 실행할 수 있습니다.")
+    try:
+        notice_view_buffer.flush()
+        company_cd = None if all_companies else (current_user.get("company_cd") or get_company_cd())
+        updated = reconcile_notice_counters(db, company_cd)
+        db.commit()
+        app_logger.info(f"🔢 게시글 집계 재계산: {updated}건 보정 (company_cd={company_cd or 'ALL'})")
+        return {"success": True, "updated": updated}
+    except Exception as e:
+        db.rollback()
+        app_logger.error(f"❌ 게시글 집계 재계산 실패: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/tags")
+async def list_notice_tags(
+    prefix: Optional[str] = Query(None, description="태그 접두어 (자동완성)"),
+    limit: int = Query(20, ge=1, le=200),
+    db: Session = Depends(get_db)
+):
+    """해시태그 목록 + 게시글 수 (자동완성/패싯)"""
+    try:
+        company_cd = get_company_cd()
+        return {"items": get_tag_facets(db, company_cd, prefix, limit)}
+    except Exception as e:
+        app_logger.error(f"❌ 해시태그 조회 실패: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/unread-count")
+async def get_unread_count(
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """헤더 배지용 미읽음 게시글 수 (전체 + 분류별)"""
+    try:
+        company_cd = current_user.get("company_cd") or get_company_cd()
+        login_id = _get_login_id(current_user)
+        if not login_id:
+            return {"total": 0, "by_category": {}}
+        # 방금 열람한 게시글이 배지에 바로 반영되도록 본인 미반영 읽음(조회 버퍼)은 읽음으로 간주
+        # (버퍼를 여기서 반영하지 않음 — 반영은 백그라운드 루프가 담당)
+        pending = notice_view_buffer.pending_read_notice_ids(company_cd, login_id)
+        counts = get_unread_counts(db, company_cd, login_id, read_notice_ids=pending)
+        return {"total": counts["total"], "by_category": counts["by_category"]}
+    except Exception as e:
+        app_logger.error(f"❌ 미읽음 수 조회 실패: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/read-all")
+async def read_all_notices(
+    request: NoticeReadAllRequest,
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """모두 읽음 처리 (category 지정 시 해당 분류만)"""
+    try:
+        company_cd = current_user.get("company_cd") or get_company_cd()
+        login_id = _get_login_id(current_user)
+        if not login_id:
+            raise HTTPException(status_code=400, detail="사용자 정보가 없습니다.")
+        marked = mark_all_read(db, company_cd, login_id, (request.category or "").strip() or None)
+        db.commit()
+        if marked:
+            invalidate_read_receipts(company_cd)
+        counts = get_unread_counts(db, company_cd, login_id, use_cache=False)
+        return {"success": True, "marked": marked, "total": counts["total"], "by_category": counts["by_category"]}
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        db.rollback()
+        app_logger.error(f"❌ 모두 읽음 처리 실패: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/reactions/summary")
+async def get_reaction_summaries(
+    notice_ids: str = Query(..., description="게시글 ID 목록 (쉼표 구분)"),
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """목록 한 페이지 분량 게시글의 반응 수/본인 반응 일괄 조회"""
+    try:
+        ids = []
+        for token in notice_ids.split(","):
+            token = token.strip()
+            if token:
+                if not token.isdigit():
+                    raise HTTPException(status_code=400, detail=f"잘못된 게시글 ID입니다: {token}")
+                ids.append(int(token))
+        ids = list(dict.fromkeys(ids))
+        if len(ids) > MAX_REACTION_SUMMARY_IDS:
+            raise HTTPException(status_code=400, detail=f"최대 {MAX_REACTION_SUMMARY_IDS}건까지 조회할 수 있습니다.")
+
+        company_cd = current_user.get("company_cd") or get_company_cd()
+        summaries = _reaction_summaries(db, company_cd, ids, _get_login_id(current_user))
+        return {"items": {str(nid): summaries[nid] for nid in ids if nid in summaries}}
+    except HTTPException:
+        raise
+    except Exception as e:
+        app_logger.error(f"❌ 반응 일괄 조회 실패: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/{notice_id}")
 async def get_notice(
     notice_id: int,
@@ -318,28 +592,13 @@ async def get_notice(
     try:
         company_cd = current_user.get("company_cd") or get_company_cd()
         if increase_view:
-            db.execute(text("""
-                UPDATE board_notices
-                SET view_count = view_count + 1
-                WHERE company_cd = :company_cd
-                  AND notice_id = :notice_id
-            """), {"company_cd": company_cd, "notice_id": notice_id})
-            login_id = _get_login_id(current_user)
-            if login_id:
-                db.execute(text("""
-                    INSERT IGNORE INTO board_notice_reads (
-                        company_cd, notice_id, reader_id
-                    ) VALUES (
-                        :company_cd, :notice_id, :reader_id
-                    )
-                """), {"company_cd": company_cd, "notice_id": notice_id, "reader_id": login_id})
-            db.commit()
+            # 조회수/읽음은 버퍼에 누적 후 일괄 반영 (인기 게시글 행 잠금 경합 방지)
+            notice_view_buffer.record(company_cd, notice_id, _get_login_id(current_user))
 
         row = db.execute(text("""
             SELECT
                 n.notice_id,
                 n.title,
-                n.content,
                 n.category,
                 n.status,
                 n.hashtags,
@@ -349,6 +608,11 @@ async def get_notice(
                 n.start_date,
                 n.end_date,
                 n.view_count,
+                n.reply_count,
+                n.attach_count,
+                n.like_count,
+                n.check_count,
+                n.read_count,
                 n.created_at,
                 n.updated_at
             FROM board_notices n
@@ -364,6 +628,10 @@ async def get_notice(
 
         can_edit = _is_admin(current_user) or (row.author_id == current_user.get("login_id"))
         data = dict(row._mapping)
+        # 본문은 updated_at 기준 캐시 (원본: 편집용, content_html: 표시용 정제본)
+        data.update(get_notice_content(db, company_cd, notice_id, row.updated_at) or {"content": "", "content_html": ""})
+        # 미반영 조회수 합산
+        data["view_count"] = (data.get("view_count") or 0) + notice_view_buffer.pending_views(company_cd, notice_id)
         data["can_edit"] = can_edit
         return data
     except HTTPException:
@@ -377,36 +645,65 @@ async def get_notice(
 async def get_notice_reads(
     notice_id: int,
     include_users: Optional[bool] = Query(False),
+    status: str = Query("read", description="read: 읽은 사용자, unread: 안 읽은 재직자 (관리자/작성자)"),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=MAX_READER_PAGE_SIZE),
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     try:
         company_cd = current_user.get("company_cd") or get_company_cd()
         count_row = db.execute(text("""
-            SELECT COUNT(*)
-            FROM board_notice_reads
+            SELECT read_count, author_id
+            FROM board_notices
             WHERE company_cd = :company_cd
               AND notice_id = :notice_id
         """), {"company_cd": company_cd, "notice_id": notice_id}).fetchone()
-        count = int(count_row[0]) if count_row else 0
+        count = int(count_row.read_count or 0) if count_row else 0
+        # 미반영 읽음(조회 버퍼) 중 아직 기록되지 않은 사용자만 합산 (버퍼는 백그라운드 루프가 반영)
+        pending_readers = notice_view_buffer.pending_reader_ids(company_cd, notice_id)
+        if count_row and pending_readers:
+            recorded = db.execute(text("""
+                SELECT COUNT(*)
+                FROM board_notice_reads
+                WHERE company_cd = :company_cd
+                  AND notice_id = :notice_id
+                  AND reader_id IN :reader_ids
+            """).bindparams(bindparam("reader_ids", expanding=True)), {
+                "company_cd": company_cd,
+                "notice_id": notice_id,
+                "reader_ids": sorted(pending_readers)
+            }).scalar()
+            count += len(pending_readers) - int(recorded or 0)
         if not include_users:
             return {"count": count}
+        if not count_row:
+            raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
 
-        rows = db.execute(text("""
-            SELECT
-                r.reader_id,
-                u.user_name AS reader_name,
-                r.created_at
-            FROM board_notice_reads r
-            LEFT JOIN users u
-              ON u.company_cd = r.company_cd
-             AND u.login_id = r.reader_id
-            WHERE r.company_cd = :company_cd
-              AND r.notice_id = :notice_id
-            ORDER BY r.created_at DESC
-        """), {"company_cd": company_cd, "notice_id": notice_id}).fetchall()
-        items = [dict(row._mapping) for row in rows]
-        return {"count": count, "items": items}
+        status_key = (status or "read").lower()
+        if status_key not in ("read", "unread"):
+            raise HTTPException(status_code=400, detail="status must be read or unread")
+        if status_key == "unread" and not (_is_admin(current_user) or count_row.author_id == current_user.get("login_id")):
+            raise HTTPException(status_code=403, detail="미읽음 사용자 조회 권한이 없습니다.")
+
+        # 사용자 정보는 참조 캐시로 해석 (users 조인/전체 목록 응답 없음)
+        if status_key == "unread":
+            result = list_unread_users(db, company_cd, notice_id, page, page_size)
+        else:
+            result = list_readers(db, company_cd, notice_id, page, page_size)
+        total_records = result["total_records"]
+        return {
+            "count": count,
+            "summary": get_read_summary(db, company_cd, notice_id),
+            "status": status_key,
+            "items": result["items"],
+            "total_records": total_records,
+            "total_pages": (total_records + page_size - 1) // page_size or 1,
+            "current_page": page,
+            "page_size": page_size
+        }
+    except HTTPException:
+        raise
     except Exception as e:
         app_logger.error(f"❌ 읽음 수 조회 실패: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -420,29 +717,8 @@ async def get_notice_reactions(
 ):
     try:
         company_cd = current_user.get("company_cd") or get_company_cd()
-        rows = db.execute(text("""
-            SELECT reaction, COUNT(*) AS cnt
-            FROM board_notice_reactions
-            WHERE company_cd = :company_cd
-              AND notice_id = :notice_id
-            GROUP BY reaction
-        """), {"company_cd": company_cd, "notice_id": notice_id}).fetchall()
-        counts = {row.reaction: int(row.cnt) for row in rows}
-
-        user_rows = db.execute(text("""
-            SELECT reaction
-            FROM board_notice_reactions
-            WHERE company_cd = :company_cd
-              AND notice_id = :notice_id
-              AND user_id = :user_id
-        """), {
-            "company_cd": company_cd,
-            "notice_id": notice_id,
-            "user_id": _get_login_id(current_user)
-        }).fetchall()
-        user_reactions = [row.reaction for row in user_rows]
-
-        return {"counts": counts, "user_reactions": user_reactions}
+        summary = _reaction_summaries(db, company_cd, [notice_id], _get_login_id(current_user))
+        return summary.get(notice_id) or {"counts": {}, "user_reactions": []}
     except Exception as e:
         app_logger.error(f"❌ 반응 조회 실패: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -455,78 +731,51 @@ async def toggle_notice_reaction(
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
+    """
+    반응 토글 (DELETE 영향 행 수로 해제/등록 판별, 동시 더블클릭에도 PK로 1건만 유지)
+    """
     try:
         company_cd = current_user.get("company_cd") or get_company_cd()
         reaction = (request.reaction or "").strip().upper()
-        if reaction not in {"LIKE", "CHECK"}:
+        if reaction not in REACTION_COUNTERS:
             raise HTTPException(status_code=400, detail="invalid reaction")
 
         user_id = _get_login_id(current_user)
-        exists = db.execute(text("""
-            SELECT 1
-            FROM board_notice_reactions
-            WHERE company_cd = :company_cd
-              AND notice_id = :notice_id
-              AND user_id = :user_id
-              AND reaction = :reaction
-        """), {
+        params = {
             "company_cd": company_cd,
             "notice_id": notice_id,
             "user_id": user_id,
             "reaction": reaction
-        }).fetchone()
-
-        if exists:
-            db.execute(text("""
-                DELETE FROM board_notice_reactions
-                WHERE company_cd = :company_cd
-                  AND notice_id = :notice_id
-                  AND user_id = :user_id
-                  AND reaction = :reaction
-            """), {
-                "company_cd": company_cd,
-                "notice_id": notice_id,
-                "user_id": user_id,
-                "reaction": reaction
-            })
-        else:
-            db.execute(text("""
-                INSERT INTO board_notice_reactions (
-                    company_cd, notice_id, user_id, reaction
-                ) VALUES (
-                    :company_cd, :notice_id, :user_id, :reaction
-                )
-            """), {
-                "company_cd": company_cd,
-                "notice_id": notice_id,
-                "user_id": user_id,
-                "reaction": reaction
-            })
-        db.commit()
-
-        rows = db.execute(text("""
-            SELECT reaction, COUNT(*) AS cnt
-            FROM board_notice_reactions
-            WHERE company_cd = :company_cd
-              AND notice_id = :notice_id
-            GROUP BY reaction
-        """), {"company_cd": company_cd, "notice_id": notice_id}).fetchall()
-        counts = {row.reaction: int(row.cnt) for row in rows}
-
-        user_rows = db.execute(text("""
-            SELECT reaction
-            FROM board_notice_reactions
+        }
+        removed = db.execute(text("""
+            DELETE FROM board_notice_reactions
             WHERE company_cd = :company_cd
               AND notice_id = :notice_id
               AND user_id = :user_id
-        """), {
-            "company_cd": company_cd,
-            "notice_id": notice_id,
-            "user_id": user_id
-        }).fetchall()
-        user_reactions = [row.reaction for row in user_rows]
+              AND reaction = :reaction
+        """), params).rowcount
+        delta = -removed
+        if not removed:
+            try:
+                # 동시 요청이 먼저 등록했다면 0건 (이미 등록 상태)
+                delta = db.execute(text("""
+                    INSERT IGNORE INTO board_notice_reactions (
+                        company_cd, notice_id, user_id, reaction
+                    ) VALUES (
+                        :company_cd, :notice_id, :user_id, :reaction
+                    )
+                """), params).rowcount
+            except IntegrityError:
+                raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
 
-        return {"counts": counts, "user_reactions": user_reactions}
+        if delta and not add_notice_counter(db, company_cd, notice_id, REACTION_COUNTERS[reaction], delta):
+            raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
+        summary = _reaction_summaries(db, company_cd, [notice_id], user_id).get(notice_id)
+        if summary is None:
+            raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
+        db.commit()
+
+        return {**summary, "reaction": reaction, "active": reaction in summary["user_reactions"]}
     except HTTPException:
         db.rollback()
         raise
@@ -550,19 +799,23 @@ async def create_notice(
 
         normalized_status = _normalize_status(request.status)
         normalized_hashtags = _normalize_hashtags(request.hashtags)
+        processed = process_notice_content(db, company_cd, request.content, current_user.get("login_id"))
 
         db.execute(text("""
             INSERT INTO board_notices (
-                company_cd, title, content, category, status, hashtags, is_fixed,
+                company_cd, title, content, content_html, content_text, excerpt, category, status, hashtags, is_fixed,
                 author_id, start_date, end_date, created_by, updated_by
             ) VALUES (
-                :company_cd, :title, :content, :category, :status, :hashtags, :is_fixed,
+                :company_cd, :title, :content, :content_html, :content_text, :excerpt, :category, :status, :hashtags, :is_fixed,
                 :author_id, :start_date, :end_date, :created_by, :updated_by
             )
         """), {
             "company_cd": company_cd,
             "title": title,
-            "content": request.content or "",
+            "content": processed["content"],
+            "content_html": processed["content_html"],
+            "content_text": processed["content_text"],
+            "excerpt": processed["excerpt"],
             "category": (request.category or "GENERAL").strip(),
             "status": normalized_status,
             "hashtags": normalized_hashtags,
@@ -576,9 +829,16 @@ async def create_notice(
         db.commit()
 
         notice_id = db.execute(text("SELECT LAST_INSERT_ID()")).scalar()
-        _sync_notice_tags(db, company_cd, int(notice_id), normalized_hashtags)
+        tags_changed = _sync_notice_tags(db, company_cd, int(notice_id), normalized_hashtags)
+        sync_content_files(db, company_cd, int(notice_id), processed["content"])
         db.commit()
+        if tags_changed:
+            invalidate_tag_cache(company_cd)
+        invalidate_unread_cache(company_cd)
         return {"notice_id": notice_id}
+    except InlineImageError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
         db.rollback()
         raise
@@ -610,11 +870,17 @@ async def update_notice(
 
         normalized_status = _normalize_status(request.status) if request.status is not None else None
         normalized_hashtags = _normalize_hashtags(request.hashtags) if request.hashtags is not None else None
+        processed = {}
+        if request.content is not None:
+            processed = process_notice_content(db, company_cd, request.content, current_user.get("login_id"))
 
         db.execute(text("""
             UPDATE board_notices
             SET title = COALESCE(:title, title),
                 content = COALESCE(:content, content),
+                content_html = COALESCE(:content_html, content_html),
+                content_text = COALESCE(:content_text, content_text),
+                excerpt = COALESCE(:excerpt, excerpt),
                 category = COALESCE(:category, category),
                 status = COALESCE(:status, status),
                 hashtags = COALESCE(:hashtags, hashtags),
@@ -628,7 +894,10 @@ async def update_notice(
             "company_cd": company_cd,
             "notice_id": notice_id,
             "title": request.title,
-            "content": request.content,
+            "content": processed.get("content"),
+            "content_html": processed.get("content_html"),
+            "content_text": processed.get("content_text"),
+            "excerpt": processed.get("excerpt"),
             "category": request.category,
             "status": normalized_status,
             "hashtags": normalized_hashtags,
@@ -637,10 +906,19 @@ async def update_notice(
             "end_date": request.end_date,
             "updated_by": current_user.get("login_id")
         })
+        tags_changed = False
         if request.hashtags is not None:
-            _sync_notice_tags(db, company_cd, notice_id, normalized_hashtags)
+            tags_changed = _sync_notice_tags(db, company_cd, notice_id, normalized_hashtags)
+        if processed:
+            sync_content_files(db, company_cd, notice_id, processed["content"])
         db.commit()
+        invalidate_content_cache(company_cd, notice_id)
+        if tags_changed:
+            invalidate_tag_cache(company_cd)
         return {"success": True}
+    except InlineImageError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
         db.rollback()
         raise
@@ -675,6 +953,8 @@ async def delete_notice(
               AND notice_id = :notice_id
         """), {"company_cd": company_cd, "notice_id": notice_id})
         db.commit()
+        invalidate_tag_cache(company_cd)
+        invalidate_content_cache(company_cd, notice_id)
         return {"success": True}
     except HTTPException:
         db.rollback()
@@ -716,6 +996,7 @@ async def list_notice_replies(
                 bf.file_id,
                 uf.original_name,
                 uf.file_url,
+                uf.file_path,
                 uf.file_size
             FROM (
                 SELECT *
@@ -762,7 +1043,8 @@ async def list_notice_replies(
                     "file_id": data["file_id"],
                     "file_name": data["original_name"],
                     "file_url": data["file_url"],
-                    "file_size": data["file_size"]
+                    "file_size": data["file_size"],
+                    "thumbnail_url": thumbnail_url_for(company_cd, data["file_id"], data["file_path"])
                 })
 
         items = list(replies.values())
@@ -778,6 +1060,138 @@ async def list_notice_replies(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+MAX_THREAD_PAGE_SIZE = 100
+
+
+def _reply_attachments(db: Session, company_cd: str, reply_ids: List[int]) -> Dict[int, list]:
+    """답글 첨부 파일 일괄 조회 (IN 1회)"""
+    if not reply_ids:
+        return {}
+    rows = db.execute(text("""
+        SELECT
+            bf.reply_id,
+            bf.file_id,
+            uf.original_name,
+            uf.file_url,
+            uf.file_path,
+            uf.file_size
+        FROM board_notice_files bf
+        JOIN uploaded_files uf
+          ON uf.company_cd = bf.company_cd
+         AND uf.file_id = bf.file_id
+        WHERE bf.company_cd = :company_cd
+          AND bf.reply_id IN :reply_ids
+        ORDER BY bf.reply_id, bf.file_id
+    """).bindparams(bindparam("reply_ids", expanding=True)), {
+        "company_cd": company_cd,
+        "reply_ids": reply_ids
+    }).fetchall()
+    result: Dict[int, list] = {}
+    for row in rows:
+        result.setdefault(int(row.reply_id), []).append({
+            "file_id": row.file_id,
+            "file_name": row.original_name,
+            "file_url": row.file_url,
+            "file_size": row.file_size,
+            "thumbnail_url": thumbnail_url_for(company_cd, row.file_id, row.file_path)
+        })
+    return result
+
+
+def _reply_child_counts(db: Session, company_cd: str, reply_ids: List[int]) -> Dict[int, int]:
+    """답글별 직접 대댓글 수 일괄 조회"""
+    if not reply_ids:
+        return {}
+    rows = db.execute(text("""
+        SELECT parent_reply_id, COUNT(*) AS cnt
+        FROM board_notice_replies
+        WHERE company_cd = :company_cd
+          AND parent_reply_id IN :reply_ids
+        GROUP BY parent_reply_id
+    """).bindparams(bindparam("reply_ids", expanding=True)), {
+        "company_cd": company_cd,
+        "reply_ids": reply_ids
+    }).fetchall()
+    return {int(row.parent_reply_id): int(row.cnt) for row in rows}
+
+
+@router.get("/{notice_id}/replies/thread")
+async def list_notice_reply_thread(
+    notice_id: int,
+    parent_reply_id: Optional[int] = Query(None, description="지정 시 해당 답글의 대댓글, 미지정 시 최상위 답글"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(20, ge=1, le=MAX_THREAD_PAGE_SIZE),
+    db: Session = Depends(get_db)
+):
+    """
+    답글 스레드 조회 (keyset 페이지)
+    - 최상위 답글: 최신순 / 대댓글: 작성순
+    - 각 답글에 child_count 포함 → 클라이언트가 parent_reply_id로 펼쳐서 조회
+    - 첨부 파일/대댓글 수는 페이지 단위 IN 조회 1회씩
+    """
+    try:
+        company_cd = get_company_cd()
+        params = {"company_cd": company_cd, "notice_id": notice_id, "limit": limit + 1}
+        if parent_reply_id is None:
+            where = "r.parent_reply_id IS NULL"
+            order_by = "r.created_at DESC, r.reply_id DESC"
+            seek = "(r.created_at < :c_created OR (r.created_at = :c_created AND r.reply_id < :c_id))"
+        else:
+            where = "r.parent_reply_id = :parent_reply_id"
+            params["parent_reply_id"] = parent_reply_id
+            order_by = "r.created_at ASC, r.reply_id ASC"
+            seek = "(r.created_at > :c_created OR (r.created_at = :c_created AND r.reply_id > :c_id))"
+        if cursor:
+            c_created, c_id = _decode_cursor(cursor, 2)
+            where += f" AND {seek}"
+            params.update({"c_created": c_created, "c_id": c_id})
+
+        rows = db.execute(text(f"""
+            SELECT
+                r.reply_id,
+                r.notice_id,
+                r.parent_reply_id,
+                r.author_id,
+                u.user_name AS author_name,
+                r.content,
+                r.created_at
+            FROM board_notice_replies r
+            LEFT JOIN users u
+              ON u.company_cd = r.company_cd
+             AND u.login_id = r.author_id
+            WHERE r.company_cd = :company_cd
+              AND r.notice_id = :notice_id
+              AND {where}
+            ORDER BY {order_by}
+            LIMIT :limit
+        """), params).fetchall()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        items = [dict(row._mapping) for row in rows]
+        reply_ids = [int(item["reply_id"]) for item in items]
+        attachments = _reply_attachments(db, company_cd, reply_ids)
+        child_counts = _reply_child_counts(db, company_cd, reply_ids)
+        for item in items:
+            item["attachments"] = attachments.get(int(item["reply_id"]), [])
+            item["child_count"] = child_counts.get(int(item["reply_id"]), 0)
+
+        next_cursor = None
+        if has_more and items:
+            next_cursor = _encode_cursor([items[-1]["created_at"], items[-1]["reply_id"]])
+        return {
+            "items": items,
+            "parent_reply_id": parent_reply_id,
+            "has_more": has_more,
+            "next_cursor": next_cursor
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        app_logger.error(f"❌ 답글 스레드 조회 실패: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/{notice_id}/replies")
 async def create_notice_reply(
     notice_id: int,
@@ -829,8 +1243,9 @@ async def create_notice_reply(
             "created_by": author_id,
             "updated_by": author_id
         })
-        db.commit()
         reply_id = db.execute(text("SELECT LAST_INSERT_ID()")).scalar()
+        refresh_notice_counters(db, company_cd, [notice_id], ["reply_count"])
+        db.commit()
         return {"reply_id": reply_id}
     except HTTPException:
         db.rollback()
@@ -851,7 +1266,7 @@ async def delete_notice_reply(
         company_cd = current_user.get("company_cd") or get_company_cd()
         login_id = _get_login_id(current_user)
         row = db.execute(text("""
-            SELECT author_id
+            SELECT notice_id, author_id
             FROM board_notice_replies
             WHERE company_cd = :company_cd
               AND reply_id = :reply_id
@@ -866,6 +1281,8 @@ async def delete_notice_reply(
             WHERE company_cd = :company_cd
               AND reply_id = :reply_id
         """), {"company_cd": company_cd, "reply_id": reply_id})
+        # 답글 첨부는 CASCADE로 함께 삭제됨
+        refresh_notice_counters(db, company_cd, [row.notice_id], ["reply_count", "attach_count"])
         db.commit()
         return {"success": True}
     except HTTPException:
@@ -889,6 +1306,7 @@ async def list_notice_files(
                 bf.file_id,
                 uf.original_name,
                 uf.file_url,
+                uf.file_path,
                 uf.file_size,
                 bf.created_at
             FROM board_notice_files bf
@@ -906,6 +1324,7 @@ async def list_notice_files(
                 "file_name": r.original_name,
                 "file_url": r.file_url,
                 "file_size": r.file_size,
+                "thumbnail_url": thumbnail_url_for(company_cd, r.file_id, r.file_path),
                 "created_at": r.created_at
             }
             for r in rows
@@ -954,6 +1373,7 @@ async def attach_notice_files(
             "created_by": current_user.get("login_id"),
             "file_ids": file_ids
         })
+        refresh_notice_counters(db, company_cd, [notice_id], ["attach_count"])
         db.commit()
         return {"success": True}
     except HTTPException:
@@ -992,6 +1412,7 @@ async def delete_notice_file(
               AND reply_id IS NULL
               AND file_id = :file_id
         """), {"company_cd": company_cd, "notice_id": notice_id, "file_id": file_id})
+        refresh_notice_counters(db, company_cd, [notice_id], ["attach_count"])
         db.commit()
         return {"success": True}
     except HTTPException:
@@ -1043,6 +1464,7 @@ async def _attach_reply_files_internal(
         "created_by": current_user.get("login_id"),
         "file_ids": file_ids
     })
+    refresh_notice_counters(db, company_cd, [reply_row.notice_id], ["attach_count"])
     db.commit()
     return {"success": True}
 
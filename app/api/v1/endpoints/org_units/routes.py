@@ -12,6 +12,7 @@ from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.core.tenant import get_company_cd
 from app.core.logger import app_logger
+from app.services.sync_service import record_deletions
 
 router = APIRouter()
 
@@ -144,6 +145,11 @@ async def bulk_save_org_units(
                     continue
                 if _is_org_in_use(db, org_id):
                     raise HTTPException(status_code=400, detail="다른 테이블에서 사용 중인 조직입니다.")
+                record_deletions(
+                    db, "org_units",
+                    "t.company_cd = :company_cd AND t.org_id = :org_id",
+                    {"org_id": org_id, "company_cd": company_cd},
+                )
                 db.execute(
                     text("DELETE FROM org_units WHERE company_cd = :company_cd AND org_id = :org_id"),
                     {"org_id": org_id, "company_cd": company_cd},
@@ -8,7 +8,7 @@ app/api/v1/endpoints/projects/routes.py
 - 속성/이력 통합 저장 처리
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from pydantic import BaseModel, Field
@@ -19,6 +19,8 @@ from datetime import datetime, date
 from app.core.database import get_db
 from app.core.logger import app_logger
 from app.core.tenant import get_company_cd
+from app.utils.tabular import resolve_tabular_format, tabular_response
+from app.services.sync_service import record_deletions
 
 router = APIRouter()
 
@@ -118,6 +120,8 @@ async def get_projects_list(
     keyword: Optional[str] = None,             # 기존 호환용
     sort_field: Optional[str] = None,
     sort_dir: Optional[str] = None,
+    response_format: Optional[str] = Query(None, alias="format", description="압축 포맷 (tsv/columns)"),
+    accept: Optional[str] = Header(None),
     db: Session = Depends(get_db)
 ):
     """프로젝트 목록 조회 (/list 경로)"""
@@ -135,6 +139,8 @@ async def get_projects_list(
         keyword=keyword,
         sort_field=sort_field,
         sort_dir=sort_dir,
+        response_format=response_format,
+        accept=accept,
         db=db
     )
 
@@ -154,9 +160,16 @@ async def get_projects(
     keyword: Optional[str] = None,             # 기존 호환용
     sort_field: Optional[str] = None,
     sort_dir: Optional[str] = None,
+    response_format: Optional[str] = Query(None, alias="format", description="압축 포맷 (tsv/columns)"),
+    accept: Optional[str] = Header(None),
     db: Session = Depends(get_db)
 ):
-    """프로젝트 목록 조회"""
+    """
+    프로젝트 목록 조회
+
+    - format=tsv 또는 Accept: text/tab-separated-values → TSV (헤더 + 값 행)
+    - format=columns → 컬럼 배열 JSON
+    """
     try:
         app_logger.info(
             f"📋 프로젝트 목록 조회 - page: {page}, page_size: {page_size}, "
@@ -341,6 +354,16 @@ async def get_projects(
         params['offset'] = offset
         
         result = db.execute(text(base_query), params)
+
+        tabular_format = resolve_tabular_format(response_format, accept)
+        if tabular_format:
+            return tabular_response(result, tabular_format, {
+                "total": total,
+                "page": page,
+                "page_size": page_size,
+                "total_pages": (total + page_size - 1) // page_size
+            })
+
         items = [dict(row._mapping) for row in result.fetchall()]
         
         app_logger.info(f"✅ 프로젝트 목록 조회 완료 - 총 {total}건, 현재 페이지 {len(items)}건")
@@ -544,6 +567,12 @@ async def update_project(
         # ===== 3. 이력 저장 =====
         if request.histories is not None:
             # 기존 이력 삭제
+            record_deletions(
+                db, "project_history",
+                "t.company_cd = :company_cd AND t.pipeline_id = :pipeline_id",
+                {'pipeline_id': pipeline_id, "company_cd": company_cd},
+                deleted_by=request.user_id
+            )
             db.execute(text(
                 "DELETE FROM project_history WHERE company_cd = :company_cd AND pipeline_id = :pipeline_id"
             ), {'pipeline_id': pipeline_id, "company_cd": company_cd})
@@ -737,6 +766,11 @@ async def delete_project_history(
             raise HTTPException(status_code=404, detail="이력을 찾을 수 없습니다")
         
         # 삭제
+        record_deletions(
+            db, "project_history",
+            "t.company_cd = :company_cd AND t.history_id = :history_id",
+            {'history_id': history_id, "company_cd": company_cd}
+        )
         db.execute(
             text("DELETE FROM project_history WHERE company_cd = :company_cd AND history_id = :history_id"),
             {'history_id': history_id, "company_cd": company_cd}
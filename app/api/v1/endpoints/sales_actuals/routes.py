@@ -4,7 +4,7 @@
 - sales_actual_line 조회/저장
 - 집계 조회
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from pydantic import BaseModel
@@ -13,6 +13,7 @@ from typing import Optional, List, Dict
 from app.core.database import get_db
 from app.core.logger import app_logger
 from app.core.tenant import get_company_cd
+from app.utils.tabular import resolve_tabular_format, tabular_response
 
 router = APIRouter()
 
@@ -171,6 +172,8 @@ async def list_sales_actual_lines(
     field_code: Optional[str] = None,
     service_code: Optional[str] = None,
     keyword: Optional[str] = None,
+    response_format: Optional[str] = Query(None, alias="format", description="압축 포맷 (tsv/columns)"),
+    accept: Optional[str] = Header(None),
     db: Session = Depends(get_db)
 ):
     try:
@@ -232,6 +235,10 @@ async def list_sales_actual_lines(
             sql += " AND (sal.project_name_snapshot LIKE :keyword OR sal.customer_name_snapshot LIKE :keyword OR sal.pipeline_id LIKE :keyword)"
             params["keyword"] = f"%{keyword}%"
 
+        tabular_format = resolve_tabular_format(response_format, accept)
+        if tabular_format:
+            return tabular_response(db.execute(text(sql), params), tabular_format)
+
         rows = db.execute(text(sql), params).mappings().all()
         return {"items": [dict(row) for row in rows]}
     except Exception as e:
@@ -4,7 +4,7 @@
 - sales_plan, sales_plan_line CRUD
 - 프로젝트 기반 라인 초기화 지원
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from pydantic import BaseModel
@@ -13,6 +13,9 @@ from typing import Optional, List, Dict
 from app.core.database import get_db
 from app.core.logger import app_logger
 from app.core.tenant import get_company_cd
+from app.core.security import get_current_user
+from app.services.job_service import JobContext, register_job, submit_job
+from app.utils.tabular import resolve_tabular_format, tabular_response
 
 router = APIRouter()
 
@@ -356,9 +359,11 @@ async def list_sales_plan_lines(
     field_code: Optional[str] = None,
     service_code: Optional[str] = None,
     keyword: Optional[str] = None,
+    response_format: Optional[str] = Query(None, alias="format", description="압축 포맷 (tsv/columns)"),
+    accept: Optional[str] = Header(None),
     db: Session = Depends(get_db)
 ):
-    """영업계획 라인 목록"""
+    """영업계획 라인 목록 (format=tsv/columns 지원)"""
     try:
         company_cd = get_company_cd()
         sql = """
@@ -417,6 +422,10 @@ async def list_sales_plan_lines(
             sql += " AND (spl.project_name_snapshot LIKE :keyword OR spl.customer_name_snapshot LIKE :keyword OR spl.pipeline_id LIKE :keyword)"
             params["keyword"] = f"%{keyword}%"
 
+        tabular_format = resolve_tabular_format(response_format, accept)
+        if tabular_format:
+            return tabular_response(db.execute(text(sql), params), tabular_format)
+
         rows = db.execute(text(sql), params).mappings().all()
         return {"items": [dict(row) for row in rows]}
     except Exception as e:
@@ -675,19 +684,43 @@ async def delete_sales_plan_lines(plan_id: int, request: SalesPlanLineDeleteRequ
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/{plan_id}/import-projects")
+@router.post("/{plan_id}/import-projects", status_code=202)
 async def import_plan_lines_from_projects(
     plan_id: int,
     org_id: Optional[int] = None,
     manager_id: Optional[str] = None,
     field_code: Optional[str] = None,
     service_code: Optional[str] = None,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
 ):
-    """프로젝트 목록에서 영업계획 라인 생성 (없는 항목만 추가)"""
+    """
+    프로젝트 목록에서 영업계획 라인 생성 (없는 항목만 추가)
+    백그라운드 작업으로 실행 → job_id 반환, /jobs/{job_id} 결과: {inserted}
+    """
+    _ensure_plan_editable(db, plan_id)
+    db.close()
+    return submit_job(get_company_cd(), "sales_plan_import", {
+        "plan_id": plan_id,
+        "org_id": org_id,
+        "manager_id": manager_id,
+        "field_code": field_code,
+        "service_code": service_code,
+    }, current_user.get("login_id"))
+
+
+@register_job("sales_plan_import")
+def _run_plan_import_job(ctx: JobContext) -> dict:
+    plan_id = ctx.params["plan_id"]
+    org_id = ctx.params.get("org_id")
+    manager_id = ctx.params.get("manager_id")
+    field_code = ctx.params.get("field_code")
+    service_code = ctx.params.get("service_code")
+    db = ctx.session()
     try:
+        # 대기 중 확정/취소되었을 수 있으므로 다시 확인
         _ensure_plan_editable(db, plan_id)
-        company_cd = get_company_cd()
+        company_cd = ctx.company_cd
         sql = """
             INSERT INTO sales_plan_line (
                 company_cd, plan_id, pipeline_id,
@@ -772,10 +805,13 @@ async def import_plan_lines_from_projects(
             sql += " AND p.service_code = :service_code"
             params["service_code"] = service_code
 
-        result = db.execute(text(sql), params)
+        with ctx.step("프로젝트 라인 생성", 95):
+            result = db.execute(text(sql), params)
+        ctx.check_cancelled()
         db.commit()
         return {"inserted": result.rowcount}
-    except Exception as e:
+    except Exception:
         db.rollback()
-        app_logger.exception("❌ 영업계획 라인 import 실패")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise
+    finally:
+        db.close()
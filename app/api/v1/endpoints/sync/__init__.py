@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+"""
+증분 동기화 API 패키지
+"""
+
+from .routes import router
+
+__all__ = ["router"]
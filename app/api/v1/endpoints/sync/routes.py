@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+증분 동기화(delta-sync) API
+- GET /sync/{entity}?updated_since=... : 변경 행 + 삭제 기록(tombstone)
+- 클라이언트(Web/VBA) 로컬 캐시를 전체 재조회 없이 최신 상태로 유지
+"""
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.logger import app_logger
+from app.core.permissions import permission_required
+from app.core.security import get_current_user
+from app.services import sync_service
+
+router = APIRouter()
+
+
+@router.get("/{entity}")
+async def get_entity_changes(
+    entity: str,
+    request: Request,
+    updated_since: Optional[datetime] = Query(None, description="이전 응답의 watermark (없으면 전체 조회)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(sync_service.DEFAULT_SYNC_LIMIT, ge=1, le=sync_service.MAX_SYNC_LIMIT),
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    엔티티 변경분 조회
+
+    entity: projects, clients, project-history, common-codes, users, org-units
+    """
+    cfg = sync_service.SYNC_ENTITIES.get(entity)
+    if not cfg:
+        raise HTTPException(status_code=404, detail=f"지원하지 않는 동기화 대상입니다: {entity}")
+
+    # 엔티티별 화면 권한(조회) 확인
+    await permission_required(cfg["form_id"], "view")(request, current_user, db)
+
+    try:
+        result = sync_service.get_changes(
+            db,
+            entity,
+            updated_since=updated_since,
+            cursor=cursor,
+            limit=limit
+        )
+        app_logger.info(
+            f"🔄 변경분 조회 - {entity}, since: {updated_since}, "
+            f"items: {result['count']}, deleted: {len(result['deleted'])}, has_more: {result['has_more']}"
+        )
+        return result
+    except ValueError:
+        raise HTTPException(status_code=400, detail="cursor 값이 올바르지 않습니다.")
+    except Exception as e:
+        app_logger.error(f"❌ 변경분 조회 실패 ({entity}): {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
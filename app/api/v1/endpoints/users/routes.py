@@ -15,6 +15,9 @@ from app.core.database import get_db
 from app.core.logger import app_logger
 from app.core.tenant import get_company_cd
 from app.core.security import get_password_hash, get_current_user
+from app.services.job_service import JobContext, register_job, submit_job
+from app.services.sync_service import record_deletions
+from app.services.user_reference_cache import invalidate_user_cache
 
 router = APIRouter()
 
@@ -386,6 +389,7 @@ async def create_user(
             "updated_by": user_data.created_by or login_id
         })
         db.commit()
+        invalidate_user_cache(company_cd)
 
         user_no = db.execute(
             text("SELECT user_no FROM users WHERE company_cd = :company_cd AND login_id = :login_id"),
@@ -483,6 +487,7 @@ async def update_user(
         """)
         db.execute(update_query, params)
         db.commit()
+        invalidate_user_cache(company_cd)
         return {"success": True}
     except HTTPException:
         raise
@@ -509,11 +514,17 @@ async def delete_user(
         if not result:
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
 
+        record_deletions(
+            db, "users",
+            "t.company_cd = :company_cd AND t.user_no = :user_no",
+            {"user_no": user_no, "company_cd": company_cd}
+        )
         db.execute(
             text("DELETE FROM users WHERE company_cd = :company_cd AND user_no = :user_no"),
             {"user_no": user_no, "company_cd": company_cd}
         )
         db.commit()
+        invalidate_user_cache(company_cd)
         return {"success": True}
     except HTTPException:
         raise
@@ -526,67 +537,95 @@ async def delete_user(
 # ============================================
 # 비밀번호 일괄 리셋
 # ============================================
-@router.post("/password/reset")
+@router.post("/password/reset", status_code=202)
 async def bulk_password_reset(
     reset_data: BulkPasswordResetRequest,
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
+    """
+    비밀번호 일괄 리셋 (백그라운드 작업)
+    사용자별 해시 계산이 느리므로 job_id 반환 → /jobs/{job_id} 결과: {success, count, skipped}
+    """
     try:
         if not reset_data.user_nos:
             raise HTTPException(status_code=400, detail="대상 사용자가 없습니다.")
 
         company_cd = get_company_cd()
         user_nos = list(reset_data.user_nos)
-        placeholders = ",".join([f":user_no_{i}" for i in range(len(user_nos))])
-        params = {f"user_no_{i}": user_nos[i] for i in range(len(user_nos))}
-        params["company_cd"] = company_cd
-        users = db.execute(
-            text(f"SELECT user_no, login_id FROM users WHERE company_cd = :company_cd AND user_no IN ({placeholders})"),
-            params
-        ).fetchall()
-
+        users = _select_reset_users(db, company_cd, user_nos)
         if not users:
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
 
         updated_by = (reset_data.updated_by or current_user.get("login_id") or "").strip() or None
+        db.close()
+        return submit_job(company_cd, "password_reset", {
+            "user_nos": user_nos,
+            "updated_by": updated_by
+        }, current_user.get("login_id"))
+    except HTTPException:
+        raise
+    except Exception as e:
+        app_logger.error(f"❌ 비밀번호 일괄 리셋 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"비밀번호 일괄 리셋 실패: {str(e)}")
+
+
+def _select_reset_users(db: Session, company_cd: str, user_nos: List[int]):
+    placeholders = ",".join([f":user_no_{i}" for i in range(len(user_nos))])
+    params = {f"user_no_{i}": user_nos[i] for i in range(len(user_nos))}
+    params["company_cd"] = company_cd
+    return db.execute(
+        text(f"SELECT user_no, login_id FROM users WHERE company_cd = :company_cd AND user_no IN ({placeholders})"),
+        params
+    ).fetchall()
+
+
+@register_job("password_reset")
+def _run_password_reset_job(ctx: JobContext) -> dict:
+    company_cd = ctx.company_cd
+    updated_by = ctx.params.get("updated_by")
+    db = ctx.session()
+    try:
+        users = _select_reset_users(db, company_cd, ctx.params["user_nos"])
         updated_users = 0
         skipped_users = 0
 
-        for user in users:
-            user_no, login_id = user
-            normalized_login_id = (login_id or "").strip()
-            if not normalized_login_id:
-                skipped_users += 1
-                app_logger.warning(f"⚠️ 비밀번호 리셋 스킵: 빈 login_id (user_no={user_no})")
-                continue
-
-            new_password = get_password_hash(normalized_login_id)
-            db.execute(
-                text("""
-                    UPDATE users
-                    SET password = :password, updated_by = :updated_by
-                    WHERE company_cd = :company_cd
-                      AND user_no = :user_no
-                """),
-                {
-                    "password": new_password,
-                    "updated_by": updated_by or normalized_login_id,
-                    "user_no": user_no,
-                    "company_cd": company_cd
-                }
-            )
-            updated_users += 1
-
+        with ctx.step("비밀번호 리셋", 95):
+            for idx, user in enumerate(users):
+                ctx.advance(idx, len(users))
+                user_no, login_id = user
+                normalized_login_id = (login_id or "").strip()
+                if not normalized_login_id:
+                    skipped_users += 1
+                    app_logger.warning(f"⚠️ 비밀번호 리셋 스킵: 빈 login_id (user_no={user_no})")
+                    continue
+
+                new_password = get_password_hash(normalized_login_id)
+                db.execute(
+                    text("""
+                        UPDATE users
+                        SET password = :password, updated_by = :updated_by
+                        WHERE company_cd = :company_cd
+                          AND user_no = :user_no
+                    """),
+                    {
+                        "password": new_password,
+                        "updated_by": updated_by or normalized_login_id,
+                        "user_no": user_no,
+                        "company_cd": company_cd
+                    }
+                )
+                updated_users += 1
+
+        ctx.check_cancelled()
         db.commit()
         return {
             "success": True,
             "count": updated_users,
             "skipped": skipped_users
         }
-    except HTTPException:
-        raise
-    except Exception as e:
+    except Exception:
         db.rollback()
-        app_logger.error(f"❌ 비밀번호 일괄 리셋 실패: {e}")
-        raise HTTPException(status_code=500, detail=f"비밀번호 일괄 리셋 실패: {str(e)}")
+        raise
+    finally:
+        db.close()
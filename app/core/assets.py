@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+화면별 정적 리소스(Script/CSS) 매니페스트
+- navigation.js가 화면 최초 진입 시 필요한 번들만 로드하도록 제공
+- 버전 쿼리(?v=)는 파일 내용 해시로 생성 (배포 시 자동 캐시 무효화)
+"""
+import hashlib
+import os
+from functools import lru_cache
+from typing import Dict, List
+
+from app.core.config import BASE_DIR
+
+
+STATIC_DIR = os.path.join(str(BASE_DIR), "static")
+
+QUILL_SCRIPTS = [
+    "https://cdn.quilljs.com/1.3.6/quill.min.js",
+    "https://unpkg.com/quill-better-table@1.2.10/dist/quill-better-table.min.js",
+]
+QUILL_STYLES = [
+    "https://cdn.quilljs.com/1.3.6/quill.snow.css",
+    "https://unpkg.com/quill-better-table@1.2.10/dist/quill-better-table.min.css",
+]
+
+# 화면(page id) → 지연 로드 대상 번들 (로드 순서 유지)
+# index.html에 직접 포함된 공통 스크립트는 여기 넣지 않는다.
+SCREEN_BUNDLES: Dict[str, Dict[str, List[str]]] = {
+    "project-history-calendar": {
+        "scripts": ["js/project-history-calendar.js"],
+        "styles": [],
+    },
+    "report-hub": {
+        "scripts": ["js/report.js"],
+        "styles": [],
+    },
+    "notices-list": {
+        "scripts": QUILL_SCRIPTS + ["js/notices.js"],
+        "styles": QUILL_STYLES,
+    },
+    "notice-detail": {
+        "scripts": QUILL_SCRIPTS + ["js/notices.js"],
+        "styles": QUILL_STYLES,
+    },
+    "notice-templates": {
+        "scripts": QUILL_SCRIPTS + ["js/notices.js", "js/notice-templates.js"],
+        "styles": QUILL_STYLES,
+    },
+    "common-codes": {"scripts": ["js/common-codes.js"], "styles": []},
+    "industry-fields": {"scripts": ["js/industry-fields.js"], "styles": []},
+    "service-codes": {"scripts": ["js/service-codes.js"], "styles": []},
+    "org-units": {"scripts": ["js/org-units.js"], "styles": []},
+    "companies": {"scripts": ["js/companies.js"], "styles": []},
+    "data-management": {"scripts": ["js/data-management.js"], "styles": []},
+    "login-history": {"scripts": ["js/login-history.js"], "styles": []},
+    "permissions": {"scripts": ["js/permissions.js"], "styles": []},
+}
+
+# 사용 빈도가 높은 화면: 초기 화면 표시 후 유휴 시간에 미리 받아둔다.
+PRELOAD_SCREENS: List[str] = ["project-history-calendar", "notices-list"]
+
+
+def _asset_url(path: str) -> str:
+    """로컬 정적 파일은 /static 경로 + 내용 해시 버전을 붙여 반환"""
+    if path.startswith(("http://", "https://")):
+        return path
+    url = f"/static/{path}"
+    file_path = os.path.join(STATIC_DIR, path)
+    try:
+        with open(file_path, "rb") as f:
+            digest = hashlib.sha1(f.read()).hexdigest()[:10]
+        return f"{url}?v={digest}"
+    except OSError:
+        return url
+
+
+@lru_cache(maxsize=1)
+def get_asset_manifest() -> Dict[str, object]:
+    """화면별 번들 매니페스트 (프로세스당 1회 생성)"""
+    screens = {}
+    for screen, bundle in SCREEN_BUNDLES.items():
+        screens[screen] = {
+            "scripts": [_asset_url(p) for p in bundle.get("scripts", [])],
+            "styles": [_asset_url(p) for p in bundle.get("styles", [])],
+        }
+    return {
+        "screens": screens,
+        "preload": [s for s in PRELOAD_SCREENS if s in screens],
+    }
+
+
+def refresh_asset_manifest() -> Dict[str, object]:
+    """정적 파일 교체 후 매니페스트 재생성"""
+    get_asset_manifest.cache_clear()
+    return get_asset_manifest()
@@ -69,6 +69,30 @@ class Settings:
         
         return connect_args
     
+    # 게시글 조회수/읽음 기록 지연 반영 (주기 초, 누적 건수)
+    NOTICE_VIEW_FLUSH_INTERVAL_SEC: float = float(os.getenv("NOTICE_VIEW_FLUSH_INTERVAL_SEC", "5"))
+    NOTICE_VIEW_FLUSH_THRESHOLD: int = int(os.getenv("NOTICE_VIEW_FLUSH_THRESHOLD", "200"))
+
+    # 파일 다운로드: 서명 URL 유효 시간(초), nginx X-Accel-Redirect 내부 경로 (빈 값이면 앱에서 직접 전송)
+    FILE_URL_TTL_SEC: int = int(os.getenv("FILE_URL_TTL_SEC", "600"))
+    FILE_ACCEL_REDIRECT_PREFIX: str = os.getenv("FILE_ACCEL_REDIRECT_PREFIX", "")
+
+    # 분할(재개) 업로드: 파일 최대 크기(바이트), 미완료 세션 보관 시간(초, 청크 수신 시 연장)
+    RESUMABLE_UPLOAD_MAX_BYTES: int = int(os.getenv("RESUMABLE_UPLOAD_MAX_BYTES", str(1024 * 1024 * 1024)))
+    UPLOAD_SESSION_TTL_SEC: int = int(os.getenv("UPLOAD_SESSION_TTL_SEC", "86400"))
+
+    # 미참조 업로드 파일 정리: 생성 후 유예 시간(시간), 실행 주기(초)
+    UPLOAD_GC_GRACE_HOURS: int = int(os.getenv("UPLOAD_GC_GRACE_HOURS", "24"))
+    UPLOAD_GC_INTERVAL_SEC: int = int(os.getenv("UPLOAD_GC_INTERVAL_SEC", "86400"))
+
+    # 백그라운드 작업: 워커(프로세스)당 동시 실행 수, 완료 작업 보관 일수
+    JOB_WORKERS: int = int(os.getenv("JOB_WORKERS", "2"))
+    JOB_RETENTION_DAYS: int = int(os.getenv("JOB_RETENTION_DAYS", "7"))
+
+    # 회사 간 데이터 복제: PK 구간 청크 크기(행), 같은 FK 단계 테이블 동시 처리 수
+    DATA_COPY_BATCH_SIZE: int = int(os.getenv("DATA_COPY_BATCH_SIZE", "5000"))
+    DATA_COPY_PARALLEL: int = int(os.getenv("DATA_COPY_PARALLEL", "4"))
+
     CORS_ORIGINS: str = os.getenv("CORS_ORIGINS", "*")
     
     @property
@@ -2,9 +2,11 @@
 """
 데이터베이스 연결 설정 - Aiven Cloud MySQL 지원
 """
+import threading
+
 import pymysql
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session, sessionmaker
 from app.core.config import settings
 from app.core.tenant import get_company_cd
 
@@ -30,19 +32,67 @@ SessionLocal = sessionmaker(
 )
 
 
+# DBAPI 커넥션(풀 레코드 info)에 마지막으로 설정한 @company_cd 보관 키
+_TENANT_INFO_KEY = "psms_company_cd"
+
+# 세션 변수 SET 실행/생략 횟수 (요청당 왕복 절감 확인용, /health 노출)
+_tenant_stats = {"set": 0, "skipped": 0}
+_tenant_stats_lock = threading.Lock()
+
+
+def _count_tenant(key: str) -> None:
+    with _tenant_stats_lock:
+        _tenant_stats[key] += 1
+
+
+def get_tenant_session_stats() -> dict:
+    """@company_cd 설정 통계 (set: 실제 실행, skipped: 커넥션 캐시로 생략)"""
+    with _tenant_stats_lock:
+        return dict(_tenant_stats)
+
+
+@event.listens_for(engine, "connect")
+def _reset_tenant_on_connect(dbapi_connection, connection_record):
+    # 새 물리 커넥션(최초 연결/재연결)은 세션 변수가 비어 있음
+    connection_record.info.pop(_TENANT_INFO_KEY, None)
+
+
+@event.listens_for(SessionLocal, "after_begin")
+def _apply_tenant(session: Session, transaction, connection):
+    """
+    세션이 커넥션을 체크아웃해 트랜잭션을 시작할 때 @company_cd 적용
+    - 같은 커넥션에 이미 같은 값이 설정돼 있으면 SET 생략 (왕복 1회 절감)
+    - commit 후 다른 풀 커넥션을 받아도 다시 평가되므로 테넌트 값이 섞이지 않음
+    """
+    company_cd = session.info.get("company_cd")
+    if not company_cd:
+        return
+    info = connection.info
+    if info.get(_TENANT_INFO_KEY) == company_cd:
+        _count_tenant("skipped")
+        return
+    try:
+        connection.execute(text("SET @company_cd = :company_cd"), {"company_cd": company_cd})
+        info[_TENANT_INFO_KEY] = company_cd
+        _count_tenant("set")
+    except Exception:
+        # 세션 변수 설정 실패해도 기본 동작 유지
+        info.pop(_TENANT_INFO_KEY, None)
+
+
 def get_db():
-    """데이터베이스 세션 dependency"""
+    """
+    데이터베이스 세션 dependency
+
+    커넥션은 첫 쿼리 시점에 체크아웃되며(@company_cd도 그때 적용),
+    DB를 사용하지 않는 요청은 커넥션을 점유하지 않는다.
+    """
     db = SessionLocal()
     try:
         # 요청 컨텍스트의 company_cd를 세션에 저장 (쿼리 파라미터 기본값으로 사용)
         company_cd = get_company_cd()
         if company_cd:
             db.info["company_cd"] = company_cd
-            try:
-                db.execute(text("SET @company_cd = :company_cd"), {"company_cd": company_cd})
-            except Exception:
-                # 세션 변수 설정 실패해도 기본 동작 유지
-                pass
         yield db
     finally:
         db.close()
@@ -2,6 +2,7 @@
 """
 JWT 토큰 및 보안 유틸리티
 """
+from contextvars import ContextVar, Token
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from jose import JWTError, jwt
@@ -20,6 +21,26 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # OAuth2 스킴
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+# 인증/권한 평가 결과 공유 캐시 (배치 요청 처리 중에만 활성화, 기본 None)
+_auth_cache_ctx: ContextVar[Optional[Dict[Any, Any]]] = ContextVar("auth_cache", default=None)
+
+
+def enable_auth_cache(seed: Optional[Dict[Any, Any]] = None) -> Token:
+    """현재 컨텍스트(및 하위 작업)에서 인증/권한 평가 결과를 공유하도록 캐시 활성화"""
+    return _auth_cache_ctx.set(dict(seed or {}))
+
+
+def reset_auth_cache(token: Token) -> None:
+    _auth_cache_ctx.reset(token)
+
+
+def get_auth_cache() -> Optional[Dict[Any, Any]]:
+    return _auth_cache_ctx.get()
+
+
+def auth_cache_key(token: str) -> str:
+    return f"user:{token}"
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """비밀번호 검증"""
     return pwd_context.verify(plain_password, hashed_password)
@@ -120,6 +141,10 @@ async def get_current_user(
         detail="인증 정보를 확인할 수 없습니다",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+    cache = get_auth_cache()
+    if cache is not None and auth_cache_key(token) in cache:
+        return cache[auth_cache_key(token)]
     
     try:
         payload = decode_token(token)
@@ -159,7 +184,7 @@ async def get_current_user(
     if result is None:
         raise credentials_exception
     
-    return {
+    user = {
         "user_no": result[0],
         "login_id": result[1],
         "user_name": result[2],
@@ -170,6 +195,9 @@ async def get_current_user(
         "status": result[7],
         "company_cd": company_cd
     }
+    if cache is not None:
+        cache[auth_cache_key(token)] = user
+    return user
 
 async def get_current_active_user(
     current_user: dict = Depends(get_current_user)
@@ -0,0 +1,642 @@
+# -*- coding: utf-8 -*-
+"""
+회사 간 데이터 청크 복제 엔진 (data_management 복제 작업에서 사용)
+- 테이블별로 PK 구간(batch_size 행)씩 삭제/복사하고 청크마다 커밋 → 잠금/undo 로그를 청크 크기로 제한
+- 청크와 같은 트랜잭션에서 data_copy_checkpoints 갱신 → 실패/취소된 복제를 copy_id로 이어서 실행
+- FK 단계가 같은 테이블(서로 의존하지 않음)은 별도 커넥션으로 병렬 처리
+- 건수는 삭제/삽입 rowcount로 집계 (테이블별 COUNT(*) 생략), 테이블별 초당 처리량 보고
+- 자기 참조 AUTO_INCREMENT 테이블(org_units 등)은 키 구간을 미리 확보해 새 키/부모 키를 한 문장으로 변환 복제
+- 동기화(sync): PK 구간별 체크섬(COUNT + BIT_XOR(CRC32))을 양쪽에서 비교해 다른 구간만
+  행 단위로 비교하고 필요한 INSERT/UPDATE/DELETE만 반영 (dry_run이면 차이 리포트만)
+  (company_cd 없는 UNIQUE 키가 있는 테이블은 회사 간 같은 키를 둘 수 없어 동기화 제외)
+"""
+import json
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import engine
+from app.core.logger import app_logger
+from app.services.job_service import JobCancelled, JobContext
+from app.services.schema_cache import SchemaSnapshot
+
+# 병렬 처리 중 진행 기록/취소 확인 주기 (초)
+DATA_COPY_POLL_SEC = 0.5
+DATA_COPY_MAX_BATCH_SIZE = 100_000
+DATA_COPY_MAX_PARALLEL = 8
+
+
+def _dumps(value) -> Optional[str]:
+    if value is None:
+        return None
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def _key_condition(keys: List[str], op: str, prefix: str, values: Optional[list], params: dict) -> str:
+    """(`k1`, `k2`) op (:p0, :p1) 조건 (values가 없으면 빈 문자열)"""
+    if values is None:
+        return ""
+    names = []
+    for idx, value in enumerate(values):
+        name = f"{prefix}{idx}"
+        params[name] = value
+        names.append(f":{name}")
+    columns = ", ".join(f"`{k}`" for k in keys)
+    return f" AND ({columns}) {op} ({', '.join(names)})"
+
+
+def load_checkpoints(conn: Connection, copy_id: str) -> Dict[str, dict]:
+    rows = conn.execute(text("""
+        SELECT table_name, source_company_cd, target_company_cd, phase, last_pk,
+               deleted_rows, inserted_rows, chunks, delete_ms, copy_ms
+        FROM data_copy_checkpoints
+        WHERE copy_id = :copy_id
+    """), {"copy_id": copy_id}).mappings().all()
+    checkpoints = {}
+    for row in rows:
+        item = dict(row)
+        if isinstance(item.get("last_pk"), str):
+            item["last_pk"] = json.loads(item["last_pk"])
+        checkpoints[item["table_name"]] = item
+    return checkpoints
+
+
+def _prepare_checkpoints(copy_id: str, source: str, target: str, tables: List[str]) -> Dict[str, dict]:
+    """체크포인트 준비 (이어하기면 기존 값 유지) + 보관 기간 지난 체크포인트 정리"""
+    with engine.connect() as conn:
+        conn.execute(text("""
+            DELETE FROM data_copy_checkpoints
+            WHERE updated_at < NOW() - INTERVAL :days DAY
+        """), {"days": settings.JOB_RETENTION_DAYS})
+        existing = load_checkpoints(conn, copy_id)
+        for item in existing.values():
+            if item["source_company_cd"] != source or item["target_company_cd"] != target:
+                raise ValueError("이어서 실행할 복제의 원본/대상 회사가 다릅니다.")
+        for table in tables:
+            if table in existing:
+                continue
+            conn.execute(text("""
+                INSERT INTO data_copy_checkpoints (copy_id, table_name, source_company_cd, target_company_cd)
+                VALUES (:copy_id, :table_name, :source, :target)
+            """), {"copy_id": copy_id, "table_name": table, "source": source, "target": target})
+        conn.commit()
+        return load_checkpoints(conn, copy_id)
+
+
+def needs_id_remap(schema: SchemaSnapshot, table: str) -> bool:
+    """AUTO_INCREMENT 키를 자기 참조하는 테이블 (키를 그대로 복사하면 전역 유일 키와 충돌)"""
+    id_col = schema.auto_increment.get(table)
+    return bool(id_col) and any(parent == id_col for _, parent in schema.self_references(table))
+
+
+def clone_with_id_remap(
+    db: Session,
+    schema: SchemaSnapshot,
+    table: str,
+    source: str,
+    target: str,
+    actor_id: Optional[str] = None
+) -> int:
+    """
+    자기 참조 테이블 회사 간 복제 (행 수와 무관하게 문장 2회, 복제 건수 반환)
+    - 현재 최대 키를 FOR UPDATE로 잠가(끝 구간 gap 잠금 → 다른 INSERT 대기) 새 키 구간을 확보
+    - 새 키 = 최대 키 + 원본 키 순번(ROW_NUMBER), 부모 컬럼도 같은 매핑으로 변환해 INSERT ... SELECT 1회
+    - 매핑에 없는 부모(원본에서 끊어진 참조)는 NULL
+    FOREIGN_KEY_CHECKS와 commit은 호출자가 관리
+    """
+    id_col = schema.auto_increment[table]
+    ref_cols = {child for child, parent in schema.self_references(table) if parent == id_col}
+    cols = schema.columns_of(table)
+
+    base = db.execute(text(f"""
+        SELECT `{id_col}` FROM `{table}` ORDER BY `{id_col}` DESC LIMIT 1 FOR UPDATE
+    """)).scalar() or 0
+
+    select_parts = []
+    joins = []
+    for col in cols:
+        if col == "company_cd":
+            select_parts.append(":target AS `company_cd`")
+        elif col == id_col:
+            select_parts.append(f"m.new_id AS `{col}`")
+        elif col in ref_cols:
+            alias = f"p{len(joins)}"
+            joins.append(f"LEFT JOIN id_map {alias} ON {alias}.old_id = s.`{col}`")
+            select_parts.append(f"{alias}.new_id AS `{col}`")
+        elif actor_id and col in ("created_by", "updated_by"):
+            select_parts.append(f":actor_id AS `{col}`")
+        else:
+            select_parts.append(f"s.`{col}`")
+
+    result = db.execute(text(f"""
+        INSERT INTO `{table}` ({", ".join(f"`{c}`" for c in cols)})
+        WITH id_map AS (
+            SELECT `{id_col}` AS old_id,
+                   :base + ROW_NUMBER() OVER (ORDER BY `{id_col}`) AS new_id
+            FROM `{table}`
+            WHERE company_cd = :source
+        )
+        SELECT {", ".join(select_parts)}
+        FROM `{table}` s
+        JOIN id_map m ON m.old_id = s.`{id_col}`
+        {" ".join(joins)}
+        WHERE s.company_cd = :source
+    """), {"source": source, "target": target, "base": int(base), "actor_id": actor_id})
+    return int(result.rowcount or 0)
+
+
+class _CopyProgress:
+    """병렬 작업 스레드가 갱신하고 작업 스레드가 읽는 진행 상태"""
+
+    def __init__(self, total_tables: int):
+        self.total_tables = total_tables
+        self.done_tables = 0
+        self.rows = 0
+        self.active: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, table: str, rows: int) -> None:
+        with self._lock:
+            self.rows += rows
+            self.active[table] = self.active.get(table, 0) + rows
+
+    def finish(self, table: str) -> None:
+        with self._lock:
+            self.done_tables += 1
+            self.active.pop(table, None)
+
+    def report(self, ctx: JobContext, label: str) -> None:
+        with self._lock:
+            done = self.done_tables
+            active = ", ".join(f"{t} {n:,}" for t, n in list(self.active.items())[:3])
+            rows = self.rows
+        ctx.advance(done, self.total_tables, f"{label}: {done}/{self.total_tables} 테이블, {rows:,}행 {active}".strip())
+
+
+class _TableCopier:
+    """테이블 1개 삭제/복사 (작업 스레드마다 전용 커넥션 사용)"""
+
+    def __init__(self, schema: SchemaSnapshot, copy_id: str, source: str, target: str, batch_size: int, stop: threading.Event):
+        self.schema = schema
+        self.copy_id = copy_id
+        self.source = source
+        self.target = target
+        self.batch_size = batch_size
+        self.stop = stop
+
+    def _check_stop(self) -> None:
+        if self.stop.is_set():
+            raise JobCancelled("복제가 중단되었습니다.")
+
+    def _connect(self):
+        conn = engine.connect()
+        # 같은 단계의 다른 테이블을 병렬 처리하므로 FK 검사는 커넥션 단위로 끔 (종료 시 복원)
+        conn.execute(text("SET FOREIGN_KEY_CHECKS=0"))
+        conn.commit()
+        return conn
+
+    @staticmethod
+    def _close(conn: Connection) -> None:
+        try:
+            conn.rollback()
+            conn.execute(text("SET FOREIGN_KEY_CHECKS=1"))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _save(self, conn: Connection, table: str, sets: str, params: dict) -> None:
+        conn.execute(text(f"""
+            UPDATE data_copy_checkpoints
+            SET {sets}, chunks = chunks + 1
+            WHERE copy_id = :copy_id
+              AND table_name = :table_name
+        """), {"copy_id": self.copy_id, "table_name": table, **params})
+
+    def delete_table(self, table: str, progress: _CopyProgress) -> None:
+        """대상 회사 행을 PK 순서로 batch_size씩 삭제 (반복 실행해도 안전)"""
+        conn = self._connect()
+        try:
+            keys = self.schema.key_columns(table)
+            order = f" ORDER BY {', '.join(f'`{k}`' for k in keys)}" if keys else ""
+            sql = f"DELETE FROM `{table}` WHERE company_cd = :target{order} LIMIT :batch"
+            while True:
+                self._check_stop()
+                started = time.perf_counter()
+                deleted = int(conn.execute(text(sql), {"target": self.target, "batch": self.batch_size}).rowcount or 0)
+                finished = deleted < self.batch_size
+                self._save(conn, table, """
+                    deleted_rows = deleted_rows + :deleted,
+                    delete_ms = delete_ms + :elapsed_ms,
+                    phase = :phase
+                """, {
+                    "deleted": deleted,
+                    "elapsed_ms": int((time.perf_counter() - started) * 1000),
+                    "phase": "DELETED" if finished else "PENDING",
+                })
+                conn.commit()
+                progress.add(table, deleted)
+                if finished:
+                    break
+        finally:
+            self._close(conn)
+        progress.finish(table)
+
+    def copy_table(self, table: str, last_pk: Optional[list], progress: _CopyProgress) -> None:
+        """원본 회사 행을 PK 구간(batch_size)씩 복사, 구간마다 마지막 PK를 체크포인트에 기록"""
+        conn = self._connect()
+        try:
+            cols = self.schema.columns_of(table)
+            col_list = ", ".join(f"`{c}`" for c in cols)
+            select_list = ", ".join(
+                ":target AS `company_cd`" if c == "company_cd" else f"`{c}`" for c in cols
+            )
+            keys = self.schema.key_columns(table)
+            if not keys:
+                # PK가 없으면 구간을 나눌 수 없어 한 번에 복사
+                self._check_stop()
+                started = time.perf_counter()
+                inserted = int(conn.execute(text(f"""
+                    INSERT INTO `{table}` ({col_list})
+                    SELECT {select_list} FROM `{table}` WHERE company_cd = :source
+                """), {"source": self.source, "target": self.target}).rowcount or 0)
+                self._save(conn, table, """
+                    inserted_rows = inserted_rows + :inserted,
+                    copy_ms = copy_ms + :elapsed_ms,
+                    phase = 'DONE'
+                """, {"inserted": inserted, "elapsed_ms": int((time.perf_counter() - started) * 1000)})
+                conn.commit()
+                progress.add(table, inserted)
+                progress.finish(table)
+                return
+
+            key_list = ", ".join(f"`{k}`" for k in keys)
+            while True:
+                self._check_stop()
+                started = time.perf_counter()
+                params = {"source": self.source, "target": self.target}
+                lower = _key_condition(keys, ">", "lo", last_pk, params)
+                # 이번 구간의 마지막 PK (없으면 남은 행이 batch_size 미만 → 마지막 구간)
+                upper_row = conn.execute(text(f"""
+                    SELECT {key_list}
+                    FROM `{table}`
+                    WHERE company_cd = :source{lower}
+                    ORDER BY {key_list}
+                    LIMIT 1 OFFSET :offset
+                """), {**params, "offset": self.batch_size - 1}).fetchone()
+                upper_pk = list(upper_row) if upper_row else None
+                upper = _key_condition(keys, "<=", "hi", upper_pk, params)
+                inserted = int(conn.execute(text(f"""
+                    INSERT INTO `{table}` ({col_list})
+                    SELECT {select_list}
+                    FROM `{table}`
+                    WHERE company_cd = :source{lower}{upper}
+                """), params).rowcount or 0)
+                finished = upper_pk is None
+                if upper_pk is not None:
+                    last_pk = upper_pk
+                self._save(conn, table, """
+                    inserted_rows = inserted_rows + :inserted,
+                    copy_ms = copy_ms + :elapsed_ms,
+                    last_pk = :last_pk,
+                    phase = :phase
+                """, {
+                    "inserted": inserted,
+                    "elapsed_ms": int((time.perf_counter() - started) * 1000),
+                    "last_pk": _dumps(last_pk),
+                    "phase": "DONE" if finished else "COPYING",
+                })
+                conn.commit()
+                progress.add(table, inserted)
+                if finished:
+                    break
+        finally:
+            self._close(conn)
+        progress.finish(table)
+
+
+def _run_level(
+    ctx: JobContext,
+    tables: List[str],
+    work: Callable[[str], None],
+    parallel: int,
+    stop: threading.Event,
+    progress: _CopyProgress,
+    label: str
+) -> None:
+    """같은 FK 단계 테이블 병렬 처리 (작업 스레드는 진행 기록/취소 확인만 담당)"""
+    if not tables:
+        return
+    pool = ThreadPoolExecutor(max_workers=max(1, min(parallel, len(tables))), thread_name_prefix="data-copy")
+    try:
+        pending = {pool.submit(work, table) for table in tables}
+        while pending:
+            done, pending = wait(pending, timeout=DATA_COPY_POLL_SEC, return_when=FIRST_EXCEPTION)
+            for future in done:
+                future.result()
+            progress.report(ctx, label)
+    except BaseException:
+        # 다른 테이블 스레드는 다음 청크 전에 멈춤 (이미 커밋한 청크는 체크포인트로 이어하기)
+        stop.set()
+        raise
+    finally:
+        pool.shutdown(wait=True)
+
+
+def run_copy(
+    ctx: JobContext,
+    schema: SchemaSnapshot,
+    copy_id: str,
+    source: str,
+    target: str,
+    levels: List[List[str]],
+    batch_size: Optional[int] = None,
+    parallel: Optional[int] = None
+) -> Dict[str, dict]:
+    """
+    단계(levels: 부모 → 자식) 순서로 대상 삭제(역순) 후 복사
+    반환: 테이블별 최종 체크포인트 (성공 시 체크포인트 행은 삭제)
+    """
+    batch_size = max(1, min(int(batch_size or settings.DATA_COPY_BATCH_SIZE), DATA_COPY_MAX_BATCH_SIZE))
+    parallel = max(1, min(int(parallel or settings.DATA_COPY_PARALLEL), DATA_COPY_MAX_PARALLEL))
+    tables = [table for level in levels for table in level]
+    checkpoints = _prepare_checkpoints(copy_id, source, target, tables)
+    resumed = any(cp["phase"] != "PENDING" or cp["chunks"] for cp in checkpoints.values())
+    if resumed:
+        app_logger.info(f"🔁 데이터 복제 이어하기: {copy_id} {source} → {target}")
+
+    stop = threading.Event()
+    copier = _TableCopier(schema, copy_id, source, target, batch_size, stop)
+
+    # 대상 삭제 (자식 → 부모)
+    to_delete = [t for t in tables if checkpoints[t]["phase"] == "PENDING"]
+    with ctx.step("대상 데이터 삭제", 30):
+        progress = _CopyProgress(len(to_delete))
+        for level in reversed(levels):
+            todo = [t for t in level if t in to_delete]
+            _run_level(ctx, todo, lambda t: copier.delete_table(t, progress), parallel, stop, progress, "삭제")
+
+    # 원본 복사 (부모 → 자식)
+    to_copy = [t for t in tables if checkpoints[t]["phase"] != "DONE"]
+    with ctx.step("원본 데이터 복사", 98):
+        progress = _CopyProgress(len(to_copy))
+        for level in levels:
+            todo = [t for t in level if t in to_copy]
+            _run_level(
+                ctx, todo,
+                lambda t: copier.copy_table(t, checkpoints[t]["last_pk"], progress),
+                parallel, stop, progress, "복사"
+            )
+
+    with engine.connect() as conn:
+        final = load_checkpoints(conn, copy_id)
+        conn.execute(text("""
+            DELETE FROM data_copy_checkpoints
+            WHERE copy_id = :copy_id
+              AND table_name IN :tables
+        """).bindparams(bindparam("tables", expanding=True)), {"copy_id": copy_id, "tables": tables})
+        conn.commit()
+    return final
+
+
+def table_throughput(checkpoint: dict) -> dict:
+    """체크포인트 → 테이블별 처리 건수/소요 시간/초당 처리량"""
+    copy_ms = int(checkpoint.get("copy_ms") or 0)
+    delete_ms = int(checkpoint.get("delete_ms") or 0)
+    inserted = int(checkpoint.get("inserted_rows") or 0)
+    return {
+        "deleted": int(checkpoint.get("deleted_rows") or 0),
+        "inserted": inserted,
+        "chunks": int(checkpoint.get("chunks") or 0),
+        "delete_ms": delete_ms,
+        "copy_ms": copy_ms,
+        "rows_per_sec": round(inserted * 1000 / copy_ms, 1) if copy_ms else None,
+    }
+
+
+# 동기화 리포트에 남길 테이블별 차이 PK 예시 수
+DATA_SYNC_SAMPLE_KEYS = 10
+
+
+def _row_checksum_expr(cols: List[str]) -> str:
+    """행 체크섬 식 (company_cd 제외, NULL과 빈 문자열 구분용 ISNULL 플래그 포함)"""
+    data_cols = [c for c in cols if c != "company_cd"]
+    values = ", ".join(f"`{c}`" for c in data_cols)
+    nulls = ", ".join(f"ISNULL(`{c}`)" for c in data_cols)
+    return f"CRC32(CONCAT_WS('#', {values}, CONCAT({nulls})))"
+
+
+def _key_in(keys: List[str], rows: List[tuple], prefix: str, params: dict, alias: str = "") -> str:
+    """ AND (`k1`, `k2`) IN ((:p0_0, :p0_1), ...) 조건 (alias가 있으면 alias.`k1`)"""
+    groups = []
+    for row_idx, row in enumerate(rows):
+        names = []
+        for key_idx, value in enumerate(row):
+            name = f"{prefix}{row_idx}_{key_idx}"
+            params[name] = value
+            names.append(f":{name}")
+        groups.append(f"({', '.join(names)})")
+    columns = ", ".join(f"{alias + '.' if alias else ''}`{k}`" for k in keys)
+    return f" AND ({columns}) IN ({', '.join(groups)})"
+
+
+class _TableSyncer(_TableCopier):
+    """테이블 1개 체크섬 비교/반영 (반복 실행해도 같은 결과라 체크포인트 없이 재실행)"""
+
+    def __init__(self, schema: SchemaSnapshot, source: str, target: str, batch_size: int, stop: threading.Event, dry_run: bool):
+        super().__init__(schema, "", source, target, batch_size, stop)
+        self.dry_run = dry_run
+
+    def _checksum(self, conn: Connection, table: str, expr: str, company_cd: str, where: str, params: dict) -> tuple:
+        row = conn.execute(text(f"""
+            SELECT COUNT(*), COALESCE(BIT_XOR({expr}), 0)
+            FROM `{table}`
+            WHERE company_cd = :company_cd{where}
+        """), {**params, "company_cd": company_cd}).fetchone()
+        return int(row[0]), int(row[1])
+
+    def _row_hashes(self, conn: Connection, table: str, keys: List[str], expr: str,
+                    company_cd: str, where: str, params: dict) -> Dict[tuple, int]:
+        key_list = ", ".join(f"`{k}`" for k in keys)
+        rows = conn.execute(text(f"""
+            SELECT {key_list}, {expr}
+            FROM `{table}`
+            WHERE company_cd = :company_cd{where}
+        """), {**params, "company_cd": company_cd}).fetchall()
+        return {tuple(row[:-1]): int(row[-1]) for row in rows}
+
+    def _apply(self, conn: Connection, table: str, keys: List[str], cols: List[str],
+               inserts: List[tuple], updates: List[tuple], deletes: List[tuple]) -> None:
+        """
+        반영 순서: INSERT → UPDATE → DELETE (같은 트랜잭션, 앞 단계가 실패하면 삭제 전에 rollback)
+        - 새 키는 일반 INSERT (다른 UNIQUE 키와 충돌하면 조용히 덮지 않고 실패)
+        - 변경 행은 키로 원본과 JOIN한 UPDATE (행을 새로 만들지 않음)
+        """
+        col_list = ", ".join(f"`{c}`" for c in cols)
+        select_list = ", ".join(":target AS `company_cd`" if c == "company_cd" else f"`{c}`" for c in cols)
+        for start in range(0, len(inserts), 500):
+            params = {"source": self.source, "target": self.target}
+            cond = _key_in(keys, inserts[start:start + 500], "i", params)
+            conn.execute(text(f"""
+                INSERT INTO `{table}` ({col_list})
+                SELECT {select_list}
+                FROM `{table}`
+                WHERE company_cd = :source{cond}
+            """), params)
+
+        set_cols = [c for c in cols if c != "company_cd" and c not in keys]
+        if set_cols:
+            join = " AND ".join(f"s.`{k}` = t.`{k}`" for k in keys)
+            assignments = ", ".join(f"t.`{c}` = s.`{c}`" for c in set_cols)
+            for start in range(0, len(updates), 500):
+                params = {"source": self.source, "target": self.target}
+                cond = _key_in(keys, updates[start:start + 500], "u", params, alias="t")
+                conn.execute(text(f"""
+                    UPDATE `{table}` t
+                    JOIN `{table}` s
+                      ON s.company_cd = :source
+                     AND {join}
+                    SET {assignments}
+                    WHERE t.company_cd = :target{cond}
+                """), params)
+
+        for start in range(0, len(deletes), 500):
+            params = {"target": self.target}
+            cond = _key_in(keys, deletes[start:start + 500], "d", params)
+            conn.execute(text(f"DELETE FROM `{table}` WHERE company_cd = :target{cond}"), params)
+
+    def sync_table(self, table: str, stats: Dict[str, dict], progress: _CopyProgress) -> None:
+        started = time.perf_counter()
+        item = {
+            "chunks": 0, "diff_chunks": 0, "scanned": 0,
+            "inserted": 0, "updated": 0, "deleted": 0,
+            "samples": {"insert": [], "update": [], "delete": []},
+            "full_replace": False,
+        }
+        stats[table] = item
+        global_keys = self.schema.global_unique_keys(table)
+        if global_keys:
+            # 원본/대상이 같은 키를 가질 수 없어 비교하면 전 행이 삭제+추가로 잡힘 → 반영하지 않음
+            item["skipped"] = f"회사 구분 없는 유일 키({', '.join(global_keys)})가 있어 동기화할 수 없습니다."
+            app_logger.warning(f"⚠️ 동기화 제외: {table} ({', '.join(global_keys)})")
+            progress.finish(table)
+            return
+        conn = self._connect()
+        try:
+            cols = self.schema.columns_of(table)
+            keys = self.schema.key_columns(table)
+            expr = _row_checksum_expr(cols)
+            if not keys:
+                self._sync_without_key(conn, table, cols, expr, item)
+            else:
+                self._sync_by_key(conn, table, cols, keys, expr, item, progress)
+        finally:
+            self._close(conn)
+        item["elapsed_ms"] = int((time.perf_counter() - started) * 1000)
+        progress.finish(table)
+
+    def _sync_without_key(self, conn: Connection, table: str, cols: List[str], expr: str, item: dict) -> None:
+        """PK 없는 테이블: 전체 체크섬만 비교해 다르면 통째로 교체"""
+        self._check_stop()
+        item["chunks"] = 1
+        source_sum = self._checksum(conn, table, expr, self.source, "", {})
+        target_sum = self._checksum(conn, table, expr, self.target, "", {})
+        item["scanned"] = source_sum[0] + target_sum[0]
+        if source_sum == target_sum:
+            return
+        item["diff_chunks"] = 1
+        item["full_replace"] = True
+        item["deleted"] = target_sum[0]
+        item["inserted"] = source_sum[0]
+        if self.dry_run:
+            return
+        col_list = ", ".join(f"`{c}`" for c in cols)
+        select_list = ", ".join(":target AS `company_cd`" if c == "company_cd" else f"`{c}`" for c in cols)
+        conn.execute(text(f"DELETE FROM `{table}` WHERE company_cd = :target"), {"target": self.target})
+        conn.execute(text(f"""
+            INSERT INTO `{table}` ({col_list})
+            SELECT {select_list} FROM `{table}` WHERE company_cd = :source
+        """), {"source": self.source, "target": self.target})
+        conn.commit()
+
+    def _sync_by_key(self, conn: Connection, table: str, cols: List[str], keys: List[str],
+                     expr: str, item: dict, progress: _CopyProgress) -> None:
+        """
+        원본 PK 기준 구간을 양쪽에 같은 조건으로 적용해 체크섬 비교
+        (첫 구간은 하한 없음, 마지막 구간은 상한 없음 → 대상에만 있는 행도 어느 구간엔가 포함)
+        """
+        key_list = ", ".join(f"`{k}`" for k in keys)
+        last_pk: Optional[list] = None
+        while True:
+            self._check_stop()
+            params: dict = {}
+            lower = _key_condition(keys, ">", "lo", last_pk, params)
+            upper_row = conn.execute(text(f"""
+                SELECT {key_list}
+                FROM `{table}`
+                WHERE company_cd = :source{lower}
+                ORDER BY {key_list}
+                LIMIT 1 OFFSET :offset
+            """), {**params, "source": self.source, "offset": self.batch_size - 1}).fetchone()
+            upper_pk = list(upper_row) if upper_row else None
+            where = lower + _key_condition(keys, "<=", "hi", upper_pk, params)
+
+            item["chunks"] += 1
+            source_sum = self._checksum(conn, table, expr, self.source, where, params)
+            target_sum = self._checksum(conn, table, expr, self.target, where, params)
+            item["scanned"] += source_sum[0] + target_sum[0]
+            changed = 0
+            if source_sum != target_sum:
+                item["diff_chunks"] += 1
+                source_rows = self._row_hashes(conn, table, keys, expr, self.source, where, params)
+                target_rows = self._row_hashes(conn, table, keys, expr, self.target, where, params)
+                inserts = [k for k in source_rows if k not in target_rows]
+                updates = [k for k, crc in source_rows.items() if k in target_rows and target_rows[k] != crc]
+                deletes = [k for k in target_rows if k not in source_rows]
+                for kind, rows in (("insert", inserts), ("update", updates), ("delete", deletes)):
+                    samples = item["samples"][kind]
+                    samples.extend(list(k) for k in rows[:DATA_SYNC_SAMPLE_KEYS - len(samples)])
+                item["inserted"] += len(inserts)
+                item["updated"] += len(updates)
+                item["deleted"] += len(deletes)
+                changed = len(inserts) + len(updates) + len(deletes)
+                if not self.dry_run and changed:
+                    self._apply(conn, table, keys, cols, inserts, updates, deletes)
+                    conn.commit()
+            else:
+                # 읽기만 한 구간도 스냅샷을 오래 잡지 않도록 종료
+                conn.rollback()
+            progress.add(table, changed)
+            if upper_pk is None:
+                break
+            last_pk = upper_pk
+
+
+def run_sync(
+    ctx: JobContext,
+    schema: SchemaSnapshot,
+    source: str,
+    target: str,
+    levels: List[List[str]],
+    dry_run: bool = False,
+    batch_size: Optional[int] = None,
+    parallel: Optional[int] = None
+) -> Dict[str, dict]:
+    """단계 순서(부모 → 자식)로 테이블별 체크섬 동기화, 테이블별 차이/반영 통계 반환"""
+    batch_size = max(1, min(int(batch_size or settings.DATA_COPY_BATCH_SIZE), DATA_COPY_MAX_BATCH_SIZE))
+    parallel = max(1, min(int(parallel or settings.DATA_COPY_PARALLEL), DATA_COPY_MAX_PARALLEL))
+    tables = [table for level in levels for table in level]
+    stop = threading.Event()
+    syncer = _TableSyncer(schema, source, target, batch_size, stop, dry_run)
+    stats: Dict[str, dict] = {}
+    label = "차이 비교" if dry_run else "동기화"
+    with ctx.step(label, 98):
+        progress = _CopyProgress(len(tables))
+        for level in levels:
+            _run_level(ctx, level, lambda t: syncer.sync_table(t, stats, progress), parallel, stop, progress, label)
+    return stats
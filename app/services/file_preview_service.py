@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+첨부 이미지 썸네일/미리보기 생성 (백그라운드)
+- 업로드 완료 후 큐에 넣고 lifespan 루프가 스레드에서 생성 (요청 응답을 지연시키지 않음)
+- 원본 옆에 {원본 이름}.thumb.jpg / {원본 이름}.preview.jpg 로 저장
+  (blob은 내용 해시 경로이므로 같은 내용의 업로드는 파생 파일도 공유)
+- 목록의 thumbnail_url은 회사 확인 미리보기 API(/files/{file_id}/preview)의 서명 URL
+  (정적 경로를 직접 노출하지 않음)
+- Pillow가 없으면 생성하지 않고 목록은 원본 URL만 사용
+"""
+import asyncio
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from app.core.logger import app_logger
+from app.services.file_storage_service import sign_preview_url
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # 선택 의존성
+    Image = None
+    ImageOps = None
+
+# 파생 파일 종류 → 긴 변 최대 픽셀
+PREVIEW_VARIANTS: Dict[str, int] = {
+    "thumb": 320,
+    "preview": 1600,
+}
+PREVIEW_SOURCE_EXTS = {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp"}
+PREVIEW_JPEG_QUALITY = 82
+PREVIEW_MAX_SOURCE_PIXELS = 64_000_000
+PREVIEW_QUEUE_SIZE = 1000
+# 목록 썸네일 서명 URL 유효 구간 (초) — 목록을 띄워 둔 채 지연 로딩해도 만료되지 않도록 길게
+PREVIEW_URL_TTL_SEC = 6 * 3600
+
+
+def previews_enabled() -> bool:
+    return Image is not None
+
+
+def is_previewable(name: str) -> bool:
+    return Path(name or "").suffix.lower() in PREVIEW_SOURCE_EXTS
+
+
+def variant_path(file_path: str, variant: str) -> Path:
+    path = Path(file_path)
+    return path.with_name(f"{path.name}.{variant}.jpg")
+
+
+def variant_paths(file_path: str) -> List[Path]:
+    """원본 삭제 시 함께 지울 파생 파일 경로"""
+    return [variant_path(file_path, variant) for variant in PREVIEW_VARIANTS]
+
+
+def thumbnail_url_for(
+    company_cd: str,
+    file_id: Optional[int],
+    file_path: Optional[str],
+    variant: str = "thumb"
+) -> Optional[str]:
+    """파생 파일이 만들어져 있으면 미리보기 API 서명 URL, 아니면 None (원본 URL 사용)"""
+    if not file_id or not file_path or not is_previewable(file_path):
+        return None
+    if not variant_path(file_path, variant).is_file():
+        return None
+    return sign_preview_url(company_cd, file_id, variant, PREVIEW_URL_TTL_SEC)
+
+
+def generate_previews(file_path: str) -> int:
+    """파생 파일 생성 (이미 있으면 건너뜀, 생성 수 반환)"""
+    if Image is None or not is_previewable(file_path):
+        return 0
+    targets = {
+        variant: variant_path(file_path, variant)
+        for variant in PREVIEW_VARIANTS
+        if not variant_path(file_path, variant).exists()
+    }
+    if not targets:
+        return 0
+
+    created = 0
+    with Image.open(file_path) as source:
+        width, height = source.size
+        if width * height > PREVIEW_MAX_SOURCE_PIXELS:
+            app_logger.warning(f"⚠️ 미리보기 생략 (이미지 과대): {file_path} {width}x{height}")
+            return 0
+        # JPEG은 디코딩 단계에서 축소 (가장 큰 파생 크기 기준)
+        largest = max(PREVIEW_VARIANTS[v] for v in targets)
+        source.draft("RGB", (largest, largest))
+        image = ImageOps.exif_transpose(source)
+        if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+            rgba = image.convert("RGBA")
+            image = Image.new("RGB", rgba.size, (255, 255, 255))
+            image.paste(rgba, mask=rgba.getchannel("A"))
+        elif image.mode != "RGB":
+            image = image.convert("RGB")
+
+        # 큰 것부터 만들고 그 결과를 다시 줄여 작은 파생 생성
+        for variant in sorted(targets, key=lambda v: -PREVIEW_VARIANTS[v]):
+            size = PREVIEW_VARIANTS[variant]
+            image = image.copy()
+            image.thumbnail((size, size), Image.LANCZOS)
+            target = targets[variant]
+            temp = target.with_name(f"{target.name}.part")
+            image.save(temp, "JPEG", quality=PREVIEW_JPEG_QUALITY, optimize=True, progressive=True)
+            os.replace(temp, target)
+            created += 1
+    return created
+
+
+class FilePreviewWorker:
+    """
+    워커(프로세스) 단위 미리보기 생성 큐
+    - enqueue는 어느 스레드/이벤트 루프에서도 호출 가능 (/batch 하위 요청은 별도 스레드의 asyncio.run에서 실행)
+      → 큐는 run()을 실행하는 lifespan 루프 소유, 다른 스레드에서는 call_soon_threadsafe로 전달
+    - 대기 한도는 _pending(대기 + 생성 중) 크기로 확인
+    """
+
+    def __init__(self, max_queue: int):
+        self._max_queue = max_queue
+        self._queue: Optional["asyncio.Queue[str]"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: Set[str] = set()
+        self._failed: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def enqueue(self, file_path: Optional[str], file_name: Optional[str] = None) -> bool:
+        """생성 대상이면 큐에 추가 (큐가 가득 차거나 루프 시작 전이면 버림 — 미리보기 API 요청 시 다시 추가됨)"""
+        if not previews_enabled() or not file_path or not is_previewable(file_name or file_path):
+            return False
+        if all(path.exists() for path in variant_paths(file_path)):
+            return False
+        with self._lock:
+            loop, queue = self._loop, self._queue
+            if loop is None or queue is None or loop.is_closed():
+                return False
+            if file_path in self._pending or file_path in self._failed:
+                return False
+            if len(self._pending) >= self._max_queue:
+                return False
+            self._pending.add(file_path)
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        try:
+            if running is loop:
+                queue.put_nowait(file_path)
+            else:
+                loop.call_soon_threadsafe(queue.put_nowait, file_path)
+        except RuntimeError:
+            # 종료 중 루프가 닫힌 경우
+            with self._lock:
+                self._pending.discard(file_path)
+            return False
+        return True
+
+    async def run(self) -> None:
+        """큐를 비우는 백그라운드 루프 (lifespan에서 실행)"""
+        if not previews_enabled():
+            app_logger.info("ℹ️ Pillow 미설치 — 첨부 미리보기 생성 비활성화")
+        queue: "asyncio.Queue[str]" = asyncio.Queue()
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            self._queue = queue
+            self._pending.clear()
+        try:
+            while True:
+                file_path = await queue.get()
+                try:
+                    created = await asyncio.to_thread(generate_previews, file_path)
+                    if created:
+                        app_logger.debug(f"🖼️ 미리보기 생성: {file_path} ({created}건)")
+                except Exception as e:
+                    # 손상/미지원 이미지는 이 워커에서 다시 시도하지 않음
+                    with self._lock:
+                        self._failed.add(file_path)
+                    app_logger.warning(f"⚠️ 미리보기 생성 실패: {file_path} ({e})")
+                finally:
+                    with self._lock:
+                        self._pending.discard(file_path)
+                    queue.task_done()
+        finally:
+            with self._lock:
+                if self._queue is queue:
+                    self._loop = None
+                    self._queue = None
+                    self._pending.clear()
+
+
+file_preview_worker = FilePreviewWorker(max_queue=PREVIEW_QUEUE_SIZE)
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""
+업로드 파일 저장소 (static/uploads/{company_cd}/)
+- 내용 주소(SHA-256) 기반 blob 저장: blobs/{해시 앞 2자리}/{해시}{확장자}
+- 같은 회사에 같은 내용이 다시 올라오면 blob을 재사용하고 참조 수(ref_count)만 증가
+- blob 파일 존재 확인/삭제는 blob 행 잠금 아래에서만 수행 (정리 작업은 행을 지운 트랜잭션 안에서 파일 삭제)
+- uploaded_files 행은 업로드(원본 파일명/등록자)마다 생성되며 sha256으로 blob을 참조
+- 디스크 쓰기/해시 계산은 스레드로 넘겨 이벤트 루프를 막지 않음
+- 다운로드 서명 URL (헤더를 붙일 수 없는 <a>/<video> 링크용)
+"""
+import asyncio
+import hashlib
+import hmac
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Optional, Tuple
+
+from fastapi import UploadFile
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import BASE_DIR, settings
+
+UPLOAD_ROOT = Path(BASE_DIR) / "static" / "uploads"
+UPLOAD_URL_PREFIX = "/static/uploads"
+MAX_UPLOAD_BYTES = 20 * 1024 * 1024  # 20MB
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+ALLOWED_EXTS = {
+    ".pdf", ".xlsx", ".xls", ".doc", ".docx", ".ppt", ".pptx",
+    ".txt", ".csv", ".zip", ".hwp",
+    ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp", ".svg",
+    ".mp4", ".mov", ".avi", ".mkv", ".mp3", ".wav"
+}
+
+BLOB_DIR_NAME = "blobs"
+TEMP_DIR_NAME = ".tmp"
+
+
+class UploadTooLargeError(ValueError):
+    """업로드 용량 제한 초과"""
+
+
+def file_url_for(company_cd: str, stored_name: str) -> str:
+    return f"{UPLOAD_URL_PREFIX}/{company_cd}/{stored_name}"
+
+
+def blob_stored_name(sha256: str, ext: str) -> str:
+    """회사 디렉터리 기준 blob 상대 경로"""
+    return f"{BLOB_DIR_NAME}/{sha256[:2]}/{sha256}{ext}"
+
+
+def _temp_path(company_cd: str) -> Path:
+    temp_dir = UPLOAD_ROOT / company_cd / TEMP_DIR_NAME
+    temp_dir.mkdir(parents=True, exist_ok=True)
+    return temp_dir / f"{uuid.uuid4().hex}.part"
+
+
+async def receive_upload(company_cd: str, file: UploadFile) -> Tuple[Path, str, int]:
+    """
+    업로드 스트림을 임시 파일로 받으면서 SHA-256 계산 (쓰기는 스레드에서 수행)
+    반환: (임시 파일 경로, sha256, 크기) — 실패 시 임시 파일 삭제
+    """
+    temp_path = await asyncio.to_thread(_temp_path, company_cd)
+    digest = hashlib.sha256()
+    total_bytes = 0
+    handle = await asyncio.to_thread(temp_path.open, "wb")
+    try:
+        while True:
+            chunk = await file.read(UPLOAD_CHUNK_BYTES)
+            if not chunk:
+                break
+            total_bytes += len(chunk)
+            if total_bytes > MAX_UPLOAD_BYTES:
+                raise UploadTooLargeError("파일 용량 제한을 초과했습니다.")
+            digest.update(chunk)
+            await asyncio.to_thread(handle.write, chunk)
+    except BaseException:
+        await asyncio.to_thread(handle.close)
+        temp_path.unlink(missing_ok=True)
+        raise
+    await asyncio.to_thread(handle.close)
+    return temp_path, digest.hexdigest(), total_bytes
+
+
+def find_blob(db: Session, company_cd: str, sha256: str, for_update: bool = False) -> Optional[dict]:
+    lock = "FOR UPDATE" if for_update else ""
+    row = db.execute(text(f"""
+        SELECT sha256, stored_name, file_path, file_url, file_size, mime_type, ref_count
+        FROM uploaded_file_blobs
+        WHERE company_cd = :company_cd
+          AND sha256 = :sha256
+        {lock}
+    """), {"company_cd": company_cd, "sha256": sha256}).fetchone()
+    return dict(row._mapping) if row else None
+
+
+def acquire_blob(
+    db: Session,
+    company_cd: str,
+    sha256: str,
+    ext: str,
+    file_size: int,
+    mime_type: Optional[str],
+    temp_path: Optional[Path] = None
+) -> Optional[dict]:
+    """
+    blob 참조 획득 (참조 수 +1, commit은 호출자가 수행)
+    - 새 내용이면 임시 파일을 blob 경로로 이동, 기존 내용이면 임시 파일 삭제
+    - 경로가 해시로 정해지므로 동시 업로드가 같은 경로로 교체해도 내용은 동일
+    - 디스크 확인은 blob 행을 잠근 뒤 수행 (정리 작업이 행 삭제 ~ 파일 삭제 ~ commit 동안 같은 행을 잠금)
+    - temp_path 없이(중복 확인 재사용) 호출했는데 파일이 없으면 None — 호출자는 rollback 후 전송 요청
+    """
+    stored_name = blob_stored_name(sha256, ext)
+    file_path = UPLOAD_ROOT / company_cd / stored_name
+    db.execute(text("""
+        INSERT INTO uploaded_file_blobs (
+            company_cd, sha256, stored_name, file_path, file_url, file_size, mime_type, ref_count
+        ) VALUES (
+            :company_cd, :sha256, :stored_name, :file_path, :file_url, :file_size, :mime_type, 1
+        )
+        ON DUPLICATE KEY UPDATE ref_count = ref_count + 1
+    """), {
+        "company_cd": company_cd,
+        "sha256": sha256,
+        "stored_name": stored_name,
+        "file_path": str(file_path),
+        "file_url": file_url_for(company_cd, stored_name),
+        "file_size": file_size,
+        "mime_type": mime_type or "",
+    })
+    blob = find_blob(db, company_cd, sha256, for_update=True)
+    blob_path = Path(blob["file_path"])
+    if temp_path is None:
+        return blob if blob_path.exists() else None
+    if blob_path.exists():
+        temp_path.unlink(missing_ok=True)
+    else:
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(temp_path, blob_path)
+    return blob
+
+
+def release_blob(db: Session, company_cd: str, sha256: str) -> Optional[Path]:
+    """
+    blob 참조 해제 (참조 수 -1, commit은 호출자가 수행)
+    참조가 0이 되면 행을 삭제하고 삭제할 디스크 경로를 반환 (호출자는 행 잠금이 유지되는 commit 전에 삭제)
+    """
+    db.execute(text("""
+        UPDATE uploaded_file_blobs
+        SET ref_count = GREATEST(ref_count - 1, 0)
+        WHERE company_cd = :company_cd
+          AND sha256 = :sha256
+    """), {"company_cd": company_cd, "sha256": sha256})
+    blob = find_blob(db, company_cd, sha256)
+    if not blob or blob["ref_count"] > 0:
+        return None
+    db.execute(text("""
+        DELETE FROM uploaded_file_blobs
+        WHERE company_cd = :company_cd
+          AND sha256 = :sha256
+          AND ref_count = 0
+    """), {"company_cd": company_cd, "sha256": sha256})
+    return Path(blob["file_path"])
+
+
+def register_uploaded_file(
+    db: Session,
+    company_cd: str,
+    original_name: str,
+    blob: dict,
+    mime_type: Optional[str],
+    login_id: Optional[str]
+) -> dict:
+    """
+    blob을 참조하는 uploaded_files 행 등록 (commit은 호출자가 수행)
+    반환: file_id, url, file_name, mime_type, size, sha256
+    """
+    result = db.execute(text("""
+        INSERT INTO uploaded_files (
+            company_cd, original_name, stored_name, file_path, file_url,
+            mime_type, file_size, sha256, created_by, updated_by
+        ) VALUES (
+            :company_cd, :original_name, :stored_name, :file_path, :file_url,
+            :mime_type, :file_size, :sha256, :created_by, :updated_by
+        )
+    """), {
+        "company_cd": company_cd,
+        "original_name": original_name,
+        "stored_name": blob["stored_name"],
+        "file_path": blob["file_path"],
+        "file_url": blob["file_url"],
+        "mime_type": mime_type or blob.get("mime_type") or "",
+        "file_size": blob["file_size"],
+        "sha256": blob["sha256"],
+        "created_by": login_id,
+        "updated_by": login_id
+    })
+    file_id = None
+    try:
+        file_id = result.lastrowid
+    except Exception:
+        file_id = None
+    if not file_id:
+        file_id = db.execute(text("SELECT LAST_INSERT_ID()")).scalar()
+    return {
+        "file_id": file_id,
+        "url": blob["file_url"],
+        "file_name": original_name,
+        "mime_type": mime_type or blob.get("mime_type") or "",
+        "size": blob["file_size"],
+        "sha256": blob["sha256"]
+    }
+
+
+def store_bytes(
+    db: Session,
+    company_cd: str,
+    data: bytes,
+    original_name: str,
+    mime_type: Optional[str],
+    login_id: Optional[str]
+) -> dict:
+    """
+    메모리 데이터를 blob으로 저장 후 등록 (commit은 호출자가 수행)
+    롤백 시 참조 없는 blob 파일이 남을 수 있으며 고아 파일 정리 대상이 된다.
+    """
+    ext = Path(original_name).suffix.lower()
+    if ext not in ALLOWED_EXTS:
+        raise ValueError(f"unsupported extension: {ext}")
+    if len(data) > MAX_UPLOAD_BYTES:
+        raise UploadTooLargeError("file too large")
+    sha256 = hashlib.sha256(data).hexdigest()
+    temp_path = _temp_path(company_cd)
+    temp_path.write_bytes(data)
+    try:
+        blob = acquire_blob(db, company_cd, sha256, ext, len(data), mime_type, temp_path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+    return register_uploaded_file(db, company_cd, original_name, blob, mime_type, login_id)
+
+
+# 서명 용도 — 용도가 다른 서명은 서로의 라우트에서 통과하지 않음
+DOWNLOAD_SIGNATURE_PURPOSE = "download"
+
+
+def preview_signature_purpose(variant: str) -> str:
+    return f"preview:{variant}"
+
+
+def _file_signature(purpose: str, company_cd: str, file_id: int, expires: int) -> str:
+    message = f"{purpose}:{company_cd}:{int(file_id)}:{int(expires)}".encode()
+    return hmac.new(settings.SECRET_KEY.encode(), message, hashlib.sha256).hexdigest()[:32]
+
+
+def sign_file_url(company_cd: str, file_id: int, ttl_sec: Optional[int] = None) -> Tuple[str, int]:
+    """다운로드 서명 쿼리 (API 루트 기준 경로, 만료 epoch 초)"""
+    expires = int(time.time()) + int(ttl_sec or settings.FILE_URL_TTL_SEC)
+    sig = _file_signature(DOWNLOAD_SIGNATURE_PURPOSE, company_cd, file_id, expires)
+    return f"/files/{int(file_id)}?cd={company_cd}&exp={expires}&sig={sig}", expires
+
+
+def sign_preview_url(company_cd: str, file_id: int, variant: str, ttl_sec: int) -> str:
+    """
+    썸네일/미리보기 서명 URL (API 접두어 포함 — <img src>용)
+    - 만료 시각을 ttl 구간 단위로 맞춰 같은 구간의 목록 조회는 같은 URL (브라우저 캐시 재사용)
+    """
+    now = int(time.time())
+    expires = (now // ttl_sec + 2) * ttl_sec
+    sig = _file_signature(preview_signature_purpose(variant), company_cd, file_id, expires)
+    return (
+        f"{settings.API_V1_PREFIX}/files/{int(file_id)}/preview"
+        f"?variant={variant}&cd={company_cd}&exp={expires}&sig={sig}"
+    )
+
+
+def verify_file_signature(purpose: str, company_cd: str, file_id: int, expires: int, sig: str) -> bool:
+    """purpose: DOWNLOAD_SIGNATURE_PURPOSE 또는 preview_signature_purpose(variant)"""
+    if int(expires) < time.time():
+        return False
+    return hmac.compare_digest(_file_signature(purpose, company_cd, file_id, expires), sig or "")
@@ -0,0 +1,383 @@
+# -*- coding: utf-8 -*-
+"""
+백그라운드 작업 (프로세스 내 스레드 풀 + background_jobs 테이블)
+- 요청은 작업을 등록하고 job_id만 반환, 실제 처리는 워커 스레드에서 별도 DB 세션으로 수행
+- 진행률/단계별 소요 시간/결과는 background_jobs 에 기록되어 어느 워커에서든 /jobs/{job_id} 로 조회
+- 취소는 cancel_requested 플래그 → 작업이 다음 진행 기록 시점에 JobCancelled 로 중단(롤백)
+- 실행 중인 작업은 유지 루프가 heartbeat를 갱신하고, 갱신이 끊긴 작업(프로세스 종료)은 실패 처리
+"""
+import asyncio
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Set
+
+from fastapi import HTTPException
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.logger import app_logger
+from app.core.tenant import set_company_cd
+
+JOB_PROGRESS_INTERVAL_SEC = 0.5
+JOB_HEARTBEAT_SEC = 30
+JOB_STALE_SEC = 180
+JOB_QUEUED_MAX_SEC = 3600
+
+JOB_FINISHED_STATUSES = ("SUCCEEDED", "FAILED", "CANCELLED")
+
+_WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+JobHandler = Callable[["JobContext"], Optional[dict]]
+_handlers: Dict[str, JobHandler] = {}
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_queued: Set[str] = set()
+_running: Dict[str, "JobContext"] = {}
+_running_lock = threading.Lock()
+_shutting_down = threading.Event()
+
+
+class JobCancelled(Exception):
+    """취소 요청/서버 종료로 작업 중단"""
+
+
+def register_job(job_type: str) -> Callable[[JobHandler], JobHandler]:
+    """작업 처리 함수 등록 (handler(ctx) → 결과 dict)"""
+    def decorator(handler: JobHandler) -> JobHandler:
+        _handlers[job_type] = handler
+        return handler
+    return decorator
+
+
+def _dumps(value) -> Optional[str]:
+    if value is None:
+        return None
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+class JobContext:
+    """작업 처리 함수에 전달되는 진행 기록/취소 확인 도구"""
+
+    def __init__(self, job_id: str, company_cd: str, job_type: str, params: dict, login_id: Optional[str]):
+        self.job_id = job_id
+        self.company_cd = company_cd
+        self.job_type = job_type
+        self.params = params
+        self.login_id = login_id
+        self.steps: List[dict] = []
+        self._percent = 0.0
+        self._message: Optional[str] = None
+        self._step_range = (0.0, 100.0)
+        self._last_write = 0.0
+
+    def session(self) -> Session:
+        """작업용 DB 세션 (요청 회사 기준, 닫기는 호출자)"""
+        db = SessionLocal()
+        db.info["company_cd"] = self.company_cd
+        return db
+
+    def progress(self, percent: float, message: Optional[str] = None, force: bool = False) -> None:
+        """진행률 기록 (0.5초 간격으로만 DB 반영) + 취소 확인"""
+        self._percent = max(self._percent, min(float(percent), 100.0))
+        if message is not None:
+            self._message = message[:500]
+        now = time.monotonic()
+        if not force and now - self._last_write < JOB_PROGRESS_INTERVAL_SEC:
+            return
+        self._last_write = now
+        if _shutting_down.is_set():
+            raise JobCancelled("서버 종료로 작업이 중단되었습니다.")
+        db = SessionLocal()
+        try:
+            db.execute(text("""
+                UPDATE background_jobs
+                SET progress = :progress,
+                    message = :message,
+                    steps = :steps,
+                    heartbeat_at = NOW()
+                WHERE job_id = :job_id
+            """), {
+                "job_id": self.job_id,
+                "progress": round(self._percent, 2),
+                "message": self._message,
+                "steps": _dumps(self.steps),
+            })
+            cancel = db.execute(text("""
+                SELECT cancel_requested FROM background_jobs WHERE job_id = :job_id
+            """), {"job_id": self.job_id}).scalar()
+            db.commit()
+        finally:
+            db.close()
+        if cancel:
+            raise JobCancelled("사용자 요청으로 작업이 취소되었습니다.")
+
+    def advance(self, done: int, total: int, message: Optional[str] = None) -> None:
+        """현재 단계 안에서의 진행 (done/total을 단계 구간으로 환산)"""
+        start, end = self._step_range
+        ratio = (done / total) if total else 1.0
+        self.progress(start + (end - start) * min(max(ratio, 0.0), 1.0), message)
+
+    def check_cancelled(self) -> None:
+        self.progress(self._percent, force=True)
+
+    @contextmanager
+    def step(self, name: str, end_percent: float) -> Iterator[None]:
+        """단계 구간 (시작 시 메시지 기록, 종료 시 소요 시간 저장 후 end_percent 반영)"""
+        self._step_range = (self._percent, float(end_percent))
+        entry = {"name": name, "started_at": time.strftime("%Y-%m-%d %H:%M:%S"), "elapsed_ms": None}
+        self.steps.append(entry)
+        started = time.perf_counter()
+        self.progress(self._percent, name, force=True)
+        try:
+            yield
+        finally:
+            entry["elapsed_ms"] = int((time.perf_counter() - started) * 1000)
+        self.progress(end_percent, name, force=True)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, settings.JOB_WORKERS),
+                thread_name_prefix="psms-job"
+            )
+        return _executor
+
+
+def _finish(job_id: str, status: str, ctx: Optional[JobContext], result=None, error: Optional[str] = None) -> None:
+    db = SessionLocal()
+    try:
+        db.execute(text("""
+            UPDATE background_jobs
+            SET status = :status,
+                progress = CASE WHEN :status = 'SUCCEEDED' THEN 100 ELSE progress END,
+                steps = COALESCE(:steps, steps),
+                result = :result,
+                error = :error,
+                finished_at = NOW(),
+                heartbeat_at = NOW()
+            WHERE job_id = :job_id
+        """), {
+            "job_id": job_id,
+            "status": status,
+            "steps": _dumps(ctx.steps) if ctx and ctx.steps else None,
+            "result": _dumps(result),
+            "error": error,
+        })
+        db.commit()
+    finally:
+        db.close()
+
+
+def _run(job_id: str, company_cd: str, job_type: str, params: dict, login_id: Optional[str]) -> None:
+    with _running_lock:
+        _queued.discard(job_id)
+    set_company_cd(company_cd)
+    db = SessionLocal()
+    try:
+        started = db.execute(text("""
+            UPDATE background_jobs
+            SET status = 'RUNNING',
+                started_at = NOW(),
+                heartbeat_at = NOW(),
+                worker_id = :worker_id
+            WHERE job_id = :job_id
+              AND status = 'QUEUED'
+              AND cancel_requested = 0
+        """), {"job_id": job_id, "worker_id": _WORKER_ID}).rowcount
+        db.commit()
+    finally:
+        db.close()
+    if not started:
+        return
+
+    ctx = JobContext(job_id, company_cd, job_type, params, login_id)
+    with _running_lock:
+        _running[job_id] = ctx
+    started_at = time.perf_counter()
+    try:
+        result = _handlers[job_type](ctx)
+        _finish(job_id, "SUCCEEDED", ctx, result=result)
+        app_logger.info(f"✅ 작업 완료: {job_type} ({job_id}) {time.perf_counter() - started_at:.1f}s")
+    except JobCancelled as e:
+        _finish(job_id, "CANCELLED", ctx, error=str(e))
+        app_logger.info(f"🛑 작업 취소: {job_type} ({job_id})")
+    except HTTPException as e:
+        _finish(job_id, "FAILED", ctx, error=str(e.detail))
+        app_logger.warning(f"⚠️ 작업 실패: {job_type} ({job_id}) {e.detail}")
+    except Exception as e:
+        _finish(job_id, "FAILED", ctx, error=str(e))
+        app_logger.error(f"❌ 작업 실패: {job_type} ({job_id}) {e}", exc_info=True)
+    finally:
+        with _running_lock:
+            _running.pop(job_id, None)
+
+
+def submit_job(company_cd: str, job_type: str, params: dict, login_id: Optional[str]) -> dict:
+    """작업 등록 후 워커 스레드에 전달 (등록은 별도 세션에서 즉시 commit)"""
+    if job_type not in _handlers:
+        raise ValueError(f"unknown job type: {job_type}")
+    job_id = uuid.uuid4().hex
+    db = SessionLocal()
+    try:
+        db.execute(text("""
+            INSERT INTO background_jobs (job_id, company_cd, job_type, status, params, created_by)
+            VALUES (:job_id, :company_cd, :job_type, 'QUEUED', :params, :created_by)
+        """), {
+            "job_id": job_id,
+            "company_cd": company_cd,
+            "job_type": job_type,
+            "params": _dumps(params),
+            "created_by": login_id,
+        })
+        db.commit()
+    finally:
+        db.close()
+    with _running_lock:
+        _queued.add(job_id)
+    _get_executor().submit(_run, job_id, company_cd, job_type, params, login_id)
+    app_logger.info(f"📋 작업 등록: {job_type} ({job_id}) company={company_cd}")
+    return {"job_id": job_id, "job_type": job_type, "status": "QUEUED"}
+
+
+def _job_view(row) -> dict:
+    data = dict(row._mapping)
+    for key in ("params", "steps", "result"):
+        if isinstance(data.get(key), str):
+            try:
+                data[key] = json.loads(data[key])
+            except ValueError:
+                pass
+    if data.get("progress") is not None:
+        data["progress"] = float(data["progress"])
+    data["cancel_requested"] = bool(data.get("cancel_requested"))
+    data["finished"] = data.get("status") in JOB_FINISHED_STATUSES
+    return data
+
+
+_JOB_COLUMNS = """
+    job_id, company_cd, job_type, status, progress, message, params, steps, result, error,
+    cancel_requested, created_by, created_at, started_at, finished_at
+"""
+
+
+def get_job(db: Session, company_cd: str, job_id: str) -> Optional[dict]:
+    row = db.execute(text(f"""
+        SELECT {_JOB_COLUMNS}
+        FROM background_jobs
+        WHERE job_id = :job_id
+          AND company_cd = :company_cd
+    """), {"job_id": job_id, "company_cd": company_cd}).fetchone()
+    return _job_view(row) if row else None
+
+
+def list_jobs(db: Session, company_cd: str, created_by: Optional[str] = None, limit: int = 50) -> List[dict]:
+    sql = f"""
+        SELECT {_JOB_COLUMNS}
+        FROM background_jobs
+        WHERE company_cd = :company_cd
+    """
+    params = {"company_cd": company_cd, "limit": limit}
+    if created_by:
+        sql += " AND created_by = :created_by"
+        params["created_by"] = created_by
+    sql += " ORDER BY created_at DESC LIMIT :limit"
+    return [_job_view(row) for row in db.execute(text(sql), params).fetchall()]
+
+
+def request_cancel(db: Session, company_cd: str, job_id: str) -> None:
+    """취소 요청 (대기 중이면 즉시 취소, 실행 중이면 다음 진행 기록 시점에 중단, commit 포함)"""
+    db.execute(text("""
+        UPDATE background_jobs
+        SET cancel_requested = 1,
+            status = CASE WHEN status = 'QUEUED' THEN 'CANCELLED' ELSE status END,
+            finished_at = CASE WHEN status = 'CANCELLED' THEN NOW() ELSE finished_at END
+        WHERE job_id = :job_id
+          AND company_cd = :company_cd
+          AND status IN ('QUEUED', 'RUNNING')
+    """), {"job_id": job_id, "company_cd": company_cd})
+    db.commit()
+
+
+def _maintain() -> None:
+    """실행 중 작업 heartbeat 갱신, 응답 없는 작업 실패 처리, 오래된 작업 삭제"""
+    with _running_lock:
+        running_ids = list(_running)
+    db = SessionLocal()
+    try:
+        if running_ids:
+            db.execute(text("""
+                UPDATE background_jobs
+                SET heartbeat_at = NOW()
+                WHERE job_id IN :job_ids
+            """).bindparams(bindparam("job_ids", expanding=True)), {"job_ids": running_ids})
+        stale = db.execute(text("""
+            UPDATE background_jobs
+            SET status = 'FAILED',
+                error = '작업을 실행하던 서버가 응답하지 않아 중단되었습니다.',
+                finished_at = NOW()
+            WHERE (status = 'RUNNING' AND heartbeat_at < NOW() - INTERVAL :stale SECOND)
+               OR (status = 'QUEUED' AND created_at < NOW() - INTERVAL :queued_max SECOND)
+        """), {"stale": JOB_STALE_SEC, "queued_max": JOB_QUEUED_MAX_SEC}).rowcount
+        db.execute(text("""
+            DELETE FROM background_jobs
+            WHERE status IN ('SUCCEEDED', 'FAILED', 'CANCELLED')
+              AND finished_at < NOW() - INTERVAL :days DAY
+        """), {"days": settings.JOB_RETENTION_DAYS})
+        db.commit()
+        if stale:
+            app_logger.warning(f"⚠️ 응답 없는 작업 실패 처리: {stale}건")
+    except Exception as e:
+        db.rollback()
+        app_logger.error(f"❌ 작업 유지 처리 실패: {e}", exc_info=True)
+    finally:
+        db.close()
+
+
+async def run_maintenance(interval: float = JOB_HEARTBEAT_SEC) -> None:
+    """작업 유지 루프 (lifespan에서 실행)"""
+    while True:
+        await asyncio.to_thread(_maintain)
+        await asyncio.sleep(interval)
+
+
+def shutdown_jobs() -> None:
+    """종료 시 대기 작업 취소, 실행 중 작업은 다음 진행 기록 시점에 중단"""
+    _shutting_down.set()
+    with _executor_lock:
+        executor = _executor
+    if executor is None:
+        return
+    executor.shutdown(wait=False, cancel_futures=True)
+    with _running_lock:
+        queued_ids = list(_queued)
+        _queued.clear()
+    if not queued_ids:
+        return
+    db = SessionLocal()
+    try:
+        db.execute(text("""
+            UPDATE background_jobs
+            SET status = 'FAILED',
+                error = '서버 종료로 실행되지 않았습니다.',
+                finished_at = NOW()
+            WHERE job_id IN :job_ids
+              AND status = 'QUEUED'
+        """).bindparams(bindparam("job_ids", expanding=True)), {"job_ids": queued_ids})
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        app_logger.error(f"❌ 대기 작업 정리 실패: {e}", exc_info=True)
+    finally:
+        db.close()
@@ -0,0 +1,366 @@
+# -*- coding: utf-8 -*-
+"""
+게시글 본문 처리 파이프라인 (등록/수정 시 1회 수행)
+- 인라인 base64 이미지 → uploaded_files 저장 후 URL로 치환 (본문 크기 축소)
+- 허용 목록 기반 HTML 정제본(content_html) 생성 → 조회 화면은 정제본을 그대로 표시
+- 목록용 평문 요약(excerpt) 생성
+- 본문이 참조하는 업로드 파일을 board_notice_content_files에 기록 (고아 파일 정리 기준)
+- 정제 결과는 (회사, 게시글, updated_at) 키로 워커 메모리에 캐시
+"""
+import base64
+import binascii
+import hashlib
+import html
+import re
+import threading
+from collections import OrderedDict
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from app.services.file_storage_service import MAX_UPLOAD_BYTES, UPLOAD_URL_PREFIX, store_bytes
+from app.services.notice_search_service import html_to_text
+
+EXCERPT_LENGTH = 160
+
+# 정제 본문 캐시 최대 항목 수 (워커 단위)
+CONTENT_CACHE_SIZE = 256
+
+# 인라인 이미지 MIME → 저장 확장자 (SVG는 스크립트 포함 가능성으로 제외)
+INLINE_IMAGE_EXTS = {
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/jpg": ".jpg",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+    "image/bmp": ".bmp",
+}
+
+_INLINE_IMG_RE = re.compile(
+    r"""(<img\b[^>]*?\bsrc\s*=\s*)(["'])data:([a-z0-9.+/-]+);base64,([^"']*)\2""",
+    re.IGNORECASE
+)
+_IMG_SRC_RE = re.compile(r"""<img\b[^>]*?\bsrc\s*=\s*(["'])([^"']+)\1""", re.IGNORECASE)
+
+
+class InlineImageError(ValueError):
+    """인라인 이미지 형식/크기 오류 (요청 오류로 처리)"""
+
+
+# ---------------------------------------------------------------------------
+# HTML 정제 (Quill + quill-better-table 출력 기준 허용 목록)
+# ---------------------------------------------------------------------------
+ALLOWED_TAGS = {
+    "p", "br", "div", "span", "strong", "b", "em", "i", "u", "s", "strike", "sub", "sup",
+    "a", "ul", "ol", "li", "blockquote", "pre", "code", "hr",
+    "h1", "h2", "h3", "h4", "h5", "h6", "img", "iframe",
+    "table", "thead", "tbody", "tfoot", "tr", "td", "th", "colgroup", "col",
+}
+VOID_TAGS = {"br", "hr", "img", "col"}
+# 내용까지 제거하는 태그
+DROP_CONTENT_TAGS = {"script", "style", "noscript", "template", "object", "embed", "svg", "math", "textarea", "select"}
+
+GLOBAL_ATTRS = {"class", "style", "title", "spellcheck"}
+TAG_ATTRS = {
+    "a": {"href", "target", "rel"},
+    "img": {"src", "alt", "width", "height"},
+    "iframe": {"src", "frameborder", "allowfullscreen"},
+    "td": {"colspan", "rowspan"},
+    "th": {"colspan", "rowspan"},
+    "col": {"width"},
+    "table": {"width"},
+}
+URL_ATTRS = {"href", "src"}
+# iframe은 Quill 동영상 삽입(class="ql-video")이 만드는 허용 호스트의 https 주소만 유지 (sandbox 부여)
+IFRAME_HOSTS = {
+    "www.youtube.com", "youtube.com", "www.youtube-nocookie.com",
+    "player.vimeo.com",
+}
+IFRAME_SANDBOX = "allow-scripts allow-same-origin allow-presentation allow-popups"
+_SAFE_URL_RE = re.compile(r"^(https?:|mailto:|tel:|/|#|\.{0,2}/)|^[^:]*$", re.IGNORECASE)
+_UNSAFE_STYLE_RE = re.compile(r"expression|javascript:|url\s*\(|behavior|@import", re.IGNORECASE)
+
+
+def _safe_url(tag: str, value: str) -> bool:
+    value = value.strip()
+    if tag in ("img", "iframe"):
+        # 이미지/동영상은 http(s)와 상대 경로만 (data: 는 추출 대상)
+        return bool(re.match(r"^(https?:|/)", value, re.IGNORECASE))
+    compact = re.sub(r"[\x00-\x20]", "", value)
+    return bool(_SAFE_URL_RE.match(compact))
+
+
+def _allowed_iframe(attrs) -> bool:
+    values = {(n or "").lower(): (v or "") for n, v in attrs}
+    if "ql-video" not in values.get("class", "").split():
+        return False
+    src = urlsplit(values.get("src", "").strip())
+    return src.scheme.lower() == "https" and (src.hostname or "").lower() in IFRAME_HOSTS
+
+
+class _Sanitizer(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.out: List[str] = []
+        self.drop_depth = 0
+        self.open_tags: List[str] = []
+
+    def _attrs(self, tag: str, attrs) -> str:
+        allowed = GLOBAL_ATTRS | TAG_ATTRS.get(tag, set())
+        parts = []
+        for name, value in attrs:
+            name = (name or "").lower()
+            value = value or ""
+            if not (name in allowed or name.startswith("data-")):
+                continue
+            if name in URL_ATTRS and not _safe_url(tag, value):
+                continue
+            if name == "style" and _UNSAFE_STYLE_RE.search(value):
+                continue
+            parts.append(f' {name}="{html.escape(value, quote=True)}"')
+        if tag == "a" and any(n == "target" for n, _ in attrs):
+            parts.append(' rel="noopener noreferrer"')
+        if tag == "iframe":
+            parts.append(f' sandbox="{IFRAME_SANDBOX}"')
+        return "".join(parts)
+
+    def handle_starttag(self, tag, attrs):
+        tag = tag.lower()
+        if tag in DROP_CONTENT_TAGS:
+            if tag not in VOID_TAGS:
+                self.drop_depth += 1
+            return
+        if self.drop_depth or tag not in ALLOWED_TAGS:
+            return
+        if tag in ("img", "iframe") and not any(n == "src" and _safe_url(tag, v or "") for n, v in attrs):
+            return
+        if tag == "iframe" and not _allowed_iframe(attrs):
+            return
+        if tag == "a":
+            attrs = [(n, v) for n, v in attrs if n != "rel"]
+        self.out.append(f"<{tag}{self._attrs(tag, attrs)}>")
+        if tag not in VOID_TAGS:
+            self.open_tags.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag.lower() not in VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        tag = tag.lower()
+        if tag in DROP_CONTENT_TAGS:
+            self.drop_depth = max(0, self.drop_depth - 1)
+            return
+        if self.drop_depth or tag not in ALLOWED_TAGS or tag in VOID_TAGS:
+            return
+        if tag not in self.open_tags:
+            return
+        # 짝이 맞지 않는 태그는 안쪽부터 닫아 구조 유지
+        while self.open_tags:
+            current = self.open_tags.pop()
+            self.out.append(f"</{current}>")
+            if current == tag:
+                break
+
+    def handle_data(self, data):
+        if not self.drop_depth:
+            self.out.append(html.escape(data, quote=False))
+
+    def result(self) -> str:
+        self.close()
+        while self.open_tags:
+            self.out.append(f"</{self.open_tags.pop()}>")
+        return "".join(self.out)
+
+
+def sanitize_html(value: Optional[str]) -> str:
+    """허용 태그/속성만 남긴 표시용 HTML"""
+    if not value:
+        return ""
+    parser = _Sanitizer()
+    parser.feed(value)
+    return parser.result()
+
+
+def make_excerpt(content_text: Optional[str], length: int = EXCERPT_LENGTH) -> str:
+    """목록용 평문 요약 (단어 경계에서 자름)"""
+    if not content_text:
+        return ""
+    if len(content_text) <= length:
+        return content_text
+    cut = content_text[:length]
+    space = cut.rfind(" ")
+    if space > length // 2:
+        cut = cut[:space]
+    return cut.rstrip() + "…"
+
+
+# ---------------------------------------------------------------------------
+# 인라인 이미지 추출
+# ---------------------------------------------------------------------------
+def extract_inline_images(
+    db: Session,
+    company_cd: str,
+    content: str,
+    login_id: Optional[str]
+) -> Tuple[str, List[int]]:
+    """
+    base64 인라인 이미지를 업로드 파일로 저장하고 src를 파일 URL로 치환
+    (commit은 호출자가 수행, 같은 본문 안의 동일 이미지는 한 번만 저장)
+
+    Returns:
+        (치환된 본문, 새로 저장한 file_id 목록)
+    """
+    if not content or "base64," not in content:
+        return content, []
+
+    saved: Dict[str, str] = {}
+    file_ids: List[int] = []
+
+    def _replace(match: "re.Match") -> str:
+        prefix, quote, mime_type, payload = match.groups()
+        mime_type = mime_type.lower()
+        ext = INLINE_IMAGE_EXTS.get(mime_type)
+        if not ext:
+            raise InlineImageError(f"지원하지 않는 인라인 이미지 형식입니다: {mime_type}")
+        try:
+            data = base64.b64decode(re.sub(r"\s+", "", payload), validate=True)
+        except (binascii.Error, ValueError):
+            raise InlineImageError("인라인 이미지 데이터가 올바르지 않습니다.")
+        if len(data) > MAX_UPLOAD_BYTES:
+            raise InlineImageError("인라인 이미지 용량 제한을 초과했습니다.")
+        digest = hashlib.sha256(data).hexdigest()
+        url = saved.get(digest)
+        if not url:
+            stored = store_bytes(db, company_cd, data, f"inline-{digest[:12]}{ext}", mime_type, login_id)
+            url = stored["url"]
+            saved[digest] = url
+            file_ids.append(int(stored["file_id"]))
+        return f"{prefix}{quote}{url}{quote}"
+
+    return _INLINE_IMG_RE.sub(_replace, content), file_ids
+
+
+def referenced_upload_urls(company_cd: str, content: Optional[str]) -> Set[str]:
+    """본문 <img>가 참조하는 해당 회사 업로드 파일 URL"""
+    if not content:
+        return set()
+    prefix = f"{UPLOAD_URL_PREFIX}/{company_cd}/"
+    return {src for _, src in _IMG_SRC_RE.findall(content) if src.startswith(prefix)}
+
+
+def sync_content_files(db: Session, company_cd: str, notice_id: int, content: Optional[str]) -> None:
+    """본문 참조 파일 목록 동기화 (변경분만 반영, commit은 호출자가 수행)"""
+    urls = referenced_upload_urls(company_cd, content)
+    wanted: Set[int] = set()
+    if urls:
+        stmt = text("""
+            SELECT file_id
+            FROM uploaded_files
+            WHERE company_cd = :company_cd
+              AND file_url IN :urls
+        """).bindparams(bindparam("urls", expanding=True))
+        wanted = {int(fid) for fid in db.execute(stmt, {"company_cd": company_cd, "urls": sorted(urls)}).scalars()}
+
+    current = {
+        int(fid) for fid in db.execute(text("""
+            SELECT file_id
+            FROM board_notice_content_files
+            WHERE company_cd = :company_cd
+              AND notice_id = :notice_id
+        """), {"company_cd": company_cd, "notice_id": notice_id}).scalars()
+    }
+    removed = current - wanted
+    added = wanted - current
+    if removed:
+        db.execute(text("""
+            DELETE FROM board_notice_content_files
+            WHERE company_cd = :company_cd
+              AND notice_id = :notice_id
+              AND file_id IN :file_ids
+        """).bindparams(bindparam("file_ids", expanding=True)),
+            {"company_cd": company_cd, "notice_id": notice_id, "file_ids": sorted(removed)})
+    if added:
+        db.execute(text("""
+            INSERT IGNORE INTO board_notice_content_files (company_cd, notice_id, file_id)
+            VALUES (:company_cd, :notice_id, :file_id)
+        """), [
+            {"company_cd": company_cd, "notice_id": notice_id, "file_id": fid}
+            for fid in sorted(added)
+        ])
+
+
+def process_notice_content(
+    db: Session,
+    company_cd: str,
+    content: Optional[str],
+    login_id: Optional[str]
+) -> dict:
+    """
+    등록/수정 본문 처리 결과
+    content(이미지 치환 원본), content_html, content_text, excerpt, inline_file_ids
+    """
+    content, inline_file_ids = extract_inline_images(db, company_cd, content or "", login_id)
+    content_text = html_to_text(content)
+    return {
+        "content": content,
+        "content_html": sanitize_html(content),
+        "content_text": content_text,
+        "excerpt": make_excerpt(content_text),
+        "inline_file_ids": inline_file_ids,
+    }
+
+
+# ---------------------------------------------------------------------------
+# 정제 본문 캐시
+# ---------------------------------------------------------------------------
+_cache: "OrderedDict[Tuple[str, int], Tuple[object, dict]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def invalidate_content_cache(company_cd: str, notice_id: int) -> None:
+    with _cache_lock:
+        _cache.pop((company_cd, int(notice_id)), None)
+
+
+def get_notice_content(db: Session, company_cd: str, notice_id: int, updated_at) -> Optional[dict]:
+    """
+    게시글 본문(content, content_html) 조회
+    updated_at이 캐시와 같으면 본문 컬럼을 다시 읽지 않는다.
+    content_html이 없는 기존 게시글은 조회 시 정제해 캐시한다.
+    iframe 정책 강화 전에 저장된 정제본은 iframe이 있을 때만 다시 정제한다.
+    """
+    key = (company_cd, int(notice_id))
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached and cached[0] == updated_at:
+            _cache.move_to_end(key)
+            return cached[1]
+
+    row = db.execute(text("""
+        SELECT content, content_html, updated_at
+        FROM board_notices
+        WHERE company_cd = :company_cd
+          AND notice_id = :notice_id
+    """), {"company_cd": company_cd, "notice_id": notice_id}).fetchone()
+    if not row:
+        return None
+    content_html = row.content_html
+    if content_html is None:
+        content_html = sanitize_html(row.content)
+    elif "<iframe" in content_html:
+        content_html = sanitize_html(content_html)
+    data = {
+        "content": row.content or "",
+        "content_html": content_html,
+    }
+    with _cache_lock:
+        _cache[key] = (row.updated_at, data)
+        _cache.move_to_end(key)
+        while len(_cache) > CONTENT_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return data
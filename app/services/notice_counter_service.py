@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+게시글 집계 컬럼(board_notices.*_count) 관리
+- 답글/첨부/반응/읽음 쓰기 경로에서 해당 게시글의 집계만 재계산 (같은 트랜잭션)
+- 누락/불일치 보정용 전체 재집계(reconcile) 제공
+"""
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+
+# 집계 컬럼 → 게시글(n) 기준 상관 서브쿼리
+NOTICE_COUNTERS: Dict[str, str] = {
+    "reply_count": """
+        SELECT COUNT(*) FROM board_notice_replies x
+        WHERE x.company_cd = n.company_cd AND x.notice_id = n.notice_id
+    """,
+    "attach_count": """
+        SELECT COUNT(*) FROM board_notice_files x
+        WHERE x.company_cd = n.company_cd AND x.notice_id = n.notice_id
+    """,
+    "like_count": """
+        SELECT COUNT(*) FROM board_notice_reactions x
+        WHERE x.company_cd = n.company_cd AND x.notice_id = n.notice_id AND x.reaction = 'LIKE'
+    """,
+    "check_count": """
+        SELECT COUNT(*) FROM board_notice_reactions x
+        WHERE x.company_cd = n.company_cd AND x.notice_id = n.notice_id AND x.reaction = 'CHECK'
+    """,
+    "read_count": """
+        SELECT COUNT(*) FROM board_notice_reads x
+        WHERE x.company_cd = n.company_cd AND x.notice_id = n.notice_id
+    """,
+}
+
+REACTION_COUNTERS = {"LIKE": "like_count", "CHECK": "check_count"}
+
+
+def refresh_notice_counters(
+    db: Session,
+    company_cd: str,
+    notice_ids: Iterable[int],
+    counters: Optional[Iterable[str]] = None
+) -> None:
+    """
+    지정 게시글의 집계 컬럼 재계산 (commit은 호출자가 수행)
+
+    증감(+1/-1) 대신 재계산을 사용해 INSERT IGNORE 중복이나
+    답글 삭제 시 첨부 CASCADE 삭제 같은 경우에도 값이 어긋나지 않도록 한다.
+    """
+    ids = sorted({int(nid) for nid in notice_ids if nid})
+    if not ids:
+        return
+    names = [c for c in (counters or NOTICE_COUNTERS.keys()) if c in NOTICE_COUNTERS]
+    if not names:
+        return
+    assignments = ", ".join(f"n.{name} = ({NOTICE_COUNTERS[name]})" for name in names)
+    # 집계 갱신은 게시글 수정이 아니므로 updated_at 유지
+    stmt = text(f"""
+        UPDATE board_notices n
+        SET {assignments},
+            n.updated_at = n.updated_at
+        WHERE n.company_cd = :company_cd
+          AND n.notice_id IN :notice_ids
+    """).bindparams(bindparam("notice_ids", expanding=True))
+    db.execute(stmt, {"company_cd": company_cd, "notice_ids": ids})
+
+
+def add_notice_counter(db: Session, company_cd: str, notice_id: int, counter: str, delta: int) -> int:
+    """
+    집계 컬럼 증감 (affected rows로 변화량이 확정된 경우에 사용, 갱신 행 수 반환)
+    """
+    if counter not in NOTICE_COUNTERS:
+        raise ValueError(f"unknown counter: {counter}")
+    result = db.execute(text(f"""
+        UPDATE board_notices
+        SET {counter} = GREATEST({counter} + :delta, 0),
+            updated_at = updated_at
+        WHERE company_cd = :company_cd
+          AND notice_id = :notice_id
+    """), {"company_cd": company_cd, "notice_id": notice_id, "delta": delta})
+    return result.rowcount or 0
+
+
+def reconcile_notice_counters(db: Session, company_cd: Optional[str] = None) -> int:
+    """
+    집계 컬럼 전체 재집계 (값이 다른 게시글만 갱신, 갱신 건수 반환)
+
+    Args:
+        company_cd: 지정 시 해당 회사만, None이면 전체 회사
+    """
+    where = "WHERE company_cd = :company_cd" if company_cd else ""
+    n_where = "AND n.company_cd = :company_cd" if company_cd else ""
+    params = {"company_cd": company_cd} if company_cd else {}
+
+    result = db.execute(text(f"""
+        UPDATE board_notices n
+        LEFT JOIN (
+            SELECT company_cd, notice_id, COUNT(*) AS cnt
+            FROM board_notice_replies {where}
+            GROUP BY company_cd, notice_id
+        ) r ON r.company_cd = n.company_cd AND r.notice_id = n.notice_id
+        LEFT JOIN (
+            SELECT company_cd, notice_id, COUNT(*) AS cnt
+            FROM board_notice_files {where}
+            GROUP BY company_cd, notice_id
+        ) f ON f.company_cd = n.company_cd AND f.notice_id = n.notice_id
+        LEFT JOIN (
+            SELECT company_cd, notice_id,
+                   SUM(reaction = 'LIKE') AS like_cnt,
+                   SUM(reaction = 'CHECK') AS check_cnt
+            FROM board_notice_reactions {where}
+            GROUP BY company_cd, notice_id
+        ) a ON a.company_cd = n.company_cd AND a.notice_id = n.notice_id
+        LEFT JOIN (
+            SELECT company_cd, notice_id, COUNT(*) AS cnt
+            FROM board_notice_reads {where}
+            GROUP BY company_cd, notice_id
+        ) d ON d.company_cd = n.company_cd AND d.notice_id = n.notice_id
+        SET n.reply_count = COALESCE(r.cnt, 0),
+            n.attach_count = COALESCE(f.cnt, 0),
+            n.like_count = COALESCE(a.like_cnt, 0),
+            n.check_count = COALESCE(a.check_cnt, 0),
+            n.read_count = COALESCE(d.cnt, 0),
+            n.updated_at = n.updated_at
+        WHERE (
+            n.reply_count <> COALESCE(r.cnt, 0)
+            OR n.attach_count <> COALESCE(f.cnt, 0)
+            OR n.like_count <> COALESCE(a.like_cnt, 0)
+            OR n.check_count <> COALESCE(a.check_cnt, 0)
+            OR n.read_count <> COALESCE(d.cnt, 0)
+        ) {n_where}
+    """), params)
+    return result.rowcount or 0
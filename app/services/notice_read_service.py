@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+게시글 읽음 현황 (관리자 확인용)
+- 읽은 사용자: board_notice_reads 페이지 조회 (users 조인 없이 참조 캐시로 이름 해석)
+- 안 읽은 사용자: 재직자 집합(참조 캐시) - 읽은 사용자 집합
+- 게시글별 읽은 사용자 집합은 워커 메모리에 짧게 캐시 (건수 계산용)
+"""
+import threading
+import time
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.services.user_reference_cache import get_active_user_ids, get_user
+
+READ_SET_CACHE_TTL_SEC = 30
+
+_cache: Dict[Tuple[str, int], Tuple[float, FrozenSet[str]]] = {}
+_cache_lock = threading.Lock()
+
+
+def invalidate_read_receipts(company_cd: str, notice_ids: Optional[Iterable[int]] = None) -> None:
+    with _cache_lock:
+        if notice_ids is None:
+            for key in [k for k in _cache if k[0] == company_cd]:
+                _cache.pop(key, None)
+        else:
+            for notice_id in notice_ids:
+                _cache.pop((company_cd, int(notice_id)), None)
+
+
+def _reader_set(db: Session, company_cd: str, notice_id: int) -> FrozenSet[str]:
+    key = (company_cd, int(notice_id))
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+    readers = frozenset(db.execute(text("""
+        SELECT reader_id
+        FROM board_notice_reads
+        WHERE company_cd = :company_cd
+          AND notice_id = :notice_id
+    """), {"company_cd": company_cd, "notice_id": notice_id}).scalars())
+    with _cache_lock:
+        _cache[key] = (now + READ_SET_CACHE_TTL_SEC, readers)
+    return readers
+
+
+def _user_fields(db: Session, company_cd: str, login_id: str) -> dict:
+    user = get_user(db, company_cd, login_id) or {}
+    return {
+        "reader_name": user.get("user_name"),
+        "department": user.get("department"),
+        "team": user.get("team"),
+        "is_active": bool(user.get("is_active")),
+    }
+
+
+def get_read_summary(db: Session, company_cd: str, notice_id: int) -> dict:
+    """읽음/미읽음 건수 (재직자 기준)"""
+    readers = _reader_set(db, company_cd, notice_id)
+    active_ids = get_active_user_ids(db, company_cd)
+    active_read = sum(1 for uid in active_ids if uid in readers)
+    return {
+        "count": len(readers),
+        "active_total": len(active_ids),
+        "active_read": active_read,
+        "unread_count": len(active_ids) - active_read,
+    }
+
+
+def list_readers(db: Session, company_cd: str, notice_id: int, page: int, page_size: int) -> dict:
+    """읽은 사용자 (최근 읽은 순 페이지)"""
+    total = len(_reader_set(db, company_cd, notice_id))
+    rows = db.execute(text("""
+        SELECT reader_id, created_at
+        FROM board_notice_reads
+        WHERE company_cd = :company_cd
+          AND notice_id = :notice_id
+        ORDER BY created_at DESC, reader_id
+        LIMIT :limit OFFSET :offset
+    """), {
+        "company_cd": company_cd,
+        "notice_id": notice_id,
+        "limit": page_size,
+        "offset": (page - 1) * page_size
+    }).fetchall()
+    items = []
+    for row in rows:
+        item = {"reader_id": row.reader_id, "created_at": row.created_at}
+        item.update(_user_fields(db, company_cd, row.reader_id))
+        items.append(item)
+    return {"items": items, "total_records": total}
+
+
+def list_unread_users(db: Session, company_cd: str, notice_id: int, page: int, page_size: int) -> dict:
+    """안 읽은 재직자 (이름순 페이지)"""
+    readers = _reader_set(db, company_cd, notice_id)
+    unread = [uid for uid in get_active_user_ids(db, company_cd) if uid not in readers]
+    offset = (page - 1) * page_size
+    items = []
+    for login_id in unread[offset:offset + page_size]:
+        item = {"reader_id": login_id, "created_at": None}
+        item.update(_user_fields(db, company_cd, login_id))
+        items.append(item)
+    return {"items": items, "total_records": len(unread)}
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+게시글 전문 검색(FULLTEXT ngram) 지원
+- board_notices.content_text: Quill HTML 본문에서 태그를 제거한 검색용 텍스트
+- MATCH ... AGAINST (BOOLEAN MODE) 질의 생성 및 관련도 정렬
+- 검색어 하이라이트 스니펫 생성
+"""
+import html
+import re
+from typing import List, Optional, Tuple
+
+# ngram_token_size 기본값 (MySQL 서버 설정과 동일해야 함)
+NGRAM_TOKEN_SIZE = 2
+
+# search_field → FULLTEXT 인덱스 컬럼 목록 (MATCH 컬럼은 인덱스 정의와 정확히 일치해야 함)
+FULLTEXT_COLUMNS = {
+    "title": "n.title",
+    "content": "n.content_text",
+    "all": "n.title, n.content_text, n.hashtags",
+}
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_BLOCK_TAG_RE = re.compile(r"</?(p|div|br|li|tr|td|th|h[1-6])\b[^>]*>", re.IGNORECASE)
+_WS_RE = re.compile(r"\s+")
+_BOOLEAN_CHARS_RE = re.compile(r'[+\-<>()~*"@]')
+
+
+def html_to_text(value: Optional[str]) -> str:
+    """HTML 본문 → 검색/요약용 평문 (블록 태그는 공백으로 치환)"""
+    if not value:
+        return ""
+    text = _BLOCK_TAG_RE.sub(" ", value)
+    text = _TAG_RE.sub("", text)
+    text = html.unescape(text)
+    return _WS_RE.sub(" ", text).strip()
+
+
+def split_terms(search_text: Optional[str]) -> List[str]:
+    """검색어 분리 (불리언 연산자 문자 제거, 중복 제거)"""
+    if not search_text:
+        return []
+    cleaned = _BOOLEAN_CHARS_RE.sub(" ", search_text)
+    seen = set()
+    terms = []
+    for term in cleaned.split():
+        key = term.lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        terms.append(term)
+    return terms
+
+
+def build_boolean_query(terms: List[str]) -> Optional[str]:
+    """
+    BOOLEAN MODE 질의 생성 (모든 단어 포함, 단어는 구문 검색)
+    ngram 토큰보다 짧은 단어가 있으면 FULLTEXT로 찾을 수 없으므로 None
+    """
+    if not terms or any(len(term) < NGRAM_TOKEN_SIZE for term in terms):
+        return None
+    return " ".join(f'+"{term}"' for term in terms)
+
+
+def make_snippet(text: Optional[str], terms: List[str], width: int = 120) -> str:
+    """
+    첫 일치 위치 주변 텍스트를 잘라 <mark>로 강조 (HTML 이스케이프 처리됨)
+    """
+    if not text:
+        return ""
+    lowered = text.lower()
+    positions = [lowered.find(term.lower()) for term in terms]
+    positions = [p for p in positions if p >= 0]
+    start = 0
+    if positions and len(text) > width:
+        start = max(0, min(positions) - width // 3)
+    fragment = text[start:start + width]
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if start + width < len(text) else ""
+
+    escaped = html.escape(fragment)
+    if terms:
+        pattern = re.compile("|".join(re.escape(html.escape(t)) for t in sorted(terms, key=len, reverse=True)), re.IGNORECASE)
+        escaped = pattern.sub(lambda m: f"<mark>{m.group(0)}</mark>", escaped)
+    return f"{prefix}{escaped}{suffix}"
+
+
+def fulltext_condition(search_field: Optional[str], terms: List[str]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    (WHERE 조건, 관련도 식) 반환 — FULLTEXT 사용 불가 시 (None, None)
+    질의 문자열은 :ft_query 파라미터로 바인딩한다.
+    """
+    columns = FULLTEXT_COLUMNS.get(search_field or "all")
+    if not columns or build_boolean_query(terms) is None:
+        return None, None
+    match = f"MATCH({columns}) AGAINST (:ft_query IN BOOLEAN MODE)"
+    return match, match
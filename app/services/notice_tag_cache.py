@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+게시글 해시태그 패싯 캐시 (회사별)
+- tag → 게시글 ID 집합을 워커 메모리에 보관 (태그 자동완성/건수, 목록 태그 필터)
+- 같은 워커의 태그 변경 시 즉시 무효화, 다른 워커 변경분은 TTL 만료 후 반영
+"""
+import threading
+import time
+from typing import Dict, List, Optional, Set
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+TAG_CACHE_TTL_SEC = 60
+
+# 태그 필터 결과가 이보다 많으면 IN 목록 대신 DB 조인(EXISTS) 사용
+TAG_FILTER_MAX_IDS = 1000
+
+
+class _TenantTags:
+    __slots__ = ("expires_at", "notices")
+
+    def __init__(self, expires_at: float, notices: Dict[str, Set[int]]):
+        self.expires_at = expires_at
+        self.notices = notices
+
+
+_cache: Dict[str, _TenantTags] = {}
+_cache_lock = threading.Lock()
+
+
+def invalidate_tag_cache(company_cd: str) -> None:
+    with _cache_lock:
+        _cache.pop(company_cd, None)
+
+
+def _load(db: Session, company_cd: str) -> Dict[str, Set[int]]:
+    with _cache_lock:
+        entry = _cache.get(company_cd)
+    if entry and entry.expires_at > time.monotonic():
+        return entry.notices
+
+    rows = db.execute(text("""
+        SELECT tag, notice_id
+        FROM board_notice_tags
+        WHERE company_cd = :company_cd
+    """), {"company_cd": company_cd}).fetchall()
+    notices: Dict[str, Set[int]] = {}
+    for row in rows:
+        notices.setdefault(row.tag, set()).add(int(row.notice_id))
+    with _cache_lock:
+        _cache[company_cd] = _TenantTags(time.monotonic() + TAG_CACHE_TTL_SEC, notices)
+    return notices
+
+
+def get_tag_facets(db: Session, company_cd: str, prefix: Optional[str] = None, limit: int = 20) -> List[dict]:
+    """태그별 게시글 수 (prefix 자동완성, 건수 내림차순)"""
+    notices = _load(db, company_cd)
+    key = (prefix or "").strip().lstrip("#").lower()
+    items = [
+        {"tag": tag, "count": len(ids)}
+        for tag, ids in notices.items()
+        if not key or tag.startswith(key)
+    ]
+    items.sort(key=lambda item: (-item["count"], item["tag"]))
+    return items[:limit]
+
+
+def get_tagged_notice_ids(db: Session, company_cd: str, tags: List[str]) -> Optional[Set[int]]:
+    """
+    태그 중 하나라도 가진 게시글 ID 집합
+    결과가 TAG_FILTER_MAX_IDS를 넘으면 None (호출자는 DB 조건으로 대체)
+    """
+    notices = _load(db, company_cd)
+    result: Set[int] = set()
+    for tag in tags:
+        result |= notices.get(tag, set())
+        if len(result) > TAG_FILTER_MAX_IDS:
+            return None
+    return result
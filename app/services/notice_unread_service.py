@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""
+사용자별 미읽음 게시글 수 (헤더 배지)
+- board_notice_read_marks.watermark_id: 이 ID 이하 게시글은 모두 읽음으로 간주
+- watermark 이후 구간만 board_notice_reads(개별 읽음 = 예외 목록)와 비교하므로
+  전체 게시글 anti-join 없이 짧은 범위 스캔으로 계산
+- 읽음 기록이 반영될 때 연속해서 읽은 구간만큼 watermark를 전진시킨다.
+"""
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from app.services.notice_counter_service import refresh_notice_counters
+
+# 배지 조회 결과 캐시 (워커 단위, 초)
+UNREAD_CACHE_TTL_SEC = 15
+
+_cache: Dict[Tuple[str, str], Tuple[float, dict]] = {}
+_cache_lock = threading.Lock()
+
+# 배지 대상: 게시 기간 내 + 본인 작성 글 제외
+_VISIBLE_SQL = """
+    (n.start_date IS NULL OR n.start_date <= CURDATE())
+    AND (n.end_date IS NULL OR n.end_date >= CURDATE())
+    AND n.author_id <> :reader_id
+"""
+
+# watermark 전진을 막는 게시글: 앞으로 배지 대상이 될 수 있는 글 (게시 예정 포함)
+_PENDING_SQL = """
+    (n.end_date IS NULL OR n.end_date >= CURDATE())
+    AND n.author_id <> :reader_id
+"""
+
+
+def invalidate_unread_cache(company_cd: str, reader_id: Optional[str] = None) -> None:
+    with _cache_lock:
+        if reader_id:
+            _cache.pop((company_cd, reader_id), None)
+        else:
+            for key in [k for k in _cache if k[0] == company_cd]:
+                _cache.pop(key, None)
+
+
+def _get_watermark(db: Session, company_cd: str, reader_id: str) -> int:
+    row = db.execute(text("""
+        SELECT watermark_id
+        FROM board_notice_read_marks
+        WHERE company_cd = :company_cd
+          AND reader_id = :reader_id
+    """), {"company_cd": company_cd, "reader_id": reader_id}).fetchone()
+    return int(row.watermark_id) if row else 0
+
+
+def _set_watermark(db: Session, company_cd: str, reader_id: str, watermark_id: int) -> None:
+    # watermark는 뒤로 가지 않음
+    db.execute(text("""
+        INSERT INTO board_notice_read_marks (company_cd, reader_id, watermark_id)
+        VALUES (:company_cd, :reader_id, :watermark_id)
+        ON DUPLICATE KEY UPDATE
+            watermark_id = GREATEST(watermark_id, VALUES(watermark_id))
+    """), {"company_cd": company_cd, "reader_id": reader_id, "watermark_id": watermark_id})
+
+
+def advance_read_watermarks(db: Session, company_cd: str, reader_ids: Iterable[str]) -> None:
+    """
+    watermark 다음부터 연속으로 읽은(또는 다시 배지 대상이 될 수 없는) 게시글 구간만큼 전진
+    (commit은 호출자가 수행)
+    """
+    for reader_id in sorted(set(reader_ids)):
+        if not reader_id:
+            continue
+        watermark = _get_watermark(db, company_cd, reader_id)
+        params = {"company_cd": company_cd, "reader_id": reader_id, "watermark": watermark}
+        first_unread = db.execute(text(f"""
+            SELECT MIN(n.notice_id)
+            FROM board_notices n
+            WHERE n.company_cd = :company_cd
+              AND n.notice_id > :watermark
+              AND {_PENDING_SQL}
+              AND NOT EXISTS (
+                  SELECT 1
+                  FROM board_notice_reads r
+                  WHERE r.company_cd = n.company_cd
+                    AND r.notice_id = n.notice_id
+                    AND r.reader_id = :reader_id
+              )
+        """), params).scalar()
+        if first_unread is not None:
+            new_watermark = int(first_unread) - 1
+        else:
+            new_watermark = db.execute(text("""
+                SELECT COALESCE(MAX(notice_id), 0)
+                FROM board_notices
+                WHERE company_cd = :company_cd
+            """), params).scalar()
+            new_watermark = int(new_watermark or 0)
+        if new_watermark > watermark:
+            _set_watermark(db, company_cd, reader_id, new_watermark)
+        invalidate_unread_cache(company_cd, reader_id)
+
+
+def mark_all_read(db: Session, company_cd: str, reader_id: str, category: Optional[str] = None) -> int:
+    """
+    모두 읽음 처리 (commit은 호출자가 수행, 새로 읽음 처리한 건수 반환)
+    - watermark 이후의 배지 대상 게시글(분류 지정 시 해당 분류만)을 읽음 기록 후 watermark 전진
+    - watermark 이전 구간은 이미 읽음으로 간주되므로 기록 대상이 watermark 이후로 한정됨
+    """
+    params = {
+        "company_cd": company_cd,
+        "reader_id": reader_id,
+        "watermark": _get_watermark(db, company_cd, reader_id)
+    }
+    category_sql = ""
+    if category:
+        category_sql = "AND n.category = :category"
+        params["category"] = category
+    notice_ids = db.execute(text(f"""
+        SELECT n.notice_id
+        FROM board_notices n
+        WHERE n.company_cd = :company_cd
+          AND n.notice_id > :watermark
+          AND {_VISIBLE_SQL}
+          {category_sql}
+          AND NOT EXISTS (
+              SELECT 1
+              FROM board_notice_reads r
+              WHERE r.company_cd = n.company_cd
+                AND r.notice_id = n.notice_id
+                AND r.reader_id = :reader_id
+          )
+    """), params).scalars().all()
+    if notice_ids:
+        db.execute(text("""
+            INSERT IGNORE INTO board_notice_reads (company_cd, notice_id, reader_id)
+            VALUES (:company_cd, :notice_id, :reader_id)
+        """), [
+            {"company_cd": company_cd, "notice_id": nid, "reader_id": reader_id}
+            for nid in notice_ids
+        ])
+        refresh_notice_counters(db, company_cd, notice_ids, ["read_count"])
+    advance_read_watermarks(db, company_cd, [reader_id])
+    return len(notice_ids)
+
+
+def get_unread_counts(
+    db: Session,
+    company_cd: str,
+    reader_id: str,
+    use_cache: bool = True,
+    read_notice_ids: Optional[Iterable[int]] = None
+) -> dict:
+    """
+    미읽음 게시글 수 (전체 + 분류별)
+    read_notice_ids: 아직 DB에 반영되지 않은 본인 읽음 (조회 버퍼) — 읽음으로 간주해 제외, 캐시 미사용
+    """
+    key = (company_cd, reader_id)
+    now = time.monotonic()
+    excluded = sorted(set(read_notice_ids or []))
+    if use_cache and not excluded:
+        with _cache_lock:
+            cached = _cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+
+    watermark = _get_watermark(db, company_cd, reader_id)
+    params = {"company_cd": company_cd, "reader_id": reader_id, "watermark": watermark}
+    exclude_sql = ""
+    if excluded:
+        exclude_sql = "AND n.notice_id NOT IN :read_notice_ids"
+        params["read_notice_ids"] = excluded
+    sql = text(f"""
+        SELECT n.category, COUNT(*) AS cnt
+        FROM board_notices n
+        WHERE n.company_cd = :company_cd
+          AND n.notice_id > :watermark
+          AND {_VISIBLE_SQL}
+          {exclude_sql}
+          AND NOT EXISTS (
+              SELECT 1
+              FROM board_notice_reads r
+              WHERE r.company_cd = n.company_cd
+                AND r.notice_id = n.notice_id
+                AND r.reader_id = :reader_id
+          )
+        GROUP BY n.category
+    """)
+    if excluded:
+        sql = sql.bindparams(bindparam("read_notice_ids", expanding=True))
+    rows = db.execute(sql, params).fetchall()
+
+    by_category = {(row.category or "GENERAL"): int(row.cnt) for row in rows}
+    result = {
+        "total": sum(by_category.values()),
+        "by_category": by_category,
+        "watermark": watermark
+    }
+    if not excluded:
+        with _cache_lock:
+            _cache[key] = (now + UNREAD_CACHE_TTL_SEC, result)
+    return result
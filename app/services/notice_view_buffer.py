@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+게시글 조회수/읽음 기록 지연 반영(write-behind) 버퍼
+- 게시글 열람 시 즉시 UPDATE/INSERT 하지 않고 워커 메모리에 누적
+- 주기(NOTICE_VIEW_FLUSH_INTERVAL_SEC) 또는 누적 건수(NOTICE_VIEW_FLUSH_THRESHOLD) 도달 시
+  회사별 다중 행 UPDATE / INSERT IGNORE 로 일괄 반영
+- 종료 시 main.lifespan 에서 잔여분 반영
+"""
+import asyncio
+import threading
+import time
+from typing import Dict, Set, Tuple
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.logger import app_logger, db_logger
+from app.services.notice_counter_service import refresh_notice_counters
+from app.services.notice_read_service import invalidate_read_receipts
+from app.services.notice_unread_service import advance_read_watermarks
+
+
+class NoticeViewBuffer:
+    """워커(프로세스) 단위 조회수/읽음 누적기"""
+
+    def __init__(self, flush_interval: float, flush_threshold: int):
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._views: Dict[Tuple[str, int], int] = {}
+        self._reads: Set[Tuple[str, int, str]] = set()
+        self._last_flush = time.monotonic()
+
+    def record(self, company_cd: str, notice_id: int, reader_id: str = "") -> None:
+        """조회 1건 누적 (reader_id가 있으면 읽음 기록도 누적)"""
+        with self._lock:
+            key = (company_cd, notice_id)
+            self._views[key] = self._views.get(key, 0) + 1
+            if reader_id:
+                self._reads.add((company_cd, notice_id, reader_id))
+
+    def pending_views(self, company_cd: str, notice_id: int) -> int:
+        """아직 DB에 반영되지 않은 조회수"""
+        with self._lock:
+            return self._views.get((company_cd, notice_id), 0)
+
+    def pending_read_notice_ids(self, company_cd: str, reader_id: str) -> Set[int]:
+        """사용자의 미반영 읽음 게시글 ID (배지 계산 시 읽음으로 간주)"""
+        with self._lock:
+            return {r[1] for r in self._reads if r[0] == company_cd and r[2] == reader_id}
+
+    def pending_reader_ids(self, company_cd: str, notice_id: int) -> Set[str]:
+        """게시글의 미반영 읽음 사용자 (읽음 수에 합산)"""
+        with self._lock:
+            return {r[2] for r in self._reads if r[0] == company_cd and r[1] == notice_id}
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return sum(self._views.values()) + len(self._reads)
+
+    def should_flush(self) -> bool:
+        if self.pending_count() >= self.flush_threshold:
+            return True
+        return time.monotonic() - self._last_flush >= self.flush_interval
+
+    def _drain(self):
+        with self._lock:
+            views, self._views = self._views, {}
+            reads, self._reads = self._reads, set()
+        return views, reads
+
+    def _restore(self, views: Dict[Tuple[str, int], int], reads: Set[Tuple[str, int, str]]) -> None:
+        # 반영 실패분은 다음 주기에 재시도
+        with self._lock:
+            for key, count in views.items():
+                self._views[key] = self._views.get(key, 0) + count
+            self._reads.update(reads)
+
+    def flush(self) -> int:
+        """누적분을 DB에 일괄 반영 (반영한 건수 반환)"""
+        with self._flush_lock:
+            views, reads = self._drain()
+            self._last_flush = time.monotonic()
+            if not views and not reads:
+                return 0
+
+            db = SessionLocal()
+            try:
+                by_company: Dict[str, Dict[int, int]] = {}
+                for (company_cd, notice_id), count in views.items():
+                    by_company.setdefault(company_cd, {})[notice_id] = count
+
+                # 워커 간 잠금 순서를 맞추기 위해 키 순으로 반영
+                for company_cd, counts in sorted(by_company.items()):
+                    params = {"company_cd": company_cd}
+                    cases = []
+                    for idx, (notice_id, count) in enumerate(sorted(counts.items())):
+                        params[f"id_{idx}"] = notice_id
+                        params[f"cnt_{idx}"] = count
+                        cases.append(f"WHEN :id_{idx} THEN :cnt_{idx}")
+                    id_list = ", ".join(f":id_{idx}" for idx in range(len(counts)))
+                    db.execute(text(f"""
+                        UPDATE board_notices
+                        SET view_count = view_count + CASE notice_id {" ".join(cases)} ELSE 0 END,
+                            updated_at = updated_at
+                        WHERE company_cd = :company_cd
+                          AND notice_id IN ({id_list})
+                    """), params)
+
+                read_notices: Dict[str, Set[int]] = {}
+                if reads:
+                    params = {}
+                    values = []
+                    for idx, (company_cd, notice_id, reader_id) in enumerate(sorted(reads)):
+                        params[f"c_{idx}"] = company_cd
+                        params[f"n_{idx}"] = notice_id
+                        params[f"r_{idx}"] = reader_id
+                        values.append(f"(:c_{idx}, :n_{idx}, :r_{idx})")
+                    # 삭제된 게시글의 읽음 기록(FK 오류)도 IGNORE로 무시
+                    db.execute(text(f"""
+                        INSERT IGNORE INTO board_notice_reads (company_cd, notice_id, reader_id)
+                        VALUES {", ".join(values)}
+                    """), params)
+
+                    for company_cd, notice_id, _ in reads:
+                        read_notices.setdefault(company_cd, set()).add(notice_id)
+                    for company_cd, notice_ids in sorted(read_notices.items()):
+                        refresh_notice_counters(db, company_cd, notice_ids, ["read_count"])
+                    read_users: Dict[str, Set[str]] = {}
+                    for company_cd, _, reader_id in reads:
+                        read_users.setdefault(company_cd, set()).add(reader_id)
+                    for company_cd, reader_ids in sorted(read_users.items()):
+                        advance_read_watermarks(db, company_cd, reader_ids)
+
+                db.commit()
+                for company_cd, notice_ids in read_notices.items():
+                    invalidate_read_receipts(company_cd, notice_ids)
+                total = sum(views.values()) + len(reads)
+                db_logger.debug(f"📝 게시글 조회/읽음 반영: 조회 {sum(views.values())}건, 읽음 {len(reads)}건")
+                return total
+            except Exception as e:
+                db.rollback()
+                self._restore(views, reads)
+                db_logger.error(f"❌ 게시글 조회/읽음 반영 실패: {e}", exc_info=True)
+                return 0
+            finally:
+                db.close()
+
+    async def run(self, poll_interval: float = 1.0) -> None:
+        """주기/임계치 도달 시 반영하는 백그라운드 루프 (lifespan에서 실행)"""
+        while True:
+            await asyncio.sleep(poll_interval)
+            if self.should_flush():
+                try:
+                    await asyncio.to_thread(self.flush)
+                except Exception as e:
+                    app_logger.error(f"❌ 조회수 반영 루프 오류: {e}", exc_info=True)
+
+
+notice_view_buffer = NoticeViewBuffer(
+    flush_interval=settings.NOTICE_VIEW_FLUSH_INTERVAL_SEC,
+    flush_threshold=settings.NOTICE_VIEW_FLUSH_THRESHOLD
+)
@@ -16,6 +16,7 @@ from app.schemas.project_detail import (
     ProjectFullDetail, ProjectSaveRequest, ProjectSaveResponse
 )
 from app.core.tenant import get_company_cd
+from app.services.sync_service import record_deletions
 
 logger = logging.getLogger(__name__)
 
@@ -522,6 +523,12 @@ def save_project(db: Session, data: ProjectSaveRequest) -> ProjectSaveResponse:
                 elif row_stat == "D":  # 삭제
                     history_id = hist.get("history_id")
                     if history_id:
+                        record_deletions(
+                            db, "project_history",
+                            "t.company_cd = :company_cd AND t.history_id = :history_id",
+                            {"company_cd": company_cd, "history_id": history_id},
+                            deleted_by=data.user_id
+                        )
                         db.execute(text("""
                             DELETE FROM project_history 
                             WHERE company_cd = :company_cd
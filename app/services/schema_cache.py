@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""
+스키마 메타데이터 캐시 (information_schema 조회 대체)
+- 테이블/코멘트, 컬럼 순서/AUTO_INCREMENT, PK/UNIQUE 키, FK(부모 → 자식, 컬럼 쌍)를 쿼리 4회로 한 번에 읽어 워커 메모리에 보관
+- FK 기준 위상 정렬 순서를 미리 계산 (부분 집합은 전체 순서를 걸러 사용 — 부모가 항상 앞)
+- 회사 간 데이터 복제/동기화, 회사 생성 시 공통 테이블 복사에서 공용으로 사용
+- DDL 반영 후에는 refresh (관리 API 또는 복제 작업 시작 시), 그 외에는 TTL 만료 후 다시 읽음
+- 관리 API의 무효화는 schema_cache_versions 버전을 올려 다른 워커에도 전달
+  (get_schema마다 PK 조회 1회로 버전 비교, 테이블이 없으면 TTL만 사용)
+"""
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+
+SCHEMA_CACHE_TTL_SEC = 600
+SCHEMA_CACHE_NAME = "schema"
+
+
+def topological_sort(tables: List[str], edges: List[Tuple[str, str]]) -> List[str]:
+    """edges: parent -> child (사이클 등으로 정렬되지 않은 테이블은 원래 순서로 뒤에 추가)"""
+    table_set = set(tables)
+    adj: Dict[str, Set[str]] = {t: set() for t in tables}
+    in_deg: Dict[str, int] = {t: 0 for t in tables}
+
+    for parent, child in edges:
+        if parent == child:
+            continue
+        if parent not in table_set or child not in table_set:
+            continue
+        if child not in adj[parent]:
+            adj[parent].add(child)
+            in_deg[child] += 1
+
+    queue = [t for t in tables if in_deg[t] == 0]
+    result: List[str] = []
+    while queue:
+        node = queue.pop(0)
+        result.append(node)
+        for nxt in sorted(adj[node]):
+            in_deg[nxt] -= 1
+            if in_deg[nxt] == 0:
+                queue.append(nxt)
+
+    if len(result) < len(tables):
+        placed = set(result)
+        result.extend(t for t in tables if t not in placed)
+    return result
+
+
+class SchemaSnapshot:
+    """한 시점의 스키마 메타데이터 (읽기 전용)"""
+
+    def __init__(
+        self,
+        comments: Dict[str, str],
+        columns: Dict[str, List[str]],
+        primary_keys: Dict[str, List[str]],
+        fk_columns: List[Tuple[str, str, str, str]],
+        auto_increment: Dict[str, str],
+        unique_keys: Optional[Dict[str, Dict[str, List[str]]]] = None
+    ):
+        self.loaded_at = time.monotonic()
+        # 읽기 직전의 schema_cache_versions 버전 (None: 버전 테이블 없음)
+        self.version: Optional[int] = None
+        self.comments = comments
+        self.columns = columns
+        self.primary_keys = primary_keys
+        # (부모 테이블, 부모 컬럼, 자식 테이블, 자식 컬럼) — 복합 FK는 컬럼 쌍마다 1건
+        self.fk_columns = fk_columns
+        self.auto_increment = auto_increment
+        # PK 외 UNIQUE 인덱스 {테이블: {인덱스명: [컬럼...]}}
+        self.unique_keys = unique_keys or {}
+        self.fk_edges = sorted({(parent, child) for parent, _, child, _ in fk_columns})
+        # company_cd 컬럼이 있는 테이블 (이름순)
+        self.company_tables = sorted(t for t in comments if "company_cd" in columns.get(t, []))
+        self.order = topological_sort(sorted(comments), self.fk_edges)
+        self._position = {t: idx for idx, t in enumerate(self.order)}
+        self._parents: Dict[str, Set[str]] = {}
+        for parent, child in self.fk_edges:
+            if parent != child:
+                self._parents.setdefault(child, set()).add(parent)
+
+    def columns_of(self, table: str) -> List[str]:
+        return self.columns.get(table, [])
+
+    def key_columns(self, table: str) -> List[str]:
+        """PK 컬럼 (company_cd 제외, 회사 조건은 WHERE로 고정)"""
+        return [c for c in self.primary_keys.get(table, []) if c != "company_cd"]
+
+    def global_unique_keys(self, table: str) -> List[str]:
+        """
+        company_cd를 포함하지 않는 PK/UNIQUE 인덱스명 (전역 유일 — 회사 간 같은 키 행을 둘 수 없음)
+        예: AUTO_INCREMENT id에 별도 UNIQUE가 걸린 clients, users 등
+        """
+        names = []
+        primary = self.primary_keys.get(table)
+        if primary and "company_cd" not in primary:
+            names.append("PRIMARY")
+        for name, cols in sorted(self.unique_keys.get(table, {}).items()):
+            if "company_cd" not in cols:
+                names.append(name)
+        return names
+
+    def self_references(self, table: str) -> List[Tuple[str, str]]:
+        """자기 참조 FK 컬럼 쌍 [(자식 컬럼, 부모 컬럼)] (company_cd 쌍 제외)"""
+        return [
+            (child_col, parent_col)
+            for parent, parent_col, child, child_col in self.fk_columns
+            if parent == table and child == table and parent_col != "company_cd"
+        ]
+
+    def edges_among(self, tables: Iterable[str]) -> List[Tuple[str, str]]:
+        table_set = set(tables)
+        return [(p, c) for p, c in self.fk_edges if p in table_set and c in table_set]
+
+    def sort(self, tables: Iterable[str]) -> List[str]:
+        """부모 → 자식 순서 (미리 계산한 전체 순서 기준)"""
+        return sorted(set(tables), key=lambda t: (self._position.get(t, len(self._position)), t))
+
+    def levels(self, tables: Iterable[str]) -> List[List[str]]:
+        """FK 단계로 묶음 (같은 단계 테이블은 서로 의존하지 않아 병렬 처리 가능)"""
+        ordered = self.sort(tables)
+        table_set = set(ordered)
+        level_of: Dict[str, int] = {}
+        for table in ordered:
+            # 사이클로 아직 단계가 없는 부모는 무시 (FK 검사는 복제 중 꺼져 있음)
+            parents = [level_of[p] for p in self._parents.get(table, set()) if p in table_set and p in level_of]
+            level_of[table] = 1 + max(parents, default=-1)
+        levels: List[List[str]] = [[] for _ in range(max(level_of.values(), default=-1) + 1)]
+        for table in ordered:
+            levels[level_of[table]].append(table)
+        return levels
+
+    def expand_with_parents(self, selected: Iterable[str], within: Iterable[str]) -> Set[str]:
+        """선택 테이블 + FK 부모 테이블 (within 범위 안에서만 확장)"""
+        allowed = set(within)
+        expanded = set(selected)
+        queue = list(expanded)
+        while queue:
+            child = queue.pop(0)
+            for parent in self._parents.get(child, set()):
+                if parent in allowed and parent not in expanded:
+                    expanded.add(parent)
+                    queue.append(parent)
+        return expanded
+
+
+_snapshot: Optional[SchemaSnapshot] = None
+_snapshot_lock = threading.Lock()
+
+
+def _current_version(db) -> Optional[int]:
+    try:
+        return int(db.execute(text("""
+            SELECT version
+            FROM schema_cache_versions
+            WHERE cache_name = :cache_name
+        """), {"cache_name": SCHEMA_CACHE_NAME}).scalar() or 0)
+    except ProgrammingError:
+        # DDL_20261019_Add_SchemaCacheVersions 미적용 → 워커별 TTL만 사용
+        return None
+
+
+def invalidate_schema_cache(db=None) -> None:
+    """
+    이 워커의 스냅샷 폐기
+    db를 주면 공유 버전도 올려 다른 워커가 다음 get_schema에서 다시 읽게 함 (commit은 호출자)
+    """
+    global _snapshot
+    if db is not None:
+        try:
+            db.execute(text("""
+                INSERT INTO schema_cache_versions (cache_name, version)
+                VALUES (:cache_name, 1)
+                ON DUPLICATE KEY UPDATE version = version + 1
+            """), {"cache_name": SCHEMA_CACHE_NAME})
+        except ProgrammingError:
+            pass
+    with _snapshot_lock:
+        _snapshot = None
+
+
+def _load(db) -> SchemaSnapshot:
+    tables = db.execute(text("""
+        SELECT table_name, table_comment
+        FROM information_schema.tables
+        WHERE table_schema = DATABASE()
+          AND table_type = 'BASE TABLE'
+    """)).fetchall()
+    comments = {row[0]: (row[1] or "") for row in tables}
+
+    columns: Dict[str, List[str]] = {}
+    auto_increment: Dict[str, str] = {}
+    for row in db.execute(text("""
+        SELECT table_name, column_name, extra
+        FROM information_schema.columns
+        WHERE table_schema = DATABASE()
+        ORDER BY table_name, ordinal_position
+    """)).fetchall():
+        columns.setdefault(row[0], []).append(row[1])
+        if "auto_increment" in (row[2] or "").lower():
+            auto_increment[row[0]] = row[1]
+
+    primary_keys: Dict[str, List[str]] = {}
+    unique_keys: Dict[str, Dict[str, List[str]]] = {}
+    for row in db.execute(text("""
+        SELECT table_name, index_name, column_name
+        FROM information_schema.statistics
+        WHERE table_schema = DATABASE()
+          AND non_unique = 0
+        ORDER BY table_name, index_name, seq_in_index
+    """)).fetchall():
+        if row[1] == "PRIMARY":
+            primary_keys.setdefault(row[0], []).append(row[2])
+        else:
+            unique_keys.setdefault(row[0], {}).setdefault(row[1], []).append(row[2])
+
+    fk_rows = db.execute(text("""
+        SELECT referenced_table_name, referenced_column_name, table_name, column_name
+        FROM information_schema.key_column_usage
+        WHERE table_schema = DATABASE()
+          AND referenced_table_schema = DATABASE()
+          AND referenced_table_name IS NOT NULL
+    """)).fetchall()
+    fk_columns = [tuple(row) for row in fk_rows if row[0] in comments and row[2] in comments]
+
+    return SchemaSnapshot(comments, columns, primary_keys, fk_columns, auto_increment, unique_keys)
+
+
+def get_schema(db, refresh: bool = False) -> SchemaSnapshot:
+    """
+    스키마 스냅샷 (db: Session 또는 Connection, refresh=True면 즉시 다시 읽음)
+    TTL 이내라도 공유 버전이 바뀌었으면(다른 워커에서 무효화) 다시 읽음
+    """
+    global _snapshot
+    with _snapshot_lock:
+        snapshot = _snapshot
+    version = _current_version(db)
+    if (
+        not refresh
+        and snapshot
+        and snapshot.version == version
+        and snapshot.loaded_at + SCHEMA_CACHE_TTL_SEC > time.monotonic()
+    ):
+        return snapshot
+    snapshot = _load(db)
+    snapshot.version = version
+    with _snapshot_lock:
+        _snapshot = snapshot
+    return snapshot
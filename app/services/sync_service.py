@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""
+증분 동기화(delta-sync) 서비스
+- updated_since 워터마크 이후 변경된 행 + 삭제 기록(tombstone) 조회
+- 물리 삭제되는 테이블은 삭제 직전에 sync_deletion_log에 키를 기록한다.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.logger import db_logger
+from app.core.tenant import get_company_cd
+
+
+# entity(URL) → 테이블/키/조회 컬럼/권한 화면 ID
+SYNC_ENTITIES: Dict[str, Dict[str, Any]] = {
+    "projects": {
+        "table": "projects",
+        "keys": ["pipeline_id"],
+        "columns": "t.*",
+        "form_id": "projects",
+    },
+    "clients": {
+        "table": "clients",
+        "keys": ["client_id"],
+        "columns": "t.*",
+        "form_id": "clients",
+    },
+    "project-history": {
+        "table": "project_history",
+        "keys": ["history_id"],
+        "columns": "t.*",
+        "form_id": "projects",
+    },
+    "common-codes": {
+        "table": "comm_code",
+        "keys": ["group_code", "code"],
+        "columns": "t.*",
+        "form_id": "common",
+    },
+    "users": {
+        "table": "users",
+        "keys": ["user_no"],
+        # password 컬럼은 제외
+        "columns": """
+            t.company_cd, t.user_no, t.login_id, t.user_name, t.role, t.is_sales_rep,
+            t.email, t.phone, t.headquarters, t.department, t.team, t.org_id,
+            t.start_date, t.end_date, t.status,
+            t.created_at, t.updated_at, t.created_by, t.updated_by
+        """,
+        "form_id": "users",
+    },
+    "org-units": {
+        "table": "org_units",
+        "keys": ["org_id"],
+        "columns": "t.*",
+        "form_id": "org-units",
+    },
+}
+
+SYNC_TABLE_KEYS: Dict[str, List[str]] = {
+    cfg["table"]: cfg["keys"] for cfg in SYNC_ENTITIES.values()
+}
+
+DEFAULT_SYNC_LIMIT = 500
+MAX_SYNC_LIMIT = 5000
+MAX_TOMBSTONES = 5000
+
+
+def _row_key_expr(keys: List[str], alias: str = "t") -> str:
+    if len(keys) == 1:
+        return f"CAST({alias}.{keys[0]} AS CHAR)"
+    return "CONCAT_WS('|', " + ", ".join(f"{alias}.{k}" for k in keys) + ")"
+
+
+def record_deletions(
+    db: Session,
+    table_name: str,
+    where_sql: str,
+    params: Dict[str, Any],
+    deleted_by: Optional[str] = None
+) -> None:
+    """
+    삭제 대상 행의 키를 sync_deletion_log에 기록 (DELETE 직전, 같은 트랜잭션에서 호출)
+
+    Args:
+        table_name: 동기화 대상 테이블명 (SYNC_TABLE_KEYS)
+        where_sql: 삭제 조건 (별칭 t 기준, 예: "t.company_cd = :company_cd AND t.org_id = :org_id")
+        params: 조건 파라미터
+    """
+    keys = SYNC_TABLE_KEYS.get(table_name)
+    if not keys:
+        return
+    try:
+        db.execute(text(f"""
+            INSERT INTO sync_deletion_log (company_cd, table_name, row_key, deleted_by)
+            SELECT t.company_cd, :sync_table_name, {_row_key_expr(keys)}, :sync_deleted_by
+            FROM {table_name} t
+            WHERE {where_sql}
+        """), {**params, "sync_table_name": table_name, "sync_deleted_by": deleted_by})
+    except Exception as e:
+        # 삭제 로그 테이블 미적용 환경에서도 본 처리(삭제)는 진행
+        db_logger.warning(f"⚠️ 삭제 로그 기록 실패 ({table_name}): {e}")
+
+
+def _encode_cursor(updated_at: Any, key_values: List[Any]) -> str:
+    """커서: [updated_at, [키 값...]] (키는 컬럼 타입 그대로 보관 — 숫자 키를 문자열로 비교하지 않도록)"""
+    raw = json.dumps([updated_at.isoformat() if updated_at else None, key_values], default=str)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str, keys: List[str]) -> (Optional[datetime], List[Any]):
+    raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+    updated_at, key_values = json.loads(raw)
+    if not isinstance(key_values, list):
+        # 이전 형식 커서 (CAST/CONCAT_WS 문자열 키)
+        key_values = str(key_values).split("|") if len(keys) > 1 else [key_values]
+    if len(key_values) != len(keys):
+        raise ValueError("cursor key mismatch")
+    return (datetime.fromisoformat(updated_at) if updated_at else None), key_values
+
+
+def get_changes(
+    db: Session,
+    entity: str,
+    updated_since: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_SYNC_LIMIT
+) -> Dict[str, Any]:
+    """
+    변경분 조회
+
+    - updated_since 없음: 전체 스냅샷 (초기 적재용, tombstone 없음)
+    - updated_since 있음: updated_at >= updated_since 인 행 + 그 이후 삭제 기록
+    - 결과가 limit를 넘으면 next_cursor로 이어서 조회 (updated_at, key 순 keyset)
+    - 응답의 watermark를 다음 폴링의 updated_since로 사용
+    - 클라이언트는 deleted(tombstone)를 먼저 반영한 뒤 items를 upsert 한다.
+      (삭제 후 같은 키로 재등록된 행이 둘 다에 포함될 수 있음)
+    """
+    cfg = SYNC_ENTITIES[entity]
+    table = cfg["table"]
+    keys = cfg["keys"]
+    company_cd = get_company_cd()
+    limit = max(1, min(limit, MAX_SYNC_LIMIT))
+
+    # 조회 시작 시점의 DB 시각을 워터마크로 사용 (서버/DB 시계 차이 방지)
+    watermark = db.execute(text("SELECT NOW()")).scalar()
+
+    where = ["t.company_cd = :company_cd"]
+    params: Dict[str, Any] = {"company_cd": company_cd, "limit": limit + 1}
+    if updated_since:
+        where.append("t.updated_at >= :updated_since")
+        params["updated_since"] = updated_since
+    if cursor:
+        # ORDER BY와 같은 (updated_at, 키...) 행 값 비교 — 키 컬럼은 타입 그대로 비교
+        cursor_ts, cursor_keys = _decode_cursor(cursor, keys)
+        key_cols = ", ".join(f"t.{k}" for k in keys)
+        key_params = ", ".join(f":cursor_k{idx}" for idx in range(len(keys)))
+        if cursor_ts is None:
+            # updated_at NULL 행이 먼저 정렬됨
+            where.append(
+                f"(t.updated_at IS NOT NULL OR ({key_cols}) > ({key_params}))"
+            )
+        else:
+            where.append(f"(t.updated_at, {key_cols}) > (:cursor_ts, {key_params})")
+            params["cursor_ts"] = cursor_ts
+        for idx, value in enumerate(cursor_keys):
+            params[f"cursor_k{idx}"] = value
+
+    rows = db.execute(text(f"""
+        SELECT {cfg["columns"]}, {", ".join(f"t.{k} AS _sync_k{idx}" for idx, k in enumerate(keys))}
+        FROM {table} t
+        WHERE {" AND ".join(where)}
+        ORDER BY t.updated_at, {", ".join(f"t.{k}" for k in keys)}
+        LIMIT :limit
+    """), params).mappings().all()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    items = []
+    for row in rows:
+        item = dict(row)
+        for idx in range(len(keys)):
+            item.pop(f"_sync_k{idx}", None)
+        items.append(item)
+
+    next_cursor = None
+    if has_more and rows:
+        last = rows[-1]
+        next_cursor = _encode_cursor(
+            last["updated_at"], [last[f"_sync_k{idx}"] for idx in range(len(keys))]
+        )
+
+    # tombstone은 마지막 페이지에서 반환 (페이징 중 삭제된 행까지 포함)
+    deleted: List[Dict[str, Any]] = []
+    if updated_since and not has_more:
+        try:
+            deleted_rows = db.execute(text("""
+                SELECT row_key, deleted_at
+                FROM sync_deletion_log
+                WHERE company_cd = :company_cd
+                  AND table_name = :table_name
+                  AND deleted_at >= :updated_since
+                ORDER BY deleted_at, log_id
+                LIMIT :max_rows
+            """), {
+                "company_cd": company_cd,
+                "table_name": table,
+                "updated_since": updated_since,
+                "max_rows": MAX_TOMBSTONES
+            }).mappings().all()
+            for row in deleted_rows:
+                key_values = row["row_key"].split("|") if len(keys) > 1 else [row["row_key"]]
+                deleted.append({
+                    **dict(zip(keys, key_values)),
+                    "deleted_at": row["deleted_at"]
+                })
+        except Exception as e:
+            db_logger.warning(f"⚠️ 삭제 로그 조회 실패 ({table}): {e}")
+
+    return {
+        "entity": entity,
+        "items": items,
+        "deleted": deleted,
+        "count": len(items),
+        "has_more": has_more,
+        "next_cursor": next_cursor,
+        # 다음 페이지가 남아 있으면 워터마크를 진행시키지 않는다.
+        "watermark": None if has_more else watermark,
+        "key_columns": keys
+    }
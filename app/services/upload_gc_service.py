@@ -0,0 +1,461 @@
+# -*- coding: utf-8 -*-
+"""
+미참조 업로드 파일 정리 + 회사별 저장소 사용량 집계
+- 참조: board_notice_files(첨부), board_notice_content_files(본문 인라인),
+        게시글/답글/템플릿 본문에 남아 있는 업로드 URL (본문 참조 목록이 없는 기존 글 보호)
+- 유예 시간(UPLOAD_GC_GRACE_HOURS)보다 오래된 미참조 uploaded_files 행을 배치 삭제하고
+  blob 참조 수를 줄여 0이 되면 파일(미리보기 포함) 삭제
+  (파일 삭제는 blob 행을 지운 트랜잭션 안, commit 전에 수행 — 같은 내용을 동시에 올리는
+   acquire_blob은 행 잠금에서 기다렸다가 파일이 없으면 새로 옮겨 둠)
+- 디스크 ↔ DB 대조: 참조 수 보정, DB에 없는 디스크 파일 삭제, 디스크에 없는 DB 파일 집계
+- 여러 워커 중 하나만 실행 (MySQL GET_LOCK), 결과는 upload_storage_usage 에 기록
+"""
+import asyncio
+import os
+import re
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional, Set
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal, engine
+from app.core.logger import app_logger, db_logger
+from app.services.file_preview_service import PREVIEW_VARIANTS, variant_paths
+from app.services.file_storage_service import TEMP_DIR_NAME, UPLOAD_ROOT, UPLOAD_URL_PREFIX, release_blob
+
+UPLOAD_GC_LOCK_NAME = "psms_upload_gc"
+UPLOAD_GC_BATCH_SIZE = 200
+UPLOAD_GC_CONTENT_PAGE_SIZE = 500
+UPLOAD_GC_STARTUP_DELAY_SEC = 600
+UPLOAD_GC_POLL_SEC = 3600
+
+# 본문 참조 URL을 찾을 테이블: (테이블, 키 컬럼)
+_CONTENT_SOURCES = (
+    ("board_notices", "notice_id"),
+    ("board_notice_replies", "reply_id"),
+    ("notice_templates", "template_id"),
+)
+_VARIANT_SUFFIXES = tuple(f".{variant}.jpg" for variant in PREVIEW_VARIANTS)
+
+
+def _strip_variant(value: str) -> str:
+    for suffix in _VARIANT_SUFFIXES:
+        if value.endswith(suffix):
+            return value[:-len(suffix)]
+    return value
+
+
+def _content_urls(db: Session, company_cd: str) -> Set[str]:
+    """본문(게시글/답글/템플릿)에 남아 있는 해당 회사 업로드 URL"""
+    pattern = re.compile(re.escape(f"{UPLOAD_URL_PREFIX}/{company_cd}/") + r"""[^"'\s<>()]+""")
+    urls: Set[str] = set()
+    for table, key in _CONTENT_SOURCES:
+        after = 0
+        while True:
+            rows = db.execute(text(f"""
+                SELECT {key} AS row_id, content
+                FROM {table}
+                WHERE company_cd = :company_cd
+                  AND {key} > :after
+                ORDER BY {key}
+                LIMIT :limit
+            """), {"company_cd": company_cd, "after": after, "limit": UPLOAD_GC_CONTENT_PAGE_SIZE}).fetchall()
+            if not rows:
+                break
+            for row in rows:
+                if row.content:
+                    urls.update(_strip_variant(url) for url in pattern.findall(row.content))
+            after = rows[-1].row_id
+    return urls
+
+
+def _orphan_candidates(db: Session, company_cd: str, cutoff: datetime, after: int) -> List[dict]:
+    rows = db.execute(text("""
+        SELECT uf.file_id, uf.file_url, uf.file_size
+        FROM uploaded_files uf
+        WHERE uf.company_cd = :company_cd
+          AND uf.file_id > :after
+          AND uf.created_at < :cutoff
+          AND NOT EXISTS (
+              SELECT 1 FROM board_notice_files bf
+              WHERE bf.company_cd = uf.company_cd AND bf.file_id = uf.file_id
+          )
+          AND NOT EXISTS (
+              SELECT 1 FROM board_notice_content_files cf
+              WHERE cf.company_cd = uf.company_cd AND cf.file_id = uf.file_id
+          )
+        ORDER BY uf.file_id
+        LIMIT :limit
+    """), {
+        "company_cd": company_cd,
+        "after": after,
+        "cutoff": cutoff,
+        "limit": UPLOAD_GC_BATCH_SIZE,
+    }).fetchall()
+    return [dict(row._mapping) for row in rows]
+
+
+def _company_path(company_cd: str, value) -> Optional[Path]:
+    """회사 업로드 디렉터리 안의 경로만 허용 (DB 경로가 다른 회사/외부를 가리키면 None)"""
+    if not value:
+        return None
+    company_dir = (UPLOAD_ROOT / company_cd).resolve()
+    path = Path(value).resolve()
+    if company_dir not in path.parents:
+        app_logger.warning(f"⚠️ 회사 디렉터리 밖 경로 삭제 거부: company={company_cd}, path={value}")
+        return None
+    return path
+
+
+def _unlink(company_cd: str, paths: List[Path]) -> int:
+    """파일 삭제 (미리보기 포함, 회사 디렉터리 밖 경로는 거부), 회수한 바이트 반환"""
+    freed = 0
+    for value in paths:
+        path = _company_path(company_cd, value)
+        if path is None:
+            continue
+        for target in [path, *variant_paths(str(path))]:
+            try:
+                freed += target.stat().st_size
+                target.unlink()
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                app_logger.warning(f"⚠️ 업로드 파일 삭제 실패: {target} ({e})")
+    return freed
+
+
+def _delete_orphan_rows(db: Session, company_cd: str, file_ids: List[int]) -> List[Path]:
+    """
+    미참조 행 삭제 (잠금 후 참조 여부 재확인, commit은 호출자가 수행)
+    반환: 삭제할 디스크 경로 (blob 행 잠금이 유지되는 commit 전에 삭제)
+    """
+    rows = db.execute(text("""
+        SELECT uf.file_id, uf.file_path, uf.sha256
+        FROM uploaded_files uf
+        WHERE uf.company_cd = :company_cd
+          AND uf.file_id IN :file_ids
+          AND NOT EXISTS (
+              SELECT 1 FROM board_notice_files bf
+              WHERE bf.company_cd = uf.company_cd AND bf.file_id = uf.file_id
+          )
+          AND NOT EXISTS (
+              SELECT 1 FROM board_notice_content_files cf
+              WHERE cf.company_cd = uf.company_cd AND cf.file_id = uf.file_id
+          )
+        FOR UPDATE
+    """).bindparams(bindparam("file_ids", expanding=True)), {
+        "company_cd": company_cd,
+        "file_ids": file_ids,
+    }).fetchall()
+    if not rows:
+        return []
+    db.execute(text("""
+        DELETE FROM uploaded_files
+        WHERE company_cd = :company_cd
+          AND file_id IN :file_ids
+    """).bindparams(bindparam("file_ids", expanding=True)), {
+        "company_cd": company_cd,
+        "file_ids": [row.file_id for row in rows],
+    })
+
+    paths: List[Path] = []
+    for row in rows:
+        if row.sha256:
+            path = release_blob(db, company_cd, row.sha256)
+            if path:
+                paths.append(path)
+            continue
+        # sha256 없는 기존 파일: 같은 경로를 쓰는 행이 남아 있지 않을 때만 삭제
+        still_used = db.execute(text("""
+            SELECT 1
+            FROM uploaded_files
+            WHERE company_cd = :company_cd
+              AND file_path = :file_path
+            LIMIT 1
+        """), {"company_cd": company_cd, "file_path": row.file_path}).fetchone()
+        path = _company_path(company_cd, row.file_path)
+        if not still_used and path:
+            paths.append(path)
+    return paths
+
+
+def _reconcile_blobs(db: Session, company_cd: str, cutoff: datetime, dry_run: bool) -> List[Path]:
+    """
+    blob 참조 수를 uploaded_files 실제 행 수로 보정 (commit은 호출자가 수행)
+    진행 중인 업로드와 겹치지 않도록 유예 시간 이전에 변경된 blob만 대상
+    반환: 참조가 없어 삭제할 디스크 경로 (commit 전에 삭제)
+    """
+    zero_rows = db.execute(text(f"""
+        SELECT b.sha256, b.file_path
+        FROM uploaded_file_blobs b
+        WHERE b.company_cd = :company_cd
+          AND b.updated_at < :cutoff
+          AND NOT EXISTS (
+              SELECT 1 FROM uploaded_files uf
+              WHERE uf.company_cd = b.company_cd AND uf.sha256 = b.sha256
+          )
+        {"" if dry_run else "FOR UPDATE"}
+    """), {"company_cd": company_cd, "cutoff": cutoff}).fetchall()
+    if dry_run:
+        return [Path(row.file_path) for row in zero_rows]
+    if zero_rows:
+        db.execute(text("""
+            DELETE FROM uploaded_file_blobs
+            WHERE company_cd = :company_cd
+              AND sha256 IN :shas
+        """).bindparams(bindparam("shas", expanding=True)), {
+            "company_cd": company_cd,
+            "shas": [row.sha256 for row in zero_rows],
+        })
+    fixed = db.execute(text("""
+        UPDATE uploaded_file_blobs b
+        JOIN (
+            SELECT sha256, COUNT(*) AS cnt
+            FROM uploaded_files
+            WHERE company_cd = :company_cd
+              AND sha256 IS NOT NULL
+            GROUP BY sha256
+        ) u ON u.sha256 = b.sha256
+        SET b.ref_count = u.cnt
+        WHERE b.company_cd = :company_cd
+          AND b.updated_at < :cutoff
+          AND b.ref_count <> u.cnt
+    """), {"company_cd": company_cd, "cutoff": cutoff}).rowcount
+    if fixed:
+        db_logger.warning(f"⚠️ blob 참조 수 보정: company={company_cd}, {fixed}건")
+    return [Path(row.file_path) for row in zero_rows]
+
+
+def _known_names(db: Session, company_cd: str) -> Set[str]:
+    """DB에 등록된 저장 파일명 (회사 디렉터리 기준 상대 경로 — 배포 경로가 바뀌어도 비교 가능)"""
+    known: Set[str] = set()
+    for sql in (
+        "SELECT stored_name FROM uploaded_files WHERE company_cd = :company_cd",
+        "SELECT stored_name FROM uploaded_file_blobs WHERE company_cd = :company_cd",
+    ):
+        for (stored_name,) in db.execute(text(sql), {"company_cd": company_cd}):
+            if stored_name:
+                known.add(stored_name)
+    return known
+
+
+def _open_part_names(db: Session, company_cd: str) -> Set[str]:
+    rows = db.execute(text("""
+        SELECT part_path
+        FROM upload_sessions
+        WHERE company_cd = :company_cd
+          AND status = 'OPEN'
+    """), {"company_cd": company_cd}).fetchall()
+    return {Path(row.part_path).name for row in rows}
+
+
+def _scan_disk(company_cd: str, known: Set[str], open_parts: Set[str], cutoff_ts: float, dry_run: bool) -> dict:
+    """
+    회사 디렉터리 대조
+    - DB에 없는 파일(미리보기는 원본 기준)은 유예 시간 이전 것만 삭제
+    - 임시 디렉터리는 진행 중인 업로드 세션 파일을 제외하고 정리
+    """
+    stats = {"disk_bytes": 0, "stray_files": 0, "stray_bytes": 0}
+    company_dir = UPLOAD_ROOT / company_cd
+    if not company_dir.is_dir():
+        return stats
+    company_dir = Path(os.path.abspath(company_dir))
+    for dirpath, _, filenames in os.walk(company_dir):
+        in_temp = Path(dirpath).name == TEMP_DIR_NAME
+        for name in filenames:
+            path = os.path.abspath(os.path.join(dirpath, name))
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            if in_temp:
+                keep = name in open_parts or st.st_mtime >= cutoff_ts
+            else:
+                rel = Path(path).relative_to(company_dir).as_posix()
+                keep = rel in known or _strip_variant(rel) in known or st.st_mtime >= cutoff_ts
+            if keep:
+                stats["disk_bytes"] += st.st_size
+                continue
+            stats["stray_files"] += 1
+            stats["stray_bytes"] += st.st_size
+            if not dry_run:
+                try:
+                    os.unlink(path)
+                except OSError as e:
+                    app_logger.warning(f"⚠️ 미등록 파일 삭제 실패: {path} ({e})")
+    return stats
+
+
+def _write_usage(db: Session, company_cd: str, report: dict) -> None:
+    totals = db.execute(text("""
+        SELECT
+            COUNT(*) AS file_count,
+            COALESCE(SUM(file_size), 0) AS logical_bytes,
+            COALESCE(SUM(CASE WHEN sha256 IS NULL THEN file_size ELSE 0 END), 0) AS legacy_bytes
+        FROM uploaded_files
+        WHERE company_cd = :company_cd
+    """), {"company_cd": company_cd}).fetchone()
+    blob_bytes = db.execute(text("""
+        SELECT COALESCE(SUM(file_size), 0)
+        FROM uploaded_file_blobs
+        WHERE company_cd = :company_cd
+    """), {"company_cd": company_cd}).scalar()
+    report.update({
+        "file_count": int(totals.file_count),
+        "logical_bytes": int(totals.logical_bytes),
+        "stored_bytes": int(totals.legacy_bytes) + int(blob_bytes or 0),
+    })
+    db.execute(text("""
+        INSERT INTO upload_storage_usage (
+            company_cd, file_count, logical_bytes, stored_bytes, disk_bytes,
+            orphan_files, orphan_bytes, missing_files, measured_at
+        ) VALUES (
+            :company_cd, :file_count, :logical_bytes, :stored_bytes, :disk_bytes,
+            :orphan_files, :orphan_bytes, :missing_files, NOW()
+        )
+        ON DUPLICATE KEY UPDATE
+            file_count = VALUES(file_count),
+            logical_bytes = VALUES(logical_bytes),
+            stored_bytes = VALUES(stored_bytes),
+            disk_bytes = VALUES(disk_bytes),
+            orphan_files = VALUES(orphan_files),
+            orphan_bytes = VALUES(orphan_bytes),
+            missing_files = VALUES(missing_files),
+            measured_at = VALUES(measured_at)
+    """), {"company_cd": company_cd, **report})
+
+
+def collect_company(company_cd: str, dry_run: bool = False) -> dict:
+    """회사 1곳 정리 + 사용량 집계 (dry_run이면 삭제 없이 건수만)"""
+    cutoff = datetime.now() - timedelta(hours=settings.UPLOAD_GC_GRACE_HOURS)
+    report = {
+        "company_cd": company_cd,
+        "orphan_files": 0,
+        "orphan_bytes": 0,
+        "missing_files": 0,
+        "disk_bytes": 0,
+        "stray_files": 0,
+        "dry_run": dry_run,
+    }
+    db = SessionLocal()
+    db.info["company_cd"] = company_cd
+    try:
+        referenced_urls = _content_urls(db, company_cd)
+        after = 0
+        while True:
+            candidates = _orphan_candidates(db, company_cd, cutoff, after)
+            if not candidates:
+                break
+            after = candidates[-1]["file_id"]
+            orphans = [c for c in candidates if c["file_url"] not in referenced_urls]
+            if not orphans:
+                continue
+            report["orphan_files"] += len(orphans)
+            if dry_run:
+                report["orphan_bytes"] += sum(int(c["file_size"] or 0) for c in orphans)
+                continue
+            paths = _delete_orphan_rows(db, company_cd, [c["file_id"] for c in orphans])
+            # blob 행 잠금을 잡은 채 파일 삭제 후 commit (commit 실패 시 남는 행은 다음 실행에서 다시 정리)
+            report["orphan_bytes"] += _unlink(company_cd, paths)
+            db.commit()
+
+        zero_paths = _reconcile_blobs(db, company_cd, cutoff, dry_run)
+        if dry_run:
+            db.rollback()
+        else:
+            report["orphan_bytes"] += _unlink(company_cd, zero_paths)
+            db.commit()
+
+        known = _known_names(db, company_cd)
+        company_dir = UPLOAD_ROOT / company_cd
+        report["missing_files"] = sum(1 for name in known if not (company_dir / name).exists())
+        disk = _scan_disk(company_cd, known, _open_part_names(db, company_cd), cutoff.timestamp(), dry_run)
+        report["disk_bytes"] = disk["disk_bytes"]
+        report["stray_files"] = disk["stray_files"]
+        report["orphan_bytes"] += disk["stray_bytes"]
+
+        if dry_run:
+            db.rollback()
+        else:
+            _write_usage(db, company_cd, report)
+            db.commit()
+        app_logger.info(
+            f"🧹 업로드 정리{' (dry-run)' if dry_run else ''}: company={company_cd}, "
+            f"미참조 {report['orphan_files']}건, 미등록 {report['stray_files']}건, "
+            f"회수 {report['orphan_bytes']:,}B, 누락 {report['missing_files']}건"
+        )
+        return report
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def run_gc(company_cd: Optional[str] = None, dry_run: bool = False, force: bool = False) -> Optional[List[dict]]:
+    """
+    전체(또는 회사 1곳) 정리
+    - 다른 워커가 실행 중이면 None
+    - force가 아니면 마지막 집계가 실행 주기 안에 있는 회사는 건너뜀 (워커마다 루프가 돌기 때문)
+      (회사별 비교 — 한 회사의 수동 실행이 다른 회사의 주기 실행을 막지 않도록)
+    """
+    with engine.connect() as lock_conn:
+        locked = lock_conn.execute(text("SELECT GET_LOCK(:name, 0)"), {"name": UPLOAD_GC_LOCK_NAME}).scalar()
+        if not locked:
+            return None
+        try:
+            db = SessionLocal()
+            try:
+                if company_cd:
+                    companies = [company_cd]
+                else:
+                    companies = list(db.execute(text("""
+                        SELECT company_cd FROM uploaded_files GROUP BY company_cd
+                        UNION
+                        SELECT company_cd FROM uploaded_file_blobs GROUP BY company_cd
+                    """)).scalars())
+                if not force:
+                    recent = set(db.execute(text("""
+                        SELECT company_cd
+                        FROM upload_storage_usage
+                        WHERE measured_at > :since
+                    """), {
+                        "since": datetime.now() - timedelta(seconds=settings.UPLOAD_GC_INTERVAL_SEC * 0.9)
+                    }).scalars())
+                    companies = [cd for cd in companies if cd not in recent]
+            finally:
+                db.close()
+            reports: List[dict] = []
+            for cd in sorted(companies):
+                try:
+                    reports.append(collect_company(cd, dry_run=dry_run))
+                except Exception as e:
+                    app_logger.error(f"❌ 업로드 정리 실패: company={cd} ({e})", exc_info=True)
+            return reports
+        finally:
+            lock_conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": UPLOAD_GC_LOCK_NAME})
+
+
+def get_storage_usage(db: Session, company_cd: str) -> Optional[dict]:
+    row = db.execute(text("""
+        SELECT company_cd, file_count, logical_bytes, stored_bytes, disk_bytes,
+               orphan_files, orphan_bytes, missing_files, measured_at
+        FROM upload_storage_usage
+        WHERE company_cd = :company_cd
+    """), {"company_cd": company_cd}).fetchone()
+    return dict(row._mapping) if row else None
+
+
+async def run_scheduler(poll: float = UPLOAD_GC_POLL_SEC) -> None:
+    """주기 실행 루프 (lifespan에서 실행, 실제 실행 여부는 run_gc가 판단)"""
+    await asyncio.sleep(UPLOAD_GC_STARTUP_DELAY_SEC)
+    while True:
+        try:
+            await asyncio.to_thread(run_gc)
+        except Exception as e:
+            app_logger.error(f"❌ 업로드 정리 루프 오류: {e}", exc_info=True)
+        await asyncio.sleep(poll)
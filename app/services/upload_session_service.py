@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+"""
+재개 가능한 분할 업로드 (세션 생성 → 청크 PUT(offset) → 완료)
+- 세션 상태는 upload_sessions 테이블에 저장 (여러 워커가 이어받을 수 있음)
+- 청크는 요청 본문을 읽는 대로 청크별 임시 파일에 먼저 받고 (메모리 상한 = 읽기 단위, DB 트랜잭션 없음)
+  세션 행 잠금(FOR UPDATE) 구간에서 offset 재확인 후 새로 받은 구간만 .tmp/{upload_id}.part에 옮겨 기록
+  (잠금 구간은 스레드에서 실행 — 같은 워커의 동시 요청이 이벤트 루프를 막지 않도록)
+- 완료 시 디스크에서 SHA-256을 다시 계산해 검증 후 blob 저장소로 이동
+- 만료 세션은 임시 파일과 함께 주기적으로 정리
+"""
+import asyncio
+import hashlib
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.logger import app_logger
+from app.services.file_storage_service import TEMP_DIR_NAME, UPLOAD_CHUNK_BYTES, UPLOAD_ROOT
+
+# 권장 청크 크기 / 청크 1회 최대 크기
+UPLOAD_SESSION_CHUNK_BYTES = 8 * 1024 * 1024
+UPLOAD_SESSION_MAX_CHUNK_BYTES = 32 * 1024 * 1024
+
+# 만료 세션 정리 주기 (초)
+UPLOAD_SESSION_CLEANUP_INTERVAL_SEC = 3600
+
+
+class UploadSessionError(ValueError):
+    """세션 상태/offset 오류 (status_code 포함)"""
+
+    def __init__(self, message: str, status_code: int = 400, received_bytes: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.received_bytes = received_bytes
+
+
+def _part_path(company_cd: str, upload_id: str) -> Path:
+    return UPLOAD_ROOT / company_cd / TEMP_DIR_NAME / f"{upload_id}.part"
+
+
+def _chunk_path(part_path: Path) -> Path:
+    """요청별 청크 수신 파일 (.part 옆, 완료/실패 시 삭제)"""
+    return part_path.with_name(f"{part_path.stem}.{uuid.uuid4().hex}.chunk")
+
+
+def _remove_part_files(part_path: Path) -> None:
+    part_path.unlink(missing_ok=True)
+    for chunk in part_path.parent.glob(f"{part_path.stem}.*.chunk"):
+        chunk.unlink(missing_ok=True)
+
+
+def create_session(
+    db: Session,
+    company_cd: str,
+    original_name: str,
+    total_size: int,
+    mime_type: Optional[str],
+    sha256: Optional[str],
+    login_id: Optional[str]
+) -> dict:
+    """업로드 세션 생성 (빈 임시 파일 생성 포함, commit은 호출자가 수행)"""
+    upload_id = uuid.uuid4().hex
+    part_path = _part_path(company_cd, upload_id)
+    part_path.parent.mkdir(parents=True, exist_ok=True)
+    part_path.touch()
+    expires_at = datetime.now() + timedelta(seconds=settings.UPLOAD_SESSION_TTL_SEC)
+    db.execute(text("""
+        INSERT INTO upload_sessions (
+            company_cd, upload_id, original_name, mime_type, total_size, sha256,
+            received_bytes, status, part_path, expires_at, created_by
+        ) VALUES (
+            :company_cd, :upload_id, :original_name, :mime_type, :total_size, :sha256,
+            0, 'OPEN', :part_path, :expires_at, :created_by
+        )
+    """), {
+        "company_cd": company_cd,
+        "upload_id": upload_id,
+        "original_name": original_name,
+        "mime_type": mime_type or "",
+        "total_size": total_size,
+        "sha256": sha256,
+        "part_path": str(part_path),
+        "expires_at": expires_at,
+        "created_by": login_id,
+    })
+    return {
+        "upload_id": upload_id,
+        "total_size": total_size,
+        "received_bytes": 0,
+        "chunk_size": UPLOAD_SESSION_CHUNK_BYTES,
+        "expires_at": expires_at,
+    }
+
+
+def get_session(db: Session, company_cd: str, upload_id: str, for_update: bool = False) -> Optional[dict]:
+    lock = "FOR UPDATE" if for_update else ""
+    row = db.execute(text(f"""
+        SELECT upload_id, original_name, mime_type, total_size, sha256,
+               received_bytes, status, part_path, expires_at, created_by
+        FROM upload_sessions
+        WHERE company_cd = :company_cd
+          AND upload_id = :upload_id
+        {lock}
+    """), {"company_cd": company_cd, "upload_id": upload_id}).fetchone()
+    return dict(row._mapping) if row else None
+
+
+def session_view(session: dict) -> dict:
+    return {
+        "upload_id": session["upload_id"],
+        "file_name": session["original_name"],
+        "total_size": int(session["total_size"]),
+        "received_bytes": int(session["received_bytes"]),
+        "status": session["status"],
+        "chunk_size": UPLOAD_SESSION_CHUNK_BYTES,
+        "expires_at": session["expires_at"],
+    }
+
+
+def _check_open(session: Optional[dict], login_id: Optional[str]) -> dict:
+    if not session or session["created_by"] != login_id:
+        raise UploadSessionError("업로드 세션을 찾을 수 없습니다.", 404)
+    if session["status"] != "OPEN":
+        raise UploadSessionError("이미 종료된 업로드 세션입니다.", 409)
+    if session["expires_at"] and session["expires_at"] < datetime.now():
+        raise UploadSessionError("업로드 세션이 만료되었습니다.", 410)
+    return session
+
+
+def _open_session(db: Session, company_cd: str, upload_id: str, login_id: Optional[str]) -> dict:
+    return _check_open(get_session(db, company_cd, upload_id, for_update=True), login_id)
+
+
+def _append_chunk(
+    db: Session,
+    company_cd: str,
+    upload_id: str,
+    offset: int,
+    chunk_path: Path,
+    written: int,
+    login_id: Optional[str]
+) -> dict:
+    """
+    받은 청크를 .part에 반영 (세션 행 잠금 ~ commit, 스레드에서 실행)
+    - 잠금 후 offset을 다시 확인 (청크 수신 중 다른 요청이 진행시켰을 수 있음)
+    - 이미 받은 구간은 건너뛰고 새 구간만 기록
+    """
+    try:
+        session = _open_session(db, company_cd, upload_id, login_id)
+        received = int(session["received_bytes"])
+        if offset > received:
+            raise UploadSessionError("offset이 수신 위치와 다릅니다.", 409, received)
+        new_received = max(received, offset + written)
+        if new_received > received:
+            with chunk_path.open("rb") as src, Path(session["part_path"]).open("r+b") as dst:
+                src.seek(received - offset)
+                dst.seek(received)
+                while True:
+                    data = src.read(UPLOAD_CHUNK_BYTES)
+                    if not data:
+                        break
+                    dst.write(data)
+            db.execute(text("""
+                UPDATE upload_sessions
+                SET received_bytes = :received_bytes,
+                    expires_at = :expires_at
+                WHERE company_cd = :company_cd
+                  AND upload_id = :upload_id
+            """), {
+                "company_cd": company_cd,
+                "upload_id": upload_id,
+                "received_bytes": new_received,
+                "expires_at": datetime.now() + timedelta(seconds=settings.UPLOAD_SESSION_TTL_SEC),
+            })
+        db.commit()
+    except BaseException:
+        db.rollback()
+        raise
+    session["received_bytes"] = new_received
+    return session_view(session)
+
+
+async def write_chunk(
+    db: Session,
+    company_cd: str,
+    upload_id: str,
+    offset: int,
+    chunks: AsyncIterator[bytes],
+    login_id: Optional[str]
+) -> dict:
+    """
+    청크 기록 (commit 포함)
+    - offset은 현재 수신 바이트 이하여야 함 (크면 409 + received_bytes로 재개 위치 안내)
+    - 이미 받은 구간의 재전송(offset + 길이 <= 수신 바이트)은 무시
+    - 본문 수신 중에는 행 잠금/트랜잭션을 잡지 않음 (읽기 후 바로 트랜잭션 종료)
+    """
+    session = _check_open(get_session(db, company_cd, upload_id), login_id)
+    db.rollback()
+    received = int(session["received_bytes"])
+    total = int(session["total_size"])
+    if offset > received or offset < 0:
+        raise UploadSessionError("offset이 수신 위치와 다릅니다.", 409, received)
+
+    chunk_path = _chunk_path(Path(session["part_path"]))
+    handle = await asyncio.to_thread(chunk_path.open, "wb")
+    written = 0
+    try:
+        try:
+            async for data in chunks:
+                if not data:
+                    continue
+                written += len(data)
+                if written > UPLOAD_SESSION_MAX_CHUNK_BYTES or offset + written > total:
+                    raise UploadSessionError("청크 크기가 허용 범위를 넘었습니다.", 413, received)
+                await asyncio.to_thread(handle.write, data)
+        finally:
+            await asyncio.to_thread(handle.close)
+        # 짧게 끊긴 청크도 받은 만큼은 유효 (다음 요청은 새 received_bytes부터)
+        return await asyncio.to_thread(
+            _append_chunk, db, company_cd, upload_id, offset, chunk_path, written, login_id
+        )
+    finally:
+        await asyncio.to_thread(chunk_path.unlink, True)
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while True:
+            data = handle.read(UPLOAD_CHUNK_BYTES)
+            if not data:
+                break
+            digest.update(data)
+    return digest.hexdigest()
+
+
+async def verify_complete(db: Session, company_cd: str, upload_id: str, sha256: Optional[str], login_id: Optional[str]) -> dict:
+    """
+    완료 검증 (호출자가 blob 등록 후 mark_done + commit)
+    - 해시는 잠금 없이 계산 (다 받은 세션의 .part는 더 바뀌지 않음) 후 세션 행을 잠그고 상태 재확인
+    반환 세션에 계산된 sha256 포함
+    """
+    session = _check_open(get_session(db, company_cd, upload_id), login_id)
+    db.rollback()
+    if int(session["received_bytes"]) != int(session["total_size"]):
+        raise UploadSessionError("아직 받지 않은 구간이 있습니다.", 409, int(session["received_bytes"]))
+    part_path = Path(session["part_path"])
+    actual = await asyncio.to_thread(_file_sha256, part_path)
+    expected = (sha256 or session["sha256"] or "").lower()
+    if expected and expected != actual:
+        raise UploadSessionError("파일 해시가 일치하지 않습니다.", 400)
+    session = _open_session(db, company_cd, upload_id, login_id)
+    session["sha256"] = actual
+    return session
+
+
+def mark_done(db: Session, company_cd: str, upload_id: str, file_id: int) -> None:
+    db.execute(text("""
+        UPDATE upload_sessions
+        SET status = 'DONE',
+            file_id = :file_id
+        WHERE company_cd = :company_cd
+          AND upload_id = :upload_id
+    """), {"company_cd": company_cd, "upload_id": upload_id, "file_id": file_id})
+
+
+def abort_session(db: Session, company_cd: str, upload_id: str, login_id: Optional[str]) -> None:
+    """업로드 취소 (임시 파일 삭제, commit 포함)"""
+    session = _open_session(db, company_cd, upload_id, login_id)
+    db.execute(text("""
+        DELETE FROM upload_sessions
+        WHERE company_cd = :company_cd
+          AND upload_id = :upload_id
+    """), {"company_cd": company_cd, "upload_id": upload_id})
+    db.commit()
+    _remove_part_files(Path(session["part_path"]))
+
+
+def cleanup_expired_sessions(limit: int = 500) -> int:
+    """만료/완료 세션 정리 (임시 파일 삭제 후 행 삭제, 정리 건수 반환)"""
+    db = SessionLocal()
+    try:
+        rows = db.execute(text("""
+            SELECT company_cd, upload_id, part_path
+            FROM upload_sessions
+            WHERE expires_at < NOW()
+               OR (status = 'DONE' AND updated_at < NOW() - INTERVAL 1 DAY)
+            ORDER BY expires_at
+            LIMIT :limit
+        """), {"limit": limit}).fetchall()
+        for row in rows:
+            _remove_part_files(Path(row.part_path))
+            db.execute(text("""
+                DELETE FROM upload_sessions
+                WHERE company_cd = :company_cd
+                  AND upload_id = :upload_id
+            """), {"company_cd": row.company_cd, "upload_id": row.upload_id})
+        db.commit()
+        if rows:
+            app_logger.info(f"🧹 만료 업로드 세션 정리: {len(rows)}건")
+        return len(rows)
+    except Exception as e:
+        db.rollback()
+        app_logger.error(f"❌ 업로드 세션 정리 실패: {e}", exc_info=True)
+        return 0
+    finally:
+        db.close()
+
+
+async def run_cleanup(interval: float = UPLOAD_SESSION_CLEANUP_INTERVAL_SEC) -> None:
+    """만료 세션 정리 루프 (lifespan에서 실행)"""
+    while True:
+        await asyncio.to_thread(cleanup_expired_sessions)
+        await asyncio.sleep(interval)
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+사용자 참조 캐시 (회사별)
+- login_id → 이름/소속/재직 여부를 워커 메모리에 보관
+- 화면 표시용 이름 해석, 재직자 집합 계산 등 users 조인을 대체
+- 같은 워커의 사용자 변경 시 즉시 무효화, 다른 워커 변경분은 TTL 만료 후 반영
+"""
+import threading
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+USER_CACHE_TTL_SEC = 300
+
+
+class _TenantUsers:
+    __slots__ = ("expires_at", "users", "active_ids")
+
+    def __init__(self, expires_at: float, users: Dict[str, dict], active_ids: List[str]):
+        self.expires_at = expires_at
+        self.users = users
+        self.active_ids = active_ids
+
+
+_cache: Dict[str, _TenantUsers] = {}
+_cache_lock = threading.Lock()
+
+
+def invalidate_user_cache(company_cd: Optional[str] = None) -> None:
+    with _cache_lock:
+        if company_cd:
+            _cache.pop(company_cd, None)
+        else:
+            _cache.clear()
+
+
+def _load(db: Session, company_cd: str) -> _TenantUsers:
+    with _cache_lock:
+        entry = _cache.get(company_cd)
+    if entry and entry.expires_at > time.monotonic():
+        return entry
+
+    rows = db.execute(text("""
+        SELECT
+            login_id,
+            user_name,
+            headquarters,
+            department,
+            team,
+            org_id,
+            CASE
+                WHEN COALESCE(status, 'ACTIVE') = 'ACTIVE'
+                 AND (start_date IS NULL OR start_date <= CURDATE())
+                 AND (end_date IS NULL OR end_date >= CURDATE())
+                THEN 1 ELSE 0
+            END AS is_active
+        FROM users
+        WHERE company_cd = :company_cd
+    """), {"company_cd": company_cd}).fetchall()
+    users = {}
+    for row in rows:
+        data = dict(row._mapping)
+        data["is_active"] = bool(data["is_active"])
+        users[row.login_id] = data
+    # 재직자는 이름순 (미읽음 목록 등 페이지 조회 기준)
+    active_ids = sorted(
+        (uid for uid, u in users.items() if u["is_active"]),
+        key=lambda uid: (users[uid]["user_name"] or "", uid)
+    )
+    entry = _TenantUsers(time.monotonic() + USER_CACHE_TTL_SEC, users, active_ids)
+    with _cache_lock:
+        _cache[company_cd] = entry
+    return entry
+
+
+def get_user(db: Session, company_cd: str, login_id: str) -> Optional[dict]:
+    return _load(db, company_cd).users.get(login_id)
+
+
+def get_user_name(db: Session, company_cd: str, login_id: str) -> Optional[str]:
+    user = get_user(db, company_cd, login_id)
+    return user["user_name"] if user else None
+
+
+def get_active_user_ids(db: Session, company_cd: str) -> List[str]:
+    """재직자 login_id 목록 (이름순, 반환 목록은 수정하지 말 것)"""
+    return _load(db, company_cd).active_ids
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+대량 목록용 압축 응답 포맷 (VBA 그리드 등)
+- Accept: text/tab-separated-values 또는 ?format=tsv → 헤더 1행 + 값 행(TSV)
+- ?format=columns → {"columns": [...], "data": [[컬럼1 값...], [컬럼2 값...]]}
+- DB 커서 결과(Row 튜플)에서 바로 생성하여 행별 dict 생성 비용을 없앤다.
+"""
+import json
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+from fastapi.responses import Response
+
+TSV_MEDIA_TYPE = "text/tab-separated-values"
+TABULAR_FORMATS = {"tsv", "columns"}
+
+_TSV_ESCAPE = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def resolve_tabular_format(requested_format: Optional[str] = None, accept: Optional[str] = None) -> Optional[str]:
+    """요청된 압축 포맷 판별 (없으면 None → 기존 JSON 응답)"""
+    fmt = (requested_format or "").strip().lower()
+    if fmt in TABULAR_FORMATS:
+        return fmt
+    if accept and TSV_MEDIA_TYPE in accept.lower():
+        return "tsv"
+    return None
+
+
+def _tsv_value(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value.translate(_TSV_ESCAPE)
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace").translate(_TSV_ESCAPE)
+    return str(value)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    return str(value)
+
+
+def tabular_response(result, fmt: str, meta: Optional[Dict[str, Any]] = None) -> Response:
+    """
+    커서 결과를 압축 포맷 응답으로 변환
+
+    Args:
+        result: db.execute(...) 결과 (CursorResult)
+        fmt: "tsv" 또는 "columns"
+        meta: 페이징 정보 등 부가 값 (TSV는 X-* 헤더, columns는 본문에 포함)
+    """
+    meta = meta or {}
+    columns = list(result.keys())
+    rows = result.fetchall()
+
+    if fmt == "tsv":
+        lines = ["\t".join(columns)]
+        lines.extend("\t".join(map(_tsv_value, row)) for row in rows)
+        headers = {
+            f"X-{key.replace('_', '-').title()}": str(value)
+            for key, value in meta.items()
+            if value is not None
+        }
+        headers["X-Row-Count"] = str(len(rows))
+        return Response(
+            content="\n".join(lines) + "\n",
+            media_type=f"{TSV_MEDIA_TYPE}; charset=utf-8",
+            headers=headers
+        )
+
+    data = [list(col) for col in zip(*rows)] if rows else [[] for _ in columns]
+    body = {"columns": columns, "data": data, "row_count": len(rows), **meta}
+    return Response(
+        content=json.dumps(body, ensure_ascii=False, default=_json_default, separators=(",", ":")),
+        media_type="application/json"
+    )
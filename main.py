@@ -4,6 +4,7 @@
 FastAPI 메인 애플리케이션 - VBA + Web 통합 (방식1: api.py 사용)
 버전: 2.0.0
 """
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -16,10 +17,16 @@ from datetime import datetime
 from app.api.v1.endpoints import auth
 
 from app.core.config import settings
-from app.core.database import test_connection
+from app.core.database import test_connection, get_tenant_session_stats
+from app.core.assets import get_asset_manifest
 from app.core.tenant import set_company_cd
 from app.core.security import decode_token
 from app.core.logger import app_logger, access_logger, db_logger, log_startup_info, log_shutdown_info
+from app.services.file_preview_service import file_preview_worker
+from app.services.job_service import run_maintenance as run_job_maintenance, shutdown_jobs
+from app.services.notice_view_buffer import notice_view_buffer
+from app.services.upload_gc_service import run_scheduler as run_upload_gc_scheduler
+from app.services.upload_session_service import run_cleanup as run_upload_session_cleanup
 from app.api.v1.api import api_router  # ⭐ api.py에서 통합 라우터 import
 
 
@@ -52,10 +59,32 @@ async def lifespan(app: FastAPI):
         app_logger.error(f"Database initialization error: {e}")
     
     app_logger.info("=" * 70)
-    
+
+    # 게시글 조회수/읽음 지연 반영 루프
+    view_flush_task = asyncio.create_task(notice_view_buffer.run())
+    # 만료된 분할 업로드 세션 정리 루프
+    upload_cleanup_task = asyncio.create_task(run_upload_session_cleanup())
+    # 첨부 이미지 썸네일/미리보기 생성 루프
+    preview_task = asyncio.create_task(file_preview_worker.run())
+    # 미참조 업로드 파일 정리/사용량 집계 (워커 간 GET_LOCK으로 1곳만 실행)
+    upload_gc_task = asyncio.create_task(run_upload_gc_scheduler())
+    # 백그라운드 작업 heartbeat/중단 작업 복구/보관기간 정리 루프
+    job_maintenance_task = asyncio.create_task(run_job_maintenance())
+
     yield
-    
+
     # Shutdown
+    for task in (view_flush_task, upload_cleanup_task, preview_task, upload_gc_task, job_maintenance_task):
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    # 실행 중 작업은 다음 체크포인트에서 중단, 대기 작업은 FAILED 처리
+    await asyncio.to_thread(shutdown_jobs)
+    flushed = await asyncio.to_thread(notice_view_buffer.flush)
+    if flushed:
+        app_logger.info(f"📝 종료 전 게시글 조회/읽음 {flushed}건 반영")
     log_shutdown_info()
 
 
@@ -73,6 +102,10 @@ app = FastAPI(
 )
 
 
+# 정적 파일 경로 (테넌트 주입/상세 로깅 제외)
+STATIC_PATH_PREFIXES = ("/static", "/css", "/js", "/favicon")
+
+
 # ============================================
 # 미들웨어: company_cd 주입
 # ============================================
@@ -83,7 +116,11 @@ async def inject_company_cd(request: Request, call_next):
     - 로그인 전: 요청 바디의 company_cd 또는 기본값
     - 로그인 후: JWT 토큰의 company_cd
     - 헤더 X-Company-CD는 보조(토큰이 우선)
+    - 정적 파일/헬스체크는 DB를 사용하지 않으므로 건너뜀
     """
+    if request.url.path.startswith(STATIC_PATH_PREFIXES) or request.url.path == "/health":
+        return await call_next(request)
+
     company_cd = None
 
     # 1) Authorization 토큰에서 company_cd 추출 (우선)
@@ -143,7 +180,7 @@ async def log_requests(request: Request, call_next):
     path = request.url.path
     
     # 정적 파일 요청은 간단히 로깅
-    if path.startswith(("/static", "/css", "/js", "/favicon")):
+    if path.startswith(STATIC_PATH_PREFIXES):
         access_logger.info(f"{method} {path} - IP: {client_ip}")
         response = await call_next(request)
         return response
@@ -321,6 +358,15 @@ async def web_app():
     }
 
 
+@app.get("/assets/manifest")
+async def asset_manifest():
+    """화면별 Script/CSS 번들 매니페스트 (navigation.js 지연 로드용)"""
+    return JSONResponse(
+        content=get_asset_manifest(),
+        headers={"Cache-Control": "no-cache"}
+    )
+
+
 # ============================================
 # Health Check
 # ============================================
@@ -347,7 +393,8 @@ async def health_check():
                 "web": os.path.exists(STATIC_DIR),
                 "vba": True
             },
-            "database": db_status
+            "database": db_status,
+            "tenant_session": get_tenant_session_stats()
         }
     except Exception as e:
         app_logger.error(f"Health check failed: {e}", exc_info=True)
@@ -0,0 +1,26 @@
+-- DDL_20261019_Add_BackgroundJobs.sql
+-- 백그라운드 작업 (데이터 복제/회사 생성/비밀번호 일괄 초기화 등 장시간 관리 작업)
+-- 요청은 job_id만 받고 /jobs/{job_id} 로 진행률/결과 조회
+
+CREATE TABLE IF NOT EXISTS `background_jobs` (
+  `job_id` char(32) NOT NULL COMMENT '작업 ID',
+  `company_cd` varchar(20) NOT NULL COMMENT '요청 회사 코드',
+  `job_type` varchar(50) NOT NULL COMMENT '작업 종류',
+  `status` varchar(20) NOT NULL DEFAULT 'QUEUED' COMMENT 'QUEUED/RUNNING/SUCCEEDED/FAILED/CANCELLED',
+  `progress` decimal(5,2) NOT NULL DEFAULT 0 COMMENT '진행률(%)',
+  `message` varchar(500) DEFAULT NULL COMMENT '현재 단계 메시지',
+  `params` json DEFAULT NULL COMMENT '요청 파라미터',
+  `steps` json DEFAULT NULL COMMENT '단계별 소요 시간 [{name, started_at, elapsed_ms}]',
+  `result` json DEFAULT NULL COMMENT '결과',
+  `error` text DEFAULT NULL COMMENT '오류 메시지',
+  `cancel_requested` tinyint(1) NOT NULL DEFAULT 0 COMMENT '취소 요청 여부',
+  `worker_id` varchar(100) DEFAULT NULL COMMENT '실행 워커 (host:pid)',
+  `created_by` varchar(50) DEFAULT NULL COMMENT '요청자',
+  `created_at` timestamp NULL DEFAULT CURRENT_TIMESTAMP COMMENT '요청 일시',
+  `started_at` datetime DEFAULT NULL COMMENT '시작 일시',
+  `finished_at` datetime DEFAULT NULL COMMENT '종료 일시',
+  `heartbeat_at` datetime DEFAULT NULL COMMENT '마지막 진행 기록 일시',
+  PRIMARY KEY (`job_id`),
+  KEY `idx_background_jobs_company` (`company_cd`, `created_at`),
+  KEY `idx_background_jobs_status` (`status`, `heartbeat_at`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='백그라운드 작업';
@@ -0,0 +1,23 @@
+-- DDL_20261019_Add_BoardNoticeReads_CreatedIndex.sql
+-- 게시글별 읽은 사용자 페이지 조회 (최근 읽은 순) 인덱스
+
+SET @schema = DATABASE();
+
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE board_notice_reads ADD KEY `idx_board_notice_reads_notice_created` (`company_cd`, `notice_id`, `created_at`)',
+    'SELECT 1')
+  FROM information_schema.statistics
+  WHERE table_schema = @schema AND table_name = 'board_notice_reads' AND index_name = 'idx_board_notice_reads_notice_created'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- (company_cd, notice_id) 인덱스는 PK 및 위 인덱스의 선행 컬럼과 중복되어 제거
+SET @sql := (
+  SELECT IF(COUNT(*) > 0,
+    'ALTER TABLE board_notice_reads DROP KEY `idx_board_notice_reads_notice`',
+    'SELECT 1')
+  FROM information_schema.statistics
+  WHERE table_schema = @schema AND table_name = 'board_notice_reads' AND index_name = 'idx_board_notice_reads_notice'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
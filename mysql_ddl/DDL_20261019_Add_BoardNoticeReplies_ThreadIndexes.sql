@@ -0,0 +1,34 @@
+-- DDL_20261019_Add_BoardNoticeReplies_ThreadIndexes.sql
+-- 답글 스레드 keyset 조회용 인덱스
+
+SET @schema = DATABASE();
+
+-- 게시글별 답글 (작성일, ID) 순 조회
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE board_notice_replies ADD KEY `idx_board_notice_replies_thread` (`company_cd`, `notice_id`, `created_at`, `reply_id`)',
+    'SELECT 1')
+  FROM information_schema.statistics
+  WHERE table_schema = @schema AND table_name = 'board_notice_replies' AND index_name = 'idx_board_notice_replies_thread'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- 대댓글 (부모별 작성일, ID) 순 조회 + 대댓글 수 집계
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE board_notice_replies ADD KEY `idx_board_notice_replies_children` (`company_cd`, `parent_reply_id`, `created_at`, `reply_id`)',
+    'SELECT 1')
+  FROM information_schema.statistics
+  WHERE table_schema = @schema AND table_name = 'board_notice_replies' AND index_name = 'idx_board_notice_replies_children'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- (company_cd, parent_reply_id) 인덱스는 위 인덱스의 선행 컬럼과 중복되어 제거
+SET @sql := (
+  SELECT IF(COUNT(*) > 0,
+    'ALTER TABLE board_notice_replies DROP KEY `idx_board_notice_replies_parent`',
+    'SELECT 1')
+  FROM information_schema.statistics
+  WHERE table_schema = @schema AND table_name = 'board_notice_replies' AND index_name = 'idx_board_notice_replies_parent'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
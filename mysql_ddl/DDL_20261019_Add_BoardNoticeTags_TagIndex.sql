@@ -0,0 +1,24 @@
+-- DDL_20261019_Add_BoardNoticeTags_TagIndex.sql
+-- board_notice_tags: 태그 → 게시글 조회용 커버링 인덱스 (태그 필터/패싯)
+
+SET @schema = DATABASE();
+
+-- (company_cd, tag, notice_id) 인덱스 추가
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE board_notice_tags ADD KEY `idx_board_notice_tags_tag_notice` (`company_cd`, `tag`, `notice_id`)',
+    'SELECT 1')
+  FROM information_schema.statistics
+  WHERE table_schema = @schema AND table_name = 'board_notice_tags' AND index_name = 'idx_board_notice_tags_tag_notice'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- (company_cd, tag) 인덱스는 위 인덱스의 선행 컬럼과 중복되어 제거
+SET @sql := (
+  SELECT IF(COUNT(*) > 0,
+    'ALTER TABLE board_notice_tags DROP KEY `idx_board_notice_tags_tag`',
+    'SELECT 1')
+  FROM information_schema.statistics
+  WHERE table_schema = @schema AND table_name = 'board_notice_tags' AND index_name = 'idx_board_notice_tags_tag'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
@@ -0,0 +1,43 @@
+-- DDL_20261019_Add_BoardNotice_ContentRender.sql
+-- 게시글 본문 사전 처리: 정제 HTML + 목록용 요약 + 본문 참조 파일 매핑
+-- content_html이 NULL인 기존 게시글은 조회 시 정제(워커 캐시)되고, 다음 수정 시 저장됨
+
+SET @schema = DATABASE();
+
+-- board_notices: content_html 컬럼 추가 (허용 목록 정제 HTML)
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE board_notices ADD COLUMN `content_html` mediumtext DEFAULT NULL COMMENT ''표시용 본문(정제 HTML)''',
+    'SELECT 1')
+  FROM information_schema.columns
+  WHERE table_schema = @schema AND table_name = 'board_notices' AND column_name = 'content_html'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- board_notices: excerpt 컬럼 추가 (목록용 평문 요약)
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE board_notices ADD COLUMN `excerpt` varchar(300) DEFAULT NULL COMMENT ''목록용 본문 요약''',
+    'SELECT 1')
+  FROM information_schema.columns
+  WHERE table_schema = @schema AND table_name = 'board_notices' AND column_name = 'excerpt'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- 기존 게시글 요약 적재 (content_text 기준, 앱 저장 시에는 단어 경계에서 자름)
+UPDATE board_notices
+SET excerpt = IF(CHAR_LENGTH(content_text) > 160, CONCAT(LEFT(content_text, 160), '…'), content_text),
+    updated_at = updated_at
+WHERE excerpt IS NULL
+  AND content_text IS NOT NULL;
+
+CREATE TABLE IF NOT EXISTS `board_notice_content_files` (
+  `company_cd` varchar(20) NOT NULL COMMENT '회사 코드',
+  `notice_id` int NOT NULL COMMENT '공지 ID',
+  `file_id` int NOT NULL COMMENT '파일 ID',
+  `created_at` timestamp NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성 일시',
+  PRIMARY KEY (`company_cd`, `notice_id`, `file_id`),
+  KEY `idx_board_notice_content_files_file` (`company_cd`, `file_id`),
+  CONSTRAINT `fk_board_notice_content_files_notice` FOREIGN KEY (`company_cd`, `notice_id`) REFERENCES `board_notices` (`company_cd`, `notice_id`) ON DELETE CASCADE,
+  CONSTRAINT `fk_board_notice_content_files_file` FOREIGN KEY (`company_cd`, `file_id`) REFERENCES `uploaded_files` (`company_cd`, `file_id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='게시글 본문 참조 파일 (인라인 이미지)';
@@ -0,0 +1,85 @@
+-- DDL_20261019_Add_BoardNotice_Counters.sql
+-- 게시판 목록 집계 컬럼 (답글/첨부/반응/읽음 수) 추가 및 초기 적재
+
+SET @schema = DATABASE();
+
+-- board_notices: reply_count 컬럼 추가
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE board_notices ADD COLUMN `reply_count` int NOT NULL DEFAULT 0 COMMENT ''답글 수''',
+    'SELECT 1')
+  FROM information_schema.columns
+  WHERE table_schema = @schema AND table_name = 'board_notices' AND column_name = 'reply_count'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- board_notices: attach_count 컬럼 추가
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE board_notices ADD COLUMN `attach_count` int NOT NULL DEFAULT 0 COMMENT ''첨부 파일 수(답글 첨부 포함)''',
+    'SELECT 1')
+  FROM information_schema.columns
+  WHERE table_schema = @schema AND table_name = 'board_notices' AND column_name = 'attach_count'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- board_notices: like_count 컬럼 추가
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE board_notices ADD COLUMN `like_count` int NOT NULL DEFAULT 0 COMMENT ''LIKE 반응 수''',
+    'SELECT 1')
+  FROM information_schema.columns
+  WHERE table_schema = @schema AND table_name = 'board_notices' AND column_name = 'like_count'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- board_notices: check_count 컬럼 추가
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE board_notices ADD COLUMN `check_count` int NOT NULL DEFAULT 0 COMMENT ''CHECK 반응 수''',
+    'SELECT 1')
+  FROM information_schema.columns
+  WHERE table_schema = @schema AND table_name = 'board_notices' AND column_name = 'check_count'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- board_notices: read_count 컬럼 추가
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE board_notices ADD COLUMN `read_count` int NOT NULL DEFAULT 0 COMMENT ''읽은 사용자 수''',
+    'SELECT 1')
+  FROM information_schema.columns
+  WHERE table_schema = @schema AND table_name = 'board_notices' AND column_name = 'read_count'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- 초기 적재 (이후 불일치는 POST /api/v1/notices/counters/reconcile 로 보정)
+UPDATE board_notices n
+LEFT JOIN (
+    SELECT company_cd, notice_id, COUNT(*) AS cnt
+    FROM board_notice_replies
+    GROUP BY company_cd, notice_id
+) r ON r.company_cd = n.company_cd AND r.notice_id = n.notice_id
+LEFT JOIN (
+    SELECT company_cd, notice_id, COUNT(*) AS cnt
+    FROM board_notice_files
+    GROUP BY company_cd, notice_id
+) f ON f.company_cd = n.company_cd AND f.notice_id = n.notice_id
+LEFT JOIN (
+    SELECT company_cd, notice_id,
+           SUM(reaction = 'LIKE') AS like_cnt,
+           SUM(reaction = 'CHECK') AS check_cnt
+    FROM board_notice_reactions
+    GROUP BY company_cd, notice_id
+) a ON a.company_cd = n.company_cd AND a.notice_id = n.notice_id
+LEFT JOIN (
+    SELECT company_cd, notice_id, COUNT(*) AS cnt
+    FROM board_notice_reads
+    GROUP BY company_cd, notice_id
+) d ON d.company_cd = n.company_cd AND d.notice_id = n.notice_id
+SET n.reply_count = COALESCE(r.cnt, 0),
+    n.attach_count = COALESCE(f.cnt, 0),
+    n.like_count = COALESCE(a.like_cnt, 0),
+    n.check_count = COALESCE(a.check_cnt, 0),
+    n.read_count = COALESCE(d.cnt, 0),
+    n.updated_at = n.updated_at;
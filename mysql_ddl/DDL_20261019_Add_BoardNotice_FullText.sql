@@ -0,0 +1,51 @@
+-- DDL_20261019_Add_BoardNotice_FullText.sql
+-- 게시판 전문 검색: 검색용 평문 컬럼 + FULLTEXT(ngram) 인덱스
+-- ngram_token_size는 서버 기본값(2)을 가정 (app/services/notice_search_service.py NGRAM_TOKEN_SIZE)
+
+SET @schema = DATABASE();
+
+-- board_notices: content_text 컬럼 추가 (HTML 태그 제거 본문)
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE board_notices ADD COLUMN `content_text` mediumtext DEFAULT NULL COMMENT ''검색용 본문(HTML 제거)''',
+    'SELECT 1')
+  FROM information_schema.columns
+  WHERE table_schema = @schema AND table_name = 'board_notices' AND column_name = 'content_text'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- 기존 게시글 평문 적재 (엔티티 일부는 저장 시점에 앱에서 정규화됨)
+UPDATE board_notices
+SET content_text = TRIM(REGEXP_REPLACE(REGEXP_REPLACE(content, '<[^>]+>', ' '), '[[:space:]]+', ' ')),
+    updated_at = updated_at
+WHERE content_text IS NULL;
+
+-- 제목 FULLTEXT
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE board_notices ADD FULLTEXT KEY `ft_board_notices_title` (`title`) WITH PARSER ngram',
+    'SELECT 1')
+  FROM information_schema.statistics
+  WHERE table_schema = @schema AND table_name = 'board_notices' AND index_name = 'ft_board_notices_title'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- 본문 FULLTEXT
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE board_notices ADD FULLTEXT KEY `ft_board_notices_content` (`content_text`) WITH PARSER ngram',
+    'SELECT 1')
+  FROM information_schema.statistics
+  WHERE table_schema = @schema AND table_name = 'board_notices' AND index_name = 'ft_board_notices_content'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- 제목+본문+해시태그 FULLTEXT
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE board_notices ADD FULLTEXT KEY `ft_board_notices_all` (`title`, `content_text`, `hashtags`) WITH PARSER ngram',
+    'SELECT 1')
+  FROM information_schema.statistics
+  WHERE table_schema = @schema AND table_name = 'board_notices' AND index_name = 'ft_board_notices_all'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
@@ -0,0 +1,57 @@
+-- DDL_20261019_Add_BoardNotice_ListIndexes.sql
+-- 게시판 목록 조회용 인덱스 (필터/정렬 형태별)
+-- 확인: python scripts/bench_notice_search.py --company-cd <회사> --explain
+--   기본 목록/분류/상태/등록일 조건의 EXPLAIN에 아래 인덱스가 key로 선택되고
+--   Extra에 "Using filesort"가 없어야 함
+
+SET @schema = DATABASE();
+
+-- 기본 목록 정렬 (is_fixed DESC, created_at DESC, notice_id DESC) + keyset
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE board_notices ADD KEY `idx_board_notices_list` (`company_cd`, `is_fixed`, `created_at`, `notice_id`)',
+    'SELECT 1')
+  FROM information_schema.statistics
+  WHERE table_schema = @schema AND table_name = 'board_notices' AND index_name = 'idx_board_notices_list'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- 분류 필터 + 기본 정렬
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE board_notices ADD KEY `idx_board_notices_category_list` (`company_cd`, `category`, `is_fixed`, `created_at`, `notice_id`)',
+    'SELECT 1')
+  FROM information_schema.statistics
+  WHERE table_schema = @schema AND table_name = 'board_notices' AND index_name = 'idx_board_notices_category_list'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- 상태 필터 + 기본 정렬
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE board_notices ADD KEY `idx_board_notices_status_list` (`company_cd`, `status`, `is_fixed`, `created_at`, `notice_id`)',
+    'SELECT 1')
+  FROM information_schema.statistics
+  WHERE table_schema = @schema AND table_name = 'board_notices' AND index_name = 'idx_board_notices_status_list'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- 등록일 범위 조건 (created_from/created_to)
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE board_notices ADD KEY `idx_board_notices_created` (`company_cd`, `created_at`)',
+    'SELECT 1')
+  FROM information_schema.statistics
+  WHERE table_schema = @schema AND table_name = 'board_notices' AND index_name = 'idx_board_notices_created'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- (company_cd, status) 인덱스는 idx_board_notices_status_list의 선행 컬럼과 중복되어 제거
+SET @sql := (
+  SELECT IF(COUNT(*) > 0,
+    'ALTER TABLE board_notices DROP KEY `idx_board_notices_status`',
+    'SELECT 1')
+  FROM information_schema.statistics
+  WHERE table_schema = @schema AND table_name = 'board_notices' AND index_name = 'idx_board_notices_status'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
@@ -0,0 +1,13 @@
+-- DDL_20261019_Add_BoardNotice_ReadMarks.sql
+-- 사용자별 게시글 읽음 watermark (미읽음 배지 계산용)
+-- watermark_id 이하 게시글은 읽음으로 간주, 이후 구간은 board_notice_reads와 비교
+-- 기존 사용자는 행이 없으면 0부터 계산하며, 첫 읽음 반영 시 연속 읽음 구간만큼 전진
+
+CREATE TABLE IF NOT EXISTS `board_notice_read_marks` (
+  `company_cd` varchar(20) NOT NULL COMMENT '회사 코드',
+  `reader_id` varchar(50) NOT NULL COMMENT '사용자 ID',
+  `watermark_id` int NOT NULL DEFAULT 0 COMMENT '이 ID 이하 게시글은 모두 읽음',
+  `updated_at` timestamp NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정 일시',
+  PRIMARY KEY (`company_cd`, `reader_id`),
+  CONSTRAINT `fk_board_notice_read_marks_reader` FOREIGN KEY (`company_cd`, `reader_id`) REFERENCES `users` (`company_cd`, `login_id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='게시판 사용자별 읽음 watermark';
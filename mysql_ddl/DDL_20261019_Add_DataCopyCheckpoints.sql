@@ -0,0 +1,21 @@
+-- DDL_20261019_Add_DataCopyCheckpoints.sql
+-- 회사 간 데이터 복제 체크포인트 (테이블별 진행 단계/마지막 PK)
+-- 청크마다 데이터와 같은 트랜잭션으로 갱신 → 실패/취소된 복제를 copy_id로 이어서 실행
+
+CREATE TABLE IF NOT EXISTS `data_copy_checkpoints` (
+  `copy_id` char(32) NOT NULL COMMENT '복제 ID (최초 작업 job_id)',
+  `table_name` varchar(64) NOT NULL COMMENT '테이블명',
+  `source_company_cd` varchar(20) NOT NULL COMMENT '원본 회사 코드',
+  `target_company_cd` varchar(20) NOT NULL COMMENT '대상 회사 코드',
+  `phase` varchar(20) NOT NULL DEFAULT 'PENDING' COMMENT 'PENDING/DELETED/COPYING/DONE',
+  `last_pk` json DEFAULT NULL COMMENT '마지막으로 복사한 PK 값 (company_cd 제외)',
+  `deleted_rows` bigint NOT NULL DEFAULT 0 COMMENT '대상 삭제 건수',
+  `inserted_rows` bigint NOT NULL DEFAULT 0 COMMENT '복사 건수',
+  `chunks` int NOT NULL DEFAULT 0 COMMENT '처리 청크 수',
+  `delete_ms` bigint NOT NULL DEFAULT 0 COMMENT '삭제 누적 소요 시간(ms)',
+  `copy_ms` bigint NOT NULL DEFAULT 0 COMMENT '복사 누적 소요 시간(ms)',
+  `created_at` timestamp NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성 일시',
+  `updated_at` timestamp NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정 일시',
+  PRIMARY KEY (`copy_id`, `table_name`),
+  KEY `idx_data_copy_checkpoints_updated` (`updated_at`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='데이터 복제 체크포인트';
@@ -0,0 +1,11 @@
+-- DDL_20261019_Add_SchemaCacheVersions.sql
+-- 워커 메모리 스키마 캐시 버전 (app/services/schema_cache.py)
+-- 스키마 갱신 API가 version을 올리면 다른 워커도 다음 get_schema에서 다시 읽음
+-- (테이블이 없으면 워커별 TTL 만료로만 갱신)
+
+CREATE TABLE IF NOT EXISTS `schema_cache_versions` (
+  `cache_name` varchar(50) NOT NULL COMMENT '캐시 이름',
+  `version` bigint NOT NULL DEFAULT 0 COMMENT '무효화할 때마다 1 증가',
+  `updated_at` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '마지막 무효화 일시',
+  PRIMARY KEY (`cache_name`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='스키마 캐시 버전';
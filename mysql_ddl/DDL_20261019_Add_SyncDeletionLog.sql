@@ -0,0 +1,78 @@
+-- DDL_20261019_Add_SyncDeletionLog.sql
+-- 증분 동기화(updated_since): 삭제 기록 테이블 + (company_cd, updated_at) 인덱스
+
+SET @schema = DATABASE();
+
+-- 물리 삭제 기록 (tombstone)
+CREATE TABLE IF NOT EXISTS `sync_deletion_log` (
+  `company_cd` varchar(20) NOT NULL COMMENT '회사 코드',
+  `log_id` bigint NOT NULL AUTO_INCREMENT COMMENT '로그 ID',
+  `table_name` varchar(64) NOT NULL COMMENT '대상 테이블',
+  `row_key` varchar(200) NOT NULL COMMENT '삭제 행 키 (복합키는 | 구분)',
+  `deleted_at` timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '삭제 일시',
+  `deleted_by` varchar(50) DEFAULT NULL COMMENT '삭제자 ID',
+  PRIMARY KEY (`company_cd`, `log_id`),
+  UNIQUE KEY `uk_sync_deletion_log_id` (`log_id`),
+  KEY `idx_sync_deletion_log_table` (`company_cd`, `table_name`, `deleted_at`),
+  CONSTRAINT `fk_sync_deletion_log_company` FOREIGN KEY (`company_cd`) REFERENCES `companies` (`company_cd`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='동기화용 삭제 기록';
+
+-- projects: (company_cd, updated_at) 인덱스
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE projects ADD KEY `idx_projects_updated` (`company_cd`, `updated_at`)',
+    'SELECT 1')
+  FROM information_schema.statistics
+  WHERE table_schema = @schema AND table_name = 'projects' AND index_name = 'idx_projects_updated'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- clients: (company_cd, updated_at) 인덱스
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE clients ADD KEY `idx_clients_updated` (`company_cd`, `updated_at`)',
+    'SELECT 1')
+  FROM information_schema.statistics
+  WHERE table_schema = @schema AND table_name = 'clients' AND index_name = 'idx_clients_updated'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- project_history: (company_cd, updated_at) 인덱스
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE project_history ADD KEY `idx_project_history_updated` (`company_cd`, `updated_at`)',
+    'SELECT 1')
+  FROM information_schema.statistics
+  WHERE table_schema = @schema AND table_name = 'project_history' AND index_name = 'idx_project_history_updated'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- comm_code: (company_cd, updated_at) 인덱스
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE comm_code ADD KEY `idx_comm_code_updated` (`company_cd`, `updated_at`)',
+    'SELECT 1')
+  FROM information_schema.statistics
+  WHERE table_schema = @schema AND table_name = 'comm_code' AND index_name = 'idx_comm_code_updated'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- users: (company_cd, updated_at) 인덱스
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE users ADD KEY `idx_users_updated` (`company_cd`, `updated_at`)',
+    'SELECT 1')
+  FROM information_schema.statistics
+  WHERE table_schema = @schema AND table_name = 'users' AND index_name = 'idx_users_updated'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- org_units: (company_cd, updated_at) 인덱스
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE org_units ADD KEY `idx_org_units_updated` (`company_cd`, `updated_at`)',
+    'SELECT 1')
+  FROM information_schema.statistics
+  WHERE table_schema = @schema AND table_name = 'org_units' AND index_name = 'idx_org_units_updated'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
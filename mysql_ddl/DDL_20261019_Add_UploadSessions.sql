@@ -0,0 +1,23 @@
+-- DDL_20261019_Add_UploadSessions.sql
+-- 재개 가능한 분할 업로드 세션 (세션 생성 → 청크 PUT(offset) → 완료)
+-- 미완료 세션은 expires_at 이후 임시 파일과 함께 정리
+
+CREATE TABLE IF NOT EXISTS `upload_sessions` (
+  `company_cd` varchar(20) NOT NULL COMMENT '회사 코드',
+  `upload_id` char(32) NOT NULL COMMENT '업로드 세션 ID',
+  `original_name` varchar(255) NOT NULL COMMENT '원본 파일명',
+  `mime_type` varchar(100) DEFAULT NULL COMMENT 'MIME 타입',
+  `total_size` bigint NOT NULL COMMENT '전체 크기(byte)',
+  `sha256` char(64) DEFAULT NULL COMMENT '클라이언트 제공 SHA-256 (완료 시 검증)',
+  `received_bytes` bigint NOT NULL DEFAULT 0 COMMENT '연속 수신 바이트',
+  `status` varchar(10) NOT NULL DEFAULT 'OPEN' COMMENT 'OPEN/DONE',
+  `part_path` varchar(500) NOT NULL COMMENT '임시 파일 경로',
+  `file_id` int DEFAULT NULL COMMENT '완료 시 등록된 uploaded_files.file_id',
+  `expires_at` datetime NOT NULL COMMENT '만료 일시',
+  `created_by` varchar(50) DEFAULT NULL COMMENT '생성자',
+  `created_at` timestamp NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성 일시',
+  `updated_at` timestamp NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정 일시',
+  PRIMARY KEY (`company_cd`, `upload_id`),
+  KEY `idx_upload_sessions_expires` (`expires_at`),
+  CONSTRAINT `fk_upload_sessions_company` FOREIGN KEY (`company_cd`) REFERENCES `companies` (`company_cd`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='분할 업로드 세션';
@@ -0,0 +1,17 @@
+-- DDL_20261019_Add_UploadStorageUsage.sql
+-- 업로드 저장소 사용량 (회사별, 고아 파일 정리 작업이 갱신)
+
+CREATE TABLE IF NOT EXISTS `upload_storage_usage` (
+  `company_cd` varchar(20) NOT NULL COMMENT '회사 코드',
+  `file_count` int NOT NULL DEFAULT 0 COMMENT 'uploaded_files 행 수',
+  `logical_bytes` bigint NOT NULL DEFAULT 0 COMMENT '업로드 크기 합계 (중복 포함)',
+  `stored_bytes` bigint NOT NULL DEFAULT 0 COMMENT '저장 크기 합계 (blob + 기존 개별 파일)',
+  `disk_bytes` bigint NOT NULL DEFAULT 0 COMMENT '디스크 실측 크기 (미리보기/임시 파일 포함)',
+  `orphan_files` int NOT NULL DEFAULT 0 COMMENT '마지막 정리에서 삭제한 미참조 파일 행 수',
+  `orphan_bytes` bigint NOT NULL DEFAULT 0 COMMENT '마지막 정리에서 회수한 디스크 크기',
+  `missing_files` int NOT NULL DEFAULT 0 COMMENT 'DB에는 있으나 디스크에 없는 파일 수',
+  `measured_at` datetime NOT NULL COMMENT '측정 일시',
+  PRIMARY KEY (`company_cd`),
+  CONSTRAINT `fk_upload_storage_usage_company` FOREIGN KEY (`company_cd`) REFERENCES `companies` (`company_cd`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='업로드 저장소 사용량';
+
@@ -0,0 +1,39 @@
+-- DDL_20261019_Add_UploadedFileBlobs.sql
+-- 업로드 파일 내용 주소(SHA-256) 저장: 회사별 blob + 참조 수
+-- uploaded_files.sha256 이 NULL 인 기존 파일은 개별 저장 파일을 그대로 사용
+
+SET @schema = DATABASE();
+
+CREATE TABLE IF NOT EXISTS `uploaded_file_blobs` (
+  `company_cd` varchar(20) NOT NULL COMMENT '회사 코드',
+  `sha256` char(64) NOT NULL COMMENT '내용 SHA-256 (hex)',
+  `stored_name` varchar(255) NOT NULL COMMENT '저장 파일명 (회사 디렉터리 기준 상대 경로)',
+  `file_path` varchar(500) NOT NULL COMMENT '저장 경로',
+  `file_url` varchar(500) NOT NULL COMMENT '접근 URL',
+  `file_size` bigint NOT NULL COMMENT '파일 크기(byte)',
+  `mime_type` varchar(100) DEFAULT NULL COMMENT '최초 업로드 MIME 타입',
+  `ref_count` int NOT NULL DEFAULT 0 COMMENT '참조 uploaded_files 수',
+  `created_at` timestamp NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성 일시',
+  `updated_at` timestamp NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정 일시',
+  PRIMARY KEY (`company_cd`, `sha256`),
+  CONSTRAINT `fk_uploaded_file_blobs_company` FOREIGN KEY (`company_cd`) REFERENCES `companies` (`company_cd`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='업로드 파일 내용 저장소 (중복 제거)';
+
+-- uploaded_files: sha256 컬럼 추가
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE uploaded_files ADD COLUMN `sha256` char(64) DEFAULT NULL COMMENT ''내용 SHA-256 (uploaded_file_blobs 참조)'' AFTER `file_size`',
+    'SELECT 1')
+  FROM information_schema.columns
+  WHERE table_schema = @schema AND table_name = 'uploaded_files' AND column_name = 'sha256'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+SET @sql := (
+  SELECT IF(COUNT(*) = 0,
+    'ALTER TABLE uploaded_files ADD KEY `idx_uploaded_files_sha256` (`company_cd`, `sha256`)',
+    'SELECT 1')
+  FROM information_schema.statistics
+  WHERE table_schema = @schema AND table_name = 'uploaded_files' AND index_name = 'idx_uploaded_files_sha256'
+);
+PREPARE stmt FROM @sql; EXECUTE stmt; DEALLOCATE PREPARE stmt;
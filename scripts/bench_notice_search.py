@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+게시판 검색 벤치마크: LIKE '%검색어%' vs FULLTEXT(ngram) MATCH
+(--explain: 목록 조회 형태별 EXPLAIN 인덱스 사용 확인)
+
+사용 예:
+  # 10만 건 적재 후 측정 (BENCH 제목 접두어로 생성, --cleanup 으로 삭제)
+  python scripts/bench_notice_search.py --company-cd TESTCOMP --author-id admin --seed 100000
+  python scripts/bench_notice_search.py --company-cd TESTCOMP --terms 영업 계획 --repeat 5
+  python scripts/bench_notice_search.py --company-cd TESTCOMP --explain
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text  # noqa: E402
+
+from app.core.database import engine  # noqa: E402
+from app.services.notice_search_service import build_boolean_query, split_terms  # noqa: E402
+
+WORDS = [
+    "영업", "계획", "실적", "프로젝트", "매출", "고객", "계약", "견적", "회의", "보고",
+    "일정", "변경", "공지", "시스템", "점검", "교육", "인사", "예산", "분기", "목표",
+]
+BENCH_PREFIX = "[BENCH]"
+
+
+def seed(conn, company_cd: str, author_id: str, count: int, batch: int = 1000) -> None:
+    rnd = random.Random(42)
+    started = time.perf_counter()
+    for offset in range(0, count, batch):
+        rows = []
+        for i in range(offset, min(offset + batch, count)):
+            body = " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(80, 400)))
+            rows.append({
+                "company_cd": company_cd,
+                "title": f"{BENCH_PREFIX} {rnd.choice(WORDS)} {rnd.choice(WORDS)} {i}",
+                "content": f"<p>{body}</p>",
+                "content_text": body,
+                "author_id": author_id,
+            })
+        conn.execute(text("""
+            INSERT INTO board_notices (company_cd, title, content, content_text, author_id, created_by)
+            VALUES (:company_cd, :title, :content, :content_text, :author_id, :author_id)
+        """), rows)
+        conn.commit()
+    print(f"seeded {count} notices in {time.perf_counter() - started:.1f}s")
+
+
+def cleanup(conn, company_cd: str) -> None:
+    result = conn.execute(text("""
+        DELETE FROM board_notices
+        WHERE company_cd = :company_cd AND title LIKE :prefix
+    """), {"company_cd": company_cd, "prefix": f"{BENCH_PREFIX}%"})
+    conn.commit()
+    print(f"deleted {result.rowcount} bench notices")
+
+
+def timed(conn, sql: str, params: dict, repeat: int):
+    best = None
+    value = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        value = conn.execute(text(sql), params).scalar()
+        elapsed = (time.perf_counter() - started) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return value, best
+
+
+def bench(conn, company_cd: str, terms, repeat: int) -> None:
+    total = conn.execute(text(
+        "SELECT COUNT(*) FROM board_notices WHERE company_cd = :company_cd"
+    ), {"company_cd": company_cd}).scalar()
+    print(f"notices for {company_cd}: {total}")
+    for term in terms:
+        like_cnt, like_ms = timed(conn, """
+            SELECT COUNT(*) FROM board_notices n
+            WHERE n.company_cd = :company_cd
+              AND (n.title LIKE :search OR n.content LIKE :search)
+        """, {"company_cd": company_cd, "search": f"%{term}%"}, repeat)
+        query = build_boolean_query(split_terms(term))
+        if not query:
+            print(f"{term!r}: LIKE {like_cnt} rows {like_ms:.1f}ms | FULLTEXT n/a (too short)")
+            continue
+        ft_cnt, ft_ms = timed(conn, """
+            SELECT COUNT(*) FROM board_notices n
+            WHERE n.company_cd = :company_cd
+              AND MATCH(n.title, n.content_text, n.hashtags) AGAINST (:q IN BOOLEAN MODE)
+        """, {"company_cd": company_cd, "q": query}, repeat)
+        print(
+            f"{term!r}: LIKE {like_cnt} rows {like_ms:.1f}ms | "
+            f"FULLTEXT {ft_cnt} rows {ft_ms:.1f}ms | x{like_ms / max(ft_ms, 0.01):.1f}"
+        )
+
+
+# 목록 조회 형태 → 기대 인덱스 (DDL_20261019_Add_BoardNotice_ListIndexes.sql)
+LIST_SHAPES = [
+    ("default", "", "idx_board_notices_list"),
+    ("category", "AND n.category = 'GENERAL'", "idx_board_notices_category_list"),
+    ("status", "AND n.status = 'NORMAL'", "idx_board_notices_status_list"),
+    ("keyset", "AND (n.is_fixed < 'Y' OR (n.is_fixed = 'Y' AND n.created_at < NOW()))", "idx_board_notices_list"),
+]
+
+
+def explain(conn, company_cd: str) -> bool:
+    ok = True
+    order_by = "ORDER BY n.is_fixed DESC, n.created_at DESC, n.notice_id DESC LIMIT 20"
+    checks = [
+        (name, f"SELECT n.notice_id FROM board_notices n WHERE n.company_cd = :company_cd {cond} {order_by}", index, True)
+        for name, cond, index in LIST_SHAPES
+    ]
+    checks.append((
+        "created_range",
+        "SELECT COUNT(*) FROM board_notices n WHERE n.company_cd = :company_cd "
+        "AND n.created_at >= NOW() - INTERVAL 30 DAY AND n.created_at < NOW()",
+        "idx_board_notices_created",
+        False,
+    ))
+    for name, sql, index, no_filesort in checks:
+        row = conn.execute(text(f"EXPLAIN {sql}"), {"company_cd": company_cd}).mappings().first()
+        key = row.get("key")
+        extra = row.get("Extra") or ""
+        passed = key == index and not (no_filesort and "filesort" in extra)
+        ok = ok and passed
+        print(f"[{'OK' if passed else 'NG'}] {name}: key={key} rows={row.get('rows')} extra={extra}")
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--company-cd", required=True)
+    parser.add_argument("--author-id", help="--seed 시 작성자 login_id (users FK)")
+    parser.add_argument("--seed", type=int, default=0, help="적재할 게시글 수")
+    parser.add_argument("--cleanup", action="store_true", help="벤치마크 게시글 삭제 후 종료")
+    parser.add_argument("--terms", nargs="*", default=["영업", "프로젝트 계약", "예산 분기"])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--explain", action="store_true", help="목록 조회 EXPLAIN 확인 후 종료 (실패 시 exit 1)")
+    args = parser.parse_args()
+
+    with engine.connect() as conn:
+        if args.cleanup:
+            cleanup(conn, args.company_cd)
+            return
+        if args.explain:
+            sys.exit(0 if explain(conn, args.company_cd) else 1)
+        if args.seed:
+            if not args.author_id:
+                parser.error("--seed requires --author-id")
+            seed(conn, args.company_cd, args.author_id, args.seed)
+        bench(conn, args.company_cd, args.terms, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+조직(org_units) 회사 간 복제 벤치마크: 행 단위 INSERT(lastrowid) + 부모 UPDATE vs 키 구간 변환 INSERT ... SELECT
+(회사 생성 시 공통 테이블 복사 경로, app.services.data_copy_service.clone_with_id_remap)
+
+BENCH_ORG_SRC 회사에 조직 트리를 적재하고 두 방식으로 각각 다른 회사에 복제한 뒤
+소요 시간/왕복 수를 출력하고 트리 구조(이름 → 상위 이름)가 원본과 같은지 확인한다.
+
+사용 예:
+  python scripts/bench_org_clone.py --count 3000
+  python scripts/bench_org_clone.py --count 5000 --repeat 3
+  python scripts/bench_org_clone.py --cleanup
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text  # noqa: E402
+
+from app.core.database import engine  # noqa: E402
+from app.services.data_copy_service import clone_with_id_remap  # noqa: E402
+from app.services.schema_cache import get_schema  # noqa: E402
+
+SOURCE_CD = "BENCH_ORG_SRC"
+ROW_CD = "BENCH_ORG_ROW"
+SET_CD = "BENCH_ORG_SET"
+ACTOR_ID = "bench"
+
+
+def ensure_companies(conn) -> None:
+    for company_cd in (SOURCE_CD, ROW_CD, SET_CD):
+        conn.execute(text("""
+            INSERT IGNORE INTO companies (company_cd, company_name, is_use, created_by, updated_by)
+            VALUES (:company_cd, :company_cd, 'N', :actor, :actor)
+        """), {"company_cd": company_cd, "actor": ACTOR_ID})
+    conn.commit()
+
+
+def clear_orgs(conn, company_cds) -> None:
+    conn.execute(text("SET FOREIGN_KEY_CHECKS=0"))
+    for company_cd in company_cds:
+        conn.execute(text("DELETE FROM org_units WHERE company_cd = :company_cd"), {"company_cd": company_cd})
+    conn.commit()
+    conn.execute(text("SET FOREIGN_KEY_CHECKS=1"))
+
+
+def seed(conn, count: int) -> None:
+    rnd = random.Random(42)
+    started = time.perf_counter()
+    clear_orgs(conn, (SOURCE_CD,))
+    ids = []
+    for i in range(count):
+        # 앞쪽 조직 중 하나를 상위로 (깊이가 다양한 트리)
+        parent_id = rnd.choice(ids[-200:]) if ids and rnd.random() < 0.95 else None
+        result = conn.execute(text("""
+            INSERT INTO org_units (company_cd, org_name, parent_id, org_type, sort_order, is_use, created_by, updated_by)
+            VALUES (:company_cd, :org_name, :parent_id, 'TEAM', :sort_order, 'Y', :actor, :actor)
+        """), {
+            "company_cd": SOURCE_CD,
+            "org_name": f"BENCH {i:06d}",
+            "parent_id": parent_id,
+            "sort_order": i,
+            "actor": ACTOR_ID,
+        })
+        ids.append(int(result.lastrowid))
+        if i % 1000 == 999:
+            conn.commit()
+    conn.commit()
+    print(f"seeded {count} org units in {time.perf_counter() - started:.1f}s")
+
+
+def clone_row_by_row(conn, source: str, target: str) -> int:
+    """기존 방식: 행마다 INSERT 후 lastrowid로 매핑, 상위 조직은 행마다 UPDATE (2N 왕복)"""
+    rows = conn.execute(text("""
+        SELECT org_id, org_name, parent_id, org_type, sort_order, is_use, created_at, updated_at
+        FROM org_units
+        WHERE company_cd = :source
+        ORDER BY org_id ASC
+    """), {"source": source}).mappings().all()
+    id_map = {}
+    for row in rows:
+        result = conn.execute(text("""
+            INSERT INTO org_units (
+                company_cd, org_name, parent_id, org_type, sort_order, is_use,
+                created_at, updated_at, created_by, updated_by
+            ) VALUES (
+                :company_cd, :org_name, NULL, :org_type, :sort_order, :is_use,
+                :created_at, :updated_at, :actor, :actor
+            )
+        """), {**row, "company_cd": target, "actor": ACTOR_ID})
+        id_map[row["org_id"]] = int(result.lastrowid)
+    for row in rows:
+        if not row["parent_id"] or row["parent_id"] not in id_map:
+            continue
+        conn.execute(text("""
+            UPDATE org_units SET parent_id = :new_parent
+            WHERE company_cd = :company_cd AND org_id = :org_id
+        """), {"new_parent": id_map[row["parent_id"]], "company_cd": target, "org_id": id_map[row["org_id"]]})
+    return len(rows)
+
+
+def tree_shape(conn, company_cd: str) -> dict:
+    rows = conn.execute(text("""
+        SELECT o.org_name, p.org_name AS parent_name
+        FROM org_units o
+        LEFT JOIN org_units p
+          ON p.company_cd = o.company_cd
+         AND p.org_id = o.parent_id
+        WHERE o.company_cd = :company_cd
+    """), {"company_cd": company_cd}).fetchall()
+    return {row[0]: row[1] for row in rows}
+
+
+def bench(conn, repeat: int) -> bool:
+    schema = get_schema(conn, refresh=True)
+    source_shape = tree_shape(conn, SOURCE_CD)
+    print(f"source org units: {len(source_shape)}")
+    ok = True
+    for label, target, clone in (
+        ("row-by-row", ROW_CD, lambda target: clone_row_by_row(conn, SOURCE_CD, target)),
+        ("set-based ", SET_CD, lambda target: clone_with_id_remap(conn, schema, "org_units", SOURCE_CD, target, ACTOR_ID)),
+    ):
+        best = None
+        for _ in range(repeat):
+            clear_orgs(conn, (target,))
+            conn.execute(text("SET FOREIGN_KEY_CHECKS=0"))
+            started = time.perf_counter()
+            copied = clone(target)
+            conn.commit()
+            elapsed = (time.perf_counter() - started) * 1000
+            conn.execute(text("SET FOREIGN_KEY_CHECKS=1"))
+            best = elapsed if best is None else min(best, elapsed)
+        same = tree_shape(conn, target) == source_shape
+        ok = ok and same
+        round_trips = copied * 2 + 1 if label.startswith("row") else 2
+        print(f"{label}: {copied} rows {best:.1f}ms (~{round_trips} statements) tree={'OK' if same else 'NG'}")
+    return ok
+
+
+def cleanup(conn) -> None:
+    clear_orgs(conn, (SOURCE_CD, ROW_CD, SET_CD))
+    conn.execute(text("DELETE FROM companies WHERE company_cd IN (:a, :b, :c)"), {"a": SOURCE_CD, "b": ROW_CD, "c": SET_CD})
+    conn.commit()
+    print("deleted bench companies/org units")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=3000, help="원본 조직 수")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--cleanup", action="store_true", help="벤치마크 회사/조직 삭제 후 종료")
+    args = parser.parse_args()
+
+    with engine.connect() as conn:
+        if args.cleanup:
+            cleanup(conn)
+            return
+        ensure_companies(conn)
+        seed(conn, args.count)
+        sys.exit(0 if bench(conn, args.repeat) else 1)
+
+
+if __name__ == "__main__":
+    main()
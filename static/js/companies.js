@@ -263,7 +263,11 @@ async function createCompany() {
     }
 
     try {
-        await API.post(`${API_CONFIG.ENDPOINTS.COMPANIES}`, payload);
+        const result = await API.post(`${API_CONFIG.ENDPOINTS.COMPANIES}`, payload);
+        // 공통 테이블 복사 시 백그라운드 작업으로 처리됨
+        if (result?.job_id) {
+            await API.waitForJob(result.job_id);
+        }
         alert('회사 등록 완료');
         resetCompanyForm();
         await refreshCompanies();
@@ -53,7 +53,11 @@ const API_CONFIG = {
         NOTICES: '/notices',
         NOTICE_TEMPLATES_LIST: '/notice-templates/list',
         NOTICE_TEMPLATES: '/notice-templates',
+        FILES: '/files',
         FILES_UPLOAD: '/files/upload',
+        FILES_DEDUP: '/files/dedup',
+        FILES_UPLOADS: '/files/uploads',
+        JOBS: '/jobs',
 
         // 접속 이력 / 권한
         LOGIN_HISTORY: '/login-history',
@@ -303,6 +307,24 @@ const API = {
         return this.request(endpoint, {
             method: 'DELETE'
         });
+    },
+
+    /**
+     * 백그라운드 작업 완료 대기 (/jobs/{job_id} 폴링)
+     * 성공 시 result 반환, 실패/취소 시 error 메시지로 예외
+     */
+    async waitForJob(jobId, onProgress = null, intervalMs = 1000) {
+        while (true) {
+            const job = await this.get(`${API_CONFIG.ENDPOINTS.JOBS}/${encodeURIComponent(jobId)}`);
+            if (onProgress) onProgress(job);
+            if (job.finished) {
+                if (job.status === 'SUCCEEDED') return job.result;
+                const error = new Error(job.error || `작업이 ${job.status} 상태로 종료되었습니다.`);
+                error.job = job;
+                throw error;
+            }
+            await new Promise(resolve => setTimeout(resolve, intervalMs));
+        }
     }
 };
 
@@ -79,6 +79,8 @@ function initializeDataTables() {
 function bindDataActions() {
     bindButton('btnDataRefresh', refreshDataTables);
     bindButton('btnDataCopy', copySelectedTables);
+    bindButton('btnDataSync', () => syncSelectedTables(false));
+    bindButton('btnDataSyncPreview', () => syncSelectedTables(true));
 
     const sourceSelect = document.getElementById('sourceCompanySelect');
     const targetSelect = document.getElementById('targetCompanySelect');
@@ -161,8 +163,9 @@ async function refreshDataTables() {
             table_name: item.table_name,
             table_comment: item.table_comment || '',
             target_count: item.target_count,
-            status: '',
-            message: ''
+            // 회사 구분 없는 유일 키가 있는 테이블은 전체 복사 불가 (동기화는 건너뜀)
+            status: (item.global_unique_keys || []).length ? '복사 불가' : '',
+            message: (item.global_unique_keys || []).length ? `유일 키: ${item.global_unique_keys.join(', ')}` : ''
         }));
 
         sourceTablesTable.replaceData(sourceRows);
@@ -176,6 +179,18 @@ async function refreshDataTables() {
 }
 
 async function copySelectedTables() {
+    await runDataTransfer('copy', false);
+}
+
+async function syncSelectedTables(dryRun) {
+    await runDataTransfer('sync', dryRun);
+}
+
+/**
+ * 선택 테이블 복제/동기화
+ * copy: 대상 데이터 삭제 후 전체 복사, sync: 체크섬 비교 후 변경분만 반영 (dryRun이면 차이만 조회)
+ */
+async function runDataTransfer(mode, dryRun) {
     const sourceSelect = document.getElementById('sourceCompanySelect');
     const targetSelect = document.getElementById('targetCompanySelect');
     const excludeInput = document.getElementById('excludeTablesInput');
@@ -199,18 +214,26 @@ async function copySelectedTables() {
     }
     const excludeTables = excludeInput ? excludeInput.value.trim() : '';
 
-    if (!confirm(`선택된 ${selectedRows.length}개 테이블을 복제합니다.\nTarget 회사의 기존 데이터는 삭제됩니다.\n진행하시겠습니까?`)) {
+    const confirmMessage = mode === 'copy'
+        ? `선택된 ${selectedRows.length}개 테이블을 복제합니다.\nTarget 회사의 기존 데이터는 삭제됩니다.\n진행하시겠습니까?`
+        : `선택된 ${selectedRows.length}개 테이블을 동기화합니다.\nSource와 다른 Target 행만 추가/수정/삭제됩니다.\n진행하시겠습니까?`;
+    if (!dryRun && !confirm(confirmMessage)) {
         return;
     }
 
     const tables = selectedRows.map(r => r.table_name);
     try {
-        const result = await API.post(API_CONFIG.ENDPOINTS.DATA_MANAGEMENT_COPY, {
+        const job = await API.post(API_CONFIG.ENDPOINTS.DATA_MANAGEMENT_COPY, {
             source_company_cd: source,
             target_company_cd: target,
             tables,
-            exclude_tables: excludeTables ? excludeTables.split(',').map(t => t.trim()).filter(Boolean) : []
+            exclude_tables: excludeTables ? excludeTables.split(',').map(t => t.trim()).filter(Boolean) : [],
+            mode,
+            dry_run: dryRun
         });
+        const result = mode === 'copy'
+            ? await waitForCopyJob(job.job_id)
+            : await API.waitForJob(job.job_id, renderCopyProgress);
 
         const results = result.results || [];
         const statusMap = {};
@@ -218,24 +241,63 @@ async function copySelectedTables() {
             statusMap[r.table_name] = r;
         });
 
-        await refreshDataTables();
+        if (!dryRun) {
+            await refreshDataTables();
+        }
         const currentTargetRows = targetTablesTable.getData();
         currentTargetRows.forEach(row => {
             const r = statusMap[row.table_name];
             if (r) {
                 row.status = r.status;
-                row.message = `DEL ${r.deleted} / INS ${r.inserted}${r.auto_included ? ' (AUTO)' : ''}`;
+                row.message = formatTransferMessage(r, mode);
             }
         });
         targetTablesTable.replaceData(currentTargetRows);
         renderCopySummary(result.report);
-        alert('복제가 완료되었습니다.');
+        alert(dryRun ? '변경분 비교가 완료되었습니다.' : (mode === 'copy' ? '복제가 완료되었습니다.' : '동기화가 완료되었습니다.'));
     } catch (error) {
         console.error('❌ 복제 실패:', error);
         alert(error?.message || '복제 실패');
     }
 }
 
+function formatTransferMessage(r, mode) {
+    const rate = r.rows_per_sec ? ` / ${Math.round(r.rows_per_sec).toLocaleString()} rows/s` : '';
+    const auto = r.auto_included ? ' (AUTO)' : '';
+    if (mode === 'sync') {
+        if (r.status === 'SKIP') return r.skip_reason || '동기화 제외';
+        return `INS ${r.inserted} / UPD ${r.updated} / DEL ${r.deleted} (${r.diff_chunks}/${r.chunks} chunks)${auto}`;
+    }
+    return `DEL ${r.deleted} / INS ${r.inserted}${rate}${auto}`;
+}
+
+/**
+ * 복제 작업 완료 대기
+ * 실패/취소 시 커밋된 청크까지는 유지되므로 이어서 실행할지 확인
+ */
+async function waitForCopyJob(jobId) {
+    while (true) {
+        try {
+            return await API.waitForJob(jobId, renderCopyProgress);
+        } catch (error) {
+            const job = error?.job;
+            if (!job || !confirm(`${error.message}\n마지막 체크포인트부터 이어서 복제하시겠습니까?`)) {
+                throw error;
+            }
+            const copyId = job.params?.copy_id || job.job_id;
+            const resumed = await API.post(`${API_CONFIG.ENDPOINTS.DATA_MANAGEMENT_COPY}/${encodeURIComponent(copyId)}/resume`, {});
+            jobId = resumed.job_id;
+        }
+    }
+}
+
+function renderCopyProgress(job) {
+    const el = document.getElementById('dataCopySummary');
+    if (!el || job.finished) return;
+    el.style.display = 'flex';
+    el.textContent = `진행 중 ${Math.round(job.progress || 0)}% ${job.message || ''}`;
+}
+
 function renderCopySummary(report) {
     const el = document.getElementById('dataCopySummary');
     if (!el) return;
@@ -248,12 +310,28 @@ function renderCopySummary(report) {
     el.style.display = 'flex';
     el.style.flexWrap = 'wrap';
     el.style.gap = '1rem';
+    if (report.mode === 'sync') {
+        el.innerHTML = `
+            <div><strong>${report.dry_run ? '미리보기' : '동기화'}:</strong> ${report.source_company_cd} → ${report.target_company_cd}</div>
+            <div><strong>Changed Tables:</strong> ${t.changed_tables || 0} / ${t.table_count || 0}</div>
+            <div><strong>Diff Chunks:</strong> ${t.diff_chunks || 0} / ${t.chunks || 0}</div>
+            <div><strong>Inserted:</strong> ${t.inserted_total || 0}</div>
+            <div><strong>Updated:</strong> ${t.updated_total || 0}</div>
+            <div><strong>Deleted:</strong> ${t.deleted_total || 0}</div>
+            <div><strong>Scanned:</strong> ${t.scanned_total || 0}</div>
+            ${(t.skipped_tables || []).length ? `<div><strong>Skipped:</strong> ${t.skipped_tables.join(', ')}</div>` : ''}
+            <div><strong>Started:</strong> ${t.started_at || '-'}</div>
+            <div><strong>Ended:</strong> ${t.ended_at || '-'}</div>
+        `;
+        return;
+    }
     el.innerHTML = `
         <div><strong>Source:</strong> ${report.source_company_cd}</div>
         <div><strong>Target:</strong> ${report.target_company_cd}</div>
         <div><strong>Tables:</strong> ${t.table_count || 0}</div>
         <div><strong>Deleted:</strong> ${t.deleted_total || 0}</div>
         <div><strong>Inserted:</strong> ${t.inserted_total || 0}</div>
+        <div><strong>Rows/s:</strong> ${t.rows_per_sec ? Math.round(t.rows_per_sec).toLocaleString() : '-'}</div>
         <div><strong>Target Before:</strong> ${t.target_before_total || 0}</div>
         <div><strong>Target After:</strong> ${t.target_after_total || 0}</div>
         <div><strong>Started:</strong> ${t.started_at || '-'}</div>
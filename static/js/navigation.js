@@ -200,6 +200,128 @@ function updateBreadcrumb(pageId) {
     mainContainer.insertAdjacentHTML('afterbegin', breadcrumbHTML);
 }
 
+// ===================================
+// 화면별 Script/CSS 지연 로드 (서버 매니페스트 기반)
+// ===================================
+const SCREEN_MANIFEST_URL = '/assets/manifest';
+let screenManifestPromise = null;
+const loadedScreenAssets = new Map();
+
+/**
+ * 화면 번들 매니페스트 조회 (최초 1회)
+ */
+function loadScreenManifest() {
+    if (!screenManifestPromise) {
+        screenManifestPromise = fetch(SCREEN_MANIFEST_URL, { cache: 'no-cache' })
+            .then(res => (res.ok ? res.json() : { screens: {}, preload: [] }))
+            .catch(error => {
+                console.warn('⚠️ 화면 매니페스트 조회 실패:', error);
+                return { screens: {}, preload: [] };
+            });
+    }
+    return screenManifestPromise;
+}
+
+function loadScreenAsset(url, type) {
+    const key = url.split('?')[0];
+    if (loadedScreenAssets.has(key)) {
+        return loadedScreenAssets.get(key);
+    }
+    const promise = new Promise((resolve) => {
+        const el = document.createElement(type === 'style' ? 'link' : 'script');
+        if (type === 'style') {
+            el.rel = 'stylesheet';
+            el.href = url;
+        } else {
+            el.src = url;
+            el.async = false;
+        }
+        el.dataset.screenModule = key;
+        el.onload = () => resolve(true);
+        el.onerror = () => {
+            console.error('❌ 화면 리소스 로드 실패:', url);
+            resolve(false);
+        };
+        (type === 'style' ? document.head : document.body).appendChild(el);
+    });
+    loadedScreenAssets.set(key, promise);
+    return promise;
+}
+
+/**
+ * 화면에 필요한 번들 로드 보장 (스크립트는 매니페스트 순서대로 실행)
+ * @param {string} pageId - 페이지 ID
+ * @returns {Promise<void>}
+ */
+async function ensureScreenModules(pageId) {
+    const manifest = await loadScreenManifest();
+    const bundle = (manifest.screens || {})[pageId];
+    if (!bundle) return;
+
+    const startedAt = performance.now();
+    (bundle.styles || []).forEach(url => loadScreenAsset(url, 'style'));
+    for (const url of bundle.scripts || []) {
+        await loadScreenAsset(url, 'script');
+    }
+    console.log(`📦 화면 번들 로드: ${pageId} (${Math.round(performance.now() - startedAt)}ms)`);
+}
+
+// ===================================
+// 게시판 미읽음 배지
+// ===================================
+const NOTICE_UNREAD_POLL_MS = 60000;
+
+function renderNoticeUnreadBadge(data) {
+    const badge = document.getElementById('noticeUnreadBadge');
+    if (!badge) return;
+    const total = Number(data?.total || 0);
+    badge.hidden = total <= 0;
+    badge.textContent = total > 99 ? '99+' : String(total);
+    const byCategory = data?.by_category || {};
+    badge.title = Object.keys(byCategory).map(key => `${key}: ${byCategory[key]}`).join('\n');
+}
+
+async function refreshNoticeUnreadBadge() {
+    if (typeof API === 'undefined' || document.hidden) return;
+    try {
+        const data = await API.get(`${API_CONFIG.ENDPOINTS.NOTICES}/unread-count`);
+        renderNoticeUnreadBadge(data);
+    } catch (error) {
+        console.warn('⚠️ 미읽음 배지 조회 실패:', error);
+    }
+}
+
+async function markAllNoticesRead() {
+    try {
+        const data = await API.post(`${API_CONFIG.ENDPOINTS.NOTICES}/read-all`, {});
+        renderNoticeUnreadBadge(data);
+    } catch (error) {
+        console.error('❌ 모두 읽음 처리 실패:', error);
+    }
+}
+
+/**
+ * 자주 쓰는 화면 번들 미리 받기 (실행하지 않고 캐시만 채움)
+ */
+function preloadScreenModules() {
+    loadScreenManifest().then(manifest => {
+        const screens = manifest.screens || {};
+        (manifest.preload || []).forEach(pageId => {
+            const bundle = screens[pageId];
+            if (!bundle) return;
+            (bundle.scripts || []).forEach(url => {
+                if (loadedScreenAssets.has(url.split('?')[0])) return;
+                if (document.querySelector(`link[rel="preload"][href="${url}"]`)) return;
+                const link = document.createElement('link');
+                link.rel = 'preload';
+                link.as = 'script';
+                link.href = url;
+                document.head.appendChild(link);
+            });
+        });
+    });
+}
+
 /**
  * 페이지 전환
  */
@@ -244,8 +366,8 @@ function navigateTo(pageId) {
         // ⭐ Breadcrumb 업데이트 (신규 추가)
         updateBreadcrumb(pageId);
         
-        // 페이지별 초기화
-        initializePage(pageId);
+        // 페이지별 초기화 (화면 번들 로드 후)
+        ensureScreenModules(pageId).then(() => initializePage(pageId));
         
         console.log('✅ 페이지 전환 완료:', pageId);
     } else {
@@ -1081,7 +1203,7 @@ document.addEventListener('DOMContentLoaded', () => {
                     console.log('✅ 거래처 폼 히스토리 복원');
                 } 
                 else {
-                    initializePage(e.state.page);
+                    ensureScreenModules(e.state.page).then(() => initializePage(e.state.page));
                 }
             }
         } else {
@@ -1092,13 +1214,36 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     });
     
+    // 게시판 미읽음 배지 (주기 갱신 + 탭 복귀 시 갱신)
+    refreshNoticeUnreadBadge();
+    setInterval(refreshNoticeUnreadBadge, NOTICE_UNREAD_POLL_MS);
+    document.addEventListener('visibilitychange', () => {
+        if (!document.hidden) refreshNoticeUnreadBadge();
+    });
+    document.getElementById('noticeReadAllLink')?.addEventListener('click', (e) => {
+        e.preventDefault();
+        markAllNoticesRead();
+    });
+
+    // 자주 쓰는 화면 번들은 유휴 시간에 미리 받기
+    const schedulePreload = window.requestIdleCallback || ((cb) => setTimeout(cb, 1500));
+    schedulePreload(preloadScreenModules);
+
     console.log('✅ Navigation 시스템 초기화 완료');
 });
 
+window.addEventListener('load', () => {
+    const nav = performance.getEntriesByType ? performance.getEntriesByType('navigation')[0] : null;
+    if (nav) {
+        console.log(`⏱️ index 로드: DOMContentLoaded ${Math.round(nav.domContentLoadedEventEnd)}ms, load ${Math.round(nav.loadEventEnd || performance.now())}ms`);
+    }
+});
+
 // ===================================
 // Export to window (기존 완전 보존 + 신규 추가)
 // ===================================
 window.navigateTo = navigateTo;
+window.refreshNoticeUnreadBadge = refreshNoticeUnreadBadge;
 window.initializePage = initializePage;
 window.openProjectForm = openProjectForm;
 window.openClientForm = openClientForm;        // ⭐ 신규 추가
@@ -1108,5 +1253,6 @@ window.logout = logout;
 window.getCurrentPageId = getCurrentPageId;
 window.pageExists = pageExists;
 window.updateBreadcrumb = updateBreadcrumb;    // ⭐ 신규 추가
+window.ensureScreenModules = ensureScreenModules;
 
 console.log('📦 Navigation 모듈 로드 완료');
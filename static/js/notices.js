@@ -33,6 +33,9 @@ let noticeRepliesCache = [];
 let noticeReplyParentId = null;
 let noticeReactionState = { LIKE: false, CHECK: false };
 let noticeReadersVisible = false;
+let noticeReadersStatus = 'read';
+let noticeReadersPage = 1;
+let noticeReadersItems = [];
 let noticeFileInputEl = null;
 let noticeReplyFileInputEl = null;
 let noticeUploadInProgress = false;
@@ -96,6 +99,10 @@ const NOTICE_ALLOWED_EXTS = new Set([
 const NOTICE_IMAGE_EXTS = new Set(['.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp', '.svg']);
 const NOTICE_MAX_UPLOAD_BYTES = 20 * 1024 * 1024;
 const NOTICE_MAX_UPLOAD_MB = 20;
+// 20MB 초과 첨부는 분할(재개) 업로드 사용
+const NOTICE_MAX_RESUMABLE_BYTES = 1024 * 1024 * 1024;
+const NOTICE_UPLOAD_CHUNK_RETRIES = 3;
+const NOTICE_UPLOAD_SESSION_KEY_PREFIX = 'psms.upload.';
 
 function isNoticeListActive() {
     const page = document.getElementById('page-notices-list');
@@ -244,7 +251,8 @@ function initializeNoticeListTable() {
                 title: '제목',
                 field: 'title',
                 minWidth: 280,
-                formatter: cell => `<span class="notice-title">${cell.getValue() || ''}</span>`
+                formatter: cell => `<span class="notice-title">${cell.getValue() || ''}</span>`,
+                tooltip: (e, cell) => cell.getRow().getData().excerpt || ''
             },
             {
                 title: '카테고리',
@@ -414,6 +422,12 @@ function normalizeFileUrl(url) {
     return `${API_CONFIG.BASE_URL}${url}`;
 }
 
+// 이미지 첨부 썸네일 (서버에서 생성된 경우에만, 원본은 내려받지 않음)
+function renderNoticeAttachmentThumb(file) {
+    if (!file?.thumbnail_url) return '';
+    return `<img class="notice-attachment-thumb" src="${normalizeFileUrl(file.thumbnail_url)}" alt="" loading="lazy" decoding="async">`;
+}
+
 function normalizeHashtags(value) {
     if (!value) return '';
     const tokens = value
@@ -445,7 +459,8 @@ function renderNoticeAttachments() {
         return `
             <div class="notice-attachment-item" data-file-id="${file.file_id}">
                 <label class="notice-attachment-info">
-                    <input type="checkbox" class="notice-file-checkbox" data-url="${file.file_url || ''}" data-name="${file.file_name || file.original_name || ''}">
+                    <input type="checkbox" class="notice-file-checkbox" data-file-id="${file.file_id || ''}" data-url="${file.file_url || ''}" data-name="${file.file_name || file.original_name || ''}">
+                    ${renderNoticeAttachmentThumb(file)}
                     <span>${file.file_name || file.original_name || ''}</span>
                 </label>
                 <div class="notice-attachment-meta">${sizeText}</div>
@@ -493,7 +508,7 @@ function renderReplyPendingAttachments() {
         return `
             <div class="notice-attachment-item" data-file-id="${file.file_id}">
                 <label class="notice-attachment-info">
-                    <input type="checkbox" class="notice-reply-file-checkbox" data-url="${file.file_url || ''}" data-name="${file.file_name || file.original_name || ''}">
+                    <input type="checkbox" class="notice-reply-file-checkbox" data-file-id="${file.file_id || ''}" data-url="${file.file_url || ''}" data-name="${file.file_name || file.original_name || ''}">
                     <span>${file.file_name || file.original_name || ''}</span>
                 </label>
                 <div class="notice-attachment-meta">${sizeText}</div>
@@ -691,6 +706,17 @@ function bindNoticeReadersActions() {
             }
         });
     }
+    const statusSelect = document.getElementById('noticeReadersStatus');
+    if (statusSelect && !statusSelect.dataset.bound) {
+        statusSelect.dataset.bound = 'true';
+        statusSelect.addEventListener('change', () => {
+            noticeReadersStatus = statusSelect.value || 'read';
+            if (currentNoticeId) loadNoticeReaders(currentNoticeId);
+        });
+    }
+    bindNoticeButton('btnNoticeReadersMore', () => {
+        if (currentNoticeId) loadNoticeReaders(currentNoticeId, noticeReadersPage + 1);
+    });
 }
 
 function bindNoticeReactionActions() {
@@ -928,31 +954,57 @@ async function loadNoticeReads(noticeId) {
     }
 }
 
-async function loadNoticeReaders(noticeId) {
+async function loadNoticeReaders(noticeId, page = 1) {
     if (!noticeId) return;
     try {
-        const response = await API.get(`${API_CONFIG.ENDPOINTS.NOTICES}/${noticeId}/reads?include_users=true`);
+        const query = new URLSearchParams({
+            include_users: 'true',
+            status: noticeReadersStatus,
+            page: String(page),
+            page_size: '50'
+        });
+        const response = await API.get(`${API_CONFIG.ENDPOINTS.NOTICES}/${noticeId}/reads?${query.toString()}`);
         if (response && typeof response.count !== 'undefined') {
             const readInput = document.getElementById('noticeReadCount');
             if (readInput) readInput.value = response.count ?? 0;
         }
-        renderNoticeReaders(response.items || []);
+        noticeReadersPage = response.current_page || page;
+        noticeReadersItems = page > 1 ? noticeReadersItems.concat(response.items || []) : (response.items || []);
+        renderNoticeReaders(noticeReadersItems);
+        renderNoticeReadersSummary(response.summary);
+
+        const moreBtn = document.getElementById('btnNoticeReadersMore');
+        if (moreBtn) moreBtn.style.display = noticeReadersPage < (response.total_pages || 1) ? 'block' : 'none';
     } catch (error) {
         console.error('❌ 읽음 사용자 조회 실패:', error);
+        noticeReadersItems = [];
         renderNoticeReaders([]);
+        renderNoticeReadersSummary(null);
     }
 }
 
+function renderNoticeReadersSummary(summary) {
+    const el = document.getElementById('noticeReadersSummary');
+    if (!el) return;
+    el.textContent = summary
+        ? `재직자 ${summary.active_total}명 중 ${summary.active_read}명 읽음 · 미읽음 ${summary.unread_count}명`
+        : '';
+}
+
 function renderNoticeReaders(items) {
     const list = document.getElementById('noticeReadersList');
     if (!list) return;
     if (!items.length) {
-        list.innerHTML = '<div class="notice-reader-empty">읽음 기록이 없습니다.</div>';
+        list.innerHTML = noticeReadersStatus === 'unread'
+            ? '<div class="notice-reader-empty">모든 재직자가 읽었습니다.</div>'
+            : '<div class="notice-reader-empty">읽음 기록이 없습니다.</div>';
         return;
     }
     list.innerHTML = items.map((item) => {
         const name = item.reader_name || item.reader_id || '';
-        const date = formatNoticeDateTime(item.created_at);
+        const date = item.created_at
+            ? formatNoticeDateTime(item.created_at)
+            : [item.department, item.team].filter(Boolean).join(' / ');
         return `
             <div class="notice-reader-item">
                 <span class="notice-reader-name">${name}</span>
@@ -966,6 +1018,7 @@ async function loadNoticeDetail(noticeId, mode) {
     try {
         const response = await API.get(`${API_CONFIG.ENDPOINTS.NOTICES}/${noticeId}?increase_view=true`);
         const canEdit = response.can_edit || false;
+        if (typeof window.refreshNoticeUnreadBadge === 'function') window.refreshNoticeUnreadBadge();
 
         currentNoticeMode = mode === 'new' ? 'edit' : (canEdit ? 'edit' : 'view');
         document.getElementById('noticeDetailTitle').textContent = currentNoticeMode === 'edit' ? '게시판 수정' : '게시판 상세';
@@ -980,7 +1033,10 @@ async function loadNoticeDetail(noticeId, mode) {
         setNoticeInputValue('noticeAuthor', response.author_name || response.author_id || '');
         setNoticeInputValue('noticeViewCount', response.view_count ?? '0');
         setNoticeInputValue('noticeCreatedAt', response.created_at || '');
-        setNoticeContent(response.content || '');
+        // 조회 모드는 서버 정제본(content_html), 편집 모드는 원본
+        setNoticeContent(currentNoticeMode === 'edit'
+            ? (response.content || '')
+            : (response.content_html ?? response.content ?? ''));
 
         setNoticeEditMode(currentNoticeMode === 'edit', canEdit);
         pendingReplyFiles = [];
@@ -1090,6 +1146,7 @@ function collectCheckedFiles(selector) {
     return Array.from(document.querySelectorAll(selector))
         .filter(cb => cb.checked)
         .map(cb => ({
+            fileId: Number(cb.getAttribute('data-file-id')) || null,
             url: cb.getAttribute('data-url'),
             name: cb.getAttribute('data-name') || ''
         }))
@@ -1097,14 +1154,27 @@ function collectCheckedFiles(selector) {
         .map(item => ({ ...item, url: normalizeFileUrl(item.url) }));
 }
 
-function downloadFiles(files) {
+// 파일 ID가 있으면 회사 확인 다운로드 API의 단기 서명 URL 사용 (원본 파일명 전송)
+async function resolveFileDownloadUrl(file) {
+    if (!file.fileId) return file.url;
+    try {
+        const response = await API.get(`${API_CONFIG.ENDPOINTS.FILES}/${file.fileId}/link`);
+        if (response?.url) return `${API_CONFIG.BASE_URL}${API_CONFIG.API_VERSION}${response.url}`;
+    } catch (e) {
+        console.warn('⚠️ 다운로드 링크 발급 실패:', e);
+    }
+    return file.url;
+}
+
+async function downloadFiles(files) {
     if (!files.length) {
         alert('다운로드할 파일을 선택하세요.');
         return;
     }
-    files.forEach((file) => {
+    const urls = await Promise.all(files.map(resolveFileDownloadUrl));
+    files.forEach((file, idx) => {
         const link = document.createElement('a');
-        link.href = file.url;
+        link.href = urls[idx];
         if (file.name) link.download = file.name;
         link.target = '_blank';
         document.body.appendChild(link);
@@ -1315,6 +1385,7 @@ function downloadNoticeFiles(all) {
     if (all) {
         const files = [...noticeAttachmentsCache, ...pendingNoticeFiles]
             .map(file => ({
+                fileId: file.file_id || null,
                 url: normalizeFileUrl(file.file_url),
                 name: file.file_name || file.original_name || ''
             }))
@@ -1329,6 +1400,7 @@ function downloadNoticeFiles(all) {
 function downloadReplyPendingFiles(all) {
     if (all) {
         const files = pendingReplyFiles.map(file => ({
+            fileId: file.file_id || null,
             url: normalizeFileUrl(file.file_url),
             name: file.file_name || file.original_name || ''
         })).filter(item => item.url);
@@ -1895,7 +1967,7 @@ function validateNoticeFile(file, allowedExts, maxBytes) {
         return `지원하지 않는 파일 형식입니다. (${ext || 'unknown'})`;
     }
     if (maxBytes && file.size > maxBytes) {
-        return `파일 용량은 ${NOTICE_MAX_UPLOAD_MB}MB 이하만 가능합니다.`;
+        return `파일 용량은 ${Math.floor(maxBytes / (1024 * 1024))}MB 이하만 가능합니다.`;
     }
     return null;
 }
@@ -1923,16 +1995,19 @@ async function insertNoticeImage(editor, file) {
     editor.insertText(index + 1, '\n');
 }
 
-async function uploadNoticeFile(file, onProgress) {
-    const error = validateNoticeFile(file, NOTICE_ALLOWED_EXTS, NOTICE_MAX_UPLOAD_BYTES);
-    if (error) {
-        alert(error);
-        throw new Error(error);
+// 파일 내용 SHA-256 (보안 컨텍스트가 아니면 null → 해시 없이 업로드)
+async function computeNoticeFileSha256(file) {
+    if (!window.crypto?.subtle || !file?.arrayBuffer) return null;
+    try {
+        const digest = await window.crypto.subtle.digest('SHA-256', await file.arrayBuffer());
+        return Array.from(new Uint8Array(digest)).map((b) => b.toString(16).padStart(2, '0')).join('');
+    } catch (e) {
+        console.warn('⚠️ 파일 해시 계산 실패:', e);
+        return null;
     }
-    const url = `${API_CONFIG.BASE_URL}${API_CONFIG.API_VERSION}${API_CONFIG.ENDPOINTS.FILES_UPLOAD}`;
-    const formData = new FormData();
-    formData.append('file', file);
+}
 
+function buildNoticeUploadHeaders() {
     const headers = {};
     try {
         if (typeof AUTH !== 'undefined' && typeof AUTH.getAccessToken === 'function') {
@@ -1950,6 +2025,44 @@ async function uploadNoticeFile(file, onProgress) {
                                 'TESTCOMP';
         headers['X-Company-CD'] = fallbackCompany;
     }
+    return headers;
+}
+
+async function uploadNoticeFile(file, onProgress) {
+    const error = validateNoticeFile(file, NOTICE_ALLOWED_EXTS, NOTICE_MAX_RESUMABLE_BYTES);
+    if (error) {
+        alert(error);
+        throw new Error(error);
+    }
+    if (file.size > NOTICE_MAX_UPLOAD_BYTES) {
+        return await uploadNoticeFileResumable(file, onProgress);
+    }
+    const url = `${API_CONFIG.BASE_URL}${API_CONFIG.API_VERSION}${API_CONFIG.ENDPOINTS.FILES_UPLOAD}`;
+    const formData = new FormData();
+    formData.append('file', file);
+    const headers = buildNoticeUploadHeaders();
+
+    // 같은 내용이 이미 서버에 있으면 전송 없이 등록
+    const sha256 = await computeNoticeFileSha256(file);
+    if (sha256) {
+        try {
+            const dedup = await API.post(API_CONFIG.ENDPOINTS.FILES_DEDUP, {
+                sha256,
+                file_name: file.name,
+                size: file.size,
+                mime_type: file.type || null
+            });
+            if (dedup?.found && dedup.file_id && dedup.url) {
+                if (typeof onProgress === 'function') {
+                    onProgress({ lengthComputable: true, loaded: file.size, total: file.size });
+                }
+                return dedup;
+            }
+        } catch (e) {
+            console.warn('⚠️ 중복 파일 확인 실패, 업로드 진행:', e);
+        }
+        headers['X-Content-SHA256'] = sha256;
+    }
 
     return await new Promise((resolve, reject) => {
         const xhr = new XMLHttpRequest();
@@ -1998,6 +2111,99 @@ async function uploadNoticeFile(file, onProgress) {
     });
 }
 
+function noticeUploadSessionKey(file) {
+    return `${NOTICE_UPLOAD_SESSION_KEY_PREFIX}${file.name}:${file.size}:${file.lastModified || 0}`;
+}
+
+async function readNoticeUploadResponse(response) {
+    let data = null;
+    try {
+        data = await response.json();
+    } catch (e) {
+        data = null;
+    }
+    if (!response.ok) {
+        const err = new Error((data && (data.detail || data.message)) || `HTTP ${response.status}`);
+        err.status = response.status;
+        throw err;
+    }
+    return data;
+}
+
+// 분할(재개) 업로드: 세션 생성 → 청크 PUT(offset) → 완료
+// - 청크 단위로만 읽어 전송 (브라우저/서버 모두 파일 전체를 메모리에 올리지 않음)
+// - 같은 파일을 다시 선택하면 sessionStorage의 세션으로 이어서 전송
+async function uploadNoticeFileResumable(file, onProgress) {
+    const base = `${API_CONFIG.BASE_URL}${API_CONFIG.API_VERSION}${API_CONFIG.ENDPOINTS.FILES_UPLOADS}`;
+    const headers = buildNoticeUploadHeaders();
+    const storageKey = noticeUploadSessionKey(file);
+    const report = (loaded) => {
+        if (typeof onProgress === 'function') {
+            onProgress({ lengthComputable: true, loaded, total: file.size });
+        }
+    };
+
+    let session = null;
+    const savedId = sessionStorage.getItem(storageKey);
+    if (savedId) {
+        try {
+            session = await readNoticeUploadResponse(await fetch(`${base}/${savedId}`, { headers }));
+            if (session.status !== 'OPEN') session = null;
+        } catch (e) {
+            session = null;
+        }
+        if (!session) sessionStorage.removeItem(storageKey);
+    }
+    if (!session) {
+        const created = await readNoticeUploadResponse(await fetch(base, {
+            method: 'POST',
+            headers: { ...headers, 'Content-Type': 'application/json' },
+            body: JSON.stringify({ file_name: file.name, size: file.size, mime_type: file.type || null })
+        }));
+        if (created.found) {
+            report(file.size);
+            return created;
+        }
+        session = created;
+        sessionStorage.setItem(storageKey, session.upload_id);
+    }
+
+    const uploadId = session.upload_id;
+    const chunkSize = Number(session.chunk_size) || (8 * 1024 * 1024);
+    let offset = Number(session.received_bytes) || 0;
+    let failures = 0;
+    report(offset);
+    while (offset < file.size) {
+        const end = Math.min(offset + chunkSize, file.size);
+        try {
+            const result = await readNoticeUploadResponse(await fetch(`${base}/${uploadId}?offset=${offset}`, {
+                method: 'PUT',
+                headers: { ...headers, 'Content-Type': 'application/octet-stream' },
+                body: file.slice(offset, end)
+            }));
+            offset = Number(result.received_bytes);
+            failures = 0;
+            report(offset);
+        } catch (e) {
+            failures += 1;
+            if (failures > NOTICE_UPLOAD_CHUNK_RETRIES || (e.status && e.status !== 409 && e.status < 500)) {
+                throw e;
+            }
+            // 서버가 실제로 받은 위치에서 이어서 전송
+            const state = await readNoticeUploadResponse(await fetch(`${base}/${uploadId}`, { headers }));
+            offset = Number(state.received_bytes) || 0;
+        }
+    }
+
+    const uploaded = await readNoticeUploadResponse(await fetch(`${base}/${uploadId}/complete`, {
+        method: 'POST',
+        headers: { ...headers, 'Content-Type': 'application/json' },
+        body: JSON.stringify({})
+    }));
+    sessionStorage.removeItem(storageKey);
+    return uploaded;
+}
+
 function ensureNoticeReplyEditor() {
     const editorEl = document.getElementById('noticeReplyEditor');
     const fallback = document.getElementById('noticeReplyFallback');
@@ -2248,6 +2454,7 @@ function renderNoticeReplies(items) {
                             <div class="notice-attachment-item" data-file-id="${file.file_id}">
                                 <label class="notice-attachment-info">
                                     <input type="checkbox" class="notice-reply-attachment-checkbox" data-reply-id="${reply.reply_id}" data-url="${file.file_url || ''}" data-name="${file.file_name || ''}">
+                                    ${renderNoticeAttachmentThumb(file)}
                                     <span>${file.file_name || ''}</span>
                                 </label>
                                 <div class="notice-attachment-meta">${sizeText}</div>
@@ -456,7 +456,8 @@ async function bulkResetPasswords() {
         const resetEndpoint = (API_CONFIG && API_CONFIG.ENDPOINTS && API_CONFIG.ENDPOINTS.USERS_PASSWORD_RESET)
             ? API_CONFIG.ENDPOINTS.USERS_PASSWORD_RESET
             : "/users/password/reset";
-        const result = await API.post(resetEndpoint, { user_nos: userNos, updated_by: actor });
+        const job = await API.post(resetEndpoint, { user_nos: userNos, updated_by: actor });
+        const result = await API.waitForJob(job.job_id);
         const count = Number.isFinite(result?.count) ? result.count : userNos.length;
         const skipped = Number.isFinite(result?.skipped) ? result.skipped : 0;
         const detail = skipped > 0 ? ` (처리: ${count}명, 스킵: ${skipped}명)` : ` (처리: ${count}명)`;
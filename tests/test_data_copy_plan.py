@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+회사 간 복제 계획 — 회사 구분 없는 유일 키 테이블은 대상 삭제 전에 거부
+"""
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1.endpoints.data_management import routes as data_routes
+from app.services.schema_cache import SchemaSnapshot
+
+
+class _StubResult:
+    def fetchone(self):
+        return (1,)
+
+
+class _StubSession:
+    def execute(self, *args, **kwargs):
+        return _StubResult()
+
+
+def _schema() -> SchemaSnapshot:
+    return SchemaSnapshot(
+        comments={"clients": "", "projects": ""},
+        columns={
+            "clients": ["company_cd", "client_id", "client_name"],
+            "projects": ["company_cd", "pipeline_id", "client_id"],
+        },
+        primary_keys={
+            "clients": ["company_cd", "client_id"],
+            "projects": ["company_cd", "pipeline_id"],
+        },
+        fk_columns=[
+            ("clients", "company_cd", "projects", "company_cd"),
+            ("clients", "client_id", "projects", "client_id"),
+        ],
+        auto_increment={"clients": "client_id"},
+        unique_keys={"clients": {"uk_clients_id": ["client_id"]}},
+    )
+
+
+@pytest.fixture(autouse=True)
+def schema(monkeypatch):
+    snapshot = _schema()
+    monkeypatch.setattr(data_routes, "get_schema", lambda db, refresh=False: snapshot)
+    return snapshot
+
+
+def test_copy_rejects_auto_included_global_unique_parent():
+    with pytest.raises(HTTPException) as exc:
+        data_routes._plan_copy(_StubSession(), "A", "B", ["projects"], [])
+    assert exc.value.status_code == 400
+    assert "clients(uk_clients_id)" in exc.value.detail
+
+
+def test_copy_allowed_when_conflicting_table_is_excluded():
+    plan = data_routes._plan_copy(_StubSession(), "A", "B", ["projects"], ["clients"])
+    assert plan["copy_tables_list"] == ["projects"]
+
+
+def test_sync_plan_keeps_global_unique_tables():
+    plan = data_routes._plan_copy(_StubSession(), "A", "B", ["projects"], [], mode="sync")
+    assert set(plan["copy_tables_list"]) == {"clients", "projects"}
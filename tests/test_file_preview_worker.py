@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+미리보기 생성 큐 — 다른 스레드/이벤트 루프(/batch 하위 요청)에서의 enqueue
+"""
+import asyncio
+import threading
+
+from app.services import file_preview_service
+from app.services.file_preview_service import FilePreviewWorker
+
+
+def test_enqueue_from_other_thread_and_loop(tmp_path, monkeypatch):
+    generated = []
+    done = threading.Event()
+
+    def fake_generate(file_path):
+        generated.append(file_path)
+        done.set()
+        return 1
+
+    monkeypatch.setattr(file_preview_service, "previews_enabled", lambda: True)
+    monkeypatch.setattr(file_preview_service, "generate_previews", fake_generate)
+    source = tmp_path / "photo.png"
+    source.write_bytes(b"png")
+    worker = FilePreviewWorker(max_queue=10)
+
+    async def main():
+        task = asyncio.create_task(worker.run())
+        await asyncio.sleep(0)
+        results = []
+        # /batch처럼 별도 스레드에서 새 이벤트 루프로 호출
+        thread = threading.Thread(target=lambda: results.append(asyncio.run(_enqueue(worker, str(source)))))
+        thread.start()
+        await asyncio.to_thread(thread.join)
+        assert results == [True]
+        assert await asyncio.to_thread(done.wait, 5)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(main())
+    assert generated == [str(source)]
+
+
+async def _enqueue(worker, file_path):
+    return worker.enqueue(file_path)
+
+
+def test_enqueue_before_run_is_dropped(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_preview_service, "previews_enabled", lambda: True)
+    source = tmp_path / "photo.png"
+    source.write_bytes(b"png")
+    assert FilePreviewWorker(max_queue=10).enqueue(str(source)) is False
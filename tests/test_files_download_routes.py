@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""
+파일 다운로드 서명 URL — 실제 api_router(라우터 단위 권한 의존성 포함)를 거쳐 확인
+"""
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1.api import api_router
+from app.api.v1.endpoints.files import routes as files_routes
+from app.core.config import settings
+from app.core.database import get_db
+from app.services.file_preview_service import thumbnail_url_for, variant_path
+from app.services.file_storage_service import sign_file_url
+
+COMPANY_CD = "PYTEST_FILES"
+FILE_ID = 1
+FILE_BODY = b"hello psms"
+SHA256 = "ab" * 32
+DEFAULT_ROW = {
+    "original_name": "report.txt",
+    "mime_type": "text/plain",
+    "sha256": SHA256,
+}
+
+
+class _StubResult:
+    def __init__(self, row):
+        self._row = row
+
+    def fetchone(self):
+        return self._row
+
+
+class _StubSession:
+    def __init__(self, row):
+        self._row = row
+
+    def execute(self, *args, **kwargs):
+        return _StubResult(self._row)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def upload_root(tmp_path, monkeypatch):
+    """업로드 루트를 tmp_path로 교체 (다운로드/미리보기 라우트의 루트 경로 검사 기준)"""
+    monkeypatch.setattr(files_routes, "UPLOAD_ROOT", tmp_path)
+    company_dir = tmp_path / COMPANY_CD
+    company_dir.mkdir()
+    return company_dir
+
+
+@pytest.fixture
+def client(upload_root):
+    file_path = upload_root / "report.txt"
+    file_path.write_bytes(FILE_BODY)
+    app = FastAPI()
+    app.include_router(api_router, prefix=settings.API_V1_PREFIX)
+    client = TestClient(app)
+    client.use_row = lambda **values: app.dependency_overrides.__setitem__(
+        get_db, lambda: _StubSession(SimpleNamespace(**{**DEFAULT_ROW, "file_path": str(file_path), **values}))
+    )
+    client.use_row()
+    return client
+
+
+def _signed_url() -> str:
+    path, _ = sign_file_url(COMPANY_CD, FILE_ID)
+    return f"{settings.API_V1_PREFIX}{path}"
+
+
+def test_signed_url_downloads_without_token(client):
+    response = client.get(_signed_url())
+    assert response.status_code == 200
+    assert response.content == FILE_BODY
+    assert response.headers["etag"] == f'"{SHA256}"'
+    assert response.headers["accept-ranges"] == "bytes"
+
+
+def test_invalid_signature_is_rejected(client):
+    path, _ = sign_file_url(COMPANY_CD, FILE_ID)
+    response = client.get(f"{settings.API_V1_PREFIX}{path[:-4]}0000")
+    assert response.status_code == 403
+
+
+def test_unsigned_download_requires_token(client):
+    response = client.get(f"{settings.API_V1_PREFIX}/files/{FILE_ID}")
+    assert response.status_code == 401
+
+
+def test_fixed_paths_are_not_shadowed_by_file_id(client):
+    # /files/storage-usage 는 파일 다운로드(/files/{file_id})가 아니라 인증 라우터로 가야 함
+    response = client.get(f"{settings.API_V1_PREFIX}/files/storage-usage")
+    assert response.status_code == 401
+
+
+def test_thumbnail_url_is_signed_preview_route(client, upload_root):
+    image_path = upload_root / "photo.png"
+    image_path.write_bytes(b"png")
+    variant_path(str(image_path), "thumb").write_bytes(b"jpeg-thumb")
+    client.use_row(original_name="photo.png", file_path=str(image_path))
+
+    url = thumbnail_url_for(COMPANY_CD, FILE_ID, str(image_path))
+    assert url.startswith(f"{settings.API_V1_PREFIX}/files/{FILE_ID}/preview?")
+    assert url == thumbnail_url_for(COMPANY_CD, FILE_ID, str(image_path))
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.content == b"jpeg-thumb"
+
+
+def test_range_request_returns_partial_content(client):
+    response = client.get(_signed_url(), headers={"Range": "bytes=2-5"})
+    assert response.status_code == 206
+    assert response.headers["content-range"] == f"bytes 2-5/{len(FILE_BODY)}"
+    assert response.content == FILE_BODY[2:6]
+
+
+def test_suffix_range_returns_tail(client):
+    response = client.get(_signed_url(), headers={"Range": "bytes=-4"})
+    assert response.status_code == 206
+    assert response.content == FILE_BODY[-4:]
+
+
+def test_unsatisfiable_range_returns_416(client):
+    response = client.get(_signed_url(), headers={"Range": "bytes=100-200"})
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{len(FILE_BODY)}"
+
+
+def test_if_range_with_current_etag_returns_partial(client):
+    response = client.get(_signed_url(), headers={"Range": "bytes=0-4", "If-Range": f'"{SHA256}"'})
+    assert response.status_code == 206
+    assert response.content == FILE_BODY[:5]
+
+
+def test_if_range_with_stale_etag_returns_full_body(client):
+    response = client.get(_signed_url(), headers={"Range": "bytes=0-4", "If-Range": '"stale"'})
+    assert response.status_code == 200
+    assert response.content == FILE_BODY
+
+
+def test_if_none_match_returns_304(client):
+    for header in (f'"{SHA256}"', f'W/"{SHA256}"', f'"other", "{SHA256}"'):
+        response = client.get(_signed_url(), headers={"If-None-Match": header})
+        assert response.status_code == 304, header
+        assert response.content == b""
+        assert response.headers["etag"] == f'"{SHA256}"'
+
+
+def test_if_none_match_with_other_etag_returns_body(client):
+    response = client.get(_signed_url(), headers={"If-None-Match": '"other"'})
+    assert response.status_code == 200
+    assert response.content == FILE_BODY
+
+
+def test_inline_disposition_for_safe_types(client):
+    response = client.get(f"{_signed_url()}&disposition=inline")
+    assert response.headers["content-disposition"].startswith("inline")
+
+
+def test_script_capable_types_are_forced_to_attachment(client):
+    for mime_type in ("text/html", "image/svg+xml"):
+        client.use_row(mime_type=mime_type)
+        response = client.get(f"{_signed_url()}&disposition=inline")
+        assert response.status_code == 200
+        assert response.headers["content-disposition"].startswith("attachment"), mime_type
+        assert response.headers["content-security-policy"] == "sandbox"
+
+
+def test_preview_signature_is_rejected_by_download_route(client, upload_root):
+    image_path = upload_root / "photo.png"
+    image_path.write_bytes(b"png")
+    variant_path(str(image_path), "thumb").write_bytes(b"jpeg-thumb")
+    client.use_row(original_name="photo.png", file_path=str(image_path))
+
+    preview_url = thumbnail_url_for(COMPANY_CD, FILE_ID, str(image_path))
+    query = preview_url.split("?", 1)[1]
+    response = client.get(f"{settings.API_V1_PREFIX}/files/{FILE_ID}?{query}")
+    assert response.status_code == 403
+
+
+def test_signature_is_bound_to_preview_variant(client, upload_root):
+    image_path = upload_root / "photo.png"
+    image_path.write_bytes(b"png")
+    variant_path(str(image_path), "thumb").write_bytes(b"jpeg-thumb")
+    variant_path(str(image_path), "preview").write_bytes(b"jpeg-preview")
+    client.use_row(original_name="photo.png", file_path=str(image_path))
+
+    thumb_url = thumbnail_url_for(COMPANY_CD, FILE_ID, str(image_path))
+    response = client.get(thumb_url.replace("variant=thumb", "variant=preview"))
+    assert response.status_code == 403
+
+
+def test_download_signature_is_rejected_by_preview_route(client):
+    query = _signed_url().split("?", 1)[1]
+    response = client.get(f"{settings.API_V1_PREFIX}/files/{FILE_ID}/preview?variant=thumb&{query}")
+    assert response.status_code == 403
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+게시글 본문 정제(sanitize_html) 허용 목록 확인
+"""
+from app.services.notice_content_service import IFRAME_SANDBOX, sanitize_html
+
+
+def test_javascript_urls_are_removed():
+    result = sanitize_html('<a href="javascript:alert(1)">x</a><a href=" jav&#x09;ascript:alert(1)">y</a>')
+    assert "javascript" not in result.lower()
+    assert "href" not in result
+    assert ">x</a>" in result and ">y</a>" in result
+
+
+def test_safe_links_are_kept_with_noopener():
+    result = sanitize_html('<a href="https://example.com" target="_blank" rel="opener">x</a>')
+    assert 'href="https://example.com"' in result
+    assert 'rel="noopener noreferrer"' in result
+    assert result.count("rel=") == 1
+
+
+def test_event_handler_attributes_are_removed():
+    result = sanitize_html('<p onclick="alert(1)" onmouseover="x()">a</p><img src="/x.png" onerror="alert(1)">')
+    assert "onclick" not in result
+    assert "onmouseover" not in result
+    assert "onerror" not in result
+    assert '<img src="/x.png">' in result
+
+
+def test_style_url_and_expression_are_removed():
+    result = sanitize_html(
+        '<span style="background:url(javascript:alert(1))">a</span>'
+        '<span style="width:expression(alert(1))">b</span>'
+        '<span style="color: red">c</span>'
+    )
+    assert "url(" not in result
+    assert "expression" not in result
+    assert 'style="color: red"' in result
+
+
+def test_script_and_svg_content_are_dropped():
+    result = sanitize_html(
+        "<p>keep</p><script>alert(1)</script>"
+        "<svg><script>alert(2)</script><text>svg text</text></svg>"
+        "<style>p{}</style><p>after</p>"
+    )
+    assert result == "<p>keep</p><p>after</p>"
+
+
+def test_quill_video_iframe_from_allowed_host_is_kept_with_sandbox():
+    result = sanitize_html(
+        '<iframe class="ql-video" frameborder="0" allowfullscreen="true" '
+        'src="https://www.youtube.com/embed/abc"></iframe>'
+    )
+    assert 'src="https://www.youtube.com/embed/abc"' in result
+    assert f'sandbox="{IFRAME_SANDBOX}"' in result
+
+
+def test_other_iframes_are_dropped():
+    for source in (
+        '<iframe class="ql-video" src="https://evil.example.com/login"></iframe>',
+        '<iframe src="https://www.youtube.com/embed/abc"></iframe>',
+        '<iframe class="ql-video" src="http://www.youtube.com/embed/abc"></iframe>',
+        '<iframe class="ql-video" src="https://www.youtube.com.evil.example/embed"></iframe>',
+        '<iframe class="ql-video" src="javascript:alert(1)"></iframe>',
+    ):
+        assert "<iframe" not in sanitize_html(source), source
+
+
+def test_sandbox_attribute_cannot_be_overridden():
+    result = sanitize_html(
+        '<iframe class="ql-video" sandbox="allow-top-navigation" src="https://player.vimeo.com/video/1"></iframe>'
+    )
+    assert "allow-top-navigation" not in result
+    assert result.count("sandbox=") == 1
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+스키마 캐시 — 다른 워커의 무효화(공유 버전 증가)를 다음 get_schema에서 반영
+"""
+import pytest
+
+from app.services import schema_cache
+from app.services.schema_cache import SchemaSnapshot, get_schema, invalidate_schema_cache
+
+
+class _StubResult:
+    def __init__(self, value):
+        self._value = value
+
+    def scalar(self):
+        return self._value
+
+
+class _SharedVersionDb:
+    """schema_cache_versions 한 행을 흉내 내는 세션 (워커 간 공유 DB)"""
+
+    def __init__(self):
+        self.version = None
+
+    def execute(self, statement, params=None):
+        sql = str(statement)
+        if "INSERT INTO schema_cache_versions" in sql:
+            self.version = (self.version or 0) + 1
+            return _StubResult(None)
+        return _StubResult(self.version)
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    calls = []
+
+    def fake_load(db):
+        calls.append(db)
+        return SchemaSnapshot({}, {}, {}, [], {})
+
+    monkeypatch.setattr(schema_cache, "_load", fake_load)
+    invalidate_schema_cache()
+    yield calls
+    invalidate_schema_cache()
+
+
+def test_snapshot_is_reused_while_version_unchanged(loads):
+    db = _SharedVersionDb()
+    first = get_schema(db)
+    assert get_schema(db) is first
+    assert len(loads) == 1
+
+
+def test_version_bump_from_other_worker_reloads(loads):
+    db = _SharedVersionDb()
+    first = get_schema(db)
+    # 다른 워커의 /schema/refresh: 공유 버전만 올라가고 이 워커의 스냅샷은 그대로
+    db.version = (db.version or 0) + 1
+    second = get_schema(db)
+    assert second is not first
+    assert second.version == db.version
+    assert len(loads) == 2
+
+
+def test_invalidate_with_db_bumps_shared_version(loads):
+    db = _SharedVersionDb()
+    get_schema(db)
+    invalidate_schema_cache(db)
+    assert db.version == 1
+    get_schema(db)
+    assert len(loads) == 2
@@ -126,6 +126,123 @@ ErrorHandler:
     Set HttpPost = Nothing
 End Function
 
+' =====================================================
+' HTTP GET 요청 (TSV 압축 포맷 → 2차원 배열)
+' =====================================================
+Public Function HttpGetTable(endpoint As String, Optional params As Object = Nothing) As Variant
+    '
+    ' 목록 API를 TSV 포맷(format=tsv)으로 조회하여 2차원 배열로 반환
+    ' (JSON 파싱 없이 Split만 사용하므로 대량 그리드에 적합)
+    '
+    ' 반환값:
+    '   (0, 컬럼) = 헤더 행, (1 ~ n, 컬럼) = 데이터 행
+    '   실패 시 Empty
+    '
+    ' 사용 예:
+    '   Dim grid As Variant
+    '   grid = HttpGetTable("/sales-plans/3/lines")
+    '   Sheet1.Range("A1").Resize(UBound(grid, 1) + 1, UBound(grid, 2) + 1).Value = grid
+    '
+
+    Dim http As Object
+    Dim url As String
+    Dim key As Variant
+    Dim lines() As String
+    Dim cols() As String
+    Dim result() As Variant
+    Dim rowCount As Long
+    Dim colCount As Long
+    Dim r As Long
+    Dim c As Long
+
+    url = API_BASE_URL & endpoint & IIf(InStr(endpoint, "?") > 0, "&", "?") & "format=tsv"
+    If Not params Is Nothing Then
+        For Each key In params.Keys
+            If params(key) <> "" Then
+                url = url & "&" & key & "=" & UrlEncode(CStr(params(key)))
+            End If
+        Next key
+    End If
+
+    Set http = CreateObject("MSXML2.XMLHTTP")
+
+    On Error GoTo ErrorHandler
+    http.Open "GET", url, False
+    http.setRequestHeader "Accept", "text/tab-separated-values"
+    http.send
+
+    If http.Status <> 200 Then
+        MsgBox "HTTP 오류: " & http.Status & vbCrLf & http.responseText, vbCritical
+        HttpGetTable = Empty
+        Exit Function
+    End If
+
+    lines = Split(http.responseText, vbLf)
+    rowCount = UBound(lines)              ' 마지막 빈 줄 제외
+    cols = Split(lines(0), vbTab)
+    colCount = UBound(cols) + 1
+
+    ReDim result(0 To rowCount - 1, 0 To colCount - 1)
+    For r = 0 To rowCount - 1
+        cols = Split(lines(r), vbTab)
+        For c = 0 To UBound(cols)
+            If c < colCount Then result(r, c) = UnescapeTsv(cols(c))
+        Next c
+    Next r
+
+    HttpGetTable = result
+    Exit Function
+
+ErrorHandler:
+    MsgBox "HTTP 요청 실패: " & Err.Description & vbCrLf & "URL: " & url, vbCritical
+    HttpGetTable = Empty
+End Function
+
+Private Function UnescapeTsv(value As String) As String
+    If InStr(value, "\") = 0 Then
+        UnescapeTsv = value
+        Exit Function
+    End If
+    value = Replace(value, "\\", Chr(0))
+    value = Replace(value, "\t", vbTab)
+    value = Replace(value, "\n", vbLf)
+    value = Replace(value, "\r", vbCr)
+    UnescapeTsv = Replace(value, Chr(0), "\")
+End Function
+
+' =====================================================
+' 배치 요청 (여러 API 호출을 한 번에 전송)
+' =====================================================
+Public Function HttpBatch(subRequests As Collection) As Object
+    '
+    ' /batch 엔드포인트로 여러 요청을 한 번에 실행
+    '
+    ' 파라미터:
+    '   subRequests: 하위 요청 Dictionary 컬렉션
+    '                (id, method, path, query, body 키 사용)
+    '
+    ' 반환값:
+    '   results 컬렉션을 포함한 Dictionary 객체
+    '   (각 결과: id, status, elapsed_ms, body)
+    '
+    ' 사용 예:
+    '   Dim reqs As New Collection
+    '   Dim req As Object
+    '   Set req = CreateObject("Scripting.Dictionary")
+    '   req("id") = "managers"
+    '   req("path") = "/common/managers"
+    '   reqs.Add req
+    '   Set result = HttpBatch(reqs)
+    '   Set managers = result("results")(1)("body")
+    '
+
+    Dim payload As Object
+    Set payload = CreateObject("Scripting.Dictionary")
+    Set payload("requests") = subRequests
+
+    Set HttpBatch = HttpPost("/batch", payload)
+End Function
+
 ' =====================================================
 ' URL 인코딩
 ' =====================================================